@@ -1,7 +1,7 @@
 """人民币数字转中文大写转换程序入口点。"""
 import sys
 
-from src.rmb_converter.cli import main
+from src.rmb_converter.cli import run
 
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(run())
@@ -0,0 +1,114 @@
+"""预计算转换表（由 python -m src.rmb_converter.tablegen 生成，请勿手工修改）。"""
+
+# ruff: noqa: E501
+
+TABLES_VERSION = 1
+
+# 0-9999 的四位数转换结果
+FOUR_DIGITS = (
+    '零|壹|贰|叁|肆|伍|陆|柒|捌|玖|壹拾|壹拾壹|壹拾贰|壹拾叁|壹拾肆|壹拾伍|壹拾陆|壹拾柒|壹拾捌|壹拾玖|贰拾|贰拾壹|贰拾贰|贰拾叁|贰拾肆|贰拾伍|贰拾陆|贰拾柒|贰拾捌|贰拾玖|叁拾|叁拾壹|叁拾贰|叁拾叁|叁拾肆|叁拾伍|叁拾陆|叁拾柒|叁拾捌|叁拾玖|肆拾|肆拾壹|肆拾贰|肆拾叁|肆拾肆|肆拾伍|肆拾陆|肆拾柒|肆拾捌|肆拾玖|伍拾|伍拾壹|伍拾贰|伍拾叁|伍拾肆|伍拾伍|伍拾陆|伍拾柒|伍拾捌|伍拾玖|陆拾|陆拾壹|陆拾贰|陆拾叁|陆拾肆|陆拾伍|陆拾陆|陆拾柒|陆拾捌|陆拾玖|柒拾|柒拾壹|柒拾贰|柒拾叁|柒拾肆|柒拾伍|柒拾陆|柒拾柒|柒拾捌|柒拾玖|捌拾|捌拾壹|捌拾贰|捌拾叁|捌拾肆|捌拾伍|捌拾陆|捌拾柒|捌拾捌|捌拾玖|玖拾|玖拾壹|玖拾贰|玖拾叁|玖拾肆|玖拾伍|玖拾陆|玖拾柒|玖拾捌|玖拾玖|'
+    '壹佰|壹佰零壹|壹佰零贰|壹佰零叁|壹佰零肆|壹佰零伍|壹佰零陆|壹佰零柒|壹佰零捌|壹佰零玖|壹佰壹拾|壹佰壹拾壹|壹佰壹拾贰|壹佰壹拾叁|壹佰壹拾肆|壹佰壹拾伍|壹佰壹拾陆|壹佰壹拾柒|壹佰壹拾捌|壹佰壹拾玖|壹佰贰拾|壹佰贰拾壹|壹佰贰拾贰|壹佰贰拾叁|壹佰贰拾肆|壹佰贰拾伍|壹佰贰拾陆|壹佰贰拾柒|壹佰贰拾捌|壹佰贰拾玖|壹佰叁拾|壹佰叁拾壹|壹佰叁拾贰|壹佰叁拾叁|壹佰叁拾肆|壹佰叁拾伍|壹佰叁拾陆|壹佰叁拾柒|壹佰叁拾捌|壹佰叁拾玖|壹佰肆拾|壹佰肆拾壹|壹佰肆拾贰|壹佰肆拾叁|壹佰肆拾肆|壹佰肆拾伍|壹佰肆拾陆|壹佰肆拾柒|壹佰肆拾捌|壹佰肆拾玖|壹佰伍拾|壹佰伍拾壹|壹佰伍拾贰|壹佰伍拾叁|壹佰伍拾肆|壹佰伍拾伍|壹佰伍拾陆|壹佰伍拾柒|壹佰伍拾捌|壹佰伍拾玖|壹佰陆拾|壹佰陆拾壹|壹佰陆拾贰|壹佰陆拾叁|壹佰陆拾肆|壹佰陆拾伍|壹佰陆拾陆|壹佰陆拾柒|壹佰陆拾捌|壹佰陆拾玖|壹佰柒拾|壹佰柒拾壹|壹佰柒拾贰|壹佰柒拾叁|壹佰柒拾肆|壹佰柒拾伍|壹佰柒拾陆|壹佰柒拾柒|壹佰柒拾捌|壹佰柒拾玖|壹佰捌拾|壹佰捌拾壹|壹佰捌拾贰|壹佰捌拾叁|壹佰捌拾肆|壹佰捌拾伍|壹佰捌拾陆|壹佰捌拾柒|壹佰捌拾捌|壹佰捌拾玖|壹佰玖拾|壹佰玖拾壹|壹佰玖拾贰|壹佰玖拾叁|壹佰玖拾肆|壹佰玖拾伍|壹佰玖拾陆|壹佰玖拾柒|壹佰玖拾捌|壹佰玖拾玖|'
+    '贰佰|贰佰零壹|贰佰零贰|贰佰零叁|贰佰零肆|贰佰零伍|贰佰零陆|贰佰零柒|贰佰零捌|贰佰零玖|贰佰壹拾|贰佰壹拾壹|贰佰壹拾贰|贰佰壹拾叁|贰佰壹拾肆|贰佰壹拾伍|贰佰壹拾陆|贰佰壹拾柒|贰佰壹拾捌|贰佰壹拾玖|贰佰贰拾|贰佰贰拾壹|贰佰贰拾贰|贰佰贰拾叁|贰佰贰拾肆|贰佰贰拾伍|贰佰贰拾陆|贰佰贰拾柒|贰佰贰拾捌|贰佰贰拾玖|贰佰叁拾|贰佰叁拾壹|贰佰叁拾贰|贰佰叁拾叁|贰佰叁拾肆|贰佰叁拾伍|贰佰叁拾陆|贰佰叁拾柒|贰佰叁拾捌|贰佰叁拾玖|贰佰肆拾|贰佰肆拾壹|贰佰肆拾贰|贰佰肆拾叁|贰佰肆拾肆|贰佰肆拾伍|贰佰肆拾陆|贰佰肆拾柒|贰佰肆拾捌|贰佰肆拾玖|贰佰伍拾|贰佰伍拾壹|贰佰伍拾贰|贰佰伍拾叁|贰佰伍拾肆|贰佰伍拾伍|贰佰伍拾陆|贰佰伍拾柒|贰佰伍拾捌|贰佰伍拾玖|贰佰陆拾|贰佰陆拾壹|贰佰陆拾贰|贰佰陆拾叁|贰佰陆拾肆|贰佰陆拾伍|贰佰陆拾陆|贰佰陆拾柒|贰佰陆拾捌|贰佰陆拾玖|贰佰柒拾|贰佰柒拾壹|贰佰柒拾贰|贰佰柒拾叁|贰佰柒拾肆|贰佰柒拾伍|贰佰柒拾陆|贰佰柒拾柒|贰佰柒拾捌|贰佰柒拾玖|贰佰捌拾|贰佰捌拾壹|贰佰捌拾贰|贰佰捌拾叁|贰佰捌拾肆|贰佰捌拾伍|贰佰捌拾陆|贰佰捌拾柒|贰佰捌拾捌|贰佰捌拾玖|贰佰玖拾|贰佰玖拾壹|贰佰玖拾贰|贰佰玖拾叁|贰佰玖拾肆|贰佰玖拾伍|贰佰玖拾陆|贰佰玖拾柒|贰佰玖拾捌|贰佰玖拾玖|'
+    '叁佰|叁佰零壹|叁佰零贰|叁佰零叁|叁佰零肆|叁佰零伍|叁佰零陆|叁佰零柒|叁佰零捌|叁佰零玖|叁佰壹拾|叁佰壹拾壹|叁佰壹拾贰|叁佰壹拾叁|叁佰壹拾肆|叁佰壹拾伍|叁佰壹拾陆|叁佰壹拾柒|叁佰壹拾捌|叁佰壹拾玖|叁佰贰拾|叁佰贰拾壹|叁佰贰拾贰|叁佰贰拾叁|叁佰贰拾肆|叁佰贰拾伍|叁佰贰拾陆|叁佰贰拾柒|叁佰贰拾捌|叁佰贰拾玖|叁佰叁拾|叁佰叁拾壹|叁佰叁拾贰|叁佰叁拾叁|叁佰叁拾肆|叁佰叁拾伍|叁佰叁拾陆|叁佰叁拾柒|叁佰叁拾捌|叁佰叁拾玖|叁佰肆拾|叁佰肆拾壹|叁佰肆拾贰|叁佰肆拾叁|叁佰肆拾肆|叁佰肆拾伍|叁佰肆拾陆|叁佰肆拾柒|叁佰肆拾捌|叁佰肆拾玖|叁佰伍拾|叁佰伍拾壹|叁佰伍拾贰|叁佰伍拾叁|叁佰伍拾肆|叁佰伍拾伍|叁佰伍拾陆|叁佰伍拾柒|叁佰伍拾捌|叁佰伍拾玖|叁佰陆拾|叁佰陆拾壹|叁佰陆拾贰|叁佰陆拾叁|叁佰陆拾肆|叁佰陆拾伍|叁佰陆拾陆|叁佰陆拾柒|叁佰陆拾捌|叁佰陆拾玖|叁佰柒拾|叁佰柒拾壹|叁佰柒拾贰|叁佰柒拾叁|叁佰柒拾肆|叁佰柒拾伍|叁佰柒拾陆|叁佰柒拾柒|叁佰柒拾捌|叁佰柒拾玖|叁佰捌拾|叁佰捌拾壹|叁佰捌拾贰|叁佰捌拾叁|叁佰捌拾肆|叁佰捌拾伍|叁佰捌拾陆|叁佰捌拾柒|叁佰捌拾捌|叁佰捌拾玖|叁佰玖拾|叁佰玖拾壹|叁佰玖拾贰|叁佰玖拾叁|叁佰玖拾肆|叁佰玖拾伍|叁佰玖拾陆|叁佰玖拾柒|叁佰玖拾捌|叁佰玖拾玖|'
+    '肆佰|肆佰零壹|肆佰零贰|肆佰零叁|肆佰零肆|肆佰零伍|肆佰零陆|肆佰零柒|肆佰零捌|肆佰零玖|肆佰壹拾|肆佰壹拾壹|肆佰壹拾贰|肆佰壹拾叁|肆佰壹拾肆|肆佰壹拾伍|肆佰壹拾陆|肆佰壹拾柒|肆佰壹拾捌|肆佰壹拾玖|肆佰贰拾|肆佰贰拾壹|肆佰贰拾贰|肆佰贰拾叁|肆佰贰拾肆|肆佰贰拾伍|肆佰贰拾陆|肆佰贰拾柒|肆佰贰拾捌|肆佰贰拾玖|肆佰叁拾|肆佰叁拾壹|肆佰叁拾贰|肆佰叁拾叁|肆佰叁拾肆|肆佰叁拾伍|肆佰叁拾陆|肆佰叁拾柒|肆佰叁拾捌|肆佰叁拾玖|肆佰肆拾|肆佰肆拾壹|肆佰肆拾贰|肆佰肆拾叁|肆佰肆拾肆|肆佰肆拾伍|肆佰肆拾陆|肆佰肆拾柒|肆佰肆拾捌|肆佰肆拾玖|肆佰伍拾|肆佰伍拾壹|肆佰伍拾贰|肆佰伍拾叁|肆佰伍拾肆|肆佰伍拾伍|肆佰伍拾陆|肆佰伍拾柒|肆佰伍拾捌|肆佰伍拾玖|肆佰陆拾|肆佰陆拾壹|肆佰陆拾贰|肆佰陆拾叁|肆佰陆拾肆|肆佰陆拾伍|肆佰陆拾陆|肆佰陆拾柒|肆佰陆拾捌|肆佰陆拾玖|肆佰柒拾|肆佰柒拾壹|肆佰柒拾贰|肆佰柒拾叁|肆佰柒拾肆|肆佰柒拾伍|肆佰柒拾陆|肆佰柒拾柒|肆佰柒拾捌|肆佰柒拾玖|肆佰捌拾|肆佰捌拾壹|肆佰捌拾贰|肆佰捌拾叁|肆佰捌拾肆|肆佰捌拾伍|肆佰捌拾陆|肆佰捌拾柒|肆佰捌拾捌|肆佰捌拾玖|肆佰玖拾|肆佰玖拾壹|肆佰玖拾贰|肆佰玖拾叁|肆佰玖拾肆|肆佰玖拾伍|肆佰玖拾陆|肆佰玖拾柒|肆佰玖拾捌|肆佰玖拾玖|'
+    '伍佰|伍佰零壹|伍佰零贰|伍佰零叁|伍佰零肆|伍佰零伍|伍佰零陆|伍佰零柒|伍佰零捌|伍佰零玖|伍佰壹拾|伍佰壹拾壹|伍佰壹拾贰|伍佰壹拾叁|伍佰壹拾肆|伍佰壹拾伍|伍佰壹拾陆|伍佰壹拾柒|伍佰壹拾捌|伍佰壹拾玖|伍佰贰拾|伍佰贰拾壹|伍佰贰拾贰|伍佰贰拾叁|伍佰贰拾肆|伍佰贰拾伍|伍佰贰拾陆|伍佰贰拾柒|伍佰贰拾捌|伍佰贰拾玖|伍佰叁拾|伍佰叁拾壹|伍佰叁拾贰|伍佰叁拾叁|伍佰叁拾肆|伍佰叁拾伍|伍佰叁拾陆|伍佰叁拾柒|伍佰叁拾捌|伍佰叁拾玖|伍佰肆拾|伍佰肆拾壹|伍佰肆拾贰|伍佰肆拾叁|伍佰肆拾肆|伍佰肆拾伍|伍佰肆拾陆|伍佰肆拾柒|伍佰肆拾捌|伍佰肆拾玖|伍佰伍拾|伍佰伍拾壹|伍佰伍拾贰|伍佰伍拾叁|伍佰伍拾肆|伍佰伍拾伍|伍佰伍拾陆|伍佰伍拾柒|伍佰伍拾捌|伍佰伍拾玖|伍佰陆拾|伍佰陆拾壹|伍佰陆拾贰|伍佰陆拾叁|伍佰陆拾肆|伍佰陆拾伍|伍佰陆拾陆|伍佰陆拾柒|伍佰陆拾捌|伍佰陆拾玖|伍佰柒拾|伍佰柒拾壹|伍佰柒拾贰|伍佰柒拾叁|伍佰柒拾肆|伍佰柒拾伍|伍佰柒拾陆|伍佰柒拾柒|伍佰柒拾捌|伍佰柒拾玖|伍佰捌拾|伍佰捌拾壹|伍佰捌拾贰|伍佰捌拾叁|伍佰捌拾肆|伍佰捌拾伍|伍佰捌拾陆|伍佰捌拾柒|伍佰捌拾捌|伍佰捌拾玖|伍佰玖拾|伍佰玖拾壹|伍佰玖拾贰|伍佰玖拾叁|伍佰玖拾肆|伍佰玖拾伍|伍佰玖拾陆|伍佰玖拾柒|伍佰玖拾捌|伍佰玖拾玖|'
+    '陆佰|陆佰零壹|陆佰零贰|陆佰零叁|陆佰零肆|陆佰零伍|陆佰零陆|陆佰零柒|陆佰零捌|陆佰零玖|陆佰壹拾|陆佰壹拾壹|陆佰壹拾贰|陆佰壹拾叁|陆佰壹拾肆|陆佰壹拾伍|陆佰壹拾陆|陆佰壹拾柒|陆佰壹拾捌|陆佰壹拾玖|陆佰贰拾|陆佰贰拾壹|陆佰贰拾贰|陆佰贰拾叁|陆佰贰拾肆|陆佰贰拾伍|陆佰贰拾陆|陆佰贰拾柒|陆佰贰拾捌|陆佰贰拾玖|陆佰叁拾|陆佰叁拾壹|陆佰叁拾贰|陆佰叁拾叁|陆佰叁拾肆|陆佰叁拾伍|陆佰叁拾陆|陆佰叁拾柒|陆佰叁拾捌|陆佰叁拾玖|陆佰肆拾|陆佰肆拾壹|陆佰肆拾贰|陆佰肆拾叁|陆佰肆拾肆|陆佰肆拾伍|陆佰肆拾陆|陆佰肆拾柒|陆佰肆拾捌|陆佰肆拾玖|陆佰伍拾|陆佰伍拾壹|陆佰伍拾贰|陆佰伍拾叁|陆佰伍拾肆|陆佰伍拾伍|陆佰伍拾陆|陆佰伍拾柒|陆佰伍拾捌|陆佰伍拾玖|陆佰陆拾|陆佰陆拾壹|陆佰陆拾贰|陆佰陆拾叁|陆佰陆拾肆|陆佰陆拾伍|陆佰陆拾陆|陆佰陆拾柒|陆佰陆拾捌|陆佰陆拾玖|陆佰柒拾|陆佰柒拾壹|陆佰柒拾贰|陆佰柒拾叁|陆佰柒拾肆|陆佰柒拾伍|陆佰柒拾陆|陆佰柒拾柒|陆佰柒拾捌|陆佰柒拾玖|陆佰捌拾|陆佰捌拾壹|陆佰捌拾贰|陆佰捌拾叁|陆佰捌拾肆|陆佰捌拾伍|陆佰捌拾陆|陆佰捌拾柒|陆佰捌拾捌|陆佰捌拾玖|陆佰玖拾|陆佰玖拾壹|陆佰玖拾贰|陆佰玖拾叁|陆佰玖拾肆|陆佰玖拾伍|陆佰玖拾陆|陆佰玖拾柒|陆佰玖拾捌|陆佰玖拾玖|'
+    '柒佰|柒佰零壹|柒佰零贰|柒佰零叁|柒佰零肆|柒佰零伍|柒佰零陆|柒佰零柒|柒佰零捌|柒佰零玖|柒佰壹拾|柒佰壹拾壹|柒佰壹拾贰|柒佰壹拾叁|柒佰壹拾肆|柒佰壹拾伍|柒佰壹拾陆|柒佰壹拾柒|柒佰壹拾捌|柒佰壹拾玖|柒佰贰拾|柒佰贰拾壹|柒佰贰拾贰|柒佰贰拾叁|柒佰贰拾肆|柒佰贰拾伍|柒佰贰拾陆|柒佰贰拾柒|柒佰贰拾捌|柒佰贰拾玖|柒佰叁拾|柒佰叁拾壹|柒佰叁拾贰|柒佰叁拾叁|柒佰叁拾肆|柒佰叁拾伍|柒佰叁拾陆|柒佰叁拾柒|柒佰叁拾捌|柒佰叁拾玖|柒佰肆拾|柒佰肆拾壹|柒佰肆拾贰|柒佰肆拾叁|柒佰肆拾肆|柒佰肆拾伍|柒佰肆拾陆|柒佰肆拾柒|柒佰肆拾捌|柒佰肆拾玖|柒佰伍拾|柒佰伍拾壹|柒佰伍拾贰|柒佰伍拾叁|柒佰伍拾肆|柒佰伍拾伍|柒佰伍拾陆|柒佰伍拾柒|柒佰伍拾捌|柒佰伍拾玖|柒佰陆拾|柒佰陆拾壹|柒佰陆拾贰|柒佰陆拾叁|柒佰陆拾肆|柒佰陆拾伍|柒佰陆拾陆|柒佰陆拾柒|柒佰陆拾捌|柒佰陆拾玖|柒佰柒拾|柒佰柒拾壹|柒佰柒拾贰|柒佰柒拾叁|柒佰柒拾肆|柒佰柒拾伍|柒佰柒拾陆|柒佰柒拾柒|柒佰柒拾捌|柒佰柒拾玖|柒佰捌拾|柒佰捌拾壹|柒佰捌拾贰|柒佰捌拾叁|柒佰捌拾肆|柒佰捌拾伍|柒佰捌拾陆|柒佰捌拾柒|柒佰捌拾捌|柒佰捌拾玖|柒佰玖拾|柒佰玖拾壹|柒佰玖拾贰|柒佰玖拾叁|柒佰玖拾肆|柒佰玖拾伍|柒佰玖拾陆|柒佰玖拾柒|柒佰玖拾捌|柒佰玖拾玖|'
+    '捌佰|捌佰零壹|捌佰零贰|捌佰零叁|捌佰零肆|捌佰零伍|捌佰零陆|捌佰零柒|捌佰零捌|捌佰零玖|捌佰壹拾|捌佰壹拾壹|捌佰壹拾贰|捌佰壹拾叁|捌佰壹拾肆|捌佰壹拾伍|捌佰壹拾陆|捌佰壹拾柒|捌佰壹拾捌|捌佰壹拾玖|捌佰贰拾|捌佰贰拾壹|捌佰贰拾贰|捌佰贰拾叁|捌佰贰拾肆|捌佰贰拾伍|捌佰贰拾陆|捌佰贰拾柒|捌佰贰拾捌|捌佰贰拾玖|捌佰叁拾|捌佰叁拾壹|捌佰叁拾贰|捌佰叁拾叁|捌佰叁拾肆|捌佰叁拾伍|捌佰叁拾陆|捌佰叁拾柒|捌佰叁拾捌|捌佰叁拾玖|捌佰肆拾|捌佰肆拾壹|捌佰肆拾贰|捌佰肆拾叁|捌佰肆拾肆|捌佰肆拾伍|捌佰肆拾陆|捌佰肆拾柒|捌佰肆拾捌|捌佰肆拾玖|捌佰伍拾|捌佰伍拾壹|捌佰伍拾贰|捌佰伍拾叁|捌佰伍拾肆|捌佰伍拾伍|捌佰伍拾陆|捌佰伍拾柒|捌佰伍拾捌|捌佰伍拾玖|捌佰陆拾|捌佰陆拾壹|捌佰陆拾贰|捌佰陆拾叁|捌佰陆拾肆|捌佰陆拾伍|捌佰陆拾陆|捌佰陆拾柒|捌佰陆拾捌|捌佰陆拾玖|捌佰柒拾|捌佰柒拾壹|捌佰柒拾贰|捌佰柒拾叁|捌佰柒拾肆|捌佰柒拾伍|捌佰柒拾陆|捌佰柒拾柒|捌佰柒拾捌|捌佰柒拾玖|捌佰捌拾|捌佰捌拾壹|捌佰捌拾贰|捌佰捌拾叁|捌佰捌拾肆|捌佰捌拾伍|捌佰捌拾陆|捌佰捌拾柒|捌佰捌拾捌|捌佰捌拾玖|捌佰玖拾|捌佰玖拾壹|捌佰玖拾贰|捌佰玖拾叁|捌佰玖拾肆|捌佰玖拾伍|捌佰玖拾陆|捌佰玖拾柒|捌佰玖拾捌|捌佰玖拾玖|'
+    '玖佰|玖佰零壹|玖佰零贰|玖佰零叁|玖佰零肆|玖佰零伍|玖佰零陆|玖佰零柒|玖佰零捌|玖佰零玖|玖佰壹拾|玖佰壹拾壹|玖佰壹拾贰|玖佰壹拾叁|玖佰壹拾肆|玖佰壹拾伍|玖佰壹拾陆|玖佰壹拾柒|玖佰壹拾捌|玖佰壹拾玖|玖佰贰拾|玖佰贰拾壹|玖佰贰拾贰|玖佰贰拾叁|玖佰贰拾肆|玖佰贰拾伍|玖佰贰拾陆|玖佰贰拾柒|玖佰贰拾捌|玖佰贰拾玖|玖佰叁拾|玖佰叁拾壹|玖佰叁拾贰|玖佰叁拾叁|玖佰叁拾肆|玖佰叁拾伍|玖佰叁拾陆|玖佰叁拾柒|玖佰叁拾捌|玖佰叁拾玖|玖佰肆拾|玖佰肆拾壹|玖佰肆拾贰|玖佰肆拾叁|玖佰肆拾肆|玖佰肆拾伍|玖佰肆拾陆|玖佰肆拾柒|玖佰肆拾捌|玖佰肆拾玖|玖佰伍拾|玖佰伍拾壹|玖佰伍拾贰|玖佰伍拾叁|玖佰伍拾肆|玖佰伍拾伍|玖佰伍拾陆|玖佰伍拾柒|玖佰伍拾捌|玖佰伍拾玖|玖佰陆拾|玖佰陆拾壹|玖佰陆拾贰|玖佰陆拾叁|玖佰陆拾肆|玖佰陆拾伍|玖佰陆拾陆|玖佰陆拾柒|玖佰陆拾捌|玖佰陆拾玖|玖佰柒拾|玖佰柒拾壹|玖佰柒拾贰|玖佰柒拾叁|玖佰柒拾肆|玖佰柒拾伍|玖佰柒拾陆|玖佰柒拾柒|玖佰柒拾捌|玖佰柒拾玖|玖佰捌拾|玖佰捌拾壹|玖佰捌拾贰|玖佰捌拾叁|玖佰捌拾肆|玖佰捌拾伍|玖佰捌拾陆|玖佰捌拾柒|玖佰捌拾捌|玖佰捌拾玖|玖佰玖拾|玖佰玖拾壹|玖佰玖拾贰|玖佰玖拾叁|玖佰玖拾肆|玖佰玖拾伍|玖佰玖拾陆|玖佰玖拾柒|玖佰玖拾捌|玖佰玖拾玖|'
+    '壹仟|壹仟零壹|壹仟零贰|壹仟零叁|壹仟零肆|壹仟零伍|壹仟零陆|壹仟零柒|壹仟零捌|壹仟零玖|壹仟零壹拾|壹仟零壹拾壹|壹仟零壹拾贰|壹仟零壹拾叁|壹仟零壹拾肆|壹仟零壹拾伍|壹仟零壹拾陆|壹仟零壹拾柒|壹仟零壹拾捌|壹仟零壹拾玖|壹仟零贰拾|壹仟零贰拾壹|壹仟零贰拾贰|壹仟零贰拾叁|壹仟零贰拾肆|壹仟零贰拾伍|壹仟零贰拾陆|壹仟零贰拾柒|壹仟零贰拾捌|壹仟零贰拾玖|壹仟零叁拾|壹仟零叁拾壹|壹仟零叁拾贰|壹仟零叁拾叁|壹仟零叁拾肆|壹仟零叁拾伍|壹仟零叁拾陆|壹仟零叁拾柒|壹仟零叁拾捌|壹仟零叁拾玖|壹仟零肆拾|壹仟零肆拾壹|壹仟零肆拾贰|壹仟零肆拾叁|壹仟零肆拾肆|壹仟零肆拾伍|壹仟零肆拾陆|壹仟零肆拾柒|壹仟零肆拾捌|壹仟零肆拾玖|壹仟零伍拾|壹仟零伍拾壹|壹仟零伍拾贰|壹仟零伍拾叁|壹仟零伍拾肆|壹仟零伍拾伍|壹仟零伍拾陆|壹仟零伍拾柒|壹仟零伍拾捌|壹仟零伍拾玖|壹仟零陆拾|壹仟零陆拾壹|壹仟零陆拾贰|壹仟零陆拾叁|壹仟零陆拾肆|壹仟零陆拾伍|壹仟零陆拾陆|壹仟零陆拾柒|壹仟零陆拾捌|壹仟零陆拾玖|壹仟零柒拾|壹仟零柒拾壹|壹仟零柒拾贰|壹仟零柒拾叁|壹仟零柒拾肆|壹仟零柒拾伍|壹仟零柒拾陆|壹仟零柒拾柒|壹仟零柒拾捌|壹仟零柒拾玖|壹仟零捌拾|壹仟零捌拾壹|壹仟零捌拾贰|壹仟零捌拾叁|壹仟零捌拾肆|壹仟零捌拾伍|壹仟零捌拾陆|壹仟零捌拾柒|壹仟零捌拾捌|壹仟零捌拾玖|壹仟零玖拾|壹仟零玖拾壹|壹仟零玖拾贰|壹仟零玖拾叁|壹仟零玖拾肆|壹仟零玖拾伍|壹仟零玖拾陆|壹仟零玖拾柒|壹仟零玖拾捌|壹仟零玖拾玖|'
+    '壹仟壹佰|壹仟壹佰零壹|壹仟壹佰零贰|壹仟壹佰零叁|壹仟壹佰零肆|壹仟壹佰零伍|壹仟壹佰零陆|壹仟壹佰零柒|壹仟壹佰零捌|壹仟壹佰零玖|壹仟壹佰壹拾|壹仟壹佰壹拾壹|壹仟壹佰壹拾贰|壹仟壹佰壹拾叁|壹仟壹佰壹拾肆|壹仟壹佰壹拾伍|壹仟壹佰壹拾陆|壹仟壹佰壹拾柒|壹仟壹佰壹拾捌|壹仟壹佰壹拾玖|壹仟壹佰贰拾|壹仟壹佰贰拾壹|壹仟壹佰贰拾贰|壹仟壹佰贰拾叁|壹仟壹佰贰拾肆|壹仟壹佰贰拾伍|壹仟壹佰贰拾陆|壹仟壹佰贰拾柒|壹仟壹佰贰拾捌|壹仟壹佰贰拾玖|壹仟壹佰叁拾|壹仟壹佰叁拾壹|壹仟壹佰叁拾贰|壹仟壹佰叁拾叁|壹仟壹佰叁拾肆|壹仟壹佰叁拾伍|壹仟壹佰叁拾陆|壹仟壹佰叁拾柒|壹仟壹佰叁拾捌|壹仟壹佰叁拾玖|壹仟壹佰肆拾|壹仟壹佰肆拾壹|壹仟壹佰肆拾贰|壹仟壹佰肆拾叁|壹仟壹佰肆拾肆|壹仟壹佰肆拾伍|壹仟壹佰肆拾陆|壹仟壹佰肆拾柒|壹仟壹佰肆拾捌|壹仟壹佰肆拾玖|壹仟壹佰伍拾|壹仟壹佰伍拾壹|壹仟壹佰伍拾贰|壹仟壹佰伍拾叁|壹仟壹佰伍拾肆|壹仟壹佰伍拾伍|壹仟壹佰伍拾陆|壹仟壹佰伍拾柒|壹仟壹佰伍拾捌|壹仟壹佰伍拾玖|壹仟壹佰陆拾|壹仟壹佰陆拾壹|壹仟壹佰陆拾贰|壹仟壹佰陆拾叁|壹仟壹佰陆拾肆|壹仟壹佰陆拾伍|壹仟壹佰陆拾陆|壹仟壹佰陆拾柒|壹仟壹佰陆拾捌|壹仟壹佰陆拾玖|壹仟壹佰柒拾|壹仟壹佰柒拾壹|壹仟壹佰柒拾贰|壹仟壹佰柒拾叁|壹仟壹佰柒拾肆|壹仟壹佰柒拾伍|壹仟壹佰柒拾陆|壹仟壹佰柒拾柒|壹仟壹佰柒拾捌|壹仟壹佰柒拾玖|壹仟壹佰捌拾|壹仟壹佰捌拾壹|壹仟壹佰捌拾贰|壹仟壹佰捌拾叁|壹仟壹佰捌拾肆|壹仟壹佰捌拾伍|壹仟壹佰捌拾陆|壹仟壹佰捌拾柒|壹仟壹佰捌拾捌|壹仟壹佰捌拾玖|壹仟壹佰玖拾|壹仟壹佰玖拾壹|壹仟壹佰玖拾贰|壹仟壹佰玖拾叁|壹仟壹佰玖拾肆|壹仟壹佰玖拾伍|壹仟壹佰玖拾陆|壹仟壹佰玖拾柒|壹仟壹佰玖拾捌|壹仟壹佰玖拾玖|'
+    '壹仟贰佰|壹仟贰佰零壹|壹仟贰佰零贰|壹仟贰佰零叁|壹仟贰佰零肆|壹仟贰佰零伍|壹仟贰佰零陆|壹仟贰佰零柒|壹仟贰佰零捌|壹仟贰佰零玖|壹仟贰佰壹拾|壹仟贰佰壹拾壹|壹仟贰佰壹拾贰|壹仟贰佰壹拾叁|壹仟贰佰壹拾肆|壹仟贰佰壹拾伍|壹仟贰佰壹拾陆|壹仟贰佰壹拾柒|壹仟贰佰壹拾捌|壹仟贰佰壹拾玖|壹仟贰佰贰拾|壹仟贰佰贰拾壹|壹仟贰佰贰拾贰|壹仟贰佰贰拾叁|壹仟贰佰贰拾肆|壹仟贰佰贰拾伍|壹仟贰佰贰拾陆|壹仟贰佰贰拾柒|壹仟贰佰贰拾捌|壹仟贰佰贰拾玖|壹仟贰佰叁拾|壹仟贰佰叁拾壹|壹仟贰佰叁拾贰|壹仟贰佰叁拾叁|壹仟贰佰叁拾肆|壹仟贰佰叁拾伍|壹仟贰佰叁拾陆|壹仟贰佰叁拾柒|壹仟贰佰叁拾捌|壹仟贰佰叁拾玖|壹仟贰佰肆拾|壹仟贰佰肆拾壹|壹仟贰佰肆拾贰|壹仟贰佰肆拾叁|壹仟贰佰肆拾肆|壹仟贰佰肆拾伍|壹仟贰佰肆拾陆|壹仟贰佰肆拾柒|壹仟贰佰肆拾捌|壹仟贰佰肆拾玖|壹仟贰佰伍拾|壹仟贰佰伍拾壹|壹仟贰佰伍拾贰|壹仟贰佰伍拾叁|壹仟贰佰伍拾肆|壹仟贰佰伍拾伍|壹仟贰佰伍拾陆|壹仟贰佰伍拾柒|壹仟贰佰伍拾捌|壹仟贰佰伍拾玖|壹仟贰佰陆拾|壹仟贰佰陆拾壹|壹仟贰佰陆拾贰|壹仟贰佰陆拾叁|壹仟贰佰陆拾肆|壹仟贰佰陆拾伍|壹仟贰佰陆拾陆|壹仟贰佰陆拾柒|壹仟贰佰陆拾捌|壹仟贰佰陆拾玖|壹仟贰佰柒拾|壹仟贰佰柒拾壹|壹仟贰佰柒拾贰|壹仟贰佰柒拾叁|壹仟贰佰柒拾肆|壹仟贰佰柒拾伍|壹仟贰佰柒拾陆|壹仟贰佰柒拾柒|壹仟贰佰柒拾捌|壹仟贰佰柒拾玖|壹仟贰佰捌拾|壹仟贰佰捌拾壹|壹仟贰佰捌拾贰|壹仟贰佰捌拾叁|壹仟贰佰捌拾肆|壹仟贰佰捌拾伍|壹仟贰佰捌拾陆|壹仟贰佰捌拾柒|壹仟贰佰捌拾捌|壹仟贰佰捌拾玖|壹仟贰佰玖拾|壹仟贰佰玖拾壹|壹仟贰佰玖拾贰|壹仟贰佰玖拾叁|壹仟贰佰玖拾肆|壹仟贰佰玖拾伍|壹仟贰佰玖拾陆|壹仟贰佰玖拾柒|壹仟贰佰玖拾捌|壹仟贰佰玖拾玖|'
+    '壹仟叁佰|壹仟叁佰零壹|壹仟叁佰零贰|壹仟叁佰零叁|壹仟叁佰零肆|壹仟叁佰零伍|壹仟叁佰零陆|壹仟叁佰零柒|壹仟叁佰零捌|壹仟叁佰零玖|壹仟叁佰壹拾|壹仟叁佰壹拾壹|壹仟叁佰壹拾贰|壹仟叁佰壹拾叁|壹仟叁佰壹拾肆|壹仟叁佰壹拾伍|壹仟叁佰壹拾陆|壹仟叁佰壹拾柒|壹仟叁佰壹拾捌|壹仟叁佰壹拾玖|壹仟叁佰贰拾|壹仟叁佰贰拾壹|壹仟叁佰贰拾贰|壹仟叁佰贰拾叁|壹仟叁佰贰拾肆|壹仟叁佰贰拾伍|壹仟叁佰贰拾陆|壹仟叁佰贰拾柒|壹仟叁佰贰拾捌|壹仟叁佰贰拾玖|壹仟叁佰叁拾|壹仟叁佰叁拾壹|壹仟叁佰叁拾贰|壹仟叁佰叁拾叁|壹仟叁佰叁拾肆|壹仟叁佰叁拾伍|壹仟叁佰叁拾陆|壹仟叁佰叁拾柒|壹仟叁佰叁拾捌|壹仟叁佰叁拾玖|壹仟叁佰肆拾|壹仟叁佰肆拾壹|壹仟叁佰肆拾贰|壹仟叁佰肆拾叁|壹仟叁佰肆拾肆|壹仟叁佰肆拾伍|壹仟叁佰肆拾陆|壹仟叁佰肆拾柒|壹仟叁佰肆拾捌|壹仟叁佰肆拾玖|壹仟叁佰伍拾|壹仟叁佰伍拾壹|壹仟叁佰伍拾贰|壹仟叁佰伍拾叁|壹仟叁佰伍拾肆|壹仟叁佰伍拾伍|壹仟叁佰伍拾陆|壹仟叁佰伍拾柒|壹仟叁佰伍拾捌|壹仟叁佰伍拾玖|壹仟叁佰陆拾|壹仟叁佰陆拾壹|壹仟叁佰陆拾贰|壹仟叁佰陆拾叁|壹仟叁佰陆拾肆|壹仟叁佰陆拾伍|壹仟叁佰陆拾陆|壹仟叁佰陆拾柒|壹仟叁佰陆拾捌|壹仟叁佰陆拾玖|壹仟叁佰柒拾|壹仟叁佰柒拾壹|壹仟叁佰柒拾贰|壹仟叁佰柒拾叁|壹仟叁佰柒拾肆|壹仟叁佰柒拾伍|壹仟叁佰柒拾陆|壹仟叁佰柒拾柒|壹仟叁佰柒拾捌|壹仟叁佰柒拾玖|壹仟叁佰捌拾|壹仟叁佰捌拾壹|壹仟叁佰捌拾贰|壹仟叁佰捌拾叁|壹仟叁佰捌拾肆|壹仟叁佰捌拾伍|壹仟叁佰捌拾陆|壹仟叁佰捌拾柒|壹仟叁佰捌拾捌|壹仟叁佰捌拾玖|壹仟叁佰玖拾|壹仟叁佰玖拾壹|壹仟叁佰玖拾贰|壹仟叁佰玖拾叁|壹仟叁佰玖拾肆|壹仟叁佰玖拾伍|壹仟叁佰玖拾陆|壹仟叁佰玖拾柒|壹仟叁佰玖拾捌|壹仟叁佰玖拾玖|'
+    '壹仟肆佰|壹仟肆佰零壹|壹仟肆佰零贰|壹仟肆佰零叁|壹仟肆佰零肆|壹仟肆佰零伍|壹仟肆佰零陆|壹仟肆佰零柒|壹仟肆佰零捌|壹仟肆佰零玖|壹仟肆佰壹拾|壹仟肆佰壹拾壹|壹仟肆佰壹拾贰|壹仟肆佰壹拾叁|壹仟肆佰壹拾肆|壹仟肆佰壹拾伍|壹仟肆佰壹拾陆|壹仟肆佰壹拾柒|壹仟肆佰壹拾捌|壹仟肆佰壹拾玖|壹仟肆佰贰拾|壹仟肆佰贰拾壹|壹仟肆佰贰拾贰|壹仟肆佰贰拾叁|壹仟肆佰贰拾肆|壹仟肆佰贰拾伍|壹仟肆佰贰拾陆|壹仟肆佰贰拾柒|壹仟肆佰贰拾捌|壹仟肆佰贰拾玖|壹仟肆佰叁拾|壹仟肆佰叁拾壹|壹仟肆佰叁拾贰|壹仟肆佰叁拾叁|壹仟肆佰叁拾肆|壹仟肆佰叁拾伍|壹仟肆佰叁拾陆|壹仟肆佰叁拾柒|壹仟肆佰叁拾捌|壹仟肆佰叁拾玖|壹仟肆佰肆拾|壹仟肆佰肆拾壹|壹仟肆佰肆拾贰|壹仟肆佰肆拾叁|壹仟肆佰肆拾肆|壹仟肆佰肆拾伍|壹仟肆佰肆拾陆|壹仟肆佰肆拾柒|壹仟肆佰肆拾捌|壹仟肆佰肆拾玖|壹仟肆佰伍拾|壹仟肆佰伍拾壹|壹仟肆佰伍拾贰|壹仟肆佰伍拾叁|壹仟肆佰伍拾肆|壹仟肆佰伍拾伍|壹仟肆佰伍拾陆|壹仟肆佰伍拾柒|壹仟肆佰伍拾捌|壹仟肆佰伍拾玖|壹仟肆佰陆拾|壹仟肆佰陆拾壹|壹仟肆佰陆拾贰|壹仟肆佰陆拾叁|壹仟肆佰陆拾肆|壹仟肆佰陆拾伍|壹仟肆佰陆拾陆|壹仟肆佰陆拾柒|壹仟肆佰陆拾捌|壹仟肆佰陆拾玖|壹仟肆佰柒拾|壹仟肆佰柒拾壹|壹仟肆佰柒拾贰|壹仟肆佰柒拾叁|壹仟肆佰柒拾肆|壹仟肆佰柒拾伍|壹仟肆佰柒拾陆|壹仟肆佰柒拾柒|壹仟肆佰柒拾捌|壹仟肆佰柒拾玖|壹仟肆佰捌拾|壹仟肆佰捌拾壹|壹仟肆佰捌拾贰|壹仟肆佰捌拾叁|壹仟肆佰捌拾肆|壹仟肆佰捌拾伍|壹仟肆佰捌拾陆|壹仟肆佰捌拾柒|壹仟肆佰捌拾捌|壹仟肆佰捌拾玖|壹仟肆佰玖拾|壹仟肆佰玖拾壹|壹仟肆佰玖拾贰|壹仟肆佰玖拾叁|壹仟肆佰玖拾肆|壹仟肆佰玖拾伍|壹仟肆佰玖拾陆|壹仟肆佰玖拾柒|壹仟肆佰玖拾捌|壹仟肆佰玖拾玖|'
+    '壹仟伍佰|壹仟伍佰零壹|壹仟伍佰零贰|壹仟伍佰零叁|壹仟伍佰零肆|壹仟伍佰零伍|壹仟伍佰零陆|壹仟伍佰零柒|壹仟伍佰零捌|壹仟伍佰零玖|壹仟伍佰壹拾|壹仟伍佰壹拾壹|壹仟伍佰壹拾贰|壹仟伍佰壹拾叁|壹仟伍佰壹拾肆|壹仟伍佰壹拾伍|壹仟伍佰壹拾陆|壹仟伍佰壹拾柒|壹仟伍佰壹拾捌|壹仟伍佰壹拾玖|壹仟伍佰贰拾|壹仟伍佰贰拾壹|壹仟伍佰贰拾贰|壹仟伍佰贰拾叁|壹仟伍佰贰拾肆|壹仟伍佰贰拾伍|壹仟伍佰贰拾陆|壹仟伍佰贰拾柒|壹仟伍佰贰拾捌|壹仟伍佰贰拾玖|壹仟伍佰叁拾|壹仟伍佰叁拾壹|壹仟伍佰叁拾贰|壹仟伍佰叁拾叁|壹仟伍佰叁拾肆|壹仟伍佰叁拾伍|壹仟伍佰叁拾陆|壹仟伍佰叁拾柒|壹仟伍佰叁拾捌|壹仟伍佰叁拾玖|壹仟伍佰肆拾|壹仟伍佰肆拾壹|壹仟伍佰肆拾贰|壹仟伍佰肆拾叁|壹仟伍佰肆拾肆|壹仟伍佰肆拾伍|壹仟伍佰肆拾陆|壹仟伍佰肆拾柒|壹仟伍佰肆拾捌|壹仟伍佰肆拾玖|壹仟伍佰伍拾|壹仟伍佰伍拾壹|壹仟伍佰伍拾贰|壹仟伍佰伍拾叁|壹仟伍佰伍拾肆|壹仟伍佰伍拾伍|壹仟伍佰伍拾陆|壹仟伍佰伍拾柒|壹仟伍佰伍拾捌|壹仟伍佰伍拾玖|壹仟伍佰陆拾|壹仟伍佰陆拾壹|壹仟伍佰陆拾贰|壹仟伍佰陆拾叁|壹仟伍佰陆拾肆|壹仟伍佰陆拾伍|壹仟伍佰陆拾陆|壹仟伍佰陆拾柒|壹仟伍佰陆拾捌|壹仟伍佰陆拾玖|壹仟伍佰柒拾|壹仟伍佰柒拾壹|壹仟伍佰柒拾贰|壹仟伍佰柒拾叁|壹仟伍佰柒拾肆|壹仟伍佰柒拾伍|壹仟伍佰柒拾陆|壹仟伍佰柒拾柒|壹仟伍佰柒拾捌|壹仟伍佰柒拾玖|壹仟伍佰捌拾|壹仟伍佰捌拾壹|壹仟伍佰捌拾贰|壹仟伍佰捌拾叁|壹仟伍佰捌拾肆|壹仟伍佰捌拾伍|壹仟伍佰捌拾陆|壹仟伍佰捌拾柒|壹仟伍佰捌拾捌|壹仟伍佰捌拾玖|壹仟伍佰玖拾|壹仟伍佰玖拾壹|壹仟伍佰玖拾贰|壹仟伍佰玖拾叁|壹仟伍佰玖拾肆|壹仟伍佰玖拾伍|壹仟伍佰玖拾陆|壹仟伍佰玖拾柒|壹仟伍佰玖拾捌|壹仟伍佰玖拾玖|'
+    '壹仟陆佰|壹仟陆佰零壹|壹仟陆佰零贰|壹仟陆佰零叁|壹仟陆佰零肆|壹仟陆佰零伍|壹仟陆佰零陆|壹仟陆佰零柒|壹仟陆佰零捌|壹仟陆佰零玖|壹仟陆佰壹拾|壹仟陆佰壹拾壹|壹仟陆佰壹拾贰|壹仟陆佰壹拾叁|壹仟陆佰壹拾肆|壹仟陆佰壹拾伍|壹仟陆佰壹拾陆|壹仟陆佰壹拾柒|壹仟陆佰壹拾捌|壹仟陆佰壹拾玖|壹仟陆佰贰拾|壹仟陆佰贰拾壹|壹仟陆佰贰拾贰|壹仟陆佰贰拾叁|壹仟陆佰贰拾肆|壹仟陆佰贰拾伍|壹仟陆佰贰拾陆|壹仟陆佰贰拾柒|壹仟陆佰贰拾捌|壹仟陆佰贰拾玖|壹仟陆佰叁拾|壹仟陆佰叁拾壹|壹仟陆佰叁拾贰|壹仟陆佰叁拾叁|壹仟陆佰叁拾肆|壹仟陆佰叁拾伍|壹仟陆佰叁拾陆|壹仟陆佰叁拾柒|壹仟陆佰叁拾捌|壹仟陆佰叁拾玖|壹仟陆佰肆拾|壹仟陆佰肆拾壹|壹仟陆佰肆拾贰|壹仟陆佰肆拾叁|壹仟陆佰肆拾肆|壹仟陆佰肆拾伍|壹仟陆佰肆拾陆|壹仟陆佰肆拾柒|壹仟陆佰肆拾捌|壹仟陆佰肆拾玖|壹仟陆佰伍拾|壹仟陆佰伍拾壹|壹仟陆佰伍拾贰|壹仟陆佰伍拾叁|壹仟陆佰伍拾肆|壹仟陆佰伍拾伍|壹仟陆佰伍拾陆|壹仟陆佰伍拾柒|壹仟陆佰伍拾捌|壹仟陆佰伍拾玖|壹仟陆佰陆拾|壹仟陆佰陆拾壹|壹仟陆佰陆拾贰|壹仟陆佰陆拾叁|壹仟陆佰陆拾肆|壹仟陆佰陆拾伍|壹仟陆佰陆拾陆|壹仟陆佰陆拾柒|壹仟陆佰陆拾捌|壹仟陆佰陆拾玖|壹仟陆佰柒拾|壹仟陆佰柒拾壹|壹仟陆佰柒拾贰|壹仟陆佰柒拾叁|壹仟陆佰柒拾肆|壹仟陆佰柒拾伍|壹仟陆佰柒拾陆|壹仟陆佰柒拾柒|壹仟陆佰柒拾捌|壹仟陆佰柒拾玖|壹仟陆佰捌拾|壹仟陆佰捌拾壹|壹仟陆佰捌拾贰|壹仟陆佰捌拾叁|壹仟陆佰捌拾肆|壹仟陆佰捌拾伍|壹仟陆佰捌拾陆|壹仟陆佰捌拾柒|壹仟陆佰捌拾捌|壹仟陆佰捌拾玖|壹仟陆佰玖拾|壹仟陆佰玖拾壹|壹仟陆佰玖拾贰|壹仟陆佰玖拾叁|壹仟陆佰玖拾肆|壹仟陆佰玖拾伍|壹仟陆佰玖拾陆|壹仟陆佰玖拾柒|壹仟陆佰玖拾捌|壹仟陆佰玖拾玖|'
+    '壹仟柒佰|壹仟柒佰零壹|壹仟柒佰零贰|壹仟柒佰零叁|壹仟柒佰零肆|壹仟柒佰零伍|壹仟柒佰零陆|壹仟柒佰零柒|壹仟柒佰零捌|壹仟柒佰零玖|壹仟柒佰壹拾|壹仟柒佰壹拾壹|壹仟柒佰壹拾贰|壹仟柒佰壹拾叁|壹仟柒佰壹拾肆|壹仟柒佰壹拾伍|壹仟柒佰壹拾陆|壹仟柒佰壹拾柒|壹仟柒佰壹拾捌|壹仟柒佰壹拾玖|壹仟柒佰贰拾|壹仟柒佰贰拾壹|壹仟柒佰贰拾贰|壹仟柒佰贰拾叁|壹仟柒佰贰拾肆|壹仟柒佰贰拾伍|壹仟柒佰贰拾陆|壹仟柒佰贰拾柒|壹仟柒佰贰拾捌|壹仟柒佰贰拾玖|壹仟柒佰叁拾|壹仟柒佰叁拾壹|壹仟柒佰叁拾贰|壹仟柒佰叁拾叁|壹仟柒佰叁拾肆|壹仟柒佰叁拾伍|壹仟柒佰叁拾陆|壹仟柒佰叁拾柒|壹仟柒佰叁拾捌|壹仟柒佰叁拾玖|壹仟柒佰肆拾|壹仟柒佰肆拾壹|壹仟柒佰肆拾贰|壹仟柒佰肆拾叁|壹仟柒佰肆拾肆|壹仟柒佰肆拾伍|壹仟柒佰肆拾陆|壹仟柒佰肆拾柒|壹仟柒佰肆拾捌|壹仟柒佰肆拾玖|壹仟柒佰伍拾|壹仟柒佰伍拾壹|壹仟柒佰伍拾贰|壹仟柒佰伍拾叁|壹仟柒佰伍拾肆|壹仟柒佰伍拾伍|壹仟柒佰伍拾陆|壹仟柒佰伍拾柒|壹仟柒佰伍拾捌|壹仟柒佰伍拾玖|壹仟柒佰陆拾|壹仟柒佰陆拾壹|壹仟柒佰陆拾贰|壹仟柒佰陆拾叁|壹仟柒佰陆拾肆|壹仟柒佰陆拾伍|壹仟柒佰陆拾陆|壹仟柒佰陆拾柒|壹仟柒佰陆拾捌|壹仟柒佰陆拾玖|壹仟柒佰柒拾|壹仟柒佰柒拾壹|壹仟柒佰柒拾贰|壹仟柒佰柒拾叁|壹仟柒佰柒拾肆|壹仟柒佰柒拾伍|壹仟柒佰柒拾陆|壹仟柒佰柒拾柒|壹仟柒佰柒拾捌|壹仟柒佰柒拾玖|壹仟柒佰捌拾|壹仟柒佰捌拾壹|壹仟柒佰捌拾贰|壹仟柒佰捌拾叁|壹仟柒佰捌拾肆|壹仟柒佰捌拾伍|壹仟柒佰捌拾陆|壹仟柒佰捌拾柒|壹仟柒佰捌拾捌|壹仟柒佰捌拾玖|壹仟柒佰玖拾|壹仟柒佰玖拾壹|壹仟柒佰玖拾贰|壹仟柒佰玖拾叁|壹仟柒佰玖拾肆|壹仟柒佰玖拾伍|壹仟柒佰玖拾陆|壹仟柒佰玖拾柒|壹仟柒佰玖拾捌|壹仟柒佰玖拾玖|'
+    '壹仟捌佰|壹仟捌佰零壹|壹仟捌佰零贰|壹仟捌佰零叁|壹仟捌佰零肆|壹仟捌佰零伍|壹仟捌佰零陆|壹仟捌佰零柒|壹仟捌佰零捌|壹仟捌佰零玖|壹仟捌佰壹拾|壹仟捌佰壹拾壹|壹仟捌佰壹拾贰|壹仟捌佰壹拾叁|壹仟捌佰壹拾肆|壹仟捌佰壹拾伍|壹仟捌佰壹拾陆|壹仟捌佰壹拾柒|壹仟捌佰壹拾捌|壹仟捌佰壹拾玖|壹仟捌佰贰拾|壹仟捌佰贰拾壹|壹仟捌佰贰拾贰|壹仟捌佰贰拾叁|壹仟捌佰贰拾肆|壹仟捌佰贰拾伍|壹仟捌佰贰拾陆|壹仟捌佰贰拾柒|壹仟捌佰贰拾捌|壹仟捌佰贰拾玖|壹仟捌佰叁拾|壹仟捌佰叁拾壹|壹仟捌佰叁拾贰|壹仟捌佰叁拾叁|壹仟捌佰叁拾肆|壹仟捌佰叁拾伍|壹仟捌佰叁拾陆|壹仟捌佰叁拾柒|壹仟捌佰叁拾捌|壹仟捌佰叁拾玖|壹仟捌佰肆拾|壹仟捌佰肆拾壹|壹仟捌佰肆拾贰|壹仟捌佰肆拾叁|壹仟捌佰肆拾肆|壹仟捌佰肆拾伍|壹仟捌佰肆拾陆|壹仟捌佰肆拾柒|壹仟捌佰肆拾捌|壹仟捌佰肆拾玖|壹仟捌佰伍拾|壹仟捌佰伍拾壹|壹仟捌佰伍拾贰|壹仟捌佰伍拾叁|壹仟捌佰伍拾肆|壹仟捌佰伍拾伍|壹仟捌佰伍拾陆|壹仟捌佰伍拾柒|壹仟捌佰伍拾捌|壹仟捌佰伍拾玖|壹仟捌佰陆拾|壹仟捌佰陆拾壹|壹仟捌佰陆拾贰|壹仟捌佰陆拾叁|壹仟捌佰陆拾肆|壹仟捌佰陆拾伍|壹仟捌佰陆拾陆|壹仟捌佰陆拾柒|壹仟捌佰陆拾捌|壹仟捌佰陆拾玖|壹仟捌佰柒拾|壹仟捌佰柒拾壹|壹仟捌佰柒拾贰|壹仟捌佰柒拾叁|壹仟捌佰柒拾肆|壹仟捌佰柒拾伍|壹仟捌佰柒拾陆|壹仟捌佰柒拾柒|壹仟捌佰柒拾捌|壹仟捌佰柒拾玖|壹仟捌佰捌拾|壹仟捌佰捌拾壹|壹仟捌佰捌拾贰|壹仟捌佰捌拾叁|壹仟捌佰捌拾肆|壹仟捌佰捌拾伍|壹仟捌佰捌拾陆|壹仟捌佰捌拾柒|壹仟捌佰捌拾捌|壹仟捌佰捌拾玖|壹仟捌佰玖拾|壹仟捌佰玖拾壹|壹仟捌佰玖拾贰|壹仟捌佰玖拾叁|壹仟捌佰玖拾肆|壹仟捌佰玖拾伍|壹仟捌佰玖拾陆|壹仟捌佰玖拾柒|壹仟捌佰玖拾捌|壹仟捌佰玖拾玖|'
+    '壹仟玖佰|壹仟玖佰零壹|壹仟玖佰零贰|壹仟玖佰零叁|壹仟玖佰零肆|壹仟玖佰零伍|壹仟玖佰零陆|壹仟玖佰零柒|壹仟玖佰零捌|壹仟玖佰零玖|壹仟玖佰壹拾|壹仟玖佰壹拾壹|壹仟玖佰壹拾贰|壹仟玖佰壹拾叁|壹仟玖佰壹拾肆|壹仟玖佰壹拾伍|壹仟玖佰壹拾陆|壹仟玖佰壹拾柒|壹仟玖佰壹拾捌|壹仟玖佰壹拾玖|壹仟玖佰贰拾|壹仟玖佰贰拾壹|壹仟玖佰贰拾贰|壹仟玖佰贰拾叁|壹仟玖佰贰拾肆|壹仟玖佰贰拾伍|壹仟玖佰贰拾陆|壹仟玖佰贰拾柒|壹仟玖佰贰拾捌|壹仟玖佰贰拾玖|壹仟玖佰叁拾|壹仟玖佰叁拾壹|壹仟玖佰叁拾贰|壹仟玖佰叁拾叁|壹仟玖佰叁拾肆|壹仟玖佰叁拾伍|壹仟玖佰叁拾陆|壹仟玖佰叁拾柒|壹仟玖佰叁拾捌|壹仟玖佰叁拾玖|壹仟玖佰肆拾|壹仟玖佰肆拾壹|壹仟玖佰肆拾贰|壹仟玖佰肆拾叁|壹仟玖佰肆拾肆|壹仟玖佰肆拾伍|壹仟玖佰肆拾陆|壹仟玖佰肆拾柒|壹仟玖佰肆拾捌|壹仟玖佰肆拾玖|壹仟玖佰伍拾|壹仟玖佰伍拾壹|壹仟玖佰伍拾贰|壹仟玖佰伍拾叁|壹仟玖佰伍拾肆|壹仟玖佰伍拾伍|壹仟玖佰伍拾陆|壹仟玖佰伍拾柒|壹仟玖佰伍拾捌|壹仟玖佰伍拾玖|壹仟玖佰陆拾|壹仟玖佰陆拾壹|壹仟玖佰陆拾贰|壹仟玖佰陆拾叁|壹仟玖佰陆拾肆|壹仟玖佰陆拾伍|壹仟玖佰陆拾陆|壹仟玖佰陆拾柒|壹仟玖佰陆拾捌|壹仟玖佰陆拾玖|壹仟玖佰柒拾|壹仟玖佰柒拾壹|壹仟玖佰柒拾贰|壹仟玖佰柒拾叁|壹仟玖佰柒拾肆|壹仟玖佰柒拾伍|壹仟玖佰柒拾陆|壹仟玖佰柒拾柒|壹仟玖佰柒拾捌|壹仟玖佰柒拾玖|壹仟玖佰捌拾|壹仟玖佰捌拾壹|壹仟玖佰捌拾贰|壹仟玖佰捌拾叁|壹仟玖佰捌拾肆|壹仟玖佰捌拾伍|壹仟玖佰捌拾陆|壹仟玖佰捌拾柒|壹仟玖佰捌拾捌|壹仟玖佰捌拾玖|壹仟玖佰玖拾|壹仟玖佰玖拾壹|壹仟玖佰玖拾贰|壹仟玖佰玖拾叁|壹仟玖佰玖拾肆|壹仟玖佰玖拾伍|壹仟玖佰玖拾陆|壹仟玖佰玖拾柒|壹仟玖佰玖拾捌|壹仟玖佰玖拾玖|'
+    '贰仟|贰仟零壹|贰仟零贰|贰仟零叁|贰仟零肆|贰仟零伍|贰仟零陆|贰仟零柒|贰仟零捌|贰仟零玖|贰仟零壹拾|贰仟零壹拾壹|贰仟零壹拾贰|贰仟零壹拾叁|贰仟零壹拾肆|贰仟零壹拾伍|贰仟零壹拾陆|贰仟零壹拾柒|贰仟零壹拾捌|贰仟零壹拾玖|贰仟零贰拾|贰仟零贰拾壹|贰仟零贰拾贰|贰仟零贰拾叁|贰仟零贰拾肆|贰仟零贰拾伍|贰仟零贰拾陆|贰仟零贰拾柒|贰仟零贰拾捌|贰仟零贰拾玖|贰仟零叁拾|贰仟零叁拾壹|贰仟零叁拾贰|贰仟零叁拾叁|贰仟零叁拾肆|贰仟零叁拾伍|贰仟零叁拾陆|贰仟零叁拾柒|贰仟零叁拾捌|贰仟零叁拾玖|贰仟零肆拾|贰仟零肆拾壹|贰仟零肆拾贰|贰仟零肆拾叁|贰仟零肆拾肆|贰仟零肆拾伍|贰仟零肆拾陆|贰仟零肆拾柒|贰仟零肆拾捌|贰仟零肆拾玖|贰仟零伍拾|贰仟零伍拾壹|贰仟零伍拾贰|贰仟零伍拾叁|贰仟零伍拾肆|贰仟零伍拾伍|贰仟零伍拾陆|贰仟零伍拾柒|贰仟零伍拾捌|贰仟零伍拾玖|贰仟零陆拾|贰仟零陆拾壹|贰仟零陆拾贰|贰仟零陆拾叁|贰仟零陆拾肆|贰仟零陆拾伍|贰仟零陆拾陆|贰仟零陆拾柒|贰仟零陆拾捌|贰仟零陆拾玖|贰仟零柒拾|贰仟零柒拾壹|贰仟零柒拾贰|贰仟零柒拾叁|贰仟零柒拾肆|贰仟零柒拾伍|贰仟零柒拾陆|贰仟零柒拾柒|贰仟零柒拾捌|贰仟零柒拾玖|贰仟零捌拾|贰仟零捌拾壹|贰仟零捌拾贰|贰仟零捌拾叁|贰仟零捌拾肆|贰仟零捌拾伍|贰仟零捌拾陆|贰仟零捌拾柒|贰仟零捌拾捌|贰仟零捌拾玖|贰仟零玖拾|贰仟零玖拾壹|贰仟零玖拾贰|贰仟零玖拾叁|贰仟零玖拾肆|贰仟零玖拾伍|贰仟零玖拾陆|贰仟零玖拾柒|贰仟零玖拾捌|贰仟零玖拾玖|'
+    '贰仟壹佰|贰仟壹佰零壹|贰仟壹佰零贰|贰仟壹佰零叁|贰仟壹佰零肆|贰仟壹佰零伍|贰仟壹佰零陆|贰仟壹佰零柒|贰仟壹佰零捌|贰仟壹佰零玖|贰仟壹佰壹拾|贰仟壹佰壹拾壹|贰仟壹佰壹拾贰|贰仟壹佰壹拾叁|贰仟壹佰壹拾肆|贰仟壹佰壹拾伍|贰仟壹佰壹拾陆|贰仟壹佰壹拾柒|贰仟壹佰壹拾捌|贰仟壹佰壹拾玖|贰仟壹佰贰拾|贰仟壹佰贰拾壹|贰仟壹佰贰拾贰|贰仟壹佰贰拾叁|贰仟壹佰贰拾肆|贰仟壹佰贰拾伍|贰仟壹佰贰拾陆|贰仟壹佰贰拾柒|贰仟壹佰贰拾捌|贰仟壹佰贰拾玖|贰仟壹佰叁拾|贰仟壹佰叁拾壹|贰仟壹佰叁拾贰|贰仟壹佰叁拾叁|贰仟壹佰叁拾肆|贰仟壹佰叁拾伍|贰仟壹佰叁拾陆|贰仟壹佰叁拾柒|贰仟壹佰叁拾捌|贰仟壹佰叁拾玖|贰仟壹佰肆拾|贰仟壹佰肆拾壹|贰仟壹佰肆拾贰|贰仟壹佰肆拾叁|贰仟壹佰肆拾肆|贰仟壹佰肆拾伍|贰仟壹佰肆拾陆|贰仟壹佰肆拾柒|贰仟壹佰肆拾捌|贰仟壹佰肆拾玖|贰仟壹佰伍拾|贰仟壹佰伍拾壹|贰仟壹佰伍拾贰|贰仟壹佰伍拾叁|贰仟壹佰伍拾肆|贰仟壹佰伍拾伍|贰仟壹佰伍拾陆|贰仟壹佰伍拾柒|贰仟壹佰伍拾捌|贰仟壹佰伍拾玖|贰仟壹佰陆拾|贰仟壹佰陆拾壹|贰仟壹佰陆拾贰|贰仟壹佰陆拾叁|贰仟壹佰陆拾肆|贰仟壹佰陆拾伍|贰仟壹佰陆拾陆|贰仟壹佰陆拾柒|贰仟壹佰陆拾捌|贰仟壹佰陆拾玖|贰仟壹佰柒拾|贰仟壹佰柒拾壹|贰仟壹佰柒拾贰|贰仟壹佰柒拾叁|贰仟壹佰柒拾肆|贰仟壹佰柒拾伍|贰仟壹佰柒拾陆|贰仟壹佰柒拾柒|贰仟壹佰柒拾捌|贰仟壹佰柒拾玖|贰仟壹佰捌拾|贰仟壹佰捌拾壹|贰仟壹佰捌拾贰|贰仟壹佰捌拾叁|贰仟壹佰捌拾肆|贰仟壹佰捌拾伍|贰仟壹佰捌拾陆|贰仟壹佰捌拾柒|贰仟壹佰捌拾捌|贰仟壹佰捌拾玖|贰仟壹佰玖拾|贰仟壹佰玖拾壹|贰仟壹佰玖拾贰|贰仟壹佰玖拾叁|贰仟壹佰玖拾肆|贰仟壹佰玖拾伍|贰仟壹佰玖拾陆|贰仟壹佰玖拾柒|贰仟壹佰玖拾捌|贰仟壹佰玖拾玖|'
+    '贰仟贰佰|贰仟贰佰零壹|贰仟贰佰零贰|贰仟贰佰零叁|贰仟贰佰零肆|贰仟贰佰零伍|贰仟贰佰零陆|贰仟贰佰零柒|贰仟贰佰零捌|贰仟贰佰零玖|贰仟贰佰壹拾|贰仟贰佰壹拾壹|贰仟贰佰壹拾贰|贰仟贰佰壹拾叁|贰仟贰佰壹拾肆|贰仟贰佰壹拾伍|贰仟贰佰壹拾陆|贰仟贰佰壹拾柒|贰仟贰佰壹拾捌|贰仟贰佰壹拾玖|贰仟贰佰贰拾|贰仟贰佰贰拾壹|贰仟贰佰贰拾贰|贰仟贰佰贰拾叁|贰仟贰佰贰拾肆|贰仟贰佰贰拾伍|贰仟贰佰贰拾陆|贰仟贰佰贰拾柒|贰仟贰佰贰拾捌|贰仟贰佰贰拾玖|贰仟贰佰叁拾|贰仟贰佰叁拾壹|贰仟贰佰叁拾贰|贰仟贰佰叁拾叁|贰仟贰佰叁拾肆|贰仟贰佰叁拾伍|贰仟贰佰叁拾陆|贰仟贰佰叁拾柒|贰仟贰佰叁拾捌|贰仟贰佰叁拾玖|贰仟贰佰肆拾|贰仟贰佰肆拾壹|贰仟贰佰肆拾贰|贰仟贰佰肆拾叁|贰仟贰佰肆拾肆|贰仟贰佰肆拾伍|贰仟贰佰肆拾陆|贰仟贰佰肆拾柒|贰仟贰佰肆拾捌|贰仟贰佰肆拾玖|贰仟贰佰伍拾|贰仟贰佰伍拾壹|贰仟贰佰伍拾贰|贰仟贰佰伍拾叁|贰仟贰佰伍拾肆|贰仟贰佰伍拾伍|贰仟贰佰伍拾陆|贰仟贰佰伍拾柒|贰仟贰佰伍拾捌|贰仟贰佰伍拾玖|贰仟贰佰陆拾|贰仟贰佰陆拾壹|贰仟贰佰陆拾贰|贰仟贰佰陆拾叁|贰仟贰佰陆拾肆|贰仟贰佰陆拾伍|贰仟贰佰陆拾陆|贰仟贰佰陆拾柒|贰仟贰佰陆拾捌|贰仟贰佰陆拾玖|贰仟贰佰柒拾|贰仟贰佰柒拾壹|贰仟贰佰柒拾贰|贰仟贰佰柒拾叁|贰仟贰佰柒拾肆|贰仟贰佰柒拾伍|贰仟贰佰柒拾陆|贰仟贰佰柒拾柒|贰仟贰佰柒拾捌|贰仟贰佰柒拾玖|贰仟贰佰捌拾|贰仟贰佰捌拾壹|贰仟贰佰捌拾贰|贰仟贰佰捌拾叁|贰仟贰佰捌拾肆|贰仟贰佰捌拾伍|贰仟贰佰捌拾陆|贰仟贰佰捌拾柒|贰仟贰佰捌拾捌|贰仟贰佰捌拾玖|贰仟贰佰玖拾|贰仟贰佰玖拾壹|贰仟贰佰玖拾贰|贰仟贰佰玖拾叁|贰仟贰佰玖拾肆|贰仟贰佰玖拾伍|贰仟贰佰玖拾陆|贰仟贰佰玖拾柒|贰仟贰佰玖拾捌|贰仟贰佰玖拾玖|'
+    '贰仟叁佰|贰仟叁佰零壹|贰仟叁佰零贰|贰仟叁佰零叁|贰仟叁佰零肆|贰仟叁佰零伍|贰仟叁佰零陆|贰仟叁佰零柒|贰仟叁佰零捌|贰仟叁佰零玖|贰仟叁佰壹拾|贰仟叁佰壹拾壹|贰仟叁佰壹拾贰|贰仟叁佰壹拾叁|贰仟叁佰壹拾肆|贰仟叁佰壹拾伍|贰仟叁佰壹拾陆|贰仟叁佰壹拾柒|贰仟叁佰壹拾捌|贰仟叁佰壹拾玖|贰仟叁佰贰拾|贰仟叁佰贰拾壹|贰仟叁佰贰拾贰|贰仟叁佰贰拾叁|贰仟叁佰贰拾肆|贰仟叁佰贰拾伍|贰仟叁佰贰拾陆|贰仟叁佰贰拾柒|贰仟叁佰贰拾捌|贰仟叁佰贰拾玖|贰仟叁佰叁拾|贰仟叁佰叁拾壹|贰仟叁佰叁拾贰|贰仟叁佰叁拾叁|贰仟叁佰叁拾肆|贰仟叁佰叁拾伍|贰仟叁佰叁拾陆|贰仟叁佰叁拾柒|贰仟叁佰叁拾捌|贰仟叁佰叁拾玖|贰仟叁佰肆拾|贰仟叁佰肆拾壹|贰仟叁佰肆拾贰|贰仟叁佰肆拾叁|贰仟叁佰肆拾肆|贰仟叁佰肆拾伍|贰仟叁佰肆拾陆|贰仟叁佰肆拾柒|贰仟叁佰肆拾捌|贰仟叁佰肆拾玖|贰仟叁佰伍拾|贰仟叁佰伍拾壹|贰仟叁佰伍拾贰|贰仟叁佰伍拾叁|贰仟叁佰伍拾肆|贰仟叁佰伍拾伍|贰仟叁佰伍拾陆|贰仟叁佰伍拾柒|贰仟叁佰伍拾捌|贰仟叁佰伍拾玖|贰仟叁佰陆拾|贰仟叁佰陆拾壹|贰仟叁佰陆拾贰|贰仟叁佰陆拾叁|贰仟叁佰陆拾肆|贰仟叁佰陆拾伍|贰仟叁佰陆拾陆|贰仟叁佰陆拾柒|贰仟叁佰陆拾捌|贰仟叁佰陆拾玖|贰仟叁佰柒拾|贰仟叁佰柒拾壹|贰仟叁佰柒拾贰|贰仟叁佰柒拾叁|贰仟叁佰柒拾肆|贰仟叁佰柒拾伍|贰仟叁佰柒拾陆|贰仟叁佰柒拾柒|贰仟叁佰柒拾捌|贰仟叁佰柒拾玖|贰仟叁佰捌拾|贰仟叁佰捌拾壹|贰仟叁佰捌拾贰|贰仟叁佰捌拾叁|贰仟叁佰捌拾肆|贰仟叁佰捌拾伍|贰仟叁佰捌拾陆|贰仟叁佰捌拾柒|贰仟叁佰捌拾捌|贰仟叁佰捌拾玖|贰仟叁佰玖拾|贰仟叁佰玖拾壹|贰仟叁佰玖拾贰|贰仟叁佰玖拾叁|贰仟叁佰玖拾肆|贰仟叁佰玖拾伍|贰仟叁佰玖拾陆|贰仟叁佰玖拾柒|贰仟叁佰玖拾捌|贰仟叁佰玖拾玖|'
+    '贰仟肆佰|贰仟肆佰零壹|贰仟肆佰零贰|贰仟肆佰零叁|贰仟肆佰零肆|贰仟肆佰零伍|贰仟肆佰零陆|贰仟肆佰零柒|贰仟肆佰零捌|贰仟肆佰零玖|贰仟肆佰壹拾|贰仟肆佰壹拾壹|贰仟肆佰壹拾贰|贰仟肆佰壹拾叁|贰仟肆佰壹拾肆|贰仟肆佰壹拾伍|贰仟肆佰壹拾陆|贰仟肆佰壹拾柒|贰仟肆佰壹拾捌|贰仟肆佰壹拾玖|贰仟肆佰贰拾|贰仟肆佰贰拾壹|贰仟肆佰贰拾贰|贰仟肆佰贰拾叁|贰仟肆佰贰拾肆|贰仟肆佰贰拾伍|贰仟肆佰贰拾陆|贰仟肆佰贰拾柒|贰仟肆佰贰拾捌|贰仟肆佰贰拾玖|贰仟肆佰叁拾|贰仟肆佰叁拾壹|贰仟肆佰叁拾贰|贰仟肆佰叁拾叁|贰仟肆佰叁拾肆|贰仟肆佰叁拾伍|贰仟肆佰叁拾陆|贰仟肆佰叁拾柒|贰仟肆佰叁拾捌|贰仟肆佰叁拾玖|贰仟肆佰肆拾|贰仟肆佰肆拾壹|贰仟肆佰肆拾贰|贰仟肆佰肆拾叁|贰仟肆佰肆拾肆|贰仟肆佰肆拾伍|贰仟肆佰肆拾陆|贰仟肆佰肆拾柒|贰仟肆佰肆拾捌|贰仟肆佰肆拾玖|贰仟肆佰伍拾|贰仟肆佰伍拾壹|贰仟肆佰伍拾贰|贰仟肆佰伍拾叁|贰仟肆佰伍拾肆|贰仟肆佰伍拾伍|贰仟肆佰伍拾陆|贰仟肆佰伍拾柒|贰仟肆佰伍拾捌|贰仟肆佰伍拾玖|贰仟肆佰陆拾|贰仟肆佰陆拾壹|贰仟肆佰陆拾贰|贰仟肆佰陆拾叁|贰仟肆佰陆拾肆|贰仟肆佰陆拾伍|贰仟肆佰陆拾陆|贰仟肆佰陆拾柒|贰仟肆佰陆拾捌|贰仟肆佰陆拾玖|贰仟肆佰柒拾|贰仟肆佰柒拾壹|贰仟肆佰柒拾贰|贰仟肆佰柒拾叁|贰仟肆佰柒拾肆|贰仟肆佰柒拾伍|贰仟肆佰柒拾陆|贰仟肆佰柒拾柒|贰仟肆佰柒拾捌|贰仟肆佰柒拾玖|贰仟肆佰捌拾|贰仟肆佰捌拾壹|贰仟肆佰捌拾贰|贰仟肆佰捌拾叁|贰仟肆佰捌拾肆|贰仟肆佰捌拾伍|贰仟肆佰捌拾陆|贰仟肆佰捌拾柒|贰仟肆佰捌拾捌|贰仟肆佰捌拾玖|贰仟肆佰玖拾|贰仟肆佰玖拾壹|贰仟肆佰玖拾贰|贰仟肆佰玖拾叁|贰仟肆佰玖拾肆|贰仟肆佰玖拾伍|贰仟肆佰玖拾陆|贰仟肆佰玖拾柒|贰仟肆佰玖拾捌|贰仟肆佰玖拾玖|'
+    '贰仟伍佰|贰仟伍佰零壹|贰仟伍佰零贰|贰仟伍佰零叁|贰仟伍佰零肆|贰仟伍佰零伍|贰仟伍佰零陆|贰仟伍佰零柒|贰仟伍佰零捌|贰仟伍佰零玖|贰仟伍佰壹拾|贰仟伍佰壹拾壹|贰仟伍佰壹拾贰|贰仟伍佰壹拾叁|贰仟伍佰壹拾肆|贰仟伍佰壹拾伍|贰仟伍佰壹拾陆|贰仟伍佰壹拾柒|贰仟伍佰壹拾捌|贰仟伍佰壹拾玖|贰仟伍佰贰拾|贰仟伍佰贰拾壹|贰仟伍佰贰拾贰|贰仟伍佰贰拾叁|贰仟伍佰贰拾肆|贰仟伍佰贰拾伍|贰仟伍佰贰拾陆|贰仟伍佰贰拾柒|贰仟伍佰贰拾捌|贰仟伍佰贰拾玖|贰仟伍佰叁拾|贰仟伍佰叁拾壹|贰仟伍佰叁拾贰|贰仟伍佰叁拾叁|贰仟伍佰叁拾肆|贰仟伍佰叁拾伍|贰仟伍佰叁拾陆|贰仟伍佰叁拾柒|贰仟伍佰叁拾捌|贰仟伍佰叁拾玖|贰仟伍佰肆拾|贰仟伍佰肆拾壹|贰仟伍佰肆拾贰|贰仟伍佰肆拾叁|贰仟伍佰肆拾肆|贰仟伍佰肆拾伍|贰仟伍佰肆拾陆|贰仟伍佰肆拾柒|贰仟伍佰肆拾捌|贰仟伍佰肆拾玖|贰仟伍佰伍拾|贰仟伍佰伍拾壹|贰仟伍佰伍拾贰|贰仟伍佰伍拾叁|贰仟伍佰伍拾肆|贰仟伍佰伍拾伍|贰仟伍佰伍拾陆|贰仟伍佰伍拾柒|贰仟伍佰伍拾捌|贰仟伍佰伍拾玖|贰仟伍佰陆拾|贰仟伍佰陆拾壹|贰仟伍佰陆拾贰|贰仟伍佰陆拾叁|贰仟伍佰陆拾肆|贰仟伍佰陆拾伍|贰仟伍佰陆拾陆|贰仟伍佰陆拾柒|贰仟伍佰陆拾捌|贰仟伍佰陆拾玖|贰仟伍佰柒拾|贰仟伍佰柒拾壹|贰仟伍佰柒拾贰|贰仟伍佰柒拾叁|贰仟伍佰柒拾肆|贰仟伍佰柒拾伍|贰仟伍佰柒拾陆|贰仟伍佰柒拾柒|贰仟伍佰柒拾捌|贰仟伍佰柒拾玖|贰仟伍佰捌拾|贰仟伍佰捌拾壹|贰仟伍佰捌拾贰|贰仟伍佰捌拾叁|贰仟伍佰捌拾肆|贰仟伍佰捌拾伍|贰仟伍佰捌拾陆|贰仟伍佰捌拾柒|贰仟伍佰捌拾捌|贰仟伍佰捌拾玖|贰仟伍佰玖拾|贰仟伍佰玖拾壹|贰仟伍佰玖拾贰|贰仟伍佰玖拾叁|贰仟伍佰玖拾肆|贰仟伍佰玖拾伍|贰仟伍佰玖拾陆|贰仟伍佰玖拾柒|贰仟伍佰玖拾捌|贰仟伍佰玖拾玖|'
+    '贰仟陆佰|贰仟陆佰零壹|贰仟陆佰零贰|贰仟陆佰零叁|贰仟陆佰零肆|贰仟陆佰零伍|贰仟陆佰零陆|贰仟陆佰零柒|贰仟陆佰零捌|贰仟陆佰零玖|贰仟陆佰壹拾|贰仟陆佰壹拾壹|贰仟陆佰壹拾贰|贰仟陆佰壹拾叁|贰仟陆佰壹拾肆|贰仟陆佰壹拾伍|贰仟陆佰壹拾陆|贰仟陆佰壹拾柒|贰仟陆佰壹拾捌|贰仟陆佰壹拾玖|贰仟陆佰贰拾|贰仟陆佰贰拾壹|贰仟陆佰贰拾贰|贰仟陆佰贰拾叁|贰仟陆佰贰拾肆|贰仟陆佰贰拾伍|贰仟陆佰贰拾陆|贰仟陆佰贰拾柒|贰仟陆佰贰拾捌|贰仟陆佰贰拾玖|贰仟陆佰叁拾|贰仟陆佰叁拾壹|贰仟陆佰叁拾贰|贰仟陆佰叁拾叁|贰仟陆佰叁拾肆|贰仟陆佰叁拾伍|贰仟陆佰叁拾陆|贰仟陆佰叁拾柒|贰仟陆佰叁拾捌|贰仟陆佰叁拾玖|贰仟陆佰肆拾|贰仟陆佰肆拾壹|贰仟陆佰肆拾贰|贰仟陆佰肆拾叁|贰仟陆佰肆拾肆|贰仟陆佰肆拾伍|贰仟陆佰肆拾陆|贰仟陆佰肆拾柒|贰仟陆佰肆拾捌|贰仟陆佰肆拾玖|贰仟陆佰伍拾|贰仟陆佰伍拾壹|贰仟陆佰伍拾贰|贰仟陆佰伍拾叁|贰仟陆佰伍拾肆|贰仟陆佰伍拾伍|贰仟陆佰伍拾陆|贰仟陆佰伍拾柒|贰仟陆佰伍拾捌|贰仟陆佰伍拾玖|贰仟陆佰陆拾|贰仟陆佰陆拾壹|贰仟陆佰陆拾贰|贰仟陆佰陆拾叁|贰仟陆佰陆拾肆|贰仟陆佰陆拾伍|贰仟陆佰陆拾陆|贰仟陆佰陆拾柒|贰仟陆佰陆拾捌|贰仟陆佰陆拾玖|贰仟陆佰柒拾|贰仟陆佰柒拾壹|贰仟陆佰柒拾贰|贰仟陆佰柒拾叁|贰仟陆佰柒拾肆|贰仟陆佰柒拾伍|贰仟陆佰柒拾陆|贰仟陆佰柒拾柒|贰仟陆佰柒拾捌|贰仟陆佰柒拾玖|贰仟陆佰捌拾|贰仟陆佰捌拾壹|贰仟陆佰捌拾贰|贰仟陆佰捌拾叁|贰仟陆佰捌拾肆|贰仟陆佰捌拾伍|贰仟陆佰捌拾陆|贰仟陆佰捌拾柒|贰仟陆佰捌拾捌|贰仟陆佰捌拾玖|贰仟陆佰玖拾|贰仟陆佰玖拾壹|贰仟陆佰玖拾贰|贰仟陆佰玖拾叁|贰仟陆佰玖拾肆|贰仟陆佰玖拾伍|贰仟陆佰玖拾陆|贰仟陆佰玖拾柒|贰仟陆佰玖拾捌|贰仟陆佰玖拾玖|'
+    '贰仟柒佰|贰仟柒佰零壹|贰仟柒佰零贰|贰仟柒佰零叁|贰仟柒佰零肆|贰仟柒佰零伍|贰仟柒佰零陆|贰仟柒佰零柒|贰仟柒佰零捌|贰仟柒佰零玖|贰仟柒佰壹拾|贰仟柒佰壹拾壹|贰仟柒佰壹拾贰|贰仟柒佰壹拾叁|贰仟柒佰壹拾肆|贰仟柒佰壹拾伍|贰仟柒佰壹拾陆|贰仟柒佰壹拾柒|贰仟柒佰壹拾捌|贰仟柒佰壹拾玖|贰仟柒佰贰拾|贰仟柒佰贰拾壹|贰仟柒佰贰拾贰|贰仟柒佰贰拾叁|贰仟柒佰贰拾肆|贰仟柒佰贰拾伍|贰仟柒佰贰拾陆|贰仟柒佰贰拾柒|贰仟柒佰贰拾捌|贰仟柒佰贰拾玖|贰仟柒佰叁拾|贰仟柒佰叁拾壹|贰仟柒佰叁拾贰|贰仟柒佰叁拾叁|贰仟柒佰叁拾肆|贰仟柒佰叁拾伍|贰仟柒佰叁拾陆|贰仟柒佰叁拾柒|贰仟柒佰叁拾捌|贰仟柒佰叁拾玖|贰仟柒佰肆拾|贰仟柒佰肆拾壹|贰仟柒佰肆拾贰|贰仟柒佰肆拾叁|贰仟柒佰肆拾肆|贰仟柒佰肆拾伍|贰仟柒佰肆拾陆|贰仟柒佰肆拾柒|贰仟柒佰肆拾捌|贰仟柒佰肆拾玖|贰仟柒佰伍拾|贰仟柒佰伍拾壹|贰仟柒佰伍拾贰|贰仟柒佰伍拾叁|贰仟柒佰伍拾肆|贰仟柒佰伍拾伍|贰仟柒佰伍拾陆|贰仟柒佰伍拾柒|贰仟柒佰伍拾捌|贰仟柒佰伍拾玖|贰仟柒佰陆拾|贰仟柒佰陆拾壹|贰仟柒佰陆拾贰|贰仟柒佰陆拾叁|贰仟柒佰陆拾肆|贰仟柒佰陆拾伍|贰仟柒佰陆拾陆|贰仟柒佰陆拾柒|贰仟柒佰陆拾捌|贰仟柒佰陆拾玖|贰仟柒佰柒拾|贰仟柒佰柒拾壹|贰仟柒佰柒拾贰|贰仟柒佰柒拾叁|贰仟柒佰柒拾肆|贰仟柒佰柒拾伍|贰仟柒佰柒拾陆|贰仟柒佰柒拾柒|贰仟柒佰柒拾捌|贰仟柒佰柒拾玖|贰仟柒佰捌拾|贰仟柒佰捌拾壹|贰仟柒佰捌拾贰|贰仟柒佰捌拾叁|贰仟柒佰捌拾肆|贰仟柒佰捌拾伍|贰仟柒佰捌拾陆|贰仟柒佰捌拾柒|贰仟柒佰捌拾捌|贰仟柒佰捌拾玖|贰仟柒佰玖拾|贰仟柒佰玖拾壹|贰仟柒佰玖拾贰|贰仟柒佰玖拾叁|贰仟柒佰玖拾肆|贰仟柒佰玖拾伍|贰仟柒佰玖拾陆|贰仟柒佰玖拾柒|贰仟柒佰玖拾捌|贰仟柒佰玖拾玖|'
+    '贰仟捌佰|贰仟捌佰零壹|贰仟捌佰零贰|贰仟捌佰零叁|贰仟捌佰零肆|贰仟捌佰零伍|贰仟捌佰零陆|贰仟捌佰零柒|贰仟捌佰零捌|贰仟捌佰零玖|贰仟捌佰壹拾|贰仟捌佰壹拾壹|贰仟捌佰壹拾贰|贰仟捌佰壹拾叁|贰仟捌佰壹拾肆|贰仟捌佰壹拾伍|贰仟捌佰壹拾陆|贰仟捌佰壹拾柒|贰仟捌佰壹拾捌|贰仟捌佰壹拾玖|贰仟捌佰贰拾|贰仟捌佰贰拾壹|贰仟捌佰贰拾贰|贰仟捌佰贰拾叁|贰仟捌佰贰拾肆|贰仟捌佰贰拾伍|贰仟捌佰贰拾陆|贰仟捌佰贰拾柒|贰仟捌佰贰拾捌|贰仟捌佰贰拾玖|贰仟捌佰叁拾|贰仟捌佰叁拾壹|贰仟捌佰叁拾贰|贰仟捌佰叁拾叁|贰仟捌佰叁拾肆|贰仟捌佰叁拾伍|贰仟捌佰叁拾陆|贰仟捌佰叁拾柒|贰仟捌佰叁拾捌|贰仟捌佰叁拾玖|贰仟捌佰肆拾|贰仟捌佰肆拾壹|贰仟捌佰肆拾贰|贰仟捌佰肆拾叁|贰仟捌佰肆拾肆|贰仟捌佰肆拾伍|贰仟捌佰肆拾陆|贰仟捌佰肆拾柒|贰仟捌佰肆拾捌|贰仟捌佰肆拾玖|贰仟捌佰伍拾|贰仟捌佰伍拾壹|贰仟捌佰伍拾贰|贰仟捌佰伍拾叁|贰仟捌佰伍拾肆|贰仟捌佰伍拾伍|贰仟捌佰伍拾陆|贰仟捌佰伍拾柒|贰仟捌佰伍拾捌|贰仟捌佰伍拾玖|贰仟捌佰陆拾|贰仟捌佰陆拾壹|贰仟捌佰陆拾贰|贰仟捌佰陆拾叁|贰仟捌佰陆拾肆|贰仟捌佰陆拾伍|贰仟捌佰陆拾陆|贰仟捌佰陆拾柒|贰仟捌佰陆拾捌|贰仟捌佰陆拾玖|贰仟捌佰柒拾|贰仟捌佰柒拾壹|贰仟捌佰柒拾贰|贰仟捌佰柒拾叁|贰仟捌佰柒拾肆|贰仟捌佰柒拾伍|贰仟捌佰柒拾陆|贰仟捌佰柒拾柒|贰仟捌佰柒拾捌|贰仟捌佰柒拾玖|贰仟捌佰捌拾|贰仟捌佰捌拾壹|贰仟捌佰捌拾贰|贰仟捌佰捌拾叁|贰仟捌佰捌拾肆|贰仟捌佰捌拾伍|贰仟捌佰捌拾陆|贰仟捌佰捌拾柒|贰仟捌佰捌拾捌|贰仟捌佰捌拾玖|贰仟捌佰玖拾|贰仟捌佰玖拾壹|贰仟捌佰玖拾贰|贰仟捌佰玖拾叁|贰仟捌佰玖拾肆|贰仟捌佰玖拾伍|贰仟捌佰玖拾陆|贰仟捌佰玖拾柒|贰仟捌佰玖拾捌|贰仟捌佰玖拾玖|'
+    '贰仟玖佰|贰仟玖佰零壹|贰仟玖佰零贰|贰仟玖佰零叁|贰仟玖佰零肆|贰仟玖佰零伍|贰仟玖佰零陆|贰仟玖佰零柒|贰仟玖佰零捌|贰仟玖佰零玖|贰仟玖佰壹拾|贰仟玖佰壹拾壹|贰仟玖佰壹拾贰|贰仟玖佰壹拾叁|贰仟玖佰壹拾肆|贰仟玖佰壹拾伍|贰仟玖佰壹拾陆|贰仟玖佰壹拾柒|贰仟玖佰壹拾捌|贰仟玖佰壹拾玖|贰仟玖佰贰拾|贰仟玖佰贰拾壹|贰仟玖佰贰拾贰|贰仟玖佰贰拾叁|贰仟玖佰贰拾肆|贰仟玖佰贰拾伍|贰仟玖佰贰拾陆|贰仟玖佰贰拾柒|贰仟玖佰贰拾捌|贰仟玖佰贰拾玖|贰仟玖佰叁拾|贰仟玖佰叁拾壹|贰仟玖佰叁拾贰|贰仟玖佰叁拾叁|贰仟玖佰叁拾肆|贰仟玖佰叁拾伍|贰仟玖佰叁拾陆|贰仟玖佰叁拾柒|贰仟玖佰叁拾捌|贰仟玖佰叁拾玖|贰仟玖佰肆拾|贰仟玖佰肆拾壹|贰仟玖佰肆拾贰|贰仟玖佰肆拾叁|贰仟玖佰肆拾肆|贰仟玖佰肆拾伍|贰仟玖佰肆拾陆|贰仟玖佰肆拾柒|贰仟玖佰肆拾捌|贰仟玖佰肆拾玖|贰仟玖佰伍拾|贰仟玖佰伍拾壹|贰仟玖佰伍拾贰|贰仟玖佰伍拾叁|贰仟玖佰伍拾肆|贰仟玖佰伍拾伍|贰仟玖佰伍拾陆|贰仟玖佰伍拾柒|贰仟玖佰伍拾捌|贰仟玖佰伍拾玖|贰仟玖佰陆拾|贰仟玖佰陆拾壹|贰仟玖佰陆拾贰|贰仟玖佰陆拾叁|贰仟玖佰陆拾肆|贰仟玖佰陆拾伍|贰仟玖佰陆拾陆|贰仟玖佰陆拾柒|贰仟玖佰陆拾捌|贰仟玖佰陆拾玖|贰仟玖佰柒拾|贰仟玖佰柒拾壹|贰仟玖佰柒拾贰|贰仟玖佰柒拾叁|贰仟玖佰柒拾肆|贰仟玖佰柒拾伍|贰仟玖佰柒拾陆|贰仟玖佰柒拾柒|贰仟玖佰柒拾捌|贰仟玖佰柒拾玖|贰仟玖佰捌拾|贰仟玖佰捌拾壹|贰仟玖佰捌拾贰|贰仟玖佰捌拾叁|贰仟玖佰捌拾肆|贰仟玖佰捌拾伍|贰仟玖佰捌拾陆|贰仟玖佰捌拾柒|贰仟玖佰捌拾捌|贰仟玖佰捌拾玖|贰仟玖佰玖拾|贰仟玖佰玖拾壹|贰仟玖佰玖拾贰|贰仟玖佰玖拾叁|贰仟玖佰玖拾肆|贰仟玖佰玖拾伍|贰仟玖佰玖拾陆|贰仟玖佰玖拾柒|贰仟玖佰玖拾捌|贰仟玖佰玖拾玖|'
+    '叁仟|叁仟零壹|叁仟零贰|叁仟零叁|叁仟零肆|叁仟零伍|叁仟零陆|叁仟零柒|叁仟零捌|叁仟零玖|叁仟零壹拾|叁仟零壹拾壹|叁仟零壹拾贰|叁仟零壹拾叁|叁仟零壹拾肆|叁仟零壹拾伍|叁仟零壹拾陆|叁仟零壹拾柒|叁仟零壹拾捌|叁仟零壹拾玖|叁仟零贰拾|叁仟零贰拾壹|叁仟零贰拾贰|叁仟零贰拾叁|叁仟零贰拾肆|叁仟零贰拾伍|叁仟零贰拾陆|叁仟零贰拾柒|叁仟零贰拾捌|叁仟零贰拾玖|叁仟零叁拾|叁仟零叁拾壹|叁仟零叁拾贰|叁仟零叁拾叁|叁仟零叁拾肆|叁仟零叁拾伍|叁仟零叁拾陆|叁仟零叁拾柒|叁仟零叁拾捌|叁仟零叁拾玖|叁仟零肆拾|叁仟零肆拾壹|叁仟零肆拾贰|叁仟零肆拾叁|叁仟零肆拾肆|叁仟零肆拾伍|叁仟零肆拾陆|叁仟零肆拾柒|叁仟零肆拾捌|叁仟零肆拾玖|叁仟零伍拾|叁仟零伍拾壹|叁仟零伍拾贰|叁仟零伍拾叁|叁仟零伍拾肆|叁仟零伍拾伍|叁仟零伍拾陆|叁仟零伍拾柒|叁仟零伍拾捌|叁仟零伍拾玖|叁仟零陆拾|叁仟零陆拾壹|叁仟零陆拾贰|叁仟零陆拾叁|叁仟零陆拾肆|叁仟零陆拾伍|叁仟零陆拾陆|叁仟零陆拾柒|叁仟零陆拾捌|叁仟零陆拾玖|叁仟零柒拾|叁仟零柒拾壹|叁仟零柒拾贰|叁仟零柒拾叁|叁仟零柒拾肆|叁仟零柒拾伍|叁仟零柒拾陆|叁仟零柒拾柒|叁仟零柒拾捌|叁仟零柒拾玖|叁仟零捌拾|叁仟零捌拾壹|叁仟零捌拾贰|叁仟零捌拾叁|叁仟零捌拾肆|叁仟零捌拾伍|叁仟零捌拾陆|叁仟零捌拾柒|叁仟零捌拾捌|叁仟零捌拾玖|叁仟零玖拾|叁仟零玖拾壹|叁仟零玖拾贰|叁仟零玖拾叁|叁仟零玖拾肆|叁仟零玖拾伍|叁仟零玖拾陆|叁仟零玖拾柒|叁仟零玖拾捌|叁仟零玖拾玖|'
+    '叁仟壹佰|叁仟壹佰零壹|叁仟壹佰零贰|叁仟壹佰零叁|叁仟壹佰零肆|叁仟壹佰零伍|叁仟壹佰零陆|叁仟壹佰零柒|叁仟壹佰零捌|叁仟壹佰零玖|叁仟壹佰壹拾|叁仟壹佰壹拾壹|叁仟壹佰壹拾贰|叁仟壹佰壹拾叁|叁仟壹佰壹拾肆|叁仟壹佰壹拾伍|叁仟壹佰壹拾陆|叁仟壹佰壹拾柒|叁仟壹佰壹拾捌|叁仟壹佰壹拾玖|叁仟壹佰贰拾|叁仟壹佰贰拾壹|叁仟壹佰贰拾贰|叁仟壹佰贰拾叁|叁仟壹佰贰拾肆|叁仟壹佰贰拾伍|叁仟壹佰贰拾陆|叁仟壹佰贰拾柒|叁仟壹佰贰拾捌|叁仟壹佰贰拾玖|叁仟壹佰叁拾|叁仟壹佰叁拾壹|叁仟壹佰叁拾贰|叁仟壹佰叁拾叁|叁仟壹佰叁拾肆|叁仟壹佰叁拾伍|叁仟壹佰叁拾陆|叁仟壹佰叁拾柒|叁仟壹佰叁拾捌|叁仟壹佰叁拾玖|叁仟壹佰肆拾|叁仟壹佰肆拾壹|叁仟壹佰肆拾贰|叁仟壹佰肆拾叁|叁仟壹佰肆拾肆|叁仟壹佰肆拾伍|叁仟壹佰肆拾陆|叁仟壹佰肆拾柒|叁仟壹佰肆拾捌|叁仟壹佰肆拾玖|叁仟壹佰伍拾|叁仟壹佰伍拾壹|叁仟壹佰伍拾贰|叁仟壹佰伍拾叁|叁仟壹佰伍拾肆|叁仟壹佰伍拾伍|叁仟壹佰伍拾陆|叁仟壹佰伍拾柒|叁仟壹佰伍拾捌|叁仟壹佰伍拾玖|叁仟壹佰陆拾|叁仟壹佰陆拾壹|叁仟壹佰陆拾贰|叁仟壹佰陆拾叁|叁仟壹佰陆拾肆|叁仟壹佰陆拾伍|叁仟壹佰陆拾陆|叁仟壹佰陆拾柒|叁仟壹佰陆拾捌|叁仟壹佰陆拾玖|叁仟壹佰柒拾|叁仟壹佰柒拾壹|叁仟壹佰柒拾贰|叁仟壹佰柒拾叁|叁仟壹佰柒拾肆|叁仟壹佰柒拾伍|叁仟壹佰柒拾陆|叁仟壹佰柒拾柒|叁仟壹佰柒拾捌|叁仟壹佰柒拾玖|叁仟壹佰捌拾|叁仟壹佰捌拾壹|叁仟壹佰捌拾贰|叁仟壹佰捌拾叁|叁仟壹佰捌拾肆|叁仟壹佰捌拾伍|叁仟壹佰捌拾陆|叁仟壹佰捌拾柒|叁仟壹佰捌拾捌|叁仟壹佰捌拾玖|叁仟壹佰玖拾|叁仟壹佰玖拾壹|叁仟壹佰玖拾贰|叁仟壹佰玖拾叁|叁仟壹佰玖拾肆|叁仟壹佰玖拾伍|叁仟壹佰玖拾陆|叁仟壹佰玖拾柒|叁仟壹佰玖拾捌|叁仟壹佰玖拾玖|'
+    '叁仟贰佰|叁仟贰佰零壹|叁仟贰佰零贰|叁仟贰佰零叁|叁仟贰佰零肆|叁仟贰佰零伍|叁仟贰佰零陆|叁仟贰佰零柒|叁仟贰佰零捌|叁仟贰佰零玖|叁仟贰佰壹拾|叁仟贰佰壹拾壹|叁仟贰佰壹拾贰|叁仟贰佰壹拾叁|叁仟贰佰壹拾肆|叁仟贰佰壹拾伍|叁仟贰佰壹拾陆|叁仟贰佰壹拾柒|叁仟贰佰壹拾捌|叁仟贰佰壹拾玖|叁仟贰佰贰拾|叁仟贰佰贰拾壹|叁仟贰佰贰拾贰|叁仟贰佰贰拾叁|叁仟贰佰贰拾肆|叁仟贰佰贰拾伍|叁仟贰佰贰拾陆|叁仟贰佰贰拾柒|叁仟贰佰贰拾捌|叁仟贰佰贰拾玖|叁仟贰佰叁拾|叁仟贰佰叁拾壹|叁仟贰佰叁拾贰|叁仟贰佰叁拾叁|叁仟贰佰叁拾肆|叁仟贰佰叁拾伍|叁仟贰佰叁拾陆|叁仟贰佰叁拾柒|叁仟贰佰叁拾捌|叁仟贰佰叁拾玖|叁仟贰佰肆拾|叁仟贰佰肆拾壹|叁仟贰佰肆拾贰|叁仟贰佰肆拾叁|叁仟贰佰肆拾肆|叁仟贰佰肆拾伍|叁仟贰佰肆拾陆|叁仟贰佰肆拾柒|叁仟贰佰肆拾捌|叁仟贰佰肆拾玖|叁仟贰佰伍拾|叁仟贰佰伍拾壹|叁仟贰佰伍拾贰|叁仟贰佰伍拾叁|叁仟贰佰伍拾肆|叁仟贰佰伍拾伍|叁仟贰佰伍拾陆|叁仟贰佰伍拾柒|叁仟贰佰伍拾捌|叁仟贰佰伍拾玖|叁仟贰佰陆拾|叁仟贰佰陆拾壹|叁仟贰佰陆拾贰|叁仟贰佰陆拾叁|叁仟贰佰陆拾肆|叁仟贰佰陆拾伍|叁仟贰佰陆拾陆|叁仟贰佰陆拾柒|叁仟贰佰陆拾捌|叁仟贰佰陆拾玖|叁仟贰佰柒拾|叁仟贰佰柒拾壹|叁仟贰佰柒拾贰|叁仟贰佰柒拾叁|叁仟贰佰柒拾肆|叁仟贰佰柒拾伍|叁仟贰佰柒拾陆|叁仟贰佰柒拾柒|叁仟贰佰柒拾捌|叁仟贰佰柒拾玖|叁仟贰佰捌拾|叁仟贰佰捌拾壹|叁仟贰佰捌拾贰|叁仟贰佰捌拾叁|叁仟贰佰捌拾肆|叁仟贰佰捌拾伍|叁仟贰佰捌拾陆|叁仟贰佰捌拾柒|叁仟贰佰捌拾捌|叁仟贰佰捌拾玖|叁仟贰佰玖拾|叁仟贰佰玖拾壹|叁仟贰佰玖拾贰|叁仟贰佰玖拾叁|叁仟贰佰玖拾肆|叁仟贰佰玖拾伍|叁仟贰佰玖拾陆|叁仟贰佰玖拾柒|叁仟贰佰玖拾捌|叁仟贰佰玖拾玖|'
+    '叁仟叁佰|叁仟叁佰零壹|叁仟叁佰零贰|叁仟叁佰零叁|叁仟叁佰零肆|叁仟叁佰零伍|叁仟叁佰零陆|叁仟叁佰零柒|叁仟叁佰零捌|叁仟叁佰零玖|叁仟叁佰壹拾|叁仟叁佰壹拾壹|叁仟叁佰壹拾贰|叁仟叁佰壹拾叁|叁仟叁佰壹拾肆|叁仟叁佰壹拾伍|叁仟叁佰壹拾陆|叁仟叁佰壹拾柒|叁仟叁佰壹拾捌|叁仟叁佰壹拾玖|叁仟叁佰贰拾|叁仟叁佰贰拾壹|叁仟叁佰贰拾贰|叁仟叁佰贰拾叁|叁仟叁佰贰拾肆|叁仟叁佰贰拾伍|叁仟叁佰贰拾陆|叁仟叁佰贰拾柒|叁仟叁佰贰拾捌|叁仟叁佰贰拾玖|叁仟叁佰叁拾|叁仟叁佰叁拾壹|叁仟叁佰叁拾贰|叁仟叁佰叁拾叁|叁仟叁佰叁拾肆|叁仟叁佰叁拾伍|叁仟叁佰叁拾陆|叁仟叁佰叁拾柒|叁仟叁佰叁拾捌|叁仟叁佰叁拾玖|叁仟叁佰肆拾|叁仟叁佰肆拾壹|叁仟叁佰肆拾贰|叁仟叁佰肆拾叁|叁仟叁佰肆拾肆|叁仟叁佰肆拾伍|叁仟叁佰肆拾陆|叁仟叁佰肆拾柒|叁仟叁佰肆拾捌|叁仟叁佰肆拾玖|叁仟叁佰伍拾|叁仟叁佰伍拾壹|叁仟叁佰伍拾贰|叁仟叁佰伍拾叁|叁仟叁佰伍拾肆|叁仟叁佰伍拾伍|叁仟叁佰伍拾陆|叁仟叁佰伍拾柒|叁仟叁佰伍拾捌|叁仟叁佰伍拾玖|叁仟叁佰陆拾|叁仟叁佰陆拾壹|叁仟叁佰陆拾贰|叁仟叁佰陆拾叁|叁仟叁佰陆拾肆|叁仟叁佰陆拾伍|叁仟叁佰陆拾陆|叁仟叁佰陆拾柒|叁仟叁佰陆拾捌|叁仟叁佰陆拾玖|叁仟叁佰柒拾|叁仟叁佰柒拾壹|叁仟叁佰柒拾贰|叁仟叁佰柒拾叁|叁仟叁佰柒拾肆|叁仟叁佰柒拾伍|叁仟叁佰柒拾陆|叁仟叁佰柒拾柒|叁仟叁佰柒拾捌|叁仟叁佰柒拾玖|叁仟叁佰捌拾|叁仟叁佰捌拾壹|叁仟叁佰捌拾贰|叁仟叁佰捌拾叁|叁仟叁佰捌拾肆|叁仟叁佰捌拾伍|叁仟叁佰捌拾陆|叁仟叁佰捌拾柒|叁仟叁佰捌拾捌|叁仟叁佰捌拾玖|叁仟叁佰玖拾|叁仟叁佰玖拾壹|叁仟叁佰玖拾贰|叁仟叁佰玖拾叁|叁仟叁佰玖拾肆|叁仟叁佰玖拾伍|叁仟叁佰玖拾陆|叁仟叁佰玖拾柒|叁仟叁佰玖拾捌|叁仟叁佰玖拾玖|'
+    '叁仟肆佰|叁仟肆佰零壹|叁仟肆佰零贰|叁仟肆佰零叁|叁仟肆佰零肆|叁仟肆佰零伍|叁仟肆佰零陆|叁仟肆佰零柒|叁仟肆佰零捌|叁仟肆佰零玖|叁仟肆佰壹拾|叁仟肆佰壹拾壹|叁仟肆佰壹拾贰|叁仟肆佰壹拾叁|叁仟肆佰壹拾肆|叁仟肆佰壹拾伍|叁仟肆佰壹拾陆|叁仟肆佰壹拾柒|叁仟肆佰壹拾捌|叁仟肆佰壹拾玖|叁仟肆佰贰拾|叁仟肆佰贰拾壹|叁仟肆佰贰拾贰|叁仟肆佰贰拾叁|叁仟肆佰贰拾肆|叁仟肆佰贰拾伍|叁仟肆佰贰拾陆|叁仟肆佰贰拾柒|叁仟肆佰贰拾捌|叁仟肆佰贰拾玖|叁仟肆佰叁拾|叁仟肆佰叁拾壹|叁仟肆佰叁拾贰|叁仟肆佰叁拾叁|叁仟肆佰叁拾肆|叁仟肆佰叁拾伍|叁仟肆佰叁拾陆|叁仟肆佰叁拾柒|叁仟肆佰叁拾捌|叁仟肆佰叁拾玖|叁仟肆佰肆拾|叁仟肆佰肆拾壹|叁仟肆佰肆拾贰|叁仟肆佰肆拾叁|叁仟肆佰肆拾肆|叁仟肆佰肆拾伍|叁仟肆佰肆拾陆|叁仟肆佰肆拾柒|叁仟肆佰肆拾捌|叁仟肆佰肆拾玖|叁仟肆佰伍拾|叁仟肆佰伍拾壹|叁仟肆佰伍拾贰|叁仟肆佰伍拾叁|叁仟肆佰伍拾肆|叁仟肆佰伍拾伍|叁仟肆佰伍拾陆|叁仟肆佰伍拾柒|叁仟肆佰伍拾捌|叁仟肆佰伍拾玖|叁仟肆佰陆拾|叁仟肆佰陆拾壹|叁仟肆佰陆拾贰|叁仟肆佰陆拾叁|叁仟肆佰陆拾肆|叁仟肆佰陆拾伍|叁仟肆佰陆拾陆|叁仟肆佰陆拾柒|叁仟肆佰陆拾捌|叁仟肆佰陆拾玖|叁仟肆佰柒拾|叁仟肆佰柒拾壹|叁仟肆佰柒拾贰|叁仟肆佰柒拾叁|叁仟肆佰柒拾肆|叁仟肆佰柒拾伍|叁仟肆佰柒拾陆|叁仟肆佰柒拾柒|叁仟肆佰柒拾捌|叁仟肆佰柒拾玖|叁仟肆佰捌拾|叁仟肆佰捌拾壹|叁仟肆佰捌拾贰|叁仟肆佰捌拾叁|叁仟肆佰捌拾肆|叁仟肆佰捌拾伍|叁仟肆佰捌拾陆|叁仟肆佰捌拾柒|叁仟肆佰捌拾捌|叁仟肆佰捌拾玖|叁仟肆佰玖拾|叁仟肆佰玖拾壹|叁仟肆佰玖拾贰|叁仟肆佰玖拾叁|叁仟肆佰玖拾肆|叁仟肆佰玖拾伍|叁仟肆佰玖拾陆|叁仟肆佰玖拾柒|叁仟肆佰玖拾捌|叁仟肆佰玖拾玖|'
+    '叁仟伍佰|叁仟伍佰零壹|叁仟伍佰零贰|叁仟伍佰零叁|叁仟伍佰零肆|叁仟伍佰零伍|叁仟伍佰零陆|叁仟伍佰零柒|叁仟伍佰零捌|叁仟伍佰零玖|叁仟伍佰壹拾|叁仟伍佰壹拾壹|叁仟伍佰壹拾贰|叁仟伍佰壹拾叁|叁仟伍佰壹拾肆|叁仟伍佰壹拾伍|叁仟伍佰壹拾陆|叁仟伍佰壹拾柒|叁仟伍佰壹拾捌|叁仟伍佰壹拾玖|叁仟伍佰贰拾|叁仟伍佰贰拾壹|叁仟伍佰贰拾贰|叁仟伍佰贰拾叁|叁仟伍佰贰拾肆|叁仟伍佰贰拾伍|叁仟伍佰贰拾陆|叁仟伍佰贰拾柒|叁仟伍佰贰拾捌|叁仟伍佰贰拾玖|叁仟伍佰叁拾|叁仟伍佰叁拾壹|叁仟伍佰叁拾贰|叁仟伍佰叁拾叁|叁仟伍佰叁拾肆|叁仟伍佰叁拾伍|叁仟伍佰叁拾陆|叁仟伍佰叁拾柒|叁仟伍佰叁拾捌|叁仟伍佰叁拾玖|叁仟伍佰肆拾|叁仟伍佰肆拾壹|叁仟伍佰肆拾贰|叁仟伍佰肆拾叁|叁仟伍佰肆拾肆|叁仟伍佰肆拾伍|叁仟伍佰肆拾陆|叁仟伍佰肆拾柒|叁仟伍佰肆拾捌|叁仟伍佰肆拾玖|叁仟伍佰伍拾|叁仟伍佰伍拾壹|叁仟伍佰伍拾贰|叁仟伍佰伍拾叁|叁仟伍佰伍拾肆|叁仟伍佰伍拾伍|叁仟伍佰伍拾陆|叁仟伍佰伍拾柒|叁仟伍佰伍拾捌|叁仟伍佰伍拾玖|叁仟伍佰陆拾|叁仟伍佰陆拾壹|叁仟伍佰陆拾贰|叁仟伍佰陆拾叁|叁仟伍佰陆拾肆|叁仟伍佰陆拾伍|叁仟伍佰陆拾陆|叁仟伍佰陆拾柒|叁仟伍佰陆拾捌|叁仟伍佰陆拾玖|叁仟伍佰柒拾|叁仟伍佰柒拾壹|叁仟伍佰柒拾贰|叁仟伍佰柒拾叁|叁仟伍佰柒拾肆|叁仟伍佰柒拾伍|叁仟伍佰柒拾陆|叁仟伍佰柒拾柒|叁仟伍佰柒拾捌|叁仟伍佰柒拾玖|叁仟伍佰捌拾|叁仟伍佰捌拾壹|叁仟伍佰捌拾贰|叁仟伍佰捌拾叁|叁仟伍佰捌拾肆|叁仟伍佰捌拾伍|叁仟伍佰捌拾陆|叁仟伍佰捌拾柒|叁仟伍佰捌拾捌|叁仟伍佰捌拾玖|叁仟伍佰玖拾|叁仟伍佰玖拾壹|叁仟伍佰玖拾贰|叁仟伍佰玖拾叁|叁仟伍佰玖拾肆|叁仟伍佰玖拾伍|叁仟伍佰玖拾陆|叁仟伍佰玖拾柒|叁仟伍佰玖拾捌|叁仟伍佰玖拾玖|'
+    '叁仟陆佰|叁仟陆佰零壹|叁仟陆佰零贰|叁仟陆佰零叁|叁仟陆佰零肆|叁仟陆佰零伍|叁仟陆佰零陆|叁仟陆佰零柒|叁仟陆佰零捌|叁仟陆佰零玖|叁仟陆佰壹拾|叁仟陆佰壹拾壹|叁仟陆佰壹拾贰|叁仟陆佰壹拾叁|叁仟陆佰壹拾肆|叁仟陆佰壹拾伍|叁仟陆佰壹拾陆|叁仟陆佰壹拾柒|叁仟陆佰壹拾捌|叁仟陆佰壹拾玖|叁仟陆佰贰拾|叁仟陆佰贰拾壹|叁仟陆佰贰拾贰|叁仟陆佰贰拾叁|叁仟陆佰贰拾肆|叁仟陆佰贰拾伍|叁仟陆佰贰拾陆|叁仟陆佰贰拾柒|叁仟陆佰贰拾捌|叁仟陆佰贰拾玖|叁仟陆佰叁拾|叁仟陆佰叁拾壹|叁仟陆佰叁拾贰|叁仟陆佰叁拾叁|叁仟陆佰叁拾肆|叁仟陆佰叁拾伍|叁仟陆佰叁拾陆|叁仟陆佰叁拾柒|叁仟陆佰叁拾捌|叁仟陆佰叁拾玖|叁仟陆佰肆拾|叁仟陆佰肆拾壹|叁仟陆佰肆拾贰|叁仟陆佰肆拾叁|叁仟陆佰肆拾肆|叁仟陆佰肆拾伍|叁仟陆佰肆拾陆|叁仟陆佰肆拾柒|叁仟陆佰肆拾捌|叁仟陆佰肆拾玖|叁仟陆佰伍拾|叁仟陆佰伍拾壹|叁仟陆佰伍拾贰|叁仟陆佰伍拾叁|叁仟陆佰伍拾肆|叁仟陆佰伍拾伍|叁仟陆佰伍拾陆|叁仟陆佰伍拾柒|叁仟陆佰伍拾捌|叁仟陆佰伍拾玖|叁仟陆佰陆拾|叁仟陆佰陆拾壹|叁仟陆佰陆拾贰|叁仟陆佰陆拾叁|叁仟陆佰陆拾肆|叁仟陆佰陆拾伍|叁仟陆佰陆拾陆|叁仟陆佰陆拾柒|叁仟陆佰陆拾捌|叁仟陆佰陆拾玖|叁仟陆佰柒拾|叁仟陆佰柒拾壹|叁仟陆佰柒拾贰|叁仟陆佰柒拾叁|叁仟陆佰柒拾肆|叁仟陆佰柒拾伍|叁仟陆佰柒拾陆|叁仟陆佰柒拾柒|叁仟陆佰柒拾捌|叁仟陆佰柒拾玖|叁仟陆佰捌拾|叁仟陆佰捌拾壹|叁仟陆佰捌拾贰|叁仟陆佰捌拾叁|叁仟陆佰捌拾肆|叁仟陆佰捌拾伍|叁仟陆佰捌拾陆|叁仟陆佰捌拾柒|叁仟陆佰捌拾捌|叁仟陆佰捌拾玖|叁仟陆佰玖拾|叁仟陆佰玖拾壹|叁仟陆佰玖拾贰|叁仟陆佰玖拾叁|叁仟陆佰玖拾肆|叁仟陆佰玖拾伍|叁仟陆佰玖拾陆|叁仟陆佰玖拾柒|叁仟陆佰玖拾捌|叁仟陆佰玖拾玖|'
+    '叁仟柒佰|叁仟柒佰零壹|叁仟柒佰零贰|叁仟柒佰零叁|叁仟柒佰零肆|叁仟柒佰零伍|叁仟柒佰零陆|叁仟柒佰零柒|叁仟柒佰零捌|叁仟柒佰零玖|叁仟柒佰壹拾|叁仟柒佰壹拾壹|叁仟柒佰壹拾贰|叁仟柒佰壹拾叁|叁仟柒佰壹拾肆|叁仟柒佰壹拾伍|叁仟柒佰壹拾陆|叁仟柒佰壹拾柒|叁仟柒佰壹拾捌|叁仟柒佰壹拾玖|叁仟柒佰贰拾|叁仟柒佰贰拾壹|叁仟柒佰贰拾贰|叁仟柒佰贰拾叁|叁仟柒佰贰拾肆|叁仟柒佰贰拾伍|叁仟柒佰贰拾陆|叁仟柒佰贰拾柒|叁仟柒佰贰拾捌|叁仟柒佰贰拾玖|叁仟柒佰叁拾|叁仟柒佰叁拾壹|叁仟柒佰叁拾贰|叁仟柒佰叁拾叁|叁仟柒佰叁拾肆|叁仟柒佰叁拾伍|叁仟柒佰叁拾陆|叁仟柒佰叁拾柒|叁仟柒佰叁拾捌|叁仟柒佰叁拾玖|叁仟柒佰肆拾|叁仟柒佰肆拾壹|叁仟柒佰肆拾贰|叁仟柒佰肆拾叁|叁仟柒佰肆拾肆|叁仟柒佰肆拾伍|叁仟柒佰肆拾陆|叁仟柒佰肆拾柒|叁仟柒佰肆拾捌|叁仟柒佰肆拾玖|叁仟柒佰伍拾|叁仟柒佰伍拾壹|叁仟柒佰伍拾贰|叁仟柒佰伍拾叁|叁仟柒佰伍拾肆|叁仟柒佰伍拾伍|叁仟柒佰伍拾陆|叁仟柒佰伍拾柒|叁仟柒佰伍拾捌|叁仟柒佰伍拾玖|叁仟柒佰陆拾|叁仟柒佰陆拾壹|叁仟柒佰陆拾贰|叁仟柒佰陆拾叁|叁仟柒佰陆拾肆|叁仟柒佰陆拾伍|叁仟柒佰陆拾陆|叁仟柒佰陆拾柒|叁仟柒佰陆拾捌|叁仟柒佰陆拾玖|叁仟柒佰柒拾|叁仟柒佰柒拾壹|叁仟柒佰柒拾贰|叁仟柒佰柒拾叁|叁仟柒佰柒拾肆|叁仟柒佰柒拾伍|叁仟柒佰柒拾陆|叁仟柒佰柒拾柒|叁仟柒佰柒拾捌|叁仟柒佰柒拾玖|叁仟柒佰捌拾|叁仟柒佰捌拾壹|叁仟柒佰捌拾贰|叁仟柒佰捌拾叁|叁仟柒佰捌拾肆|叁仟柒佰捌拾伍|叁仟柒佰捌拾陆|叁仟柒佰捌拾柒|叁仟柒佰捌拾捌|叁仟柒佰捌拾玖|叁仟柒佰玖拾|叁仟柒佰玖拾壹|叁仟柒佰玖拾贰|叁仟柒佰玖拾叁|叁仟柒佰玖拾肆|叁仟柒佰玖拾伍|叁仟柒佰玖拾陆|叁仟柒佰玖拾柒|叁仟柒佰玖拾捌|叁仟柒佰玖拾玖|'
+    '叁仟捌佰|叁仟捌佰零壹|叁仟捌佰零贰|叁仟捌佰零叁|叁仟捌佰零肆|叁仟捌佰零伍|叁仟捌佰零陆|叁仟捌佰零柒|叁仟捌佰零捌|叁仟捌佰零玖|叁仟捌佰壹拾|叁仟捌佰壹拾壹|叁仟捌佰壹拾贰|叁仟捌佰壹拾叁|叁仟捌佰壹拾肆|叁仟捌佰壹拾伍|叁仟捌佰壹拾陆|叁仟捌佰壹拾柒|叁仟捌佰壹拾捌|叁仟捌佰壹拾玖|叁仟捌佰贰拾|叁仟捌佰贰拾壹|叁仟捌佰贰拾贰|叁仟捌佰贰拾叁|叁仟捌佰贰拾肆|叁仟捌佰贰拾伍|叁仟捌佰贰拾陆|叁仟捌佰贰拾柒|叁仟捌佰贰拾捌|叁仟捌佰贰拾玖|叁仟捌佰叁拾|叁仟捌佰叁拾壹|叁仟捌佰叁拾贰|叁仟捌佰叁拾叁|叁仟捌佰叁拾肆|叁仟捌佰叁拾伍|叁仟捌佰叁拾陆|叁仟捌佰叁拾柒|叁仟捌佰叁拾捌|叁仟捌佰叁拾玖|叁仟捌佰肆拾|叁仟捌佰肆拾壹|叁仟捌佰肆拾贰|叁仟捌佰肆拾叁|叁仟捌佰肆拾肆|叁仟捌佰肆拾伍|叁仟捌佰肆拾陆|叁仟捌佰肆拾柒|叁仟捌佰肆拾捌|叁仟捌佰肆拾玖|叁仟捌佰伍拾|叁仟捌佰伍拾壹|叁仟捌佰伍拾贰|叁仟捌佰伍拾叁|叁仟捌佰伍拾肆|叁仟捌佰伍拾伍|叁仟捌佰伍拾陆|叁仟捌佰伍拾柒|叁仟捌佰伍拾捌|叁仟捌佰伍拾玖|叁仟捌佰陆拾|叁仟捌佰陆拾壹|叁仟捌佰陆拾贰|叁仟捌佰陆拾叁|叁仟捌佰陆拾肆|叁仟捌佰陆拾伍|叁仟捌佰陆拾陆|叁仟捌佰陆拾柒|叁仟捌佰陆拾捌|叁仟捌佰陆拾玖|叁仟捌佰柒拾|叁仟捌佰柒拾壹|叁仟捌佰柒拾贰|叁仟捌佰柒拾叁|叁仟捌佰柒拾肆|叁仟捌佰柒拾伍|叁仟捌佰柒拾陆|叁仟捌佰柒拾柒|叁仟捌佰柒拾捌|叁仟捌佰柒拾玖|叁仟捌佰捌拾|叁仟捌佰捌拾壹|叁仟捌佰捌拾贰|叁仟捌佰捌拾叁|叁仟捌佰捌拾肆|叁仟捌佰捌拾伍|叁仟捌佰捌拾陆|叁仟捌佰捌拾柒|叁仟捌佰捌拾捌|叁仟捌佰捌拾玖|叁仟捌佰玖拾|叁仟捌佰玖拾壹|叁仟捌佰玖拾贰|叁仟捌佰玖拾叁|叁仟捌佰玖拾肆|叁仟捌佰玖拾伍|叁仟捌佰玖拾陆|叁仟捌佰玖拾柒|叁仟捌佰玖拾捌|叁仟捌佰玖拾玖|'
+    '叁仟玖佰|叁仟玖佰零壹|叁仟玖佰零贰|叁仟玖佰零叁|叁仟玖佰零肆|叁仟玖佰零伍|叁仟玖佰零陆|叁仟玖佰零柒|叁仟玖佰零捌|叁仟玖佰零玖|叁仟玖佰壹拾|叁仟玖佰壹拾壹|叁仟玖佰壹拾贰|叁仟玖佰壹拾叁|叁仟玖佰壹拾肆|叁仟玖佰壹拾伍|叁仟玖佰壹拾陆|叁仟玖佰壹拾柒|叁仟玖佰壹拾捌|叁仟玖佰壹拾玖|叁仟玖佰贰拾|叁仟玖佰贰拾壹|叁仟玖佰贰拾贰|叁仟玖佰贰拾叁|叁仟玖佰贰拾肆|叁仟玖佰贰拾伍|叁仟玖佰贰拾陆|叁仟玖佰贰拾柒|叁仟玖佰贰拾捌|叁仟玖佰贰拾玖|叁仟玖佰叁拾|叁仟玖佰叁拾壹|叁仟玖佰叁拾贰|叁仟玖佰叁拾叁|叁仟玖佰叁拾肆|叁仟玖佰叁拾伍|叁仟玖佰叁拾陆|叁仟玖佰叁拾柒|叁仟玖佰叁拾捌|叁仟玖佰叁拾玖|叁仟玖佰肆拾|叁仟玖佰肆拾壹|叁仟玖佰肆拾贰|叁仟玖佰肆拾叁|叁仟玖佰肆拾肆|叁仟玖佰肆拾伍|叁仟玖佰肆拾陆|叁仟玖佰肆拾柒|叁仟玖佰肆拾捌|叁仟玖佰肆拾玖|叁仟玖佰伍拾|叁仟玖佰伍拾壹|叁仟玖佰伍拾贰|叁仟玖佰伍拾叁|叁仟玖佰伍拾肆|叁仟玖佰伍拾伍|叁仟玖佰伍拾陆|叁仟玖佰伍拾柒|叁仟玖佰伍拾捌|叁仟玖佰伍拾玖|叁仟玖佰陆拾|叁仟玖佰陆拾壹|叁仟玖佰陆拾贰|叁仟玖佰陆拾叁|叁仟玖佰陆拾肆|叁仟玖佰陆拾伍|叁仟玖佰陆拾陆|叁仟玖佰陆拾柒|叁仟玖佰陆拾捌|叁仟玖佰陆拾玖|叁仟玖佰柒拾|叁仟玖佰柒拾壹|叁仟玖佰柒拾贰|叁仟玖佰柒拾叁|叁仟玖佰柒拾肆|叁仟玖佰柒拾伍|叁仟玖佰柒拾陆|叁仟玖佰柒拾柒|叁仟玖佰柒拾捌|叁仟玖佰柒拾玖|叁仟玖佰捌拾|叁仟玖佰捌拾壹|叁仟玖佰捌拾贰|叁仟玖佰捌拾叁|叁仟玖佰捌拾肆|叁仟玖佰捌拾伍|叁仟玖佰捌拾陆|叁仟玖佰捌拾柒|叁仟玖佰捌拾捌|叁仟玖佰捌拾玖|叁仟玖佰玖拾|叁仟玖佰玖拾壹|叁仟玖佰玖拾贰|叁仟玖佰玖拾叁|叁仟玖佰玖拾肆|叁仟玖佰玖拾伍|叁仟玖佰玖拾陆|叁仟玖佰玖拾柒|叁仟玖佰玖拾捌|叁仟玖佰玖拾玖|'
+    '肆仟|肆仟零壹|肆仟零贰|肆仟零叁|肆仟零肆|肆仟零伍|肆仟零陆|肆仟零柒|肆仟零捌|肆仟零玖|肆仟零壹拾|肆仟零壹拾壹|肆仟零壹拾贰|肆仟零壹拾叁|肆仟零壹拾肆|肆仟零壹拾伍|肆仟零壹拾陆|肆仟零壹拾柒|肆仟零壹拾捌|肆仟零壹拾玖|肆仟零贰拾|肆仟零贰拾壹|肆仟零贰拾贰|肆仟零贰拾叁|肆仟零贰拾肆|肆仟零贰拾伍|肆仟零贰拾陆|肆仟零贰拾柒|肆仟零贰拾捌|肆仟零贰拾玖|肆仟零叁拾|肆仟零叁拾壹|肆仟零叁拾贰|肆仟零叁拾叁|肆仟零叁拾肆|肆仟零叁拾伍|肆仟零叁拾陆|肆仟零叁拾柒|肆仟零叁拾捌|肆仟零叁拾玖|肆仟零肆拾|肆仟零肆拾壹|肆仟零肆拾贰|肆仟零肆拾叁|肆仟零肆拾肆|肆仟零肆拾伍|肆仟零肆拾陆|肆仟零肆拾柒|肆仟零肆拾捌|肆仟零肆拾玖|肆仟零伍拾|肆仟零伍拾壹|肆仟零伍拾贰|肆仟零伍拾叁|肆仟零伍拾肆|肆仟零伍拾伍|肆仟零伍拾陆|肆仟零伍拾柒|肆仟零伍拾捌|肆仟零伍拾玖|肆仟零陆拾|肆仟零陆拾壹|肆仟零陆拾贰|肆仟零陆拾叁|肆仟零陆拾肆|肆仟零陆拾伍|肆仟零陆拾陆|肆仟零陆拾柒|肆仟零陆拾捌|肆仟零陆拾玖|肆仟零柒拾|肆仟零柒拾壹|肆仟零柒拾贰|肆仟零柒拾叁|肆仟零柒拾肆|肆仟零柒拾伍|肆仟零柒拾陆|肆仟零柒拾柒|肆仟零柒拾捌|肆仟零柒拾玖|肆仟零捌拾|肆仟零捌拾壹|肆仟零捌拾贰|肆仟零捌拾叁|肆仟零捌拾肆|肆仟零捌拾伍|肆仟零捌拾陆|肆仟零捌拾柒|肆仟零捌拾捌|肆仟零捌拾玖|肆仟零玖拾|肆仟零玖拾壹|肆仟零玖拾贰|肆仟零玖拾叁|肆仟零玖拾肆|肆仟零玖拾伍|肆仟零玖拾陆|肆仟零玖拾柒|肆仟零玖拾捌|肆仟零玖拾玖|'
+    '肆仟壹佰|肆仟壹佰零壹|肆仟壹佰零贰|肆仟壹佰零叁|肆仟壹佰零肆|肆仟壹佰零伍|肆仟壹佰零陆|肆仟壹佰零柒|肆仟壹佰零捌|肆仟壹佰零玖|肆仟壹佰壹拾|肆仟壹佰壹拾壹|肆仟壹佰壹拾贰|肆仟壹佰壹拾叁|肆仟壹佰壹拾肆|肆仟壹佰壹拾伍|肆仟壹佰壹拾陆|肆仟壹佰壹拾柒|肆仟壹佰壹拾捌|肆仟壹佰壹拾玖|肆仟壹佰贰拾|肆仟壹佰贰拾壹|肆仟壹佰贰拾贰|肆仟壹佰贰拾叁|肆仟壹佰贰拾肆|肆仟壹佰贰拾伍|肆仟壹佰贰拾陆|肆仟壹佰贰拾柒|肆仟壹佰贰拾捌|肆仟壹佰贰拾玖|肆仟壹佰叁拾|肆仟壹佰叁拾壹|肆仟壹佰叁拾贰|肆仟壹佰叁拾叁|肆仟壹佰叁拾肆|肆仟壹佰叁拾伍|肆仟壹佰叁拾陆|肆仟壹佰叁拾柒|肆仟壹佰叁拾捌|肆仟壹佰叁拾玖|肆仟壹佰肆拾|肆仟壹佰肆拾壹|肆仟壹佰肆拾贰|肆仟壹佰肆拾叁|肆仟壹佰肆拾肆|肆仟壹佰肆拾伍|肆仟壹佰肆拾陆|肆仟壹佰肆拾柒|肆仟壹佰肆拾捌|肆仟壹佰肆拾玖|肆仟壹佰伍拾|肆仟壹佰伍拾壹|肆仟壹佰伍拾贰|肆仟壹佰伍拾叁|肆仟壹佰伍拾肆|肆仟壹佰伍拾伍|肆仟壹佰伍拾陆|肆仟壹佰伍拾柒|肆仟壹佰伍拾捌|肆仟壹佰伍拾玖|肆仟壹佰陆拾|肆仟壹佰陆拾壹|肆仟壹佰陆拾贰|肆仟壹佰陆拾叁|肆仟壹佰陆拾肆|肆仟壹佰陆拾伍|肆仟壹佰陆拾陆|肆仟壹佰陆拾柒|肆仟壹佰陆拾捌|肆仟壹佰陆拾玖|肆仟壹佰柒拾|肆仟壹佰柒拾壹|肆仟壹佰柒拾贰|肆仟壹佰柒拾叁|肆仟壹佰柒拾肆|肆仟壹佰柒拾伍|肆仟壹佰柒拾陆|肆仟壹佰柒拾柒|肆仟壹佰柒拾捌|肆仟壹佰柒拾玖|肆仟壹佰捌拾|肆仟壹佰捌拾壹|肆仟壹佰捌拾贰|肆仟壹佰捌拾叁|肆仟壹佰捌拾肆|肆仟壹佰捌拾伍|肆仟壹佰捌拾陆|肆仟壹佰捌拾柒|肆仟壹佰捌拾捌|肆仟壹佰捌拾玖|肆仟壹佰玖拾|肆仟壹佰玖拾壹|肆仟壹佰玖拾贰|肆仟壹佰玖拾叁|肆仟壹佰玖拾肆|肆仟壹佰玖拾伍|肆仟壹佰玖拾陆|肆仟壹佰玖拾柒|肆仟壹佰玖拾捌|肆仟壹佰玖拾玖|'
+    '肆仟贰佰|肆仟贰佰零壹|肆仟贰佰零贰|肆仟贰佰零叁|肆仟贰佰零肆|肆仟贰佰零伍|肆仟贰佰零陆|肆仟贰佰零柒|肆仟贰佰零捌|肆仟贰佰零玖|肆仟贰佰壹拾|肆仟贰佰壹拾壹|肆仟贰佰壹拾贰|肆仟贰佰壹拾叁|肆仟贰佰壹拾肆|肆仟贰佰壹拾伍|肆仟贰佰壹拾陆|肆仟贰佰壹拾柒|肆仟贰佰壹拾捌|肆仟贰佰壹拾玖|肆仟贰佰贰拾|肆仟贰佰贰拾壹|肆仟贰佰贰拾贰|肆仟贰佰贰拾叁|肆仟贰佰贰拾肆|肆仟贰佰贰拾伍|肆仟贰佰贰拾陆|肆仟贰佰贰拾柒|肆仟贰佰贰拾捌|肆仟贰佰贰拾玖|肆仟贰佰叁拾|肆仟贰佰叁拾壹|肆仟贰佰叁拾贰|肆仟贰佰叁拾叁|肆仟贰佰叁拾肆|肆仟贰佰叁拾伍|肆仟贰佰叁拾陆|肆仟贰佰叁拾柒|肆仟贰佰叁拾捌|肆仟贰佰叁拾玖|肆仟贰佰肆拾|肆仟贰佰肆拾壹|肆仟贰佰肆拾贰|肆仟贰佰肆拾叁|肆仟贰佰肆拾肆|肆仟贰佰肆拾伍|肆仟贰佰肆拾陆|肆仟贰佰肆拾柒|肆仟贰佰肆拾捌|肆仟贰佰肆拾玖|肆仟贰佰伍拾|肆仟贰佰伍拾壹|肆仟贰佰伍拾贰|肆仟贰佰伍拾叁|肆仟贰佰伍拾肆|肆仟贰佰伍拾伍|肆仟贰佰伍拾陆|肆仟贰佰伍拾柒|肆仟贰佰伍拾捌|肆仟贰佰伍拾玖|肆仟贰佰陆拾|肆仟贰佰陆拾壹|肆仟贰佰陆拾贰|肆仟贰佰陆拾叁|肆仟贰佰陆拾肆|肆仟贰佰陆拾伍|肆仟贰佰陆拾陆|肆仟贰佰陆拾柒|肆仟贰佰陆拾捌|肆仟贰佰陆拾玖|肆仟贰佰柒拾|肆仟贰佰柒拾壹|肆仟贰佰柒拾贰|肆仟贰佰柒拾叁|肆仟贰佰柒拾肆|肆仟贰佰柒拾伍|肆仟贰佰柒拾陆|肆仟贰佰柒拾柒|肆仟贰佰柒拾捌|肆仟贰佰柒拾玖|肆仟贰佰捌拾|肆仟贰佰捌拾壹|肆仟贰佰捌拾贰|肆仟贰佰捌拾叁|肆仟贰佰捌拾肆|肆仟贰佰捌拾伍|肆仟贰佰捌拾陆|肆仟贰佰捌拾柒|肆仟贰佰捌拾捌|肆仟贰佰捌拾玖|肆仟贰佰玖拾|肆仟贰佰玖拾壹|肆仟贰佰玖拾贰|肆仟贰佰玖拾叁|肆仟贰佰玖拾肆|肆仟贰佰玖拾伍|肆仟贰佰玖拾陆|肆仟贰佰玖拾柒|肆仟贰佰玖拾捌|肆仟贰佰玖拾玖|'
+    '肆仟叁佰|肆仟叁佰零壹|肆仟叁佰零贰|肆仟叁佰零叁|肆仟叁佰零肆|肆仟叁佰零伍|肆仟叁佰零陆|肆仟叁佰零柒|肆仟叁佰零捌|肆仟叁佰零玖|肆仟叁佰壹拾|肆仟叁佰壹拾壹|肆仟叁佰壹拾贰|肆仟叁佰壹拾叁|肆仟叁佰壹拾肆|肆仟叁佰壹拾伍|肆仟叁佰壹拾陆|肆仟叁佰壹拾柒|肆仟叁佰壹拾捌|肆仟叁佰壹拾玖|肆仟叁佰贰拾|肆仟叁佰贰拾壹|肆仟叁佰贰拾贰|肆仟叁佰贰拾叁|肆仟叁佰贰拾肆|肆仟叁佰贰拾伍|肆仟叁佰贰拾陆|肆仟叁佰贰拾柒|肆仟叁佰贰拾捌|肆仟叁佰贰拾玖|肆仟叁佰叁拾|肆仟叁佰叁拾壹|肆仟叁佰叁拾贰|肆仟叁佰叁拾叁|肆仟叁佰叁拾肆|肆仟叁佰叁拾伍|肆仟叁佰叁拾陆|肆仟叁佰叁拾柒|肆仟叁佰叁拾捌|肆仟叁佰叁拾玖|肆仟叁佰肆拾|肆仟叁佰肆拾壹|肆仟叁佰肆拾贰|肆仟叁佰肆拾叁|肆仟叁佰肆拾肆|肆仟叁佰肆拾伍|肆仟叁佰肆拾陆|肆仟叁佰肆拾柒|肆仟叁佰肆拾捌|肆仟叁佰肆拾玖|肆仟叁佰伍拾|肆仟叁佰伍拾壹|肆仟叁佰伍拾贰|肆仟叁佰伍拾叁|肆仟叁佰伍拾肆|肆仟叁佰伍拾伍|肆仟叁佰伍拾陆|肆仟叁佰伍拾柒|肆仟叁佰伍拾捌|肆仟叁佰伍拾玖|肆仟叁佰陆拾|肆仟叁佰陆拾壹|肆仟叁佰陆拾贰|肆仟叁佰陆拾叁|肆仟叁佰陆拾肆|肆仟叁佰陆拾伍|肆仟叁佰陆拾陆|肆仟叁佰陆拾柒|肆仟叁佰陆拾捌|肆仟叁佰陆拾玖|肆仟叁佰柒拾|肆仟叁佰柒拾壹|肆仟叁佰柒拾贰|肆仟叁佰柒拾叁|肆仟叁佰柒拾肆|肆仟叁佰柒拾伍|肆仟叁佰柒拾陆|肆仟叁佰柒拾柒|肆仟叁佰柒拾捌|肆仟叁佰柒拾玖|肆仟叁佰捌拾|肆仟叁佰捌拾壹|肆仟叁佰捌拾贰|肆仟叁佰捌拾叁|肆仟叁佰捌拾肆|肆仟叁佰捌拾伍|肆仟叁佰捌拾陆|肆仟叁佰捌拾柒|肆仟叁佰捌拾捌|肆仟叁佰捌拾玖|肆仟叁佰玖拾|肆仟叁佰玖拾壹|肆仟叁佰玖拾贰|肆仟叁佰玖拾叁|肆仟叁佰玖拾肆|肆仟叁佰玖拾伍|肆仟叁佰玖拾陆|肆仟叁佰玖拾柒|肆仟叁佰玖拾捌|肆仟叁佰玖拾玖|'
+    '肆仟肆佰|肆仟肆佰零壹|肆仟肆佰零贰|肆仟肆佰零叁|肆仟肆佰零肆|肆仟肆佰零伍|肆仟肆佰零陆|肆仟肆佰零柒|肆仟肆佰零捌|肆仟肆佰零玖|肆仟肆佰壹拾|肆仟肆佰壹拾壹|肆仟肆佰壹拾贰|肆仟肆佰壹拾叁|肆仟肆佰壹拾肆|肆仟肆佰壹拾伍|肆仟肆佰壹拾陆|肆仟肆佰壹拾柒|肆仟肆佰壹拾捌|肆仟肆佰壹拾玖|肆仟肆佰贰拾|肆仟肆佰贰拾壹|肆仟肆佰贰拾贰|肆仟肆佰贰拾叁|肆仟肆佰贰拾肆|肆仟肆佰贰拾伍|肆仟肆佰贰拾陆|肆仟肆佰贰拾柒|肆仟肆佰贰拾捌|肆仟肆佰贰拾玖|肆仟肆佰叁拾|肆仟肆佰叁拾壹|肆仟肆佰叁拾贰|肆仟肆佰叁拾叁|肆仟肆佰叁拾肆|肆仟肆佰叁拾伍|肆仟肆佰叁拾陆|肆仟肆佰叁拾柒|肆仟肆佰叁拾捌|肆仟肆佰叁拾玖|肆仟肆佰肆拾|肆仟肆佰肆拾壹|肆仟肆佰肆拾贰|肆仟肆佰肆拾叁|肆仟肆佰肆拾肆|肆仟肆佰肆拾伍|肆仟肆佰肆拾陆|肆仟肆佰肆拾柒|肆仟肆佰肆拾捌|肆仟肆佰肆拾玖|肆仟肆佰伍拾|肆仟肆佰伍拾壹|肆仟肆佰伍拾贰|肆仟肆佰伍拾叁|肆仟肆佰伍拾肆|肆仟肆佰伍拾伍|肆仟肆佰伍拾陆|肆仟肆佰伍拾柒|肆仟肆佰伍拾捌|肆仟肆佰伍拾玖|肆仟肆佰陆拾|肆仟肆佰陆拾壹|肆仟肆佰陆拾贰|肆仟肆佰陆拾叁|肆仟肆佰陆拾肆|肆仟肆佰陆拾伍|肆仟肆佰陆拾陆|肆仟肆佰陆拾柒|肆仟肆佰陆拾捌|肆仟肆佰陆拾玖|肆仟肆佰柒拾|肆仟肆佰柒拾壹|肆仟肆佰柒拾贰|肆仟肆佰柒拾叁|肆仟肆佰柒拾肆|肆仟肆佰柒拾伍|肆仟肆佰柒拾陆|肆仟肆佰柒拾柒|肆仟肆佰柒拾捌|肆仟肆佰柒拾玖|肆仟肆佰捌拾|肆仟肆佰捌拾壹|肆仟肆佰捌拾贰|肆仟肆佰捌拾叁|肆仟肆佰捌拾肆|肆仟肆佰捌拾伍|肆仟肆佰捌拾陆|肆仟肆佰捌拾柒|肆仟肆佰捌拾捌|肆仟肆佰捌拾玖|肆仟肆佰玖拾|肆仟肆佰玖拾壹|肆仟肆佰玖拾贰|肆仟肆佰玖拾叁|肆仟肆佰玖拾肆|肆仟肆佰玖拾伍|肆仟肆佰玖拾陆|肆仟肆佰玖拾柒|肆仟肆佰玖拾捌|肆仟肆佰玖拾玖|'
+    '肆仟伍佰|肆仟伍佰零壹|肆仟伍佰零贰|肆仟伍佰零叁|肆仟伍佰零肆|肆仟伍佰零伍|肆仟伍佰零陆|肆仟伍佰零柒|肆仟伍佰零捌|肆仟伍佰零玖|肆仟伍佰壹拾|肆仟伍佰壹拾壹|肆仟伍佰壹拾贰|肆仟伍佰壹拾叁|肆仟伍佰壹拾肆|肆仟伍佰壹拾伍|肆仟伍佰壹拾陆|肆仟伍佰壹拾柒|肆仟伍佰壹拾捌|肆仟伍佰壹拾玖|肆仟伍佰贰拾|肆仟伍佰贰拾壹|肆仟伍佰贰拾贰|肆仟伍佰贰拾叁|肆仟伍佰贰拾肆|肆仟伍佰贰拾伍|肆仟伍佰贰拾陆|肆仟伍佰贰拾柒|肆仟伍佰贰拾捌|肆仟伍佰贰拾玖|肆仟伍佰叁拾|肆仟伍佰叁拾壹|肆仟伍佰叁拾贰|肆仟伍佰叁拾叁|肆仟伍佰叁拾肆|肆仟伍佰叁拾伍|肆仟伍佰叁拾陆|肆仟伍佰叁拾柒|肆仟伍佰叁拾捌|肆仟伍佰叁拾玖|肆仟伍佰肆拾|肆仟伍佰肆拾壹|肆仟伍佰肆拾贰|肆仟伍佰肆拾叁|肆仟伍佰肆拾肆|肆仟伍佰肆拾伍|肆仟伍佰肆拾陆|肆仟伍佰肆拾柒|肆仟伍佰肆拾捌|肆仟伍佰肆拾玖|肆仟伍佰伍拾|肆仟伍佰伍拾壹|肆仟伍佰伍拾贰|肆仟伍佰伍拾叁|肆仟伍佰伍拾肆|肆仟伍佰伍拾伍|肆仟伍佰伍拾陆|肆仟伍佰伍拾柒|肆仟伍佰伍拾捌|肆仟伍佰伍拾玖|肆仟伍佰陆拾|肆仟伍佰陆拾壹|肆仟伍佰陆拾贰|肆仟伍佰陆拾叁|肆仟伍佰陆拾肆|肆仟伍佰陆拾伍|肆仟伍佰陆拾陆|肆仟伍佰陆拾柒|肆仟伍佰陆拾捌|肆仟伍佰陆拾玖|肆仟伍佰柒拾|肆仟伍佰柒拾壹|肆仟伍佰柒拾贰|肆仟伍佰柒拾叁|肆仟伍佰柒拾肆|肆仟伍佰柒拾伍|肆仟伍佰柒拾陆|肆仟伍佰柒拾柒|肆仟伍佰柒拾捌|肆仟伍佰柒拾玖|肆仟伍佰捌拾|肆仟伍佰捌拾壹|肆仟伍佰捌拾贰|肆仟伍佰捌拾叁|肆仟伍佰捌拾肆|肆仟伍佰捌拾伍|肆仟伍佰捌拾陆|肆仟伍佰捌拾柒|肆仟伍佰捌拾捌|肆仟伍佰捌拾玖|肆仟伍佰玖拾|肆仟伍佰玖拾壹|肆仟伍佰玖拾贰|肆仟伍佰玖拾叁|肆仟伍佰玖拾肆|肆仟伍佰玖拾伍|肆仟伍佰玖拾陆|肆仟伍佰玖拾柒|肆仟伍佰玖拾捌|肆仟伍佰玖拾玖|'
+    '肆仟陆佰|肆仟陆佰零壹|肆仟陆佰零贰|肆仟陆佰零叁|肆仟陆佰零肆|肆仟陆佰零伍|肆仟陆佰零陆|肆仟陆佰零柒|肆仟陆佰零捌|肆仟陆佰零玖|肆仟陆佰壹拾|肆仟陆佰壹拾壹|肆仟陆佰壹拾贰|肆仟陆佰壹拾叁|肆仟陆佰壹拾肆|肆仟陆佰壹拾伍|肆仟陆佰壹拾陆|肆仟陆佰壹拾柒|肆仟陆佰壹拾捌|肆仟陆佰壹拾玖|肆仟陆佰贰拾|肆仟陆佰贰拾壹|肆仟陆佰贰拾贰|肆仟陆佰贰拾叁|肆仟陆佰贰拾肆|肆仟陆佰贰拾伍|肆仟陆佰贰拾陆|肆仟陆佰贰拾柒|肆仟陆佰贰拾捌|肆仟陆佰贰拾玖|肆仟陆佰叁拾|肆仟陆佰叁拾壹|肆仟陆佰叁拾贰|肆仟陆佰叁拾叁|肆仟陆佰叁拾肆|肆仟陆佰叁拾伍|肆仟陆佰叁拾陆|肆仟陆佰叁拾柒|肆仟陆佰叁拾捌|肆仟陆佰叁拾玖|肆仟陆佰肆拾|肆仟陆佰肆拾壹|肆仟陆佰肆拾贰|肆仟陆佰肆拾叁|肆仟陆佰肆拾肆|肆仟陆佰肆拾伍|肆仟陆佰肆拾陆|肆仟陆佰肆拾柒|肆仟陆佰肆拾捌|肆仟陆佰肆拾玖|肆仟陆佰伍拾|肆仟陆佰伍拾壹|肆仟陆佰伍拾贰|肆仟陆佰伍拾叁|肆仟陆佰伍拾肆|肆仟陆佰伍拾伍|肆仟陆佰伍拾陆|肆仟陆佰伍拾柒|肆仟陆佰伍拾捌|肆仟陆佰伍拾玖|肆仟陆佰陆拾|肆仟陆佰陆拾壹|肆仟陆佰陆拾贰|肆仟陆佰陆拾叁|肆仟陆佰陆拾肆|肆仟陆佰陆拾伍|肆仟陆佰陆拾陆|肆仟陆佰陆拾柒|肆仟陆佰陆拾捌|肆仟陆佰陆拾玖|肆仟陆佰柒拾|肆仟陆佰柒拾壹|肆仟陆佰柒拾贰|肆仟陆佰柒拾叁|肆仟陆佰柒拾肆|肆仟陆佰柒拾伍|肆仟陆佰柒拾陆|肆仟陆佰柒拾柒|肆仟陆佰柒拾捌|肆仟陆佰柒拾玖|肆仟陆佰捌拾|肆仟陆佰捌拾壹|肆仟陆佰捌拾贰|肆仟陆佰捌拾叁|肆仟陆佰捌拾肆|肆仟陆佰捌拾伍|肆仟陆佰捌拾陆|肆仟陆佰捌拾柒|肆仟陆佰捌拾捌|肆仟陆佰捌拾玖|肆仟陆佰玖拾|肆仟陆佰玖拾壹|肆仟陆佰玖拾贰|肆仟陆佰玖拾叁|肆仟陆佰玖拾肆|肆仟陆佰玖拾伍|肆仟陆佰玖拾陆|肆仟陆佰玖拾柒|肆仟陆佰玖拾捌|肆仟陆佰玖拾玖|'
+    '肆仟柒佰|肆仟柒佰零壹|肆仟柒佰零贰|肆仟柒佰零叁|肆仟柒佰零肆|肆仟柒佰零伍|肆仟柒佰零陆|肆仟柒佰零柒|肆仟柒佰零捌|肆仟柒佰零玖|肆仟柒佰壹拾|肆仟柒佰壹拾壹|肆仟柒佰壹拾贰|肆仟柒佰壹拾叁|肆仟柒佰壹拾肆|肆仟柒佰壹拾伍|肆仟柒佰壹拾陆|肆仟柒佰壹拾柒|肆仟柒佰壹拾捌|肆仟柒佰壹拾玖|肆仟柒佰贰拾|肆仟柒佰贰拾壹|肆仟柒佰贰拾贰|肆仟柒佰贰拾叁|肆仟柒佰贰拾肆|肆仟柒佰贰拾伍|肆仟柒佰贰拾陆|肆仟柒佰贰拾柒|肆仟柒佰贰拾捌|肆仟柒佰贰拾玖|肆仟柒佰叁拾|肆仟柒佰叁拾壹|肆仟柒佰叁拾贰|肆仟柒佰叁拾叁|肆仟柒佰叁拾肆|肆仟柒佰叁拾伍|肆仟柒佰叁拾陆|肆仟柒佰叁拾柒|肆仟柒佰叁拾捌|肆仟柒佰叁拾玖|肆仟柒佰肆拾|肆仟柒佰肆拾壹|肆仟柒佰肆拾贰|肆仟柒佰肆拾叁|肆仟柒佰肆拾肆|肆仟柒佰肆拾伍|肆仟柒佰肆拾陆|肆仟柒佰肆拾柒|肆仟柒佰肆拾捌|肆仟柒佰肆拾玖|肆仟柒佰伍拾|肆仟柒佰伍拾壹|肆仟柒佰伍拾贰|肆仟柒佰伍拾叁|肆仟柒佰伍拾肆|肆仟柒佰伍拾伍|肆仟柒佰伍拾陆|肆仟柒佰伍拾柒|肆仟柒佰伍拾捌|肆仟柒佰伍拾玖|肆仟柒佰陆拾|肆仟柒佰陆拾壹|肆仟柒佰陆拾贰|肆仟柒佰陆拾叁|肆仟柒佰陆拾肆|肆仟柒佰陆拾伍|肆仟柒佰陆拾陆|肆仟柒佰陆拾柒|肆仟柒佰陆拾捌|肆仟柒佰陆拾玖|肆仟柒佰柒拾|肆仟柒佰柒拾壹|肆仟柒佰柒拾贰|肆仟柒佰柒拾叁|肆仟柒佰柒拾肆|肆仟柒佰柒拾伍|肆仟柒佰柒拾陆|肆仟柒佰柒拾柒|肆仟柒佰柒拾捌|肆仟柒佰柒拾玖|肆仟柒佰捌拾|肆仟柒佰捌拾壹|肆仟柒佰捌拾贰|肆仟柒佰捌拾叁|肆仟柒佰捌拾肆|肆仟柒佰捌拾伍|肆仟柒佰捌拾陆|肆仟柒佰捌拾柒|肆仟柒佰捌拾捌|肆仟柒佰捌拾玖|肆仟柒佰玖拾|肆仟柒佰玖拾壹|肆仟柒佰玖拾贰|肆仟柒佰玖拾叁|肆仟柒佰玖拾肆|肆仟柒佰玖拾伍|肆仟柒佰玖拾陆|肆仟柒佰玖拾柒|肆仟柒佰玖拾捌|肆仟柒佰玖拾玖|'
+    '肆仟捌佰|肆仟捌佰零壹|肆仟捌佰零贰|肆仟捌佰零叁|肆仟捌佰零肆|肆仟捌佰零伍|肆仟捌佰零陆|肆仟捌佰零柒|肆仟捌佰零捌|肆仟捌佰零玖|肆仟捌佰壹拾|肆仟捌佰壹拾壹|肆仟捌佰壹拾贰|肆仟捌佰壹拾叁|肆仟捌佰壹拾肆|肆仟捌佰壹拾伍|肆仟捌佰壹拾陆|肆仟捌佰壹拾柒|肆仟捌佰壹拾捌|肆仟捌佰壹拾玖|肆仟捌佰贰拾|肆仟捌佰贰拾壹|肆仟捌佰贰拾贰|肆仟捌佰贰拾叁|肆仟捌佰贰拾肆|肆仟捌佰贰拾伍|肆仟捌佰贰拾陆|肆仟捌佰贰拾柒|肆仟捌佰贰拾捌|肆仟捌佰贰拾玖|肆仟捌佰叁拾|肆仟捌佰叁拾壹|肆仟捌佰叁拾贰|肆仟捌佰叁拾叁|肆仟捌佰叁拾肆|肆仟捌佰叁拾伍|肆仟捌佰叁拾陆|肆仟捌佰叁拾柒|肆仟捌佰叁拾捌|肆仟捌佰叁拾玖|肆仟捌佰肆拾|肆仟捌佰肆拾壹|肆仟捌佰肆拾贰|肆仟捌佰肆拾叁|肆仟捌佰肆拾肆|肆仟捌佰肆拾伍|肆仟捌佰肆拾陆|肆仟捌佰肆拾柒|肆仟捌佰肆拾捌|肆仟捌佰肆拾玖|肆仟捌佰伍拾|肆仟捌佰伍拾壹|肆仟捌佰伍拾贰|肆仟捌佰伍拾叁|肆仟捌佰伍拾肆|肆仟捌佰伍拾伍|肆仟捌佰伍拾陆|肆仟捌佰伍拾柒|肆仟捌佰伍拾捌|肆仟捌佰伍拾玖|肆仟捌佰陆拾|肆仟捌佰陆拾壹|肆仟捌佰陆拾贰|肆仟捌佰陆拾叁|肆仟捌佰陆拾肆|肆仟捌佰陆拾伍|肆仟捌佰陆拾陆|肆仟捌佰陆拾柒|肆仟捌佰陆拾捌|肆仟捌佰陆拾玖|肆仟捌佰柒拾|肆仟捌佰柒拾壹|肆仟捌佰柒拾贰|肆仟捌佰柒拾叁|肆仟捌佰柒拾肆|肆仟捌佰柒拾伍|肆仟捌佰柒拾陆|肆仟捌佰柒拾柒|肆仟捌佰柒拾捌|肆仟捌佰柒拾玖|肆仟捌佰捌拾|肆仟捌佰捌拾壹|肆仟捌佰捌拾贰|肆仟捌佰捌拾叁|肆仟捌佰捌拾肆|肆仟捌佰捌拾伍|肆仟捌佰捌拾陆|肆仟捌佰捌拾柒|肆仟捌佰捌拾捌|肆仟捌佰捌拾玖|肆仟捌佰玖拾|肆仟捌佰玖拾壹|肆仟捌佰玖拾贰|肆仟捌佰玖拾叁|肆仟捌佰玖拾肆|肆仟捌佰玖拾伍|肆仟捌佰玖拾陆|肆仟捌佰玖拾柒|肆仟捌佰玖拾捌|肆仟捌佰玖拾玖|'
+    '肆仟玖佰|肆仟玖佰零壹|肆仟玖佰零贰|肆仟玖佰零叁|肆仟玖佰零肆|肆仟玖佰零伍|肆仟玖佰零陆|肆仟玖佰零柒|肆仟玖佰零捌|肆仟玖佰零玖|肆仟玖佰壹拾|肆仟玖佰壹拾壹|肆仟玖佰壹拾贰|肆仟玖佰壹拾叁|肆仟玖佰壹拾肆|肆仟玖佰壹拾伍|肆仟玖佰壹拾陆|肆仟玖佰壹拾柒|肆仟玖佰壹拾捌|肆仟玖佰壹拾玖|肆仟玖佰贰拾|肆仟玖佰贰拾壹|肆仟玖佰贰拾贰|肆仟玖佰贰拾叁|肆仟玖佰贰拾肆|肆仟玖佰贰拾伍|肆仟玖佰贰拾陆|肆仟玖佰贰拾柒|肆仟玖佰贰拾捌|肆仟玖佰贰拾玖|肆仟玖佰叁拾|肆仟玖佰叁拾壹|肆仟玖佰叁拾贰|肆仟玖佰叁拾叁|肆仟玖佰叁拾肆|肆仟玖佰叁拾伍|肆仟玖佰叁拾陆|肆仟玖佰叁拾柒|肆仟玖佰叁拾捌|肆仟玖佰叁拾玖|肆仟玖佰肆拾|肆仟玖佰肆拾壹|肆仟玖佰肆拾贰|肆仟玖佰肆拾叁|肆仟玖佰肆拾肆|肆仟玖佰肆拾伍|肆仟玖佰肆拾陆|肆仟玖佰肆拾柒|肆仟玖佰肆拾捌|肆仟玖佰肆拾玖|肆仟玖佰伍拾|肆仟玖佰伍拾壹|肆仟玖佰伍拾贰|肆仟玖佰伍拾叁|肆仟玖佰伍拾肆|肆仟玖佰伍拾伍|肆仟玖佰伍拾陆|肆仟玖佰伍拾柒|肆仟玖佰伍拾捌|肆仟玖佰伍拾玖|肆仟玖佰陆拾|肆仟玖佰陆拾壹|肆仟玖佰陆拾贰|肆仟玖佰陆拾叁|肆仟玖佰陆拾肆|肆仟玖佰陆拾伍|肆仟玖佰陆拾陆|肆仟玖佰陆拾柒|肆仟玖佰陆拾捌|肆仟玖佰陆拾玖|肆仟玖佰柒拾|肆仟玖佰柒拾壹|肆仟玖佰柒拾贰|肆仟玖佰柒拾叁|肆仟玖佰柒拾肆|肆仟玖佰柒拾伍|肆仟玖佰柒拾陆|肆仟玖佰柒拾柒|肆仟玖佰柒拾捌|肆仟玖佰柒拾玖|肆仟玖佰捌拾|肆仟玖佰捌拾壹|肆仟玖佰捌拾贰|肆仟玖佰捌拾叁|肆仟玖佰捌拾肆|肆仟玖佰捌拾伍|肆仟玖佰捌拾陆|肆仟玖佰捌拾柒|肆仟玖佰捌拾捌|肆仟玖佰捌拾玖|肆仟玖佰玖拾|肆仟玖佰玖拾壹|肆仟玖佰玖拾贰|肆仟玖佰玖拾叁|肆仟玖佰玖拾肆|肆仟玖佰玖拾伍|肆仟玖佰玖拾陆|肆仟玖佰玖拾柒|肆仟玖佰玖拾捌|肆仟玖佰玖拾玖|'
+    '伍仟|伍仟零壹|伍仟零贰|伍仟零叁|伍仟零肆|伍仟零伍|伍仟零陆|伍仟零柒|伍仟零捌|伍仟零玖|伍仟零壹拾|伍仟零壹拾壹|伍仟零壹拾贰|伍仟零壹拾叁|伍仟零壹拾肆|伍仟零壹拾伍|伍仟零壹拾陆|伍仟零壹拾柒|伍仟零壹拾捌|伍仟零壹拾玖|伍仟零贰拾|伍仟零贰拾壹|伍仟零贰拾贰|伍仟零贰拾叁|伍仟零贰拾肆|伍仟零贰拾伍|伍仟零贰拾陆|伍仟零贰拾柒|伍仟零贰拾捌|伍仟零贰拾玖|伍仟零叁拾|伍仟零叁拾壹|伍仟零叁拾贰|伍仟零叁拾叁|伍仟零叁拾肆|伍仟零叁拾伍|伍仟零叁拾陆|伍仟零叁拾柒|伍仟零叁拾捌|伍仟零叁拾玖|伍仟零肆拾|伍仟零肆拾壹|伍仟零肆拾贰|伍仟零肆拾叁|伍仟零肆拾肆|伍仟零肆拾伍|伍仟零肆拾陆|伍仟零肆拾柒|伍仟零肆拾捌|伍仟零肆拾玖|伍仟零伍拾|伍仟零伍拾壹|伍仟零伍拾贰|伍仟零伍拾叁|伍仟零伍拾肆|伍仟零伍拾伍|伍仟零伍拾陆|伍仟零伍拾柒|伍仟零伍拾捌|伍仟零伍拾玖|伍仟零陆拾|伍仟零陆拾壹|伍仟零陆拾贰|伍仟零陆拾叁|伍仟零陆拾肆|伍仟零陆拾伍|伍仟零陆拾陆|伍仟零陆拾柒|伍仟零陆拾捌|伍仟零陆拾玖|伍仟零柒拾|伍仟零柒拾壹|伍仟零柒拾贰|伍仟零柒拾叁|伍仟零柒拾肆|伍仟零柒拾伍|伍仟零柒拾陆|伍仟零柒拾柒|伍仟零柒拾捌|伍仟零柒拾玖|伍仟零捌拾|伍仟零捌拾壹|伍仟零捌拾贰|伍仟零捌拾叁|伍仟零捌拾肆|伍仟零捌拾伍|伍仟零捌拾陆|伍仟零捌拾柒|伍仟零捌拾捌|伍仟零捌拾玖|伍仟零玖拾|伍仟零玖拾壹|伍仟零玖拾贰|伍仟零玖拾叁|伍仟零玖拾肆|伍仟零玖拾伍|伍仟零玖拾陆|伍仟零玖拾柒|伍仟零玖拾捌|伍仟零玖拾玖|'
+    '伍仟壹佰|伍仟壹佰零壹|伍仟壹佰零贰|伍仟壹佰零叁|伍仟壹佰零肆|伍仟壹佰零伍|伍仟壹佰零陆|伍仟壹佰零柒|伍仟壹佰零捌|伍仟壹佰零玖|伍仟壹佰壹拾|伍仟壹佰壹拾壹|伍仟壹佰壹拾贰|伍仟壹佰壹拾叁|伍仟壹佰壹拾肆|伍仟壹佰壹拾伍|伍仟壹佰壹拾陆|伍仟壹佰壹拾柒|伍仟壹佰壹拾捌|伍仟壹佰壹拾玖|伍仟壹佰贰拾|伍仟壹佰贰拾壹|伍仟壹佰贰拾贰|伍仟壹佰贰拾叁|伍仟壹佰贰拾肆|伍仟壹佰贰拾伍|伍仟壹佰贰拾陆|伍仟壹佰贰拾柒|伍仟壹佰贰拾捌|伍仟壹佰贰拾玖|伍仟壹佰叁拾|伍仟壹佰叁拾壹|伍仟壹佰叁拾贰|伍仟壹佰叁拾叁|伍仟壹佰叁拾肆|伍仟壹佰叁拾伍|伍仟壹佰叁拾陆|伍仟壹佰叁拾柒|伍仟壹佰叁拾捌|伍仟壹佰叁拾玖|伍仟壹佰肆拾|伍仟壹佰肆拾壹|伍仟壹佰肆拾贰|伍仟壹佰肆拾叁|伍仟壹佰肆拾肆|伍仟壹佰肆拾伍|伍仟壹佰肆拾陆|伍仟壹佰肆拾柒|伍仟壹佰肆拾捌|伍仟壹佰肆拾玖|伍仟壹佰伍拾|伍仟壹佰伍拾壹|伍仟壹佰伍拾贰|伍仟壹佰伍拾叁|伍仟壹佰伍拾肆|伍仟壹佰伍拾伍|伍仟壹佰伍拾陆|伍仟壹佰伍拾柒|伍仟壹佰伍拾捌|伍仟壹佰伍拾玖|伍仟壹佰陆拾|伍仟壹佰陆拾壹|伍仟壹佰陆拾贰|伍仟壹佰陆拾叁|伍仟壹佰陆拾肆|伍仟壹佰陆拾伍|伍仟壹佰陆拾陆|伍仟壹佰陆拾柒|伍仟壹佰陆拾捌|伍仟壹佰陆拾玖|伍仟壹佰柒拾|伍仟壹佰柒拾壹|伍仟壹佰柒拾贰|伍仟壹佰柒拾叁|伍仟壹佰柒拾肆|伍仟壹佰柒拾伍|伍仟壹佰柒拾陆|伍仟壹佰柒拾柒|伍仟壹佰柒拾捌|伍仟壹佰柒拾玖|伍仟壹佰捌拾|伍仟壹佰捌拾壹|伍仟壹佰捌拾贰|伍仟壹佰捌拾叁|伍仟壹佰捌拾肆|伍仟壹佰捌拾伍|伍仟壹佰捌拾陆|伍仟壹佰捌拾柒|伍仟壹佰捌拾捌|伍仟壹佰捌拾玖|伍仟壹佰玖拾|伍仟壹佰玖拾壹|伍仟壹佰玖拾贰|伍仟壹佰玖拾叁|伍仟壹佰玖拾肆|伍仟壹佰玖拾伍|伍仟壹佰玖拾陆|伍仟壹佰玖拾柒|伍仟壹佰玖拾捌|伍仟壹佰玖拾玖|'
+    '伍仟贰佰|伍仟贰佰零壹|伍仟贰佰零贰|伍仟贰佰零叁|伍仟贰佰零肆|伍仟贰佰零伍|伍仟贰佰零陆|伍仟贰佰零柒|伍仟贰佰零捌|伍仟贰佰零玖|伍仟贰佰壹拾|伍仟贰佰壹拾壹|伍仟贰佰壹拾贰|伍仟贰佰壹拾叁|伍仟贰佰壹拾肆|伍仟贰佰壹拾伍|伍仟贰佰壹拾陆|伍仟贰佰壹拾柒|伍仟贰佰壹拾捌|伍仟贰佰壹拾玖|伍仟贰佰贰拾|伍仟贰佰贰拾壹|伍仟贰佰贰拾贰|伍仟贰佰贰拾叁|伍仟贰佰贰拾肆|伍仟贰佰贰拾伍|伍仟贰佰贰拾陆|伍仟贰佰贰拾柒|伍仟贰佰贰拾捌|伍仟贰佰贰拾玖|伍仟贰佰叁拾|伍仟贰佰叁拾壹|伍仟贰佰叁拾贰|伍仟贰佰叁拾叁|伍仟贰佰叁拾肆|伍仟贰佰叁拾伍|伍仟贰佰叁拾陆|伍仟贰佰叁拾柒|伍仟贰佰叁拾捌|伍仟贰佰叁拾玖|伍仟贰佰肆拾|伍仟贰佰肆拾壹|伍仟贰佰肆拾贰|伍仟贰佰肆拾叁|伍仟贰佰肆拾肆|伍仟贰佰肆拾伍|伍仟贰佰肆拾陆|伍仟贰佰肆拾柒|伍仟贰佰肆拾捌|伍仟贰佰肆拾玖|伍仟贰佰伍拾|伍仟贰佰伍拾壹|伍仟贰佰伍拾贰|伍仟贰佰伍拾叁|伍仟贰佰伍拾肆|伍仟贰佰伍拾伍|伍仟贰佰伍拾陆|伍仟贰佰伍拾柒|伍仟贰佰伍拾捌|伍仟贰佰伍拾玖|伍仟贰佰陆拾|伍仟贰佰陆拾壹|伍仟贰佰陆拾贰|伍仟贰佰陆拾叁|伍仟贰佰陆拾肆|伍仟贰佰陆拾伍|伍仟贰佰陆拾陆|伍仟贰佰陆拾柒|伍仟贰佰陆拾捌|伍仟贰佰陆拾玖|伍仟贰佰柒拾|伍仟贰佰柒拾壹|伍仟贰佰柒拾贰|伍仟贰佰柒拾叁|伍仟贰佰柒拾肆|伍仟贰佰柒拾伍|伍仟贰佰柒拾陆|伍仟贰佰柒拾柒|伍仟贰佰柒拾捌|伍仟贰佰柒拾玖|伍仟贰佰捌拾|伍仟贰佰捌拾壹|伍仟贰佰捌拾贰|伍仟贰佰捌拾叁|伍仟贰佰捌拾肆|伍仟贰佰捌拾伍|伍仟贰佰捌拾陆|伍仟贰佰捌拾柒|伍仟贰佰捌拾捌|伍仟贰佰捌拾玖|伍仟贰佰玖拾|伍仟贰佰玖拾壹|伍仟贰佰玖拾贰|伍仟贰佰玖拾叁|伍仟贰佰玖拾肆|伍仟贰佰玖拾伍|伍仟贰佰玖拾陆|伍仟贰佰玖拾柒|伍仟贰佰玖拾捌|伍仟贰佰玖拾玖|'
+    '伍仟叁佰|伍仟叁佰零壹|伍仟叁佰零贰|伍仟叁佰零叁|伍仟叁佰零肆|伍仟叁佰零伍|伍仟叁佰零陆|伍仟叁佰零柒|伍仟叁佰零捌|伍仟叁佰零玖|伍仟叁佰壹拾|伍仟叁佰壹拾壹|伍仟叁佰壹拾贰|伍仟叁佰壹拾叁|伍仟叁佰壹拾肆|伍仟叁佰壹拾伍|伍仟叁佰壹拾陆|伍仟叁佰壹拾柒|伍仟叁佰壹拾捌|伍仟叁佰壹拾玖|伍仟叁佰贰拾|伍仟叁佰贰拾壹|伍仟叁佰贰拾贰|伍仟叁佰贰拾叁|伍仟叁佰贰拾肆|伍仟叁佰贰拾伍|伍仟叁佰贰拾陆|伍仟叁佰贰拾柒|伍仟叁佰贰拾捌|伍仟叁佰贰拾玖|伍仟叁佰叁拾|伍仟叁佰叁拾壹|伍仟叁佰叁拾贰|伍仟叁佰叁拾叁|伍仟叁佰叁拾肆|伍仟叁佰叁拾伍|伍仟叁佰叁拾陆|伍仟叁佰叁拾柒|伍仟叁佰叁拾捌|伍仟叁佰叁拾玖|伍仟叁佰肆拾|伍仟叁佰肆拾壹|伍仟叁佰肆拾贰|伍仟叁佰肆拾叁|伍仟叁佰肆拾肆|伍仟叁佰肆拾伍|伍仟叁佰肆拾陆|伍仟叁佰肆拾柒|伍仟叁佰肆拾捌|伍仟叁佰肆拾玖|伍仟叁佰伍拾|伍仟叁佰伍拾壹|伍仟叁佰伍拾贰|伍仟叁佰伍拾叁|伍仟叁佰伍拾肆|伍仟叁佰伍拾伍|伍仟叁佰伍拾陆|伍仟叁佰伍拾柒|伍仟叁佰伍拾捌|伍仟叁佰伍拾玖|伍仟叁佰陆拾|伍仟叁佰陆拾壹|伍仟叁佰陆拾贰|伍仟叁佰陆拾叁|伍仟叁佰陆拾肆|伍仟叁佰陆拾伍|伍仟叁佰陆拾陆|伍仟叁佰陆拾柒|伍仟叁佰陆拾捌|伍仟叁佰陆拾玖|伍仟叁佰柒拾|伍仟叁佰柒拾壹|伍仟叁佰柒拾贰|伍仟叁佰柒拾叁|伍仟叁佰柒拾肆|伍仟叁佰柒拾伍|伍仟叁佰柒拾陆|伍仟叁佰柒拾柒|伍仟叁佰柒拾捌|伍仟叁佰柒拾玖|伍仟叁佰捌拾|伍仟叁佰捌拾壹|伍仟叁佰捌拾贰|伍仟叁佰捌拾叁|伍仟叁佰捌拾肆|伍仟叁佰捌拾伍|伍仟叁佰捌拾陆|伍仟叁佰捌拾柒|伍仟叁佰捌拾捌|伍仟叁佰捌拾玖|伍仟叁佰玖拾|伍仟叁佰玖拾壹|伍仟叁佰玖拾贰|伍仟叁佰玖拾叁|伍仟叁佰玖拾肆|伍仟叁佰玖拾伍|伍仟叁佰玖拾陆|伍仟叁佰玖拾柒|伍仟叁佰玖拾捌|伍仟叁佰玖拾玖|'
+    '伍仟肆佰|伍仟肆佰零壹|伍仟肆佰零贰|伍仟肆佰零叁|伍仟肆佰零肆|伍仟肆佰零伍|伍仟肆佰零陆|伍仟肆佰零柒|伍仟肆佰零捌|伍仟肆佰零玖|伍仟肆佰壹拾|伍仟肆佰壹拾壹|伍仟肆佰壹拾贰|伍仟肆佰壹拾叁|伍仟肆佰壹拾肆|伍仟肆佰壹拾伍|伍仟肆佰壹拾陆|伍仟肆佰壹拾柒|伍仟肆佰壹拾捌|伍仟肆佰壹拾玖|伍仟肆佰贰拾|伍仟肆佰贰拾壹|伍仟肆佰贰拾贰|伍仟肆佰贰拾叁|伍仟肆佰贰拾肆|伍仟肆佰贰拾伍|伍仟肆佰贰拾陆|伍仟肆佰贰拾柒|伍仟肆佰贰拾捌|伍仟肆佰贰拾玖|伍仟肆佰叁拾|伍仟肆佰叁拾壹|伍仟肆佰叁拾贰|伍仟肆佰叁拾叁|伍仟肆佰叁拾肆|伍仟肆佰叁拾伍|伍仟肆佰叁拾陆|伍仟肆佰叁拾柒|伍仟肆佰叁拾捌|伍仟肆佰叁拾玖|伍仟肆佰肆拾|伍仟肆佰肆拾壹|伍仟肆佰肆拾贰|伍仟肆佰肆拾叁|伍仟肆佰肆拾肆|伍仟肆佰肆拾伍|伍仟肆佰肆拾陆|伍仟肆佰肆拾柒|伍仟肆佰肆拾捌|伍仟肆佰肆拾玖|伍仟肆佰伍拾|伍仟肆佰伍拾壹|伍仟肆佰伍拾贰|伍仟肆佰伍拾叁|伍仟肆佰伍拾肆|伍仟肆佰伍拾伍|伍仟肆佰伍拾陆|伍仟肆佰伍拾柒|伍仟肆佰伍拾捌|伍仟肆佰伍拾玖|伍仟肆佰陆拾|伍仟肆佰陆拾壹|伍仟肆佰陆拾贰|伍仟肆佰陆拾叁|伍仟肆佰陆拾肆|伍仟肆佰陆拾伍|伍仟肆佰陆拾陆|伍仟肆佰陆拾柒|伍仟肆佰陆拾捌|伍仟肆佰陆拾玖|伍仟肆佰柒拾|伍仟肆佰柒拾壹|伍仟肆佰柒拾贰|伍仟肆佰柒拾叁|伍仟肆佰柒拾肆|伍仟肆佰柒拾伍|伍仟肆佰柒拾陆|伍仟肆佰柒拾柒|伍仟肆佰柒拾捌|伍仟肆佰柒拾玖|伍仟肆佰捌拾|伍仟肆佰捌拾壹|伍仟肆佰捌拾贰|伍仟肆佰捌拾叁|伍仟肆佰捌拾肆|伍仟肆佰捌拾伍|伍仟肆佰捌拾陆|伍仟肆佰捌拾柒|伍仟肆佰捌拾捌|伍仟肆佰捌拾玖|伍仟肆佰玖拾|伍仟肆佰玖拾壹|伍仟肆佰玖拾贰|伍仟肆佰玖拾叁|伍仟肆佰玖拾肆|伍仟肆佰玖拾伍|伍仟肆佰玖拾陆|伍仟肆佰玖拾柒|伍仟肆佰玖拾捌|伍仟肆佰玖拾玖|'
+    '伍仟伍佰|伍仟伍佰零壹|伍仟伍佰零贰|伍仟伍佰零叁|伍仟伍佰零肆|伍仟伍佰零伍|伍仟伍佰零陆|伍仟伍佰零柒|伍仟伍佰零捌|伍仟伍佰零玖|伍仟伍佰壹拾|伍仟伍佰壹拾壹|伍仟伍佰壹拾贰|伍仟伍佰壹拾叁|伍仟伍佰壹拾肆|伍仟伍佰壹拾伍|伍仟伍佰壹拾陆|伍仟伍佰壹拾柒|伍仟伍佰壹拾捌|伍仟伍佰壹拾玖|伍仟伍佰贰拾|伍仟伍佰贰拾壹|伍仟伍佰贰拾贰|伍仟伍佰贰拾叁|伍仟伍佰贰拾肆|伍仟伍佰贰拾伍|伍仟伍佰贰拾陆|伍仟伍佰贰拾柒|伍仟伍佰贰拾捌|伍仟伍佰贰拾玖|伍仟伍佰叁拾|伍仟伍佰叁拾壹|伍仟伍佰叁拾贰|伍仟伍佰叁拾叁|伍仟伍佰叁拾肆|伍仟伍佰叁拾伍|伍仟伍佰叁拾陆|伍仟伍佰叁拾柒|伍仟伍佰叁拾捌|伍仟伍佰叁拾玖|伍仟伍佰肆拾|伍仟伍佰肆拾壹|伍仟伍佰肆拾贰|伍仟伍佰肆拾叁|伍仟伍佰肆拾肆|伍仟伍佰肆拾伍|伍仟伍佰肆拾陆|伍仟伍佰肆拾柒|伍仟伍佰肆拾捌|伍仟伍佰肆拾玖|伍仟伍佰伍拾|伍仟伍佰伍拾壹|伍仟伍佰伍拾贰|伍仟伍佰伍拾叁|伍仟伍佰伍拾肆|伍仟伍佰伍拾伍|伍仟伍佰伍拾陆|伍仟伍佰伍拾柒|伍仟伍佰伍拾捌|伍仟伍佰伍拾玖|伍仟伍佰陆拾|伍仟伍佰陆拾壹|伍仟伍佰陆拾贰|伍仟伍佰陆拾叁|伍仟伍佰陆拾肆|伍仟伍佰陆拾伍|伍仟伍佰陆拾陆|伍仟伍佰陆拾柒|伍仟伍佰陆拾捌|伍仟伍佰陆拾玖|伍仟伍佰柒拾|伍仟伍佰柒拾壹|伍仟伍佰柒拾贰|伍仟伍佰柒拾叁|伍仟伍佰柒拾肆|伍仟伍佰柒拾伍|伍仟伍佰柒拾陆|伍仟伍佰柒拾柒|伍仟伍佰柒拾捌|伍仟伍佰柒拾玖|伍仟伍佰捌拾|伍仟伍佰捌拾壹|伍仟伍佰捌拾贰|伍仟伍佰捌拾叁|伍仟伍佰捌拾肆|伍仟伍佰捌拾伍|伍仟伍佰捌拾陆|伍仟伍佰捌拾柒|伍仟伍佰捌拾捌|伍仟伍佰捌拾玖|伍仟伍佰玖拾|伍仟伍佰玖拾壹|伍仟伍佰玖拾贰|伍仟伍佰玖拾叁|伍仟伍佰玖拾肆|伍仟伍佰玖拾伍|伍仟伍佰玖拾陆|伍仟伍佰玖拾柒|伍仟伍佰玖拾捌|伍仟伍佰玖拾玖|'
+    '伍仟陆佰|伍仟陆佰零壹|伍仟陆佰零贰|伍仟陆佰零叁|伍仟陆佰零肆|伍仟陆佰零伍|伍仟陆佰零陆|伍仟陆佰零柒|伍仟陆佰零捌|伍仟陆佰零玖|伍仟陆佰壹拾|伍仟陆佰壹拾壹|伍仟陆佰壹拾贰|伍仟陆佰壹拾叁|伍仟陆佰壹拾肆|伍仟陆佰壹拾伍|伍仟陆佰壹拾陆|伍仟陆佰壹拾柒|伍仟陆佰壹拾捌|伍仟陆佰壹拾玖|伍仟陆佰贰拾|伍仟陆佰贰拾壹|伍仟陆佰贰拾贰|伍仟陆佰贰拾叁|伍仟陆佰贰拾肆|伍仟陆佰贰拾伍|伍仟陆佰贰拾陆|伍仟陆佰贰拾柒|伍仟陆佰贰拾捌|伍仟陆佰贰拾玖|伍仟陆佰叁拾|伍仟陆佰叁拾壹|伍仟陆佰叁拾贰|伍仟陆佰叁拾叁|伍仟陆佰叁拾肆|伍仟陆佰叁拾伍|伍仟陆佰叁拾陆|伍仟陆佰叁拾柒|伍仟陆佰叁拾捌|伍仟陆佰叁拾玖|伍仟陆佰肆拾|伍仟陆佰肆拾壹|伍仟陆佰肆拾贰|伍仟陆佰肆拾叁|伍仟陆佰肆拾肆|伍仟陆佰肆拾伍|伍仟陆佰肆拾陆|伍仟陆佰肆拾柒|伍仟陆佰肆拾捌|伍仟陆佰肆拾玖|伍仟陆佰伍拾|伍仟陆佰伍拾壹|伍仟陆佰伍拾贰|伍仟陆佰伍拾叁|伍仟陆佰伍拾肆|伍仟陆佰伍拾伍|伍仟陆佰伍拾陆|伍仟陆佰伍拾柒|伍仟陆佰伍拾捌|伍仟陆佰伍拾玖|伍仟陆佰陆拾|伍仟陆佰陆拾壹|伍仟陆佰陆拾贰|伍仟陆佰陆拾叁|伍仟陆佰陆拾肆|伍仟陆佰陆拾伍|伍仟陆佰陆拾陆|伍仟陆佰陆拾柒|伍仟陆佰陆拾捌|伍仟陆佰陆拾玖|伍仟陆佰柒拾|伍仟陆佰柒拾壹|伍仟陆佰柒拾贰|伍仟陆佰柒拾叁|伍仟陆佰柒拾肆|伍仟陆佰柒拾伍|伍仟陆佰柒拾陆|伍仟陆佰柒拾柒|伍仟陆佰柒拾捌|伍仟陆佰柒拾玖|伍仟陆佰捌拾|伍仟陆佰捌拾壹|伍仟陆佰捌拾贰|伍仟陆佰捌拾叁|伍仟陆佰捌拾肆|伍仟陆佰捌拾伍|伍仟陆佰捌拾陆|伍仟陆佰捌拾柒|伍仟陆佰捌拾捌|伍仟陆佰捌拾玖|伍仟陆佰玖拾|伍仟陆佰玖拾壹|伍仟陆佰玖拾贰|伍仟陆佰玖拾叁|伍仟陆佰玖拾肆|伍仟陆佰玖拾伍|伍仟陆佰玖拾陆|伍仟陆佰玖拾柒|伍仟陆佰玖拾捌|伍仟陆佰玖拾玖|'
+    '伍仟柒佰|伍仟柒佰零壹|伍仟柒佰零贰|伍仟柒佰零叁|伍仟柒佰零肆|伍仟柒佰零伍|伍仟柒佰零陆|伍仟柒佰零柒|伍仟柒佰零捌|伍仟柒佰零玖|伍仟柒佰壹拾|伍仟柒佰壹拾壹|伍仟柒佰壹拾贰|伍仟柒佰壹拾叁|伍仟柒佰壹拾肆|伍仟柒佰壹拾伍|伍仟柒佰壹拾陆|伍仟柒佰壹拾柒|伍仟柒佰壹拾捌|伍仟柒佰壹拾玖|伍仟柒佰贰拾|伍仟柒佰贰拾壹|伍仟柒佰贰拾贰|伍仟柒佰贰拾叁|伍仟柒佰贰拾肆|伍仟柒佰贰拾伍|伍仟柒佰贰拾陆|伍仟柒佰贰拾柒|伍仟柒佰贰拾捌|伍仟柒佰贰拾玖|伍仟柒佰叁拾|伍仟柒佰叁拾壹|伍仟柒佰叁拾贰|伍仟柒佰叁拾叁|伍仟柒佰叁拾肆|伍仟柒佰叁拾伍|伍仟柒佰叁拾陆|伍仟柒佰叁拾柒|伍仟柒佰叁拾捌|伍仟柒佰叁拾玖|伍仟柒佰肆拾|伍仟柒佰肆拾壹|伍仟柒佰肆拾贰|伍仟柒佰肆拾叁|伍仟柒佰肆拾肆|伍仟柒佰肆拾伍|伍仟柒佰肆拾陆|伍仟柒佰肆拾柒|伍仟柒佰肆拾捌|伍仟柒佰肆拾玖|伍仟柒佰伍拾|伍仟柒佰伍拾壹|伍仟柒佰伍拾贰|伍仟柒佰伍拾叁|伍仟柒佰伍拾肆|伍仟柒佰伍拾伍|伍仟柒佰伍拾陆|伍仟柒佰伍拾柒|伍仟柒佰伍拾捌|伍仟柒佰伍拾玖|伍仟柒佰陆拾|伍仟柒佰陆拾壹|伍仟柒佰陆拾贰|伍仟柒佰陆拾叁|伍仟柒佰陆拾肆|伍仟柒佰陆拾伍|伍仟柒佰陆拾陆|伍仟柒佰陆拾柒|伍仟柒佰陆拾捌|伍仟柒佰陆拾玖|伍仟柒佰柒拾|伍仟柒佰柒拾壹|伍仟柒佰柒拾贰|伍仟柒佰柒拾叁|伍仟柒佰柒拾肆|伍仟柒佰柒拾伍|伍仟柒佰柒拾陆|伍仟柒佰柒拾柒|伍仟柒佰柒拾捌|伍仟柒佰柒拾玖|伍仟柒佰捌拾|伍仟柒佰捌拾壹|伍仟柒佰捌拾贰|伍仟柒佰捌拾叁|伍仟柒佰捌拾肆|伍仟柒佰捌拾伍|伍仟柒佰捌拾陆|伍仟柒佰捌拾柒|伍仟柒佰捌拾捌|伍仟柒佰捌拾玖|伍仟柒佰玖拾|伍仟柒佰玖拾壹|伍仟柒佰玖拾贰|伍仟柒佰玖拾叁|伍仟柒佰玖拾肆|伍仟柒佰玖拾伍|伍仟柒佰玖拾陆|伍仟柒佰玖拾柒|伍仟柒佰玖拾捌|伍仟柒佰玖拾玖|'
+    '伍仟捌佰|伍仟捌佰零壹|伍仟捌佰零贰|伍仟捌佰零叁|伍仟捌佰零肆|伍仟捌佰零伍|伍仟捌佰零陆|伍仟捌佰零柒|伍仟捌佰零捌|伍仟捌佰零玖|伍仟捌佰壹拾|伍仟捌佰壹拾壹|伍仟捌佰壹拾贰|伍仟捌佰壹拾叁|伍仟捌佰壹拾肆|伍仟捌佰壹拾伍|伍仟捌佰壹拾陆|伍仟捌佰壹拾柒|伍仟捌佰壹拾捌|伍仟捌佰壹拾玖|伍仟捌佰贰拾|伍仟捌佰贰拾壹|伍仟捌佰贰拾贰|伍仟捌佰贰拾叁|伍仟捌佰贰拾肆|伍仟捌佰贰拾伍|伍仟捌佰贰拾陆|伍仟捌佰贰拾柒|伍仟捌佰贰拾捌|伍仟捌佰贰拾玖|伍仟捌佰叁拾|伍仟捌佰叁拾壹|伍仟捌佰叁拾贰|伍仟捌佰叁拾叁|伍仟捌佰叁拾肆|伍仟捌佰叁拾伍|伍仟捌佰叁拾陆|伍仟捌佰叁拾柒|伍仟捌佰叁拾捌|伍仟捌佰叁拾玖|伍仟捌佰肆拾|伍仟捌佰肆拾壹|伍仟捌佰肆拾贰|伍仟捌佰肆拾叁|伍仟捌佰肆拾肆|伍仟捌佰肆拾伍|伍仟捌佰肆拾陆|伍仟捌佰肆拾柒|伍仟捌佰肆拾捌|伍仟捌佰肆拾玖|伍仟捌佰伍拾|伍仟捌佰伍拾壹|伍仟捌佰伍拾贰|伍仟捌佰伍拾叁|伍仟捌佰伍拾肆|伍仟捌佰伍拾伍|伍仟捌佰伍拾陆|伍仟捌佰伍拾柒|伍仟捌佰伍拾捌|伍仟捌佰伍拾玖|伍仟捌佰陆拾|伍仟捌佰陆拾壹|伍仟捌佰陆拾贰|伍仟捌佰陆拾叁|伍仟捌佰陆拾肆|伍仟捌佰陆拾伍|伍仟捌佰陆拾陆|伍仟捌佰陆拾柒|伍仟捌佰陆拾捌|伍仟捌佰陆拾玖|伍仟捌佰柒拾|伍仟捌佰柒拾壹|伍仟捌佰柒拾贰|伍仟捌佰柒拾叁|伍仟捌佰柒拾肆|伍仟捌佰柒拾伍|伍仟捌佰柒拾陆|伍仟捌佰柒拾柒|伍仟捌佰柒拾捌|伍仟捌佰柒拾玖|伍仟捌佰捌拾|伍仟捌佰捌拾壹|伍仟捌佰捌拾贰|伍仟捌佰捌拾叁|伍仟捌佰捌拾肆|伍仟捌佰捌拾伍|伍仟捌佰捌拾陆|伍仟捌佰捌拾柒|伍仟捌佰捌拾捌|伍仟捌佰捌拾玖|伍仟捌佰玖拾|伍仟捌佰玖拾壹|伍仟捌佰玖拾贰|伍仟捌佰玖拾叁|伍仟捌佰玖拾肆|伍仟捌佰玖拾伍|伍仟捌佰玖拾陆|伍仟捌佰玖拾柒|伍仟捌佰玖拾捌|伍仟捌佰玖拾玖|'
+    '伍仟玖佰|伍仟玖佰零壹|伍仟玖佰零贰|伍仟玖佰零叁|伍仟玖佰零肆|伍仟玖佰零伍|伍仟玖佰零陆|伍仟玖佰零柒|伍仟玖佰零捌|伍仟玖佰零玖|伍仟玖佰壹拾|伍仟玖佰壹拾壹|伍仟玖佰壹拾贰|伍仟玖佰壹拾叁|伍仟玖佰壹拾肆|伍仟玖佰壹拾伍|伍仟玖佰壹拾陆|伍仟玖佰壹拾柒|伍仟玖佰壹拾捌|伍仟玖佰壹拾玖|伍仟玖佰贰拾|伍仟玖佰贰拾壹|伍仟玖佰贰拾贰|伍仟玖佰贰拾叁|伍仟玖佰贰拾肆|伍仟玖佰贰拾伍|伍仟玖佰贰拾陆|伍仟玖佰贰拾柒|伍仟玖佰贰拾捌|伍仟玖佰贰拾玖|伍仟玖佰叁拾|伍仟玖佰叁拾壹|伍仟玖佰叁拾贰|伍仟玖佰叁拾叁|伍仟玖佰叁拾肆|伍仟玖佰叁拾伍|伍仟玖佰叁拾陆|伍仟玖佰叁拾柒|伍仟玖佰叁拾捌|伍仟玖佰叁拾玖|伍仟玖佰肆拾|伍仟玖佰肆拾壹|伍仟玖佰肆拾贰|伍仟玖佰肆拾叁|伍仟玖佰肆拾肆|伍仟玖佰肆拾伍|伍仟玖佰肆拾陆|伍仟玖佰肆拾柒|伍仟玖佰肆拾捌|伍仟玖佰肆拾玖|伍仟玖佰伍拾|伍仟玖佰伍拾壹|伍仟玖佰伍拾贰|伍仟玖佰伍拾叁|伍仟玖佰伍拾肆|伍仟玖佰伍拾伍|伍仟玖佰伍拾陆|伍仟玖佰伍拾柒|伍仟玖佰伍拾捌|伍仟玖佰伍拾玖|伍仟玖佰陆拾|伍仟玖佰陆拾壹|伍仟玖佰陆拾贰|伍仟玖佰陆拾叁|伍仟玖佰陆拾肆|伍仟玖佰陆拾伍|伍仟玖佰陆拾陆|伍仟玖佰陆拾柒|伍仟玖佰陆拾捌|伍仟玖佰陆拾玖|伍仟玖佰柒拾|伍仟玖佰柒拾壹|伍仟玖佰柒拾贰|伍仟玖佰柒拾叁|伍仟玖佰柒拾肆|伍仟玖佰柒拾伍|伍仟玖佰柒拾陆|伍仟玖佰柒拾柒|伍仟玖佰柒拾捌|伍仟玖佰柒拾玖|伍仟玖佰捌拾|伍仟玖佰捌拾壹|伍仟玖佰捌拾贰|伍仟玖佰捌拾叁|伍仟玖佰捌拾肆|伍仟玖佰捌拾伍|伍仟玖佰捌拾陆|伍仟玖佰捌拾柒|伍仟玖佰捌拾捌|伍仟玖佰捌拾玖|伍仟玖佰玖拾|伍仟玖佰玖拾壹|伍仟玖佰玖拾贰|伍仟玖佰玖拾叁|伍仟玖佰玖拾肆|伍仟玖佰玖拾伍|伍仟玖佰玖拾陆|伍仟玖佰玖拾柒|伍仟玖佰玖拾捌|伍仟玖佰玖拾玖|'
+    '陆仟|陆仟零壹|陆仟零贰|陆仟零叁|陆仟零肆|陆仟零伍|陆仟零陆|陆仟零柒|陆仟零捌|陆仟零玖|陆仟零壹拾|陆仟零壹拾壹|陆仟零壹拾贰|陆仟零壹拾叁|陆仟零壹拾肆|陆仟零壹拾伍|陆仟零壹拾陆|陆仟零壹拾柒|陆仟零壹拾捌|陆仟零壹拾玖|陆仟零贰拾|陆仟零贰拾壹|陆仟零贰拾贰|陆仟零贰拾叁|陆仟零贰拾肆|陆仟零贰拾伍|陆仟零贰拾陆|陆仟零贰拾柒|陆仟零贰拾捌|陆仟零贰拾玖|陆仟零叁拾|陆仟零叁拾壹|陆仟零叁拾贰|陆仟零叁拾叁|陆仟零叁拾肆|陆仟零叁拾伍|陆仟零叁拾陆|陆仟零叁拾柒|陆仟零叁拾捌|陆仟零叁拾玖|陆仟零肆拾|陆仟零肆拾壹|陆仟零肆拾贰|陆仟零肆拾叁|陆仟零肆拾肆|陆仟零肆拾伍|陆仟零肆拾陆|陆仟零肆拾柒|陆仟零肆拾捌|陆仟零肆拾玖|陆仟零伍拾|陆仟零伍拾壹|陆仟零伍拾贰|陆仟零伍拾叁|陆仟零伍拾肆|陆仟零伍拾伍|陆仟零伍拾陆|陆仟零伍拾柒|陆仟零伍拾捌|陆仟零伍拾玖|陆仟零陆拾|陆仟零陆拾壹|陆仟零陆拾贰|陆仟零陆拾叁|陆仟零陆拾肆|陆仟零陆拾伍|陆仟零陆拾陆|陆仟零陆拾柒|陆仟零陆拾捌|陆仟零陆拾玖|陆仟零柒拾|陆仟零柒拾壹|陆仟零柒拾贰|陆仟零柒拾叁|陆仟零柒拾肆|陆仟零柒拾伍|陆仟零柒拾陆|陆仟零柒拾柒|陆仟零柒拾捌|陆仟零柒拾玖|陆仟零捌拾|陆仟零捌拾壹|陆仟零捌拾贰|陆仟零捌拾叁|陆仟零捌拾肆|陆仟零捌拾伍|陆仟零捌拾陆|陆仟零捌拾柒|陆仟零捌拾捌|陆仟零捌拾玖|陆仟零玖拾|陆仟零玖拾壹|陆仟零玖拾贰|陆仟零玖拾叁|陆仟零玖拾肆|陆仟零玖拾伍|陆仟零玖拾陆|陆仟零玖拾柒|陆仟零玖拾捌|陆仟零玖拾玖|'
+    '陆仟壹佰|陆仟壹佰零壹|陆仟壹佰零贰|陆仟壹佰零叁|陆仟壹佰零肆|陆仟壹佰零伍|陆仟壹佰零陆|陆仟壹佰零柒|陆仟壹佰零捌|陆仟壹佰零玖|陆仟壹佰壹拾|陆仟壹佰壹拾壹|陆仟壹佰壹拾贰|陆仟壹佰壹拾叁|陆仟壹佰壹拾肆|陆仟壹佰壹拾伍|陆仟壹佰壹拾陆|陆仟壹佰壹拾柒|陆仟壹佰壹拾捌|陆仟壹佰壹拾玖|陆仟壹佰贰拾|陆仟壹佰贰拾壹|陆仟壹佰贰拾贰|陆仟壹佰贰拾叁|陆仟壹佰贰拾肆|陆仟壹佰贰拾伍|陆仟壹佰贰拾陆|陆仟壹佰贰拾柒|陆仟壹佰贰拾捌|陆仟壹佰贰拾玖|陆仟壹佰叁拾|陆仟壹佰叁拾壹|陆仟壹佰叁拾贰|陆仟壹佰叁拾叁|陆仟壹佰叁拾肆|陆仟壹佰叁拾伍|陆仟壹佰叁拾陆|陆仟壹佰叁拾柒|陆仟壹佰叁拾捌|陆仟壹佰叁拾玖|陆仟壹佰肆拾|陆仟壹佰肆拾壹|陆仟壹佰肆拾贰|陆仟壹佰肆拾叁|陆仟壹佰肆拾肆|陆仟壹佰肆拾伍|陆仟壹佰肆拾陆|陆仟壹佰肆拾柒|陆仟壹佰肆拾捌|陆仟壹佰肆拾玖|陆仟壹佰伍拾|陆仟壹佰伍拾壹|陆仟壹佰伍拾贰|陆仟壹佰伍拾叁|陆仟壹佰伍拾肆|陆仟壹佰伍拾伍|陆仟壹佰伍拾陆|陆仟壹佰伍拾柒|陆仟壹佰伍拾捌|陆仟壹佰伍拾玖|陆仟壹佰陆拾|陆仟壹佰陆拾壹|陆仟壹佰陆拾贰|陆仟壹佰陆拾叁|陆仟壹佰陆拾肆|陆仟壹佰陆拾伍|陆仟壹佰陆拾陆|陆仟壹佰陆拾柒|陆仟壹佰陆拾捌|陆仟壹佰陆拾玖|陆仟壹佰柒拾|陆仟壹佰柒拾壹|陆仟壹佰柒拾贰|陆仟壹佰柒拾叁|陆仟壹佰柒拾肆|陆仟壹佰柒拾伍|陆仟壹佰柒拾陆|陆仟壹佰柒拾柒|陆仟壹佰柒拾捌|陆仟壹佰柒拾玖|陆仟壹佰捌拾|陆仟壹佰捌拾壹|陆仟壹佰捌拾贰|陆仟壹佰捌拾叁|陆仟壹佰捌拾肆|陆仟壹佰捌拾伍|陆仟壹佰捌拾陆|陆仟壹佰捌拾柒|陆仟壹佰捌拾捌|陆仟壹佰捌拾玖|陆仟壹佰玖拾|陆仟壹佰玖拾壹|陆仟壹佰玖拾贰|陆仟壹佰玖拾叁|陆仟壹佰玖拾肆|陆仟壹佰玖拾伍|陆仟壹佰玖拾陆|陆仟壹佰玖拾柒|陆仟壹佰玖拾捌|陆仟壹佰玖拾玖|'
+    '陆仟贰佰|陆仟贰佰零壹|陆仟贰佰零贰|陆仟贰佰零叁|陆仟贰佰零肆|陆仟贰佰零伍|陆仟贰佰零陆|陆仟贰佰零柒|陆仟贰佰零捌|陆仟贰佰零玖|陆仟贰佰壹拾|陆仟贰佰壹拾壹|陆仟贰佰壹拾贰|陆仟贰佰壹拾叁|陆仟贰佰壹拾肆|陆仟贰佰壹拾伍|陆仟贰佰壹拾陆|陆仟贰佰壹拾柒|陆仟贰佰壹拾捌|陆仟贰佰壹拾玖|陆仟贰佰贰拾|陆仟贰佰贰拾壹|陆仟贰佰贰拾贰|陆仟贰佰贰拾叁|陆仟贰佰贰拾肆|陆仟贰佰贰拾伍|陆仟贰佰贰拾陆|陆仟贰佰贰拾柒|陆仟贰佰贰拾捌|陆仟贰佰贰拾玖|陆仟贰佰叁拾|陆仟贰佰叁拾壹|陆仟贰佰叁拾贰|陆仟贰佰叁拾叁|陆仟贰佰叁拾肆|陆仟贰佰叁拾伍|陆仟贰佰叁拾陆|陆仟贰佰叁拾柒|陆仟贰佰叁拾捌|陆仟贰佰叁拾玖|陆仟贰佰肆拾|陆仟贰佰肆拾壹|陆仟贰佰肆拾贰|陆仟贰佰肆拾叁|陆仟贰佰肆拾肆|陆仟贰佰肆拾伍|陆仟贰佰肆拾陆|陆仟贰佰肆拾柒|陆仟贰佰肆拾捌|陆仟贰佰肆拾玖|陆仟贰佰伍拾|陆仟贰佰伍拾壹|陆仟贰佰伍拾贰|陆仟贰佰伍拾叁|陆仟贰佰伍拾肆|陆仟贰佰伍拾伍|陆仟贰佰伍拾陆|陆仟贰佰伍拾柒|陆仟贰佰伍拾捌|陆仟贰佰伍拾玖|陆仟贰佰陆拾|陆仟贰佰陆拾壹|陆仟贰佰陆拾贰|陆仟贰佰陆拾叁|陆仟贰佰陆拾肆|陆仟贰佰陆拾伍|陆仟贰佰陆拾陆|陆仟贰佰陆拾柒|陆仟贰佰陆拾捌|陆仟贰佰陆拾玖|陆仟贰佰柒拾|陆仟贰佰柒拾壹|陆仟贰佰柒拾贰|陆仟贰佰柒拾叁|陆仟贰佰柒拾肆|陆仟贰佰柒拾伍|陆仟贰佰柒拾陆|陆仟贰佰柒拾柒|陆仟贰佰柒拾捌|陆仟贰佰柒拾玖|陆仟贰佰捌拾|陆仟贰佰捌拾壹|陆仟贰佰捌拾贰|陆仟贰佰捌拾叁|陆仟贰佰捌拾肆|陆仟贰佰捌拾伍|陆仟贰佰捌拾陆|陆仟贰佰捌拾柒|陆仟贰佰捌拾捌|陆仟贰佰捌拾玖|陆仟贰佰玖拾|陆仟贰佰玖拾壹|陆仟贰佰玖拾贰|陆仟贰佰玖拾叁|陆仟贰佰玖拾肆|陆仟贰佰玖拾伍|陆仟贰佰玖拾陆|陆仟贰佰玖拾柒|陆仟贰佰玖拾捌|陆仟贰佰玖拾玖|'
+    '陆仟叁佰|陆仟叁佰零壹|陆仟叁佰零贰|陆仟叁佰零叁|陆仟叁佰零肆|陆仟叁佰零伍|陆仟叁佰零陆|陆仟叁佰零柒|陆仟叁佰零捌|陆仟叁佰零玖|陆仟叁佰壹拾|陆仟叁佰壹拾壹|陆仟叁佰壹拾贰|陆仟叁佰壹拾叁|陆仟叁佰壹拾肆|陆仟叁佰壹拾伍|陆仟叁佰壹拾陆|陆仟叁佰壹拾柒|陆仟叁佰壹拾捌|陆仟叁佰壹拾玖|陆仟叁佰贰拾|陆仟叁佰贰拾壹|陆仟叁佰贰拾贰|陆仟叁佰贰拾叁|陆仟叁佰贰拾肆|陆仟叁佰贰拾伍|陆仟叁佰贰拾陆|陆仟叁佰贰拾柒|陆仟叁佰贰拾捌|陆仟叁佰贰拾玖|陆仟叁佰叁拾|陆仟叁佰叁拾壹|陆仟叁佰叁拾贰|陆仟叁佰叁拾叁|陆仟叁佰叁拾肆|陆仟叁佰叁拾伍|陆仟叁佰叁拾陆|陆仟叁佰叁拾柒|陆仟叁佰叁拾捌|陆仟叁佰叁拾玖|陆仟叁佰肆拾|陆仟叁佰肆拾壹|陆仟叁佰肆拾贰|陆仟叁佰肆拾叁|陆仟叁佰肆拾肆|陆仟叁佰肆拾伍|陆仟叁佰肆拾陆|陆仟叁佰肆拾柒|陆仟叁佰肆拾捌|陆仟叁佰肆拾玖|陆仟叁佰伍拾|陆仟叁佰伍拾壹|陆仟叁佰伍拾贰|陆仟叁佰伍拾叁|陆仟叁佰伍拾肆|陆仟叁佰伍拾伍|陆仟叁佰伍拾陆|陆仟叁佰伍拾柒|陆仟叁佰伍拾捌|陆仟叁佰伍拾玖|陆仟叁佰陆拾|陆仟叁佰陆拾壹|陆仟叁佰陆拾贰|陆仟叁佰陆拾叁|陆仟叁佰陆拾肆|陆仟叁佰陆拾伍|陆仟叁佰陆拾陆|陆仟叁佰陆拾柒|陆仟叁佰陆拾捌|陆仟叁佰陆拾玖|陆仟叁佰柒拾|陆仟叁佰柒拾壹|陆仟叁佰柒拾贰|陆仟叁佰柒拾叁|陆仟叁佰柒拾肆|陆仟叁佰柒拾伍|陆仟叁佰柒拾陆|陆仟叁佰柒拾柒|陆仟叁佰柒拾捌|陆仟叁佰柒拾玖|陆仟叁佰捌拾|陆仟叁佰捌拾壹|陆仟叁佰捌拾贰|陆仟叁佰捌拾叁|陆仟叁佰捌拾肆|陆仟叁佰捌拾伍|陆仟叁佰捌拾陆|陆仟叁佰捌拾柒|陆仟叁佰捌拾捌|陆仟叁佰捌拾玖|陆仟叁佰玖拾|陆仟叁佰玖拾壹|陆仟叁佰玖拾贰|陆仟叁佰玖拾叁|陆仟叁佰玖拾肆|陆仟叁佰玖拾伍|陆仟叁佰玖拾陆|陆仟叁佰玖拾柒|陆仟叁佰玖拾捌|陆仟叁佰玖拾玖|'
+    '陆仟肆佰|陆仟肆佰零壹|陆仟肆佰零贰|陆仟肆佰零叁|陆仟肆佰零肆|陆仟肆佰零伍|陆仟肆佰零陆|陆仟肆佰零柒|陆仟肆佰零捌|陆仟肆佰零玖|陆仟肆佰壹拾|陆仟肆佰壹拾壹|陆仟肆佰壹拾贰|陆仟肆佰壹拾叁|陆仟肆佰壹拾肆|陆仟肆佰壹拾伍|陆仟肆佰壹拾陆|陆仟肆佰壹拾柒|陆仟肆佰壹拾捌|陆仟肆佰壹拾玖|陆仟肆佰贰拾|陆仟肆佰贰拾壹|陆仟肆佰贰拾贰|陆仟肆佰贰拾叁|陆仟肆佰贰拾肆|陆仟肆佰贰拾伍|陆仟肆佰贰拾陆|陆仟肆佰贰拾柒|陆仟肆佰贰拾捌|陆仟肆佰贰拾玖|陆仟肆佰叁拾|陆仟肆佰叁拾壹|陆仟肆佰叁拾贰|陆仟肆佰叁拾叁|陆仟肆佰叁拾肆|陆仟肆佰叁拾伍|陆仟肆佰叁拾陆|陆仟肆佰叁拾柒|陆仟肆佰叁拾捌|陆仟肆佰叁拾玖|陆仟肆佰肆拾|陆仟肆佰肆拾壹|陆仟肆佰肆拾贰|陆仟肆佰肆拾叁|陆仟肆佰肆拾肆|陆仟肆佰肆拾伍|陆仟肆佰肆拾陆|陆仟肆佰肆拾柒|陆仟肆佰肆拾捌|陆仟肆佰肆拾玖|陆仟肆佰伍拾|陆仟肆佰伍拾壹|陆仟肆佰伍拾贰|陆仟肆佰伍拾叁|陆仟肆佰伍拾肆|陆仟肆佰伍拾伍|陆仟肆佰伍拾陆|陆仟肆佰伍拾柒|陆仟肆佰伍拾捌|陆仟肆佰伍拾玖|陆仟肆佰陆拾|陆仟肆佰陆拾壹|陆仟肆佰陆拾贰|陆仟肆佰陆拾叁|陆仟肆佰陆拾肆|陆仟肆佰陆拾伍|陆仟肆佰陆拾陆|陆仟肆佰陆拾柒|陆仟肆佰陆拾捌|陆仟肆佰陆拾玖|陆仟肆佰柒拾|陆仟肆佰柒拾壹|陆仟肆佰柒拾贰|陆仟肆佰柒拾叁|陆仟肆佰柒拾肆|陆仟肆佰柒拾伍|陆仟肆佰柒拾陆|陆仟肆佰柒拾柒|陆仟肆佰柒拾捌|陆仟肆佰柒拾玖|陆仟肆佰捌拾|陆仟肆佰捌拾壹|陆仟肆佰捌拾贰|陆仟肆佰捌拾叁|陆仟肆佰捌拾肆|陆仟肆佰捌拾伍|陆仟肆佰捌拾陆|陆仟肆佰捌拾柒|陆仟肆佰捌拾捌|陆仟肆佰捌拾玖|陆仟肆佰玖拾|陆仟肆佰玖拾壹|陆仟肆佰玖拾贰|陆仟肆佰玖拾叁|陆仟肆佰玖拾肆|陆仟肆佰玖拾伍|陆仟肆佰玖拾陆|陆仟肆佰玖拾柒|陆仟肆佰玖拾捌|陆仟肆佰玖拾玖|'
+    '陆仟伍佰|陆仟伍佰零壹|陆仟伍佰零贰|陆仟伍佰零叁|陆仟伍佰零肆|陆仟伍佰零伍|陆仟伍佰零陆|陆仟伍佰零柒|陆仟伍佰零捌|陆仟伍佰零玖|陆仟伍佰壹拾|陆仟伍佰壹拾壹|陆仟伍佰壹拾贰|陆仟伍佰壹拾叁|陆仟伍佰壹拾肆|陆仟伍佰壹拾伍|陆仟伍佰壹拾陆|陆仟伍佰壹拾柒|陆仟伍佰壹拾捌|陆仟伍佰壹拾玖|陆仟伍佰贰拾|陆仟伍佰贰拾壹|陆仟伍佰贰拾贰|陆仟伍佰贰拾叁|陆仟伍佰贰拾肆|陆仟伍佰贰拾伍|陆仟伍佰贰拾陆|陆仟伍佰贰拾柒|陆仟伍佰贰拾捌|陆仟伍佰贰拾玖|陆仟伍佰叁拾|陆仟伍佰叁拾壹|陆仟伍佰叁拾贰|陆仟伍佰叁拾叁|陆仟伍佰叁拾肆|陆仟伍佰叁拾伍|陆仟伍佰叁拾陆|陆仟伍佰叁拾柒|陆仟伍佰叁拾捌|陆仟伍佰叁拾玖|陆仟伍佰肆拾|陆仟伍佰肆拾壹|陆仟伍佰肆拾贰|陆仟伍佰肆拾叁|陆仟伍佰肆拾肆|陆仟伍佰肆拾伍|陆仟伍佰肆拾陆|陆仟伍佰肆拾柒|陆仟伍佰肆拾捌|陆仟伍佰肆拾玖|陆仟伍佰伍拾|陆仟伍佰伍拾壹|陆仟伍佰伍拾贰|陆仟伍佰伍拾叁|陆仟伍佰伍拾肆|陆仟伍佰伍拾伍|陆仟伍佰伍拾陆|陆仟伍佰伍拾柒|陆仟伍佰伍拾捌|陆仟伍佰伍拾玖|陆仟伍佰陆拾|陆仟伍佰陆拾壹|陆仟伍佰陆拾贰|陆仟伍佰陆拾叁|陆仟伍佰陆拾肆|陆仟伍佰陆拾伍|陆仟伍佰陆拾陆|陆仟伍佰陆拾柒|陆仟伍佰陆拾捌|陆仟伍佰陆拾玖|陆仟伍佰柒拾|陆仟伍佰柒拾壹|陆仟伍佰柒拾贰|陆仟伍佰柒拾叁|陆仟伍佰柒拾肆|陆仟伍佰柒拾伍|陆仟伍佰柒拾陆|陆仟伍佰柒拾柒|陆仟伍佰柒拾捌|陆仟伍佰柒拾玖|陆仟伍佰捌拾|陆仟伍佰捌拾壹|陆仟伍佰捌拾贰|陆仟伍佰捌拾叁|陆仟伍佰捌拾肆|陆仟伍佰捌拾伍|陆仟伍佰捌拾陆|陆仟伍佰捌拾柒|陆仟伍佰捌拾捌|陆仟伍佰捌拾玖|陆仟伍佰玖拾|陆仟伍佰玖拾壹|陆仟伍佰玖拾贰|陆仟伍佰玖拾叁|陆仟伍佰玖拾肆|陆仟伍佰玖拾伍|陆仟伍佰玖拾陆|陆仟伍佰玖拾柒|陆仟伍佰玖拾捌|陆仟伍佰玖拾玖|'
+    '陆仟陆佰|陆仟陆佰零壹|陆仟陆佰零贰|陆仟陆佰零叁|陆仟陆佰零肆|陆仟陆佰零伍|陆仟陆佰零陆|陆仟陆佰零柒|陆仟陆佰零捌|陆仟陆佰零玖|陆仟陆佰壹拾|陆仟陆佰壹拾壹|陆仟陆佰壹拾贰|陆仟陆佰壹拾叁|陆仟陆佰壹拾肆|陆仟陆佰壹拾伍|陆仟陆佰壹拾陆|陆仟陆佰壹拾柒|陆仟陆佰壹拾捌|陆仟陆佰壹拾玖|陆仟陆佰贰拾|陆仟陆佰贰拾壹|陆仟陆佰贰拾贰|陆仟陆佰贰拾叁|陆仟陆佰贰拾肆|陆仟陆佰贰拾伍|陆仟陆佰贰拾陆|陆仟陆佰贰拾柒|陆仟陆佰贰拾捌|陆仟陆佰贰拾玖|陆仟陆佰叁拾|陆仟陆佰叁拾壹|陆仟陆佰叁拾贰|陆仟陆佰叁拾叁|陆仟陆佰叁拾肆|陆仟陆佰叁拾伍|陆仟陆佰叁拾陆|陆仟陆佰叁拾柒|陆仟陆佰叁拾捌|陆仟陆佰叁拾玖|陆仟陆佰肆拾|陆仟陆佰肆拾壹|陆仟陆佰肆拾贰|陆仟陆佰肆拾叁|陆仟陆佰肆拾肆|陆仟陆佰肆拾伍|陆仟陆佰肆拾陆|陆仟陆佰肆拾柒|陆仟陆佰肆拾捌|陆仟陆佰肆拾玖|陆仟陆佰伍拾|陆仟陆佰伍拾壹|陆仟陆佰伍拾贰|陆仟陆佰伍拾叁|陆仟陆佰伍拾肆|陆仟陆佰伍拾伍|陆仟陆佰伍拾陆|陆仟陆佰伍拾柒|陆仟陆佰伍拾捌|陆仟陆佰伍拾玖|陆仟陆佰陆拾|陆仟陆佰陆拾壹|陆仟陆佰陆拾贰|陆仟陆佰陆拾叁|陆仟陆佰陆拾肆|陆仟陆佰陆拾伍|陆仟陆佰陆拾陆|陆仟陆佰陆拾柒|陆仟陆佰陆拾捌|陆仟陆佰陆拾玖|陆仟陆佰柒拾|陆仟陆佰柒拾壹|陆仟陆佰柒拾贰|陆仟陆佰柒拾叁|陆仟陆佰柒拾肆|陆仟陆佰柒拾伍|陆仟陆佰柒拾陆|陆仟陆佰柒拾柒|陆仟陆佰柒拾捌|陆仟陆佰柒拾玖|陆仟陆佰捌拾|陆仟陆佰捌拾壹|陆仟陆佰捌拾贰|陆仟陆佰捌拾叁|陆仟陆佰捌拾肆|陆仟陆佰捌拾伍|陆仟陆佰捌拾陆|陆仟陆佰捌拾柒|陆仟陆佰捌拾捌|陆仟陆佰捌拾玖|陆仟陆佰玖拾|陆仟陆佰玖拾壹|陆仟陆佰玖拾贰|陆仟陆佰玖拾叁|陆仟陆佰玖拾肆|陆仟陆佰玖拾伍|陆仟陆佰玖拾陆|陆仟陆佰玖拾柒|陆仟陆佰玖拾捌|陆仟陆佰玖拾玖|'
+    '陆仟柒佰|陆仟柒佰零壹|陆仟柒佰零贰|陆仟柒佰零叁|陆仟柒佰零肆|陆仟柒佰零伍|陆仟柒佰零陆|陆仟柒佰零柒|陆仟柒佰零捌|陆仟柒佰零玖|陆仟柒佰壹拾|陆仟柒佰壹拾壹|陆仟柒佰壹拾贰|陆仟柒佰壹拾叁|陆仟柒佰壹拾肆|陆仟柒佰壹拾伍|陆仟柒佰壹拾陆|陆仟柒佰壹拾柒|陆仟柒佰壹拾捌|陆仟柒佰壹拾玖|陆仟柒佰贰拾|陆仟柒佰贰拾壹|陆仟柒佰贰拾贰|陆仟柒佰贰拾叁|陆仟柒佰贰拾肆|陆仟柒佰贰拾伍|陆仟柒佰贰拾陆|陆仟柒佰贰拾柒|陆仟柒佰贰拾捌|陆仟柒佰贰拾玖|陆仟柒佰叁拾|陆仟柒佰叁拾壹|陆仟柒佰叁拾贰|陆仟柒佰叁拾叁|陆仟柒佰叁拾肆|陆仟柒佰叁拾伍|陆仟柒佰叁拾陆|陆仟柒佰叁拾柒|陆仟柒佰叁拾捌|陆仟柒佰叁拾玖|陆仟柒佰肆拾|陆仟柒佰肆拾壹|陆仟柒佰肆拾贰|陆仟柒佰肆拾叁|陆仟柒佰肆拾肆|陆仟柒佰肆拾伍|陆仟柒佰肆拾陆|陆仟柒佰肆拾柒|陆仟柒佰肆拾捌|陆仟柒佰肆拾玖|陆仟柒佰伍拾|陆仟柒佰伍拾壹|陆仟柒佰伍拾贰|陆仟柒佰伍拾叁|陆仟柒佰伍拾肆|陆仟柒佰伍拾伍|陆仟柒佰伍拾陆|陆仟柒佰伍拾柒|陆仟柒佰伍拾捌|陆仟柒佰伍拾玖|陆仟柒佰陆拾|陆仟柒佰陆拾壹|陆仟柒佰陆拾贰|陆仟柒佰陆拾叁|陆仟柒佰陆拾肆|陆仟柒佰陆拾伍|陆仟柒佰陆拾陆|陆仟柒佰陆拾柒|陆仟柒佰陆拾捌|陆仟柒佰陆拾玖|陆仟柒佰柒拾|陆仟柒佰柒拾壹|陆仟柒佰柒拾贰|陆仟柒佰柒拾叁|陆仟柒佰柒拾肆|陆仟柒佰柒拾伍|陆仟柒佰柒拾陆|陆仟柒佰柒拾柒|陆仟柒佰柒拾捌|陆仟柒佰柒拾玖|陆仟柒佰捌拾|陆仟柒佰捌拾壹|陆仟柒佰捌拾贰|陆仟柒佰捌拾叁|陆仟柒佰捌拾肆|陆仟柒佰捌拾伍|陆仟柒佰捌拾陆|陆仟柒佰捌拾柒|陆仟柒佰捌拾捌|陆仟柒佰捌拾玖|陆仟柒佰玖拾|陆仟柒佰玖拾壹|陆仟柒佰玖拾贰|陆仟柒佰玖拾叁|陆仟柒佰玖拾肆|陆仟柒佰玖拾伍|陆仟柒佰玖拾陆|陆仟柒佰玖拾柒|陆仟柒佰玖拾捌|陆仟柒佰玖拾玖|'
+    '陆仟捌佰|陆仟捌佰零壹|陆仟捌佰零贰|陆仟捌佰零叁|陆仟捌佰零肆|陆仟捌佰零伍|陆仟捌佰零陆|陆仟捌佰零柒|陆仟捌佰零捌|陆仟捌佰零玖|陆仟捌佰壹拾|陆仟捌佰壹拾壹|陆仟捌佰壹拾贰|陆仟捌佰壹拾叁|陆仟捌佰壹拾肆|陆仟捌佰壹拾伍|陆仟捌佰壹拾陆|陆仟捌佰壹拾柒|陆仟捌佰壹拾捌|陆仟捌佰壹拾玖|陆仟捌佰贰拾|陆仟捌佰贰拾壹|陆仟捌佰贰拾贰|陆仟捌佰贰拾叁|陆仟捌佰贰拾肆|陆仟捌佰贰拾伍|陆仟捌佰贰拾陆|陆仟捌佰贰拾柒|陆仟捌佰贰拾捌|陆仟捌佰贰拾玖|陆仟捌佰叁拾|陆仟捌佰叁拾壹|陆仟捌佰叁拾贰|陆仟捌佰叁拾叁|陆仟捌佰叁拾肆|陆仟捌佰叁拾伍|陆仟捌佰叁拾陆|陆仟捌佰叁拾柒|陆仟捌佰叁拾捌|陆仟捌佰叁拾玖|陆仟捌佰肆拾|陆仟捌佰肆拾壹|陆仟捌佰肆拾贰|陆仟捌佰肆拾叁|陆仟捌佰肆拾肆|陆仟捌佰肆拾伍|陆仟捌佰肆拾陆|陆仟捌佰肆拾柒|陆仟捌佰肆拾捌|陆仟捌佰肆拾玖|陆仟捌佰伍拾|陆仟捌佰伍拾壹|陆仟捌佰伍拾贰|陆仟捌佰伍拾叁|陆仟捌佰伍拾肆|陆仟捌佰伍拾伍|陆仟捌佰伍拾陆|陆仟捌佰伍拾柒|陆仟捌佰伍拾捌|陆仟捌佰伍拾玖|陆仟捌佰陆拾|陆仟捌佰陆拾壹|陆仟捌佰陆拾贰|陆仟捌佰陆拾叁|陆仟捌佰陆拾肆|陆仟捌佰陆拾伍|陆仟捌佰陆拾陆|陆仟捌佰陆拾柒|陆仟捌佰陆拾捌|陆仟捌佰陆拾玖|陆仟捌佰柒拾|陆仟捌佰柒拾壹|陆仟捌佰柒拾贰|陆仟捌佰柒拾叁|陆仟捌佰柒拾肆|陆仟捌佰柒拾伍|陆仟捌佰柒拾陆|陆仟捌佰柒拾柒|陆仟捌佰柒拾捌|陆仟捌佰柒拾玖|陆仟捌佰捌拾|陆仟捌佰捌拾壹|陆仟捌佰捌拾贰|陆仟捌佰捌拾叁|陆仟捌佰捌拾肆|陆仟捌佰捌拾伍|陆仟捌佰捌拾陆|陆仟捌佰捌拾柒|陆仟捌佰捌拾捌|陆仟捌佰捌拾玖|陆仟捌佰玖拾|陆仟捌佰玖拾壹|陆仟捌佰玖拾贰|陆仟捌佰玖拾叁|陆仟捌佰玖拾肆|陆仟捌佰玖拾伍|陆仟捌佰玖拾陆|陆仟捌佰玖拾柒|陆仟捌佰玖拾捌|陆仟捌佰玖拾玖|'
+    '陆仟玖佰|陆仟玖佰零壹|陆仟玖佰零贰|陆仟玖佰零叁|陆仟玖佰零肆|陆仟玖佰零伍|陆仟玖佰零陆|陆仟玖佰零柒|陆仟玖佰零捌|陆仟玖佰零玖|陆仟玖佰壹拾|陆仟玖佰壹拾壹|陆仟玖佰壹拾贰|陆仟玖佰壹拾叁|陆仟玖佰壹拾肆|陆仟玖佰壹拾伍|陆仟玖佰壹拾陆|陆仟玖佰壹拾柒|陆仟玖佰壹拾捌|陆仟玖佰壹拾玖|陆仟玖佰贰拾|陆仟玖佰贰拾壹|陆仟玖佰贰拾贰|陆仟玖佰贰拾叁|陆仟玖佰贰拾肆|陆仟玖佰贰拾伍|陆仟玖佰贰拾陆|陆仟玖佰贰拾柒|陆仟玖佰贰拾捌|陆仟玖佰贰拾玖|陆仟玖佰叁拾|陆仟玖佰叁拾壹|陆仟玖佰叁拾贰|陆仟玖佰叁拾叁|陆仟玖佰叁拾肆|陆仟玖佰叁拾伍|陆仟玖佰叁拾陆|陆仟玖佰叁拾柒|陆仟玖佰叁拾捌|陆仟玖佰叁拾玖|陆仟玖佰肆拾|陆仟玖佰肆拾壹|陆仟玖佰肆拾贰|陆仟玖佰肆拾叁|陆仟玖佰肆拾肆|陆仟玖佰肆拾伍|陆仟玖佰肆拾陆|陆仟玖佰肆拾柒|陆仟玖佰肆拾捌|陆仟玖佰肆拾玖|陆仟玖佰伍拾|陆仟玖佰伍拾壹|陆仟玖佰伍拾贰|陆仟玖佰伍拾叁|陆仟玖佰伍拾肆|陆仟玖佰伍拾伍|陆仟玖佰伍拾陆|陆仟玖佰伍拾柒|陆仟玖佰伍拾捌|陆仟玖佰伍拾玖|陆仟玖佰陆拾|陆仟玖佰陆拾壹|陆仟玖佰陆拾贰|陆仟玖佰陆拾叁|陆仟玖佰陆拾肆|陆仟玖佰陆拾伍|陆仟玖佰陆拾陆|陆仟玖佰陆拾柒|陆仟玖佰陆拾捌|陆仟玖佰陆拾玖|陆仟玖佰柒拾|陆仟玖佰柒拾壹|陆仟玖佰柒拾贰|陆仟玖佰柒拾叁|陆仟玖佰柒拾肆|陆仟玖佰柒拾伍|陆仟玖佰柒拾陆|陆仟玖佰柒拾柒|陆仟玖佰柒拾捌|陆仟玖佰柒拾玖|陆仟玖佰捌拾|陆仟玖佰捌拾壹|陆仟玖佰捌拾贰|陆仟玖佰捌拾叁|陆仟玖佰捌拾肆|陆仟玖佰捌拾伍|陆仟玖佰捌拾陆|陆仟玖佰捌拾柒|陆仟玖佰捌拾捌|陆仟玖佰捌拾玖|陆仟玖佰玖拾|陆仟玖佰玖拾壹|陆仟玖佰玖拾贰|陆仟玖佰玖拾叁|陆仟玖佰玖拾肆|陆仟玖佰玖拾伍|陆仟玖佰玖拾陆|陆仟玖佰玖拾柒|陆仟玖佰玖拾捌|陆仟玖佰玖拾玖|'
+    '柒仟|柒仟零壹|柒仟零贰|柒仟零叁|柒仟零肆|柒仟零伍|柒仟零陆|柒仟零柒|柒仟零捌|柒仟零玖|柒仟零壹拾|柒仟零壹拾壹|柒仟零壹拾贰|柒仟零壹拾叁|柒仟零壹拾肆|柒仟零壹拾伍|柒仟零壹拾陆|柒仟零壹拾柒|柒仟零壹拾捌|柒仟零壹拾玖|柒仟零贰拾|柒仟零贰拾壹|柒仟零贰拾贰|柒仟零贰拾叁|柒仟零贰拾肆|柒仟零贰拾伍|柒仟零贰拾陆|柒仟零贰拾柒|柒仟零贰拾捌|柒仟零贰拾玖|柒仟零叁拾|柒仟零叁拾壹|柒仟零叁拾贰|柒仟零叁拾叁|柒仟零叁拾肆|柒仟零叁拾伍|柒仟零叁拾陆|柒仟零叁拾柒|柒仟零叁拾捌|柒仟零叁拾玖|柒仟零肆拾|柒仟零肆拾壹|柒仟零肆拾贰|柒仟零肆拾叁|柒仟零肆拾肆|柒仟零肆拾伍|柒仟零肆拾陆|柒仟零肆拾柒|柒仟零肆拾捌|柒仟零肆拾玖|柒仟零伍拾|柒仟零伍拾壹|柒仟零伍拾贰|柒仟零伍拾叁|柒仟零伍拾肆|柒仟零伍拾伍|柒仟零伍拾陆|柒仟零伍拾柒|柒仟零伍拾捌|柒仟零伍拾玖|柒仟零陆拾|柒仟零陆拾壹|柒仟零陆拾贰|柒仟零陆拾叁|柒仟零陆拾肆|柒仟零陆拾伍|柒仟零陆拾陆|柒仟零陆拾柒|柒仟零陆拾捌|柒仟零陆拾玖|柒仟零柒拾|柒仟零柒拾壹|柒仟零柒拾贰|柒仟零柒拾叁|柒仟零柒拾肆|柒仟零柒拾伍|柒仟零柒拾陆|柒仟零柒拾柒|柒仟零柒拾捌|柒仟零柒拾玖|柒仟零捌拾|柒仟零捌拾壹|柒仟零捌拾贰|柒仟零捌拾叁|柒仟零捌拾肆|柒仟零捌拾伍|柒仟零捌拾陆|柒仟零捌拾柒|柒仟零捌拾捌|柒仟零捌拾玖|柒仟零玖拾|柒仟零玖拾壹|柒仟零玖拾贰|柒仟零玖拾叁|柒仟零玖拾肆|柒仟零玖拾伍|柒仟零玖拾陆|柒仟零玖拾柒|柒仟零玖拾捌|柒仟零玖拾玖|'
+    '柒仟壹佰|柒仟壹佰零壹|柒仟壹佰零贰|柒仟壹佰零叁|柒仟壹佰零肆|柒仟壹佰零伍|柒仟壹佰零陆|柒仟壹佰零柒|柒仟壹佰零捌|柒仟壹佰零玖|柒仟壹佰壹拾|柒仟壹佰壹拾壹|柒仟壹佰壹拾贰|柒仟壹佰壹拾叁|柒仟壹佰壹拾肆|柒仟壹佰壹拾伍|柒仟壹佰壹拾陆|柒仟壹佰壹拾柒|柒仟壹佰壹拾捌|柒仟壹佰壹拾玖|柒仟壹佰贰拾|柒仟壹佰贰拾壹|柒仟壹佰贰拾贰|柒仟壹佰贰拾叁|柒仟壹佰贰拾肆|柒仟壹佰贰拾伍|柒仟壹佰贰拾陆|柒仟壹佰贰拾柒|柒仟壹佰贰拾捌|柒仟壹佰贰拾玖|柒仟壹佰叁拾|柒仟壹佰叁拾壹|柒仟壹佰叁拾贰|柒仟壹佰叁拾叁|柒仟壹佰叁拾肆|柒仟壹佰叁拾伍|柒仟壹佰叁拾陆|柒仟壹佰叁拾柒|柒仟壹佰叁拾捌|柒仟壹佰叁拾玖|柒仟壹佰肆拾|柒仟壹佰肆拾壹|柒仟壹佰肆拾贰|柒仟壹佰肆拾叁|柒仟壹佰肆拾肆|柒仟壹佰肆拾伍|柒仟壹佰肆拾陆|柒仟壹佰肆拾柒|柒仟壹佰肆拾捌|柒仟壹佰肆拾玖|柒仟壹佰伍拾|柒仟壹佰伍拾壹|柒仟壹佰伍拾贰|柒仟壹佰伍拾叁|柒仟壹佰伍拾肆|柒仟壹佰伍拾伍|柒仟壹佰伍拾陆|柒仟壹佰伍拾柒|柒仟壹佰伍拾捌|柒仟壹佰伍拾玖|柒仟壹佰陆拾|柒仟壹佰陆拾壹|柒仟壹佰陆拾贰|柒仟壹佰陆拾叁|柒仟壹佰陆拾肆|柒仟壹佰陆拾伍|柒仟壹佰陆拾陆|柒仟壹佰陆拾柒|柒仟壹佰陆拾捌|柒仟壹佰陆拾玖|柒仟壹佰柒拾|柒仟壹佰柒拾壹|柒仟壹佰柒拾贰|柒仟壹佰柒拾叁|柒仟壹佰柒拾肆|柒仟壹佰柒拾伍|柒仟壹佰柒拾陆|柒仟壹佰柒拾柒|柒仟壹佰柒拾捌|柒仟壹佰柒拾玖|柒仟壹佰捌拾|柒仟壹佰捌拾壹|柒仟壹佰捌拾贰|柒仟壹佰捌拾叁|柒仟壹佰捌拾肆|柒仟壹佰捌拾伍|柒仟壹佰捌拾陆|柒仟壹佰捌拾柒|柒仟壹佰捌拾捌|柒仟壹佰捌拾玖|柒仟壹佰玖拾|柒仟壹佰玖拾壹|柒仟壹佰玖拾贰|柒仟壹佰玖拾叁|柒仟壹佰玖拾肆|柒仟壹佰玖拾伍|柒仟壹佰玖拾陆|柒仟壹佰玖拾柒|柒仟壹佰玖拾捌|柒仟壹佰玖拾玖|'
+    '柒仟贰佰|柒仟贰佰零壹|柒仟贰佰零贰|柒仟贰佰零叁|柒仟贰佰零肆|柒仟贰佰零伍|柒仟贰佰零陆|柒仟贰佰零柒|柒仟贰佰零捌|柒仟贰佰零玖|柒仟贰佰壹拾|柒仟贰佰壹拾壹|柒仟贰佰壹拾贰|柒仟贰佰壹拾叁|柒仟贰佰壹拾肆|柒仟贰佰壹拾伍|柒仟贰佰壹拾陆|柒仟贰佰壹拾柒|柒仟贰佰壹拾捌|柒仟贰佰壹拾玖|柒仟贰佰贰拾|柒仟贰佰贰拾壹|柒仟贰佰贰拾贰|柒仟贰佰贰拾叁|柒仟贰佰贰拾肆|柒仟贰佰贰拾伍|柒仟贰佰贰拾陆|柒仟贰佰贰拾柒|柒仟贰佰贰拾捌|柒仟贰佰贰拾玖|柒仟贰佰叁拾|柒仟贰佰叁拾壹|柒仟贰佰叁拾贰|柒仟贰佰叁拾叁|柒仟贰佰叁拾肆|柒仟贰佰叁拾伍|柒仟贰佰叁拾陆|柒仟贰佰叁拾柒|柒仟贰佰叁拾捌|柒仟贰佰叁拾玖|柒仟贰佰肆拾|柒仟贰佰肆拾壹|柒仟贰佰肆拾贰|柒仟贰佰肆拾叁|柒仟贰佰肆拾肆|柒仟贰佰肆拾伍|柒仟贰佰肆拾陆|柒仟贰佰肆拾柒|柒仟贰佰肆拾捌|柒仟贰佰肆拾玖|柒仟贰佰伍拾|柒仟贰佰伍拾壹|柒仟贰佰伍拾贰|柒仟贰佰伍拾叁|柒仟贰佰伍拾肆|柒仟贰佰伍拾伍|柒仟贰佰伍拾陆|柒仟贰佰伍拾柒|柒仟贰佰伍拾捌|柒仟贰佰伍拾玖|柒仟贰佰陆拾|柒仟贰佰陆拾壹|柒仟贰佰陆拾贰|柒仟贰佰陆拾叁|柒仟贰佰陆拾肆|柒仟贰佰陆拾伍|柒仟贰佰陆拾陆|柒仟贰佰陆拾柒|柒仟贰佰陆拾捌|柒仟贰佰陆拾玖|柒仟贰佰柒拾|柒仟贰佰柒拾壹|柒仟贰佰柒拾贰|柒仟贰佰柒拾叁|柒仟贰佰柒拾肆|柒仟贰佰柒拾伍|柒仟贰佰柒拾陆|柒仟贰佰柒拾柒|柒仟贰佰柒拾捌|柒仟贰佰柒拾玖|柒仟贰佰捌拾|柒仟贰佰捌拾壹|柒仟贰佰捌拾贰|柒仟贰佰捌拾叁|柒仟贰佰捌拾肆|柒仟贰佰捌拾伍|柒仟贰佰捌拾陆|柒仟贰佰捌拾柒|柒仟贰佰捌拾捌|柒仟贰佰捌拾玖|柒仟贰佰玖拾|柒仟贰佰玖拾壹|柒仟贰佰玖拾贰|柒仟贰佰玖拾叁|柒仟贰佰玖拾肆|柒仟贰佰玖拾伍|柒仟贰佰玖拾陆|柒仟贰佰玖拾柒|柒仟贰佰玖拾捌|柒仟贰佰玖拾玖|'
+    '柒仟叁佰|柒仟叁佰零壹|柒仟叁佰零贰|柒仟叁佰零叁|柒仟叁佰零肆|柒仟叁佰零伍|柒仟叁佰零陆|柒仟叁佰零柒|柒仟叁佰零捌|柒仟叁佰零玖|柒仟叁佰壹拾|柒仟叁佰壹拾壹|柒仟叁佰壹拾贰|柒仟叁佰壹拾叁|柒仟叁佰壹拾肆|柒仟叁佰壹拾伍|柒仟叁佰壹拾陆|柒仟叁佰壹拾柒|柒仟叁佰壹拾捌|柒仟叁佰壹拾玖|柒仟叁佰贰拾|柒仟叁佰贰拾壹|柒仟叁佰贰拾贰|柒仟叁佰贰拾叁|柒仟叁佰贰拾肆|柒仟叁佰贰拾伍|柒仟叁佰贰拾陆|柒仟叁佰贰拾柒|柒仟叁佰贰拾捌|柒仟叁佰贰拾玖|柒仟叁佰叁拾|柒仟叁佰叁拾壹|柒仟叁佰叁拾贰|柒仟叁佰叁拾叁|柒仟叁佰叁拾肆|柒仟叁佰叁拾伍|柒仟叁佰叁拾陆|柒仟叁佰叁拾柒|柒仟叁佰叁拾捌|柒仟叁佰叁拾玖|柒仟叁佰肆拾|柒仟叁佰肆拾壹|柒仟叁佰肆拾贰|柒仟叁佰肆拾叁|柒仟叁佰肆拾肆|柒仟叁佰肆拾伍|柒仟叁佰肆拾陆|柒仟叁佰肆拾柒|柒仟叁佰肆拾捌|柒仟叁佰肆拾玖|柒仟叁佰伍拾|柒仟叁佰伍拾壹|柒仟叁佰伍拾贰|柒仟叁佰伍拾叁|柒仟叁佰伍拾肆|柒仟叁佰伍拾伍|柒仟叁佰伍拾陆|柒仟叁佰伍拾柒|柒仟叁佰伍拾捌|柒仟叁佰伍拾玖|柒仟叁佰陆拾|柒仟叁佰陆拾壹|柒仟叁佰陆拾贰|柒仟叁佰陆拾叁|柒仟叁佰陆拾肆|柒仟叁佰陆拾伍|柒仟叁佰陆拾陆|柒仟叁佰陆拾柒|柒仟叁佰陆拾捌|柒仟叁佰陆拾玖|柒仟叁佰柒拾|柒仟叁佰柒拾壹|柒仟叁佰柒拾贰|柒仟叁佰柒拾叁|柒仟叁佰柒拾肆|柒仟叁佰柒拾伍|柒仟叁佰柒拾陆|柒仟叁佰柒拾柒|柒仟叁佰柒拾捌|柒仟叁佰柒拾玖|柒仟叁佰捌拾|柒仟叁佰捌拾壹|柒仟叁佰捌拾贰|柒仟叁佰捌拾叁|柒仟叁佰捌拾肆|柒仟叁佰捌拾伍|柒仟叁佰捌拾陆|柒仟叁佰捌拾柒|柒仟叁佰捌拾捌|柒仟叁佰捌拾玖|柒仟叁佰玖拾|柒仟叁佰玖拾壹|柒仟叁佰玖拾贰|柒仟叁佰玖拾叁|柒仟叁佰玖拾肆|柒仟叁佰玖拾伍|柒仟叁佰玖拾陆|柒仟叁佰玖拾柒|柒仟叁佰玖拾捌|柒仟叁佰玖拾玖|'
+    '柒仟肆佰|柒仟肆佰零壹|柒仟肆佰零贰|柒仟肆佰零叁|柒仟肆佰零肆|柒仟肆佰零伍|柒仟肆佰零陆|柒仟肆佰零柒|柒仟肆佰零捌|柒仟肆佰零玖|柒仟肆佰壹拾|柒仟肆佰壹拾壹|柒仟肆佰壹拾贰|柒仟肆佰壹拾叁|柒仟肆佰壹拾肆|柒仟肆佰壹拾伍|柒仟肆佰壹拾陆|柒仟肆佰壹拾柒|柒仟肆佰壹拾捌|柒仟肆佰壹拾玖|柒仟肆佰贰拾|柒仟肆佰贰拾壹|柒仟肆佰贰拾贰|柒仟肆佰贰拾叁|柒仟肆佰贰拾肆|柒仟肆佰贰拾伍|柒仟肆佰贰拾陆|柒仟肆佰贰拾柒|柒仟肆佰贰拾捌|柒仟肆佰贰拾玖|柒仟肆佰叁拾|柒仟肆佰叁拾壹|柒仟肆佰叁拾贰|柒仟肆佰叁拾叁|柒仟肆佰叁拾肆|柒仟肆佰叁拾伍|柒仟肆佰叁拾陆|柒仟肆佰叁拾柒|柒仟肆佰叁拾捌|柒仟肆佰叁拾玖|柒仟肆佰肆拾|柒仟肆佰肆拾壹|柒仟肆佰肆拾贰|柒仟肆佰肆拾叁|柒仟肆佰肆拾肆|柒仟肆佰肆拾伍|柒仟肆佰肆拾陆|柒仟肆佰肆拾柒|柒仟肆佰肆拾捌|柒仟肆佰肆拾玖|柒仟肆佰伍拾|柒仟肆佰伍拾壹|柒仟肆佰伍拾贰|柒仟肆佰伍拾叁|柒仟肆佰伍拾肆|柒仟肆佰伍拾伍|柒仟肆佰伍拾陆|柒仟肆佰伍拾柒|柒仟肆佰伍拾捌|柒仟肆佰伍拾玖|柒仟肆佰陆拾|柒仟肆佰陆拾壹|柒仟肆佰陆拾贰|柒仟肆佰陆拾叁|柒仟肆佰陆拾肆|柒仟肆佰陆拾伍|柒仟肆佰陆拾陆|柒仟肆佰陆拾柒|柒仟肆佰陆拾捌|柒仟肆佰陆拾玖|柒仟肆佰柒拾|柒仟肆佰柒拾壹|柒仟肆佰柒拾贰|柒仟肆佰柒拾叁|柒仟肆佰柒拾肆|柒仟肆佰柒拾伍|柒仟肆佰柒拾陆|柒仟肆佰柒拾柒|柒仟肆佰柒拾捌|柒仟肆佰柒拾玖|柒仟肆佰捌拾|柒仟肆佰捌拾壹|柒仟肆佰捌拾贰|柒仟肆佰捌拾叁|柒仟肆佰捌拾肆|柒仟肆佰捌拾伍|柒仟肆佰捌拾陆|柒仟肆佰捌拾柒|柒仟肆佰捌拾捌|柒仟肆佰捌拾玖|柒仟肆佰玖拾|柒仟肆佰玖拾壹|柒仟肆佰玖拾贰|柒仟肆佰玖拾叁|柒仟肆佰玖拾肆|柒仟肆佰玖拾伍|柒仟肆佰玖拾陆|柒仟肆佰玖拾柒|柒仟肆佰玖拾捌|柒仟肆佰玖拾玖|'
+    '柒仟伍佰|柒仟伍佰零壹|柒仟伍佰零贰|柒仟伍佰零叁|柒仟伍佰零肆|柒仟伍佰零伍|柒仟伍佰零陆|柒仟伍佰零柒|柒仟伍佰零捌|柒仟伍佰零玖|柒仟伍佰壹拾|柒仟伍佰壹拾壹|柒仟伍佰壹拾贰|柒仟伍佰壹拾叁|柒仟伍佰壹拾肆|柒仟伍佰壹拾伍|柒仟伍佰壹拾陆|柒仟伍佰壹拾柒|柒仟伍佰壹拾捌|柒仟伍佰壹拾玖|柒仟伍佰贰拾|柒仟伍佰贰拾壹|柒仟伍佰贰拾贰|柒仟伍佰贰拾叁|柒仟伍佰贰拾肆|柒仟伍佰贰拾伍|柒仟伍佰贰拾陆|柒仟伍佰贰拾柒|柒仟伍佰贰拾捌|柒仟伍佰贰拾玖|柒仟伍佰叁拾|柒仟伍佰叁拾壹|柒仟伍佰叁拾贰|柒仟伍佰叁拾叁|柒仟伍佰叁拾肆|柒仟伍佰叁拾伍|柒仟伍佰叁拾陆|柒仟伍佰叁拾柒|柒仟伍佰叁拾捌|柒仟伍佰叁拾玖|柒仟伍佰肆拾|柒仟伍佰肆拾壹|柒仟伍佰肆拾贰|柒仟伍佰肆拾叁|柒仟伍佰肆拾肆|柒仟伍佰肆拾伍|柒仟伍佰肆拾陆|柒仟伍佰肆拾柒|柒仟伍佰肆拾捌|柒仟伍佰肆拾玖|柒仟伍佰伍拾|柒仟伍佰伍拾壹|柒仟伍佰伍拾贰|柒仟伍佰伍拾叁|柒仟伍佰伍拾肆|柒仟伍佰伍拾伍|柒仟伍佰伍拾陆|柒仟伍佰伍拾柒|柒仟伍佰伍拾捌|柒仟伍佰伍拾玖|柒仟伍佰陆拾|柒仟伍佰陆拾壹|柒仟伍佰陆拾贰|柒仟伍佰陆拾叁|柒仟伍佰陆拾肆|柒仟伍佰陆拾伍|柒仟伍佰陆拾陆|柒仟伍佰陆拾柒|柒仟伍佰陆拾捌|柒仟伍佰陆拾玖|柒仟伍佰柒拾|柒仟伍佰柒拾壹|柒仟伍佰柒拾贰|柒仟伍佰柒拾叁|柒仟伍佰柒拾肆|柒仟伍佰柒拾伍|柒仟伍佰柒拾陆|柒仟伍佰柒拾柒|柒仟伍佰柒拾捌|柒仟伍佰柒拾玖|柒仟伍佰捌拾|柒仟伍佰捌拾壹|柒仟伍佰捌拾贰|柒仟伍佰捌拾叁|柒仟伍佰捌拾肆|柒仟伍佰捌拾伍|柒仟伍佰捌拾陆|柒仟伍佰捌拾柒|柒仟伍佰捌拾捌|柒仟伍佰捌拾玖|柒仟伍佰玖拾|柒仟伍佰玖拾壹|柒仟伍佰玖拾贰|柒仟伍佰玖拾叁|柒仟伍佰玖拾肆|柒仟伍佰玖拾伍|柒仟伍佰玖拾陆|柒仟伍佰玖拾柒|柒仟伍佰玖拾捌|柒仟伍佰玖拾玖|'
+    '柒仟陆佰|柒仟陆佰零壹|柒仟陆佰零贰|柒仟陆佰零叁|柒仟陆佰零肆|柒仟陆佰零伍|柒仟陆佰零陆|柒仟陆佰零柒|柒仟陆佰零捌|柒仟陆佰零玖|柒仟陆佰壹拾|柒仟陆佰壹拾壹|柒仟陆佰壹拾贰|柒仟陆佰壹拾叁|柒仟陆佰壹拾肆|柒仟陆佰壹拾伍|柒仟陆佰壹拾陆|柒仟陆佰壹拾柒|柒仟陆佰壹拾捌|柒仟陆佰壹拾玖|柒仟陆佰贰拾|柒仟陆佰贰拾壹|柒仟陆佰贰拾贰|柒仟陆佰贰拾叁|柒仟陆佰贰拾肆|柒仟陆佰贰拾伍|柒仟陆佰贰拾陆|柒仟陆佰贰拾柒|柒仟陆佰贰拾捌|柒仟陆佰贰拾玖|柒仟陆佰叁拾|柒仟陆佰叁拾壹|柒仟陆佰叁拾贰|柒仟陆佰叁拾叁|柒仟陆佰叁拾肆|柒仟陆佰叁拾伍|柒仟陆佰叁拾陆|柒仟陆佰叁拾柒|柒仟陆佰叁拾捌|柒仟陆佰叁拾玖|柒仟陆佰肆拾|柒仟陆佰肆拾壹|柒仟陆佰肆拾贰|柒仟陆佰肆拾叁|柒仟陆佰肆拾肆|柒仟陆佰肆拾伍|柒仟陆佰肆拾陆|柒仟陆佰肆拾柒|柒仟陆佰肆拾捌|柒仟陆佰肆拾玖|柒仟陆佰伍拾|柒仟陆佰伍拾壹|柒仟陆佰伍拾贰|柒仟陆佰伍拾叁|柒仟陆佰伍拾肆|柒仟陆佰伍拾伍|柒仟陆佰伍拾陆|柒仟陆佰伍拾柒|柒仟陆佰伍拾捌|柒仟陆佰伍拾玖|柒仟陆佰陆拾|柒仟陆佰陆拾壹|柒仟陆佰陆拾贰|柒仟陆佰陆拾叁|柒仟陆佰陆拾肆|柒仟陆佰陆拾伍|柒仟陆佰陆拾陆|柒仟陆佰陆拾柒|柒仟陆佰陆拾捌|柒仟陆佰陆拾玖|柒仟陆佰柒拾|柒仟陆佰柒拾壹|柒仟陆佰柒拾贰|柒仟陆佰柒拾叁|柒仟陆佰柒拾肆|柒仟陆佰柒拾伍|柒仟陆佰柒拾陆|柒仟陆佰柒拾柒|柒仟陆佰柒拾捌|柒仟陆佰柒拾玖|柒仟陆佰捌拾|柒仟陆佰捌拾壹|柒仟陆佰捌拾贰|柒仟陆佰捌拾叁|柒仟陆佰捌拾肆|柒仟陆佰捌拾伍|柒仟陆佰捌拾陆|柒仟陆佰捌拾柒|柒仟陆佰捌拾捌|柒仟陆佰捌拾玖|柒仟陆佰玖拾|柒仟陆佰玖拾壹|柒仟陆佰玖拾贰|柒仟陆佰玖拾叁|柒仟陆佰玖拾肆|柒仟陆佰玖拾伍|柒仟陆佰玖拾陆|柒仟陆佰玖拾柒|柒仟陆佰玖拾捌|柒仟陆佰玖拾玖|'
+    '柒仟柒佰|柒仟柒佰零壹|柒仟柒佰零贰|柒仟柒佰零叁|柒仟柒佰零肆|柒仟柒佰零伍|柒仟柒佰零陆|柒仟柒佰零柒|柒仟柒佰零捌|柒仟柒佰零玖|柒仟柒佰壹拾|柒仟柒佰壹拾壹|柒仟柒佰壹拾贰|柒仟柒佰壹拾叁|柒仟柒佰壹拾肆|柒仟柒佰壹拾伍|柒仟柒佰壹拾陆|柒仟柒佰壹拾柒|柒仟柒佰壹拾捌|柒仟柒佰壹拾玖|柒仟柒佰贰拾|柒仟柒佰贰拾壹|柒仟柒佰贰拾贰|柒仟柒佰贰拾叁|柒仟柒佰贰拾肆|柒仟柒佰贰拾伍|柒仟柒佰贰拾陆|柒仟柒佰贰拾柒|柒仟柒佰贰拾捌|柒仟柒佰贰拾玖|柒仟柒佰叁拾|柒仟柒佰叁拾壹|柒仟柒佰叁拾贰|柒仟柒佰叁拾叁|柒仟柒佰叁拾肆|柒仟柒佰叁拾伍|柒仟柒佰叁拾陆|柒仟柒佰叁拾柒|柒仟柒佰叁拾捌|柒仟柒佰叁拾玖|柒仟柒佰肆拾|柒仟柒佰肆拾壹|柒仟柒佰肆拾贰|柒仟柒佰肆拾叁|柒仟柒佰肆拾肆|柒仟柒佰肆拾伍|柒仟柒佰肆拾陆|柒仟柒佰肆拾柒|柒仟柒佰肆拾捌|柒仟柒佰肆拾玖|柒仟柒佰伍拾|柒仟柒佰伍拾壹|柒仟柒佰伍拾贰|柒仟柒佰伍拾叁|柒仟柒佰伍拾肆|柒仟柒佰伍拾伍|柒仟柒佰伍拾陆|柒仟柒佰伍拾柒|柒仟柒佰伍拾捌|柒仟柒佰伍拾玖|柒仟柒佰陆拾|柒仟柒佰陆拾壹|柒仟柒佰陆拾贰|柒仟柒佰陆拾叁|柒仟柒佰陆拾肆|柒仟柒佰陆拾伍|柒仟柒佰陆拾陆|柒仟柒佰陆拾柒|柒仟柒佰陆拾捌|柒仟柒佰陆拾玖|柒仟柒佰柒拾|柒仟柒佰柒拾壹|柒仟柒佰柒拾贰|柒仟柒佰柒拾叁|柒仟柒佰柒拾肆|柒仟柒佰柒拾伍|柒仟柒佰柒拾陆|柒仟柒佰柒拾柒|柒仟柒佰柒拾捌|柒仟柒佰柒拾玖|柒仟柒佰捌拾|柒仟柒佰捌拾壹|柒仟柒佰捌拾贰|柒仟柒佰捌拾叁|柒仟柒佰捌拾肆|柒仟柒佰捌拾伍|柒仟柒佰捌拾陆|柒仟柒佰捌拾柒|柒仟柒佰捌拾捌|柒仟柒佰捌拾玖|柒仟柒佰玖拾|柒仟柒佰玖拾壹|柒仟柒佰玖拾贰|柒仟柒佰玖拾叁|柒仟柒佰玖拾肆|柒仟柒佰玖拾伍|柒仟柒佰玖拾陆|柒仟柒佰玖拾柒|柒仟柒佰玖拾捌|柒仟柒佰玖拾玖|'
+    '柒仟捌佰|柒仟捌佰零壹|柒仟捌佰零贰|柒仟捌佰零叁|柒仟捌佰零肆|柒仟捌佰零伍|柒仟捌佰零陆|柒仟捌佰零柒|柒仟捌佰零捌|柒仟捌佰零玖|柒仟捌佰壹拾|柒仟捌佰壹拾壹|柒仟捌佰壹拾贰|柒仟捌佰壹拾叁|柒仟捌佰壹拾肆|柒仟捌佰壹拾伍|柒仟捌佰壹拾陆|柒仟捌佰壹拾柒|柒仟捌佰壹拾捌|柒仟捌佰壹拾玖|柒仟捌佰贰拾|柒仟捌佰贰拾壹|柒仟捌佰贰拾贰|柒仟捌佰贰拾叁|柒仟捌佰贰拾肆|柒仟捌佰贰拾伍|柒仟捌佰贰拾陆|柒仟捌佰贰拾柒|柒仟捌佰贰拾捌|柒仟捌佰贰拾玖|柒仟捌佰叁拾|柒仟捌佰叁拾壹|柒仟捌佰叁拾贰|柒仟捌佰叁拾叁|柒仟捌佰叁拾肆|柒仟捌佰叁拾伍|柒仟捌佰叁拾陆|柒仟捌佰叁拾柒|柒仟捌佰叁拾捌|柒仟捌佰叁拾玖|柒仟捌佰肆拾|柒仟捌佰肆拾壹|柒仟捌佰肆拾贰|柒仟捌佰肆拾叁|柒仟捌佰肆拾肆|柒仟捌佰肆拾伍|柒仟捌佰肆拾陆|柒仟捌佰肆拾柒|柒仟捌佰肆拾捌|柒仟捌佰肆拾玖|柒仟捌佰伍拾|柒仟捌佰伍拾壹|柒仟捌佰伍拾贰|柒仟捌佰伍拾叁|柒仟捌佰伍拾肆|柒仟捌佰伍拾伍|柒仟捌佰伍拾陆|柒仟捌佰伍拾柒|柒仟捌佰伍拾捌|柒仟捌佰伍拾玖|柒仟捌佰陆拾|柒仟捌佰陆拾壹|柒仟捌佰陆拾贰|柒仟捌佰陆拾叁|柒仟捌佰陆拾肆|柒仟捌佰陆拾伍|柒仟捌佰陆拾陆|柒仟捌佰陆拾柒|柒仟捌佰陆拾捌|柒仟捌佰陆拾玖|柒仟捌佰柒拾|柒仟捌佰柒拾壹|柒仟捌佰柒拾贰|柒仟捌佰柒拾叁|柒仟捌佰柒拾肆|柒仟捌佰柒拾伍|柒仟捌佰柒拾陆|柒仟捌佰柒拾柒|柒仟捌佰柒拾捌|柒仟捌佰柒拾玖|柒仟捌佰捌拾|柒仟捌佰捌拾壹|柒仟捌佰捌拾贰|柒仟捌佰捌拾叁|柒仟捌佰捌拾肆|柒仟捌佰捌拾伍|柒仟捌佰捌拾陆|柒仟捌佰捌拾柒|柒仟捌佰捌拾捌|柒仟捌佰捌拾玖|柒仟捌佰玖拾|柒仟捌佰玖拾壹|柒仟捌佰玖拾贰|柒仟捌佰玖拾叁|柒仟捌佰玖拾肆|柒仟捌佰玖拾伍|柒仟捌佰玖拾陆|柒仟捌佰玖拾柒|柒仟捌佰玖拾捌|柒仟捌佰玖拾玖|'
+    '柒仟玖佰|柒仟玖佰零壹|柒仟玖佰零贰|柒仟玖佰零叁|柒仟玖佰零肆|柒仟玖佰零伍|柒仟玖佰零陆|柒仟玖佰零柒|柒仟玖佰零捌|柒仟玖佰零玖|柒仟玖佰壹拾|柒仟玖佰壹拾壹|柒仟玖佰壹拾贰|柒仟玖佰壹拾叁|柒仟玖佰壹拾肆|柒仟玖佰壹拾伍|柒仟玖佰壹拾陆|柒仟玖佰壹拾柒|柒仟玖佰壹拾捌|柒仟玖佰壹拾玖|柒仟玖佰贰拾|柒仟玖佰贰拾壹|柒仟玖佰贰拾贰|柒仟玖佰贰拾叁|柒仟玖佰贰拾肆|柒仟玖佰贰拾伍|柒仟玖佰贰拾陆|柒仟玖佰贰拾柒|柒仟玖佰贰拾捌|柒仟玖佰贰拾玖|柒仟玖佰叁拾|柒仟玖佰叁拾壹|柒仟玖佰叁拾贰|柒仟玖佰叁拾叁|柒仟玖佰叁拾肆|柒仟玖佰叁拾伍|柒仟玖佰叁拾陆|柒仟玖佰叁拾柒|柒仟玖佰叁拾捌|柒仟玖佰叁拾玖|柒仟玖佰肆拾|柒仟玖佰肆拾壹|柒仟玖佰肆拾贰|柒仟玖佰肆拾叁|柒仟玖佰肆拾肆|柒仟玖佰肆拾伍|柒仟玖佰肆拾陆|柒仟玖佰肆拾柒|柒仟玖佰肆拾捌|柒仟玖佰肆拾玖|柒仟玖佰伍拾|柒仟玖佰伍拾壹|柒仟玖佰伍拾贰|柒仟玖佰伍拾叁|柒仟玖佰伍拾肆|柒仟玖佰伍拾伍|柒仟玖佰伍拾陆|柒仟玖佰伍拾柒|柒仟玖佰伍拾捌|柒仟玖佰伍拾玖|柒仟玖佰陆拾|柒仟玖佰陆拾壹|柒仟玖佰陆拾贰|柒仟玖佰陆拾叁|柒仟玖佰陆拾肆|柒仟玖佰陆拾伍|柒仟玖佰陆拾陆|柒仟玖佰陆拾柒|柒仟玖佰陆拾捌|柒仟玖佰陆拾玖|柒仟玖佰柒拾|柒仟玖佰柒拾壹|柒仟玖佰柒拾贰|柒仟玖佰柒拾叁|柒仟玖佰柒拾肆|柒仟玖佰柒拾伍|柒仟玖佰柒拾陆|柒仟玖佰柒拾柒|柒仟玖佰柒拾捌|柒仟玖佰柒拾玖|柒仟玖佰捌拾|柒仟玖佰捌拾壹|柒仟玖佰捌拾贰|柒仟玖佰捌拾叁|柒仟玖佰捌拾肆|柒仟玖佰捌拾伍|柒仟玖佰捌拾陆|柒仟玖佰捌拾柒|柒仟玖佰捌拾捌|柒仟玖佰捌拾玖|柒仟玖佰玖拾|柒仟玖佰玖拾壹|柒仟玖佰玖拾贰|柒仟玖佰玖拾叁|柒仟玖佰玖拾肆|柒仟玖佰玖拾伍|柒仟玖佰玖拾陆|柒仟玖佰玖拾柒|柒仟玖佰玖拾捌|柒仟玖佰玖拾玖|'
+    '捌仟|捌仟零壹|捌仟零贰|捌仟零叁|捌仟零肆|捌仟零伍|捌仟零陆|捌仟零柒|捌仟零捌|捌仟零玖|捌仟零壹拾|捌仟零壹拾壹|捌仟零壹拾贰|捌仟零壹拾叁|捌仟零壹拾肆|捌仟零壹拾伍|捌仟零壹拾陆|捌仟零壹拾柒|捌仟零壹拾捌|捌仟零壹拾玖|捌仟零贰拾|捌仟零贰拾壹|捌仟零贰拾贰|捌仟零贰拾叁|捌仟零贰拾肆|捌仟零贰拾伍|捌仟零贰拾陆|捌仟零贰拾柒|捌仟零贰拾捌|捌仟零贰拾玖|捌仟零叁拾|捌仟零叁拾壹|捌仟零叁拾贰|捌仟零叁拾叁|捌仟零叁拾肆|捌仟零叁拾伍|捌仟零叁拾陆|捌仟零叁拾柒|捌仟零叁拾捌|捌仟零叁拾玖|捌仟零肆拾|捌仟零肆拾壹|捌仟零肆拾贰|捌仟零肆拾叁|捌仟零肆拾肆|捌仟零肆拾伍|捌仟零肆拾陆|捌仟零肆拾柒|捌仟零肆拾捌|捌仟零肆拾玖|捌仟零伍拾|捌仟零伍拾壹|捌仟零伍拾贰|捌仟零伍拾叁|捌仟零伍拾肆|捌仟零伍拾伍|捌仟零伍拾陆|捌仟零伍拾柒|捌仟零伍拾捌|捌仟零伍拾玖|捌仟零陆拾|捌仟零陆拾壹|捌仟零陆拾贰|捌仟零陆拾叁|捌仟零陆拾肆|捌仟零陆拾伍|捌仟零陆拾陆|捌仟零陆拾柒|捌仟零陆拾捌|捌仟零陆拾玖|捌仟零柒拾|捌仟零柒拾壹|捌仟零柒拾贰|捌仟零柒拾叁|捌仟零柒拾肆|捌仟零柒拾伍|捌仟零柒拾陆|捌仟零柒拾柒|捌仟零柒拾捌|捌仟零柒拾玖|捌仟零捌拾|捌仟零捌拾壹|捌仟零捌拾贰|捌仟零捌拾叁|捌仟零捌拾肆|捌仟零捌拾伍|捌仟零捌拾陆|捌仟零捌拾柒|捌仟零捌拾捌|捌仟零捌拾玖|捌仟零玖拾|捌仟零玖拾壹|捌仟零玖拾贰|捌仟零玖拾叁|捌仟零玖拾肆|捌仟零玖拾伍|捌仟零玖拾陆|捌仟零玖拾柒|捌仟零玖拾捌|捌仟零玖拾玖|'
+    '捌仟壹佰|捌仟壹佰零壹|捌仟壹佰零贰|捌仟壹佰零叁|捌仟壹佰零肆|捌仟壹佰零伍|捌仟壹佰零陆|捌仟壹佰零柒|捌仟壹佰零捌|捌仟壹佰零玖|捌仟壹佰壹拾|捌仟壹佰壹拾壹|捌仟壹佰壹拾贰|捌仟壹佰壹拾叁|捌仟壹佰壹拾肆|捌仟壹佰壹拾伍|捌仟壹佰壹拾陆|捌仟壹佰壹拾柒|捌仟壹佰壹拾捌|捌仟壹佰壹拾玖|捌仟壹佰贰拾|捌仟壹佰贰拾壹|捌仟壹佰贰拾贰|捌仟壹佰贰拾叁|捌仟壹佰贰拾肆|捌仟壹佰贰拾伍|捌仟壹佰贰拾陆|捌仟壹佰贰拾柒|捌仟壹佰贰拾捌|捌仟壹佰贰拾玖|捌仟壹佰叁拾|捌仟壹佰叁拾壹|捌仟壹佰叁拾贰|捌仟壹佰叁拾叁|捌仟壹佰叁拾肆|捌仟壹佰叁拾伍|捌仟壹佰叁拾陆|捌仟壹佰叁拾柒|捌仟壹佰叁拾捌|捌仟壹佰叁拾玖|捌仟壹佰肆拾|捌仟壹佰肆拾壹|捌仟壹佰肆拾贰|捌仟壹佰肆拾叁|捌仟壹佰肆拾肆|捌仟壹佰肆拾伍|捌仟壹佰肆拾陆|捌仟壹佰肆拾柒|捌仟壹佰肆拾捌|捌仟壹佰肆拾玖|捌仟壹佰伍拾|捌仟壹佰伍拾壹|捌仟壹佰伍拾贰|捌仟壹佰伍拾叁|捌仟壹佰伍拾肆|捌仟壹佰伍拾伍|捌仟壹佰伍拾陆|捌仟壹佰伍拾柒|捌仟壹佰伍拾捌|捌仟壹佰伍拾玖|捌仟壹佰陆拾|捌仟壹佰陆拾壹|捌仟壹佰陆拾贰|捌仟壹佰陆拾叁|捌仟壹佰陆拾肆|捌仟壹佰陆拾伍|捌仟壹佰陆拾陆|捌仟壹佰陆拾柒|捌仟壹佰陆拾捌|捌仟壹佰陆拾玖|捌仟壹佰柒拾|捌仟壹佰柒拾壹|捌仟壹佰柒拾贰|捌仟壹佰柒拾叁|捌仟壹佰柒拾肆|捌仟壹佰柒拾伍|捌仟壹佰柒拾陆|捌仟壹佰柒拾柒|捌仟壹佰柒拾捌|捌仟壹佰柒拾玖|捌仟壹佰捌拾|捌仟壹佰捌拾壹|捌仟壹佰捌拾贰|捌仟壹佰捌拾叁|捌仟壹佰捌拾肆|捌仟壹佰捌拾伍|捌仟壹佰捌拾陆|捌仟壹佰捌拾柒|捌仟壹佰捌拾捌|捌仟壹佰捌拾玖|捌仟壹佰玖拾|捌仟壹佰玖拾壹|捌仟壹佰玖拾贰|捌仟壹佰玖拾叁|捌仟壹佰玖拾肆|捌仟壹佰玖拾伍|捌仟壹佰玖拾陆|捌仟壹佰玖拾柒|捌仟壹佰玖拾捌|捌仟壹佰玖拾玖|'
+    '捌仟贰佰|捌仟贰佰零壹|捌仟贰佰零贰|捌仟贰佰零叁|捌仟贰佰零肆|捌仟贰佰零伍|捌仟贰佰零陆|捌仟贰佰零柒|捌仟贰佰零捌|捌仟贰佰零玖|捌仟贰佰壹拾|捌仟贰佰壹拾壹|捌仟贰佰壹拾贰|捌仟贰佰壹拾叁|捌仟贰佰壹拾肆|捌仟贰佰壹拾伍|捌仟贰佰壹拾陆|捌仟贰佰壹拾柒|捌仟贰佰壹拾捌|捌仟贰佰壹拾玖|捌仟贰佰贰拾|捌仟贰佰贰拾壹|捌仟贰佰贰拾贰|捌仟贰佰贰拾叁|捌仟贰佰贰拾肆|捌仟贰佰贰拾伍|捌仟贰佰贰拾陆|捌仟贰佰贰拾柒|捌仟贰佰贰拾捌|捌仟贰佰贰拾玖|捌仟贰佰叁拾|捌仟贰佰叁拾壹|捌仟贰佰叁拾贰|捌仟贰佰叁拾叁|捌仟贰佰叁拾肆|捌仟贰佰叁拾伍|捌仟贰佰叁拾陆|捌仟贰佰叁拾柒|捌仟贰佰叁拾捌|捌仟贰佰叁拾玖|捌仟贰佰肆拾|捌仟贰佰肆拾壹|捌仟贰佰肆拾贰|捌仟贰佰肆拾叁|捌仟贰佰肆拾肆|捌仟贰佰肆拾伍|捌仟贰佰肆拾陆|捌仟贰佰肆拾柒|捌仟贰佰肆拾捌|捌仟贰佰肆拾玖|捌仟贰佰伍拾|捌仟贰佰伍拾壹|捌仟贰佰伍拾贰|捌仟贰佰伍拾叁|捌仟贰佰伍拾肆|捌仟贰佰伍拾伍|捌仟贰佰伍拾陆|捌仟贰佰伍拾柒|捌仟贰佰伍拾捌|捌仟贰佰伍拾玖|捌仟贰佰陆拾|捌仟贰佰陆拾壹|捌仟贰佰陆拾贰|捌仟贰佰陆拾叁|捌仟贰佰陆拾肆|捌仟贰佰陆拾伍|捌仟贰佰陆拾陆|捌仟贰佰陆拾柒|捌仟贰佰陆拾捌|捌仟贰佰陆拾玖|捌仟贰佰柒拾|捌仟贰佰柒拾壹|捌仟贰佰柒拾贰|捌仟贰佰柒拾叁|捌仟贰佰柒拾肆|捌仟贰佰柒拾伍|捌仟贰佰柒拾陆|捌仟贰佰柒拾柒|捌仟贰佰柒拾捌|捌仟贰佰柒拾玖|捌仟贰佰捌拾|捌仟贰佰捌拾壹|捌仟贰佰捌拾贰|捌仟贰佰捌拾叁|捌仟贰佰捌拾肆|捌仟贰佰捌拾伍|捌仟贰佰捌拾陆|捌仟贰佰捌拾柒|捌仟贰佰捌拾捌|捌仟贰佰捌拾玖|捌仟贰佰玖拾|捌仟贰佰玖拾壹|捌仟贰佰玖拾贰|捌仟贰佰玖拾叁|捌仟贰佰玖拾肆|捌仟贰佰玖拾伍|捌仟贰佰玖拾陆|捌仟贰佰玖拾柒|捌仟贰佰玖拾捌|捌仟贰佰玖拾玖|'
+    '捌仟叁佰|捌仟叁佰零壹|捌仟叁佰零贰|捌仟叁佰零叁|捌仟叁佰零肆|捌仟叁佰零伍|捌仟叁佰零陆|捌仟叁佰零柒|捌仟叁佰零捌|捌仟叁佰零玖|捌仟叁佰壹拾|捌仟叁佰壹拾壹|捌仟叁佰壹拾贰|捌仟叁佰壹拾叁|捌仟叁佰壹拾肆|捌仟叁佰壹拾伍|捌仟叁佰壹拾陆|捌仟叁佰壹拾柒|捌仟叁佰壹拾捌|捌仟叁佰壹拾玖|捌仟叁佰贰拾|捌仟叁佰贰拾壹|捌仟叁佰贰拾贰|捌仟叁佰贰拾叁|捌仟叁佰贰拾肆|捌仟叁佰贰拾伍|捌仟叁佰贰拾陆|捌仟叁佰贰拾柒|捌仟叁佰贰拾捌|捌仟叁佰贰拾玖|捌仟叁佰叁拾|捌仟叁佰叁拾壹|捌仟叁佰叁拾贰|捌仟叁佰叁拾叁|捌仟叁佰叁拾肆|捌仟叁佰叁拾伍|捌仟叁佰叁拾陆|捌仟叁佰叁拾柒|捌仟叁佰叁拾捌|捌仟叁佰叁拾玖|捌仟叁佰肆拾|捌仟叁佰肆拾壹|捌仟叁佰肆拾贰|捌仟叁佰肆拾叁|捌仟叁佰肆拾肆|捌仟叁佰肆拾伍|捌仟叁佰肆拾陆|捌仟叁佰肆拾柒|捌仟叁佰肆拾捌|捌仟叁佰肆拾玖|捌仟叁佰伍拾|捌仟叁佰伍拾壹|捌仟叁佰伍拾贰|捌仟叁佰伍拾叁|捌仟叁佰伍拾肆|捌仟叁佰伍拾伍|捌仟叁佰伍拾陆|捌仟叁佰伍拾柒|捌仟叁佰伍拾捌|捌仟叁佰伍拾玖|捌仟叁佰陆拾|捌仟叁佰陆拾壹|捌仟叁佰陆拾贰|捌仟叁佰陆拾叁|捌仟叁佰陆拾肆|捌仟叁佰陆拾伍|捌仟叁佰陆拾陆|捌仟叁佰陆拾柒|捌仟叁佰陆拾捌|捌仟叁佰陆拾玖|捌仟叁佰柒拾|捌仟叁佰柒拾壹|捌仟叁佰柒拾贰|捌仟叁佰柒拾叁|捌仟叁佰柒拾肆|捌仟叁佰柒拾伍|捌仟叁佰柒拾陆|捌仟叁佰柒拾柒|捌仟叁佰柒拾捌|捌仟叁佰柒拾玖|捌仟叁佰捌拾|捌仟叁佰捌拾壹|捌仟叁佰捌拾贰|捌仟叁佰捌拾叁|捌仟叁佰捌拾肆|捌仟叁佰捌拾伍|捌仟叁佰捌拾陆|捌仟叁佰捌拾柒|捌仟叁佰捌拾捌|捌仟叁佰捌拾玖|捌仟叁佰玖拾|捌仟叁佰玖拾壹|捌仟叁佰玖拾贰|捌仟叁佰玖拾叁|捌仟叁佰玖拾肆|捌仟叁佰玖拾伍|捌仟叁佰玖拾陆|捌仟叁佰玖拾柒|捌仟叁佰玖拾捌|捌仟叁佰玖拾玖|'
+    '捌仟肆佰|捌仟肆佰零壹|捌仟肆佰零贰|捌仟肆佰零叁|捌仟肆佰零肆|捌仟肆佰零伍|捌仟肆佰零陆|捌仟肆佰零柒|捌仟肆佰零捌|捌仟肆佰零玖|捌仟肆佰壹拾|捌仟肆佰壹拾壹|捌仟肆佰壹拾贰|捌仟肆佰壹拾叁|捌仟肆佰壹拾肆|捌仟肆佰壹拾伍|捌仟肆佰壹拾陆|捌仟肆佰壹拾柒|捌仟肆佰壹拾捌|捌仟肆佰壹拾玖|捌仟肆佰贰拾|捌仟肆佰贰拾壹|捌仟肆佰贰拾贰|捌仟肆佰贰拾叁|捌仟肆佰贰拾肆|捌仟肆佰贰拾伍|捌仟肆佰贰拾陆|捌仟肆佰贰拾柒|捌仟肆佰贰拾捌|捌仟肆佰贰拾玖|捌仟肆佰叁拾|捌仟肆佰叁拾壹|捌仟肆佰叁拾贰|捌仟肆佰叁拾叁|捌仟肆佰叁拾肆|捌仟肆佰叁拾伍|捌仟肆佰叁拾陆|捌仟肆佰叁拾柒|捌仟肆佰叁拾捌|捌仟肆佰叁拾玖|捌仟肆佰肆拾|捌仟肆佰肆拾壹|捌仟肆佰肆拾贰|捌仟肆佰肆拾叁|捌仟肆佰肆拾肆|捌仟肆佰肆拾伍|捌仟肆佰肆拾陆|捌仟肆佰肆拾柒|捌仟肆佰肆拾捌|捌仟肆佰肆拾玖|捌仟肆佰伍拾|捌仟肆佰伍拾壹|捌仟肆佰伍拾贰|捌仟肆佰伍拾叁|捌仟肆佰伍拾肆|捌仟肆佰伍拾伍|捌仟肆佰伍拾陆|捌仟肆佰伍拾柒|捌仟肆佰伍拾捌|捌仟肆佰伍拾玖|捌仟肆佰陆拾|捌仟肆佰陆拾壹|捌仟肆佰陆拾贰|捌仟肆佰陆拾叁|捌仟肆佰陆拾肆|捌仟肆佰陆拾伍|捌仟肆佰陆拾陆|捌仟肆佰陆拾柒|捌仟肆佰陆拾捌|捌仟肆佰陆拾玖|捌仟肆佰柒拾|捌仟肆佰柒拾壹|捌仟肆佰柒拾贰|捌仟肆佰柒拾叁|捌仟肆佰柒拾肆|捌仟肆佰柒拾伍|捌仟肆佰柒拾陆|捌仟肆佰柒拾柒|捌仟肆佰柒拾捌|捌仟肆佰柒拾玖|捌仟肆佰捌拾|捌仟肆佰捌拾壹|捌仟肆佰捌拾贰|捌仟肆佰捌拾叁|捌仟肆佰捌拾肆|捌仟肆佰捌拾伍|捌仟肆佰捌拾陆|捌仟肆佰捌拾柒|捌仟肆佰捌拾捌|捌仟肆佰捌拾玖|捌仟肆佰玖拾|捌仟肆佰玖拾壹|捌仟肆佰玖拾贰|捌仟肆佰玖拾叁|捌仟肆佰玖拾肆|捌仟肆佰玖拾伍|捌仟肆佰玖拾陆|捌仟肆佰玖拾柒|捌仟肆佰玖拾捌|捌仟肆佰玖拾玖|'
+    '捌仟伍佰|捌仟伍佰零壹|捌仟伍佰零贰|捌仟伍佰零叁|捌仟伍佰零肆|捌仟伍佰零伍|捌仟伍佰零陆|捌仟伍佰零柒|捌仟伍佰零捌|捌仟伍佰零玖|捌仟伍佰壹拾|捌仟伍佰壹拾壹|捌仟伍佰壹拾贰|捌仟伍佰壹拾叁|捌仟伍佰壹拾肆|捌仟伍佰壹拾伍|捌仟伍佰壹拾陆|捌仟伍佰壹拾柒|捌仟伍佰壹拾捌|捌仟伍佰壹拾玖|捌仟伍佰贰拾|捌仟伍佰贰拾壹|捌仟伍佰贰拾贰|捌仟伍佰贰拾叁|捌仟伍佰贰拾肆|捌仟伍佰贰拾伍|捌仟伍佰贰拾陆|捌仟伍佰贰拾柒|捌仟伍佰贰拾捌|捌仟伍佰贰拾玖|捌仟伍佰叁拾|捌仟伍佰叁拾壹|捌仟伍佰叁拾贰|捌仟伍佰叁拾叁|捌仟伍佰叁拾肆|捌仟伍佰叁拾伍|捌仟伍佰叁拾陆|捌仟伍佰叁拾柒|捌仟伍佰叁拾捌|捌仟伍佰叁拾玖|捌仟伍佰肆拾|捌仟伍佰肆拾壹|捌仟伍佰肆拾贰|捌仟伍佰肆拾叁|捌仟伍佰肆拾肆|捌仟伍佰肆拾伍|捌仟伍佰肆拾陆|捌仟伍佰肆拾柒|捌仟伍佰肆拾捌|捌仟伍佰肆拾玖|捌仟伍佰伍拾|捌仟伍佰伍拾壹|捌仟伍佰伍拾贰|捌仟伍佰伍拾叁|捌仟伍佰伍拾肆|捌仟伍佰伍拾伍|捌仟伍佰伍拾陆|捌仟伍佰伍拾柒|捌仟伍佰伍拾捌|捌仟伍佰伍拾玖|捌仟伍佰陆拾|捌仟伍佰陆拾壹|捌仟伍佰陆拾贰|捌仟伍佰陆拾叁|捌仟伍佰陆拾肆|捌仟伍佰陆拾伍|捌仟伍佰陆拾陆|捌仟伍佰陆拾柒|捌仟伍佰陆拾捌|捌仟伍佰陆拾玖|捌仟伍佰柒拾|捌仟伍佰柒拾壹|捌仟伍佰柒拾贰|捌仟伍佰柒拾叁|捌仟伍佰柒拾肆|捌仟伍佰柒拾伍|捌仟伍佰柒拾陆|捌仟伍佰柒拾柒|捌仟伍佰柒拾捌|捌仟伍佰柒拾玖|捌仟伍佰捌拾|捌仟伍佰捌拾壹|捌仟伍佰捌拾贰|捌仟伍佰捌拾叁|捌仟伍佰捌拾肆|捌仟伍佰捌拾伍|捌仟伍佰捌拾陆|捌仟伍佰捌拾柒|捌仟伍佰捌拾捌|捌仟伍佰捌拾玖|捌仟伍佰玖拾|捌仟伍佰玖拾壹|捌仟伍佰玖拾贰|捌仟伍佰玖拾叁|捌仟伍佰玖拾肆|捌仟伍佰玖拾伍|捌仟伍佰玖拾陆|捌仟伍佰玖拾柒|捌仟伍佰玖拾捌|捌仟伍佰玖拾玖|'
+    '捌仟陆佰|捌仟陆佰零壹|捌仟陆佰零贰|捌仟陆佰零叁|捌仟陆佰零肆|捌仟陆佰零伍|捌仟陆佰零陆|捌仟陆佰零柒|捌仟陆佰零捌|捌仟陆佰零玖|捌仟陆佰壹拾|捌仟陆佰壹拾壹|捌仟陆佰壹拾贰|捌仟陆佰壹拾叁|捌仟陆佰壹拾肆|捌仟陆佰壹拾伍|捌仟陆佰壹拾陆|捌仟陆佰壹拾柒|捌仟陆佰壹拾捌|捌仟陆佰壹拾玖|捌仟陆佰贰拾|捌仟陆佰贰拾壹|捌仟陆佰贰拾贰|捌仟陆佰贰拾叁|捌仟陆佰贰拾肆|捌仟陆佰贰拾伍|捌仟陆佰贰拾陆|捌仟陆佰贰拾柒|捌仟陆佰贰拾捌|捌仟陆佰贰拾玖|捌仟陆佰叁拾|捌仟陆佰叁拾壹|捌仟陆佰叁拾贰|捌仟陆佰叁拾叁|捌仟陆佰叁拾肆|捌仟陆佰叁拾伍|捌仟陆佰叁拾陆|捌仟陆佰叁拾柒|捌仟陆佰叁拾捌|捌仟陆佰叁拾玖|捌仟陆佰肆拾|捌仟陆佰肆拾壹|捌仟陆佰肆拾贰|捌仟陆佰肆拾叁|捌仟陆佰肆拾肆|捌仟陆佰肆拾伍|捌仟陆佰肆拾陆|捌仟陆佰肆拾柒|捌仟陆佰肆拾捌|捌仟陆佰肆拾玖|捌仟陆佰伍拾|捌仟陆佰伍拾壹|捌仟陆佰伍拾贰|捌仟陆佰伍拾叁|捌仟陆佰伍拾肆|捌仟陆佰伍拾伍|捌仟陆佰伍拾陆|捌仟陆佰伍拾柒|捌仟陆佰伍拾捌|捌仟陆佰伍拾玖|捌仟陆佰陆拾|捌仟陆佰陆拾壹|捌仟陆佰陆拾贰|捌仟陆佰陆拾叁|捌仟陆佰陆拾肆|捌仟陆佰陆拾伍|捌仟陆佰陆拾陆|捌仟陆佰陆拾柒|捌仟陆佰陆拾捌|捌仟陆佰陆拾玖|捌仟陆佰柒拾|捌仟陆佰柒拾壹|捌仟陆佰柒拾贰|捌仟陆佰柒拾叁|捌仟陆佰柒拾肆|捌仟陆佰柒拾伍|捌仟陆佰柒拾陆|捌仟陆佰柒拾柒|捌仟陆佰柒拾捌|捌仟陆佰柒拾玖|捌仟陆佰捌拾|捌仟陆佰捌拾壹|捌仟陆佰捌拾贰|捌仟陆佰捌拾叁|捌仟陆佰捌拾肆|捌仟陆佰捌拾伍|捌仟陆佰捌拾陆|捌仟陆佰捌拾柒|捌仟陆佰捌拾捌|捌仟陆佰捌拾玖|捌仟陆佰玖拾|捌仟陆佰玖拾壹|捌仟陆佰玖拾贰|捌仟陆佰玖拾叁|捌仟陆佰玖拾肆|捌仟陆佰玖拾伍|捌仟陆佰玖拾陆|捌仟陆佰玖拾柒|捌仟陆佰玖拾捌|捌仟陆佰玖拾玖|'
+    '捌仟柒佰|捌仟柒佰零壹|捌仟柒佰零贰|捌仟柒佰零叁|捌仟柒佰零肆|捌仟柒佰零伍|捌仟柒佰零陆|捌仟柒佰零柒|捌仟柒佰零捌|捌仟柒佰零玖|捌仟柒佰壹拾|捌仟柒佰壹拾壹|捌仟柒佰壹拾贰|捌仟柒佰壹拾叁|捌仟柒佰壹拾肆|捌仟柒佰壹拾伍|捌仟柒佰壹拾陆|捌仟柒佰壹拾柒|捌仟柒佰壹拾捌|捌仟柒佰壹拾玖|捌仟柒佰贰拾|捌仟柒佰贰拾壹|捌仟柒佰贰拾贰|捌仟柒佰贰拾叁|捌仟柒佰贰拾肆|捌仟柒佰贰拾伍|捌仟柒佰贰拾陆|捌仟柒佰贰拾柒|捌仟柒佰贰拾捌|捌仟柒佰贰拾玖|捌仟柒佰叁拾|捌仟柒佰叁拾壹|捌仟柒佰叁拾贰|捌仟柒佰叁拾叁|捌仟柒佰叁拾肆|捌仟柒佰叁拾伍|捌仟柒佰叁拾陆|捌仟柒佰叁拾柒|捌仟柒佰叁拾捌|捌仟柒佰叁拾玖|捌仟柒佰肆拾|捌仟柒佰肆拾壹|捌仟柒佰肆拾贰|捌仟柒佰肆拾叁|捌仟柒佰肆拾肆|捌仟柒佰肆拾伍|捌仟柒佰肆拾陆|捌仟柒佰肆拾柒|捌仟柒佰肆拾捌|捌仟柒佰肆拾玖|捌仟柒佰伍拾|捌仟柒佰伍拾壹|捌仟柒佰伍拾贰|捌仟柒佰伍拾叁|捌仟柒佰伍拾肆|捌仟柒佰伍拾伍|捌仟柒佰伍拾陆|捌仟柒佰伍拾柒|捌仟柒佰伍拾捌|捌仟柒佰伍拾玖|捌仟柒佰陆拾|捌仟柒佰陆拾壹|捌仟柒佰陆拾贰|捌仟柒佰陆拾叁|捌仟柒佰陆拾肆|捌仟柒佰陆拾伍|捌仟柒佰陆拾陆|捌仟柒佰陆拾柒|捌仟柒佰陆拾捌|捌仟柒佰陆拾玖|捌仟柒佰柒拾|捌仟柒佰柒拾壹|捌仟柒佰柒拾贰|捌仟柒佰柒拾叁|捌仟柒佰柒拾肆|捌仟柒佰柒拾伍|捌仟柒佰柒拾陆|捌仟柒佰柒拾柒|捌仟柒佰柒拾捌|捌仟柒佰柒拾玖|捌仟柒佰捌拾|捌仟柒佰捌拾壹|捌仟柒佰捌拾贰|捌仟柒佰捌拾叁|捌仟柒佰捌拾肆|捌仟柒佰捌拾伍|捌仟柒佰捌拾陆|捌仟柒佰捌拾柒|捌仟柒佰捌拾捌|捌仟柒佰捌拾玖|捌仟柒佰玖拾|捌仟柒佰玖拾壹|捌仟柒佰玖拾贰|捌仟柒佰玖拾叁|捌仟柒佰玖拾肆|捌仟柒佰玖拾伍|捌仟柒佰玖拾陆|捌仟柒佰玖拾柒|捌仟柒佰玖拾捌|捌仟柒佰玖拾玖|'
+    '捌仟捌佰|捌仟捌佰零壹|捌仟捌佰零贰|捌仟捌佰零叁|捌仟捌佰零肆|捌仟捌佰零伍|捌仟捌佰零陆|捌仟捌佰零柒|捌仟捌佰零捌|捌仟捌佰零玖|捌仟捌佰壹拾|捌仟捌佰壹拾壹|捌仟捌佰壹拾贰|捌仟捌佰壹拾叁|捌仟捌佰壹拾肆|捌仟捌佰壹拾伍|捌仟捌佰壹拾陆|捌仟捌佰壹拾柒|捌仟捌佰壹拾捌|捌仟捌佰壹拾玖|捌仟捌佰贰拾|捌仟捌佰贰拾壹|捌仟捌佰贰拾贰|捌仟捌佰贰拾叁|捌仟捌佰贰拾肆|捌仟捌佰贰拾伍|捌仟捌佰贰拾陆|捌仟捌佰贰拾柒|捌仟捌佰贰拾捌|捌仟捌佰贰拾玖|捌仟捌佰叁拾|捌仟捌佰叁拾壹|捌仟捌佰叁拾贰|捌仟捌佰叁拾叁|捌仟捌佰叁拾肆|捌仟捌佰叁拾伍|捌仟捌佰叁拾陆|捌仟捌佰叁拾柒|捌仟捌佰叁拾捌|捌仟捌佰叁拾玖|捌仟捌佰肆拾|捌仟捌佰肆拾壹|捌仟捌佰肆拾贰|捌仟捌佰肆拾叁|捌仟捌佰肆拾肆|捌仟捌佰肆拾伍|捌仟捌佰肆拾陆|捌仟捌佰肆拾柒|捌仟捌佰肆拾捌|捌仟捌佰肆拾玖|捌仟捌佰伍拾|捌仟捌佰伍拾壹|捌仟捌佰伍拾贰|捌仟捌佰伍拾叁|捌仟捌佰伍拾肆|捌仟捌佰伍拾伍|捌仟捌佰伍拾陆|捌仟捌佰伍拾柒|捌仟捌佰伍拾捌|捌仟捌佰伍拾玖|捌仟捌佰陆拾|捌仟捌佰陆拾壹|捌仟捌佰陆拾贰|捌仟捌佰陆拾叁|捌仟捌佰陆拾肆|捌仟捌佰陆拾伍|捌仟捌佰陆拾陆|捌仟捌佰陆拾柒|捌仟捌佰陆拾捌|捌仟捌佰陆拾玖|捌仟捌佰柒拾|捌仟捌佰柒拾壹|捌仟捌佰柒拾贰|捌仟捌佰柒拾叁|捌仟捌佰柒拾肆|捌仟捌佰柒拾伍|捌仟捌佰柒拾陆|捌仟捌佰柒拾柒|捌仟捌佰柒拾捌|捌仟捌佰柒拾玖|捌仟捌佰捌拾|捌仟捌佰捌拾壹|捌仟捌佰捌拾贰|捌仟捌佰捌拾叁|捌仟捌佰捌拾肆|捌仟捌佰捌拾伍|捌仟捌佰捌拾陆|捌仟捌佰捌拾柒|捌仟捌佰捌拾捌|捌仟捌佰捌拾玖|捌仟捌佰玖拾|捌仟捌佰玖拾壹|捌仟捌佰玖拾贰|捌仟捌佰玖拾叁|捌仟捌佰玖拾肆|捌仟捌佰玖拾伍|捌仟捌佰玖拾陆|捌仟捌佰玖拾柒|捌仟捌佰玖拾捌|捌仟捌佰玖拾玖|'
+    '捌仟玖佰|捌仟玖佰零壹|捌仟玖佰零贰|捌仟玖佰零叁|捌仟玖佰零肆|捌仟玖佰零伍|捌仟玖佰零陆|捌仟玖佰零柒|捌仟玖佰零捌|捌仟玖佰零玖|捌仟玖佰壹拾|捌仟玖佰壹拾壹|捌仟玖佰壹拾贰|捌仟玖佰壹拾叁|捌仟玖佰壹拾肆|捌仟玖佰壹拾伍|捌仟玖佰壹拾陆|捌仟玖佰壹拾柒|捌仟玖佰壹拾捌|捌仟玖佰壹拾玖|捌仟玖佰贰拾|捌仟玖佰贰拾壹|捌仟玖佰贰拾贰|捌仟玖佰贰拾叁|捌仟玖佰贰拾肆|捌仟玖佰贰拾伍|捌仟玖佰贰拾陆|捌仟玖佰贰拾柒|捌仟玖佰贰拾捌|捌仟玖佰贰拾玖|捌仟玖佰叁拾|捌仟玖佰叁拾壹|捌仟玖佰叁拾贰|捌仟玖佰叁拾叁|捌仟玖佰叁拾肆|捌仟玖佰叁拾伍|捌仟玖佰叁拾陆|捌仟玖佰叁拾柒|捌仟玖佰叁拾捌|捌仟玖佰叁拾玖|捌仟玖佰肆拾|捌仟玖佰肆拾壹|捌仟玖佰肆拾贰|捌仟玖佰肆拾叁|捌仟玖佰肆拾肆|捌仟玖佰肆拾伍|捌仟玖佰肆拾陆|捌仟玖佰肆拾柒|捌仟玖佰肆拾捌|捌仟玖佰肆拾玖|捌仟玖佰伍拾|捌仟玖佰伍拾壹|捌仟玖佰伍拾贰|捌仟玖佰伍拾叁|捌仟玖佰伍拾肆|捌仟玖佰伍拾伍|捌仟玖佰伍拾陆|捌仟玖佰伍拾柒|捌仟玖佰伍拾捌|捌仟玖佰伍拾玖|捌仟玖佰陆拾|捌仟玖佰陆拾壹|捌仟玖佰陆拾贰|捌仟玖佰陆拾叁|捌仟玖佰陆拾肆|捌仟玖佰陆拾伍|捌仟玖佰陆拾陆|捌仟玖佰陆拾柒|捌仟玖佰陆拾捌|捌仟玖佰陆拾玖|捌仟玖佰柒拾|捌仟玖佰柒拾壹|捌仟玖佰柒拾贰|捌仟玖佰柒拾叁|捌仟玖佰柒拾肆|捌仟玖佰柒拾伍|捌仟玖佰柒拾陆|捌仟玖佰柒拾柒|捌仟玖佰柒拾捌|捌仟玖佰柒拾玖|捌仟玖佰捌拾|捌仟玖佰捌拾壹|捌仟玖佰捌拾贰|捌仟玖佰捌拾叁|捌仟玖佰捌拾肆|捌仟玖佰捌拾伍|捌仟玖佰捌拾陆|捌仟玖佰捌拾柒|捌仟玖佰捌拾捌|捌仟玖佰捌拾玖|捌仟玖佰玖拾|捌仟玖佰玖拾壹|捌仟玖佰玖拾贰|捌仟玖佰玖拾叁|捌仟玖佰玖拾肆|捌仟玖佰玖拾伍|捌仟玖佰玖拾陆|捌仟玖佰玖拾柒|捌仟玖佰玖拾捌|捌仟玖佰玖拾玖|'
+    '玖仟|玖仟零壹|玖仟零贰|玖仟零叁|玖仟零肆|玖仟零伍|玖仟零陆|玖仟零柒|玖仟零捌|玖仟零玖|玖仟零壹拾|玖仟零壹拾壹|玖仟零壹拾贰|玖仟零壹拾叁|玖仟零壹拾肆|玖仟零壹拾伍|玖仟零壹拾陆|玖仟零壹拾柒|玖仟零壹拾捌|玖仟零壹拾玖|玖仟零贰拾|玖仟零贰拾壹|玖仟零贰拾贰|玖仟零贰拾叁|玖仟零贰拾肆|玖仟零贰拾伍|玖仟零贰拾陆|玖仟零贰拾柒|玖仟零贰拾捌|玖仟零贰拾玖|玖仟零叁拾|玖仟零叁拾壹|玖仟零叁拾贰|玖仟零叁拾叁|玖仟零叁拾肆|玖仟零叁拾伍|玖仟零叁拾陆|玖仟零叁拾柒|玖仟零叁拾捌|玖仟零叁拾玖|玖仟零肆拾|玖仟零肆拾壹|玖仟零肆拾贰|玖仟零肆拾叁|玖仟零肆拾肆|玖仟零肆拾伍|玖仟零肆拾陆|玖仟零肆拾柒|玖仟零肆拾捌|玖仟零肆拾玖|玖仟零伍拾|玖仟零伍拾壹|玖仟零伍拾贰|玖仟零伍拾叁|玖仟零伍拾肆|玖仟零伍拾伍|玖仟零伍拾陆|玖仟零伍拾柒|玖仟零伍拾捌|玖仟零伍拾玖|玖仟零陆拾|玖仟零陆拾壹|玖仟零陆拾贰|玖仟零陆拾叁|玖仟零陆拾肆|玖仟零陆拾伍|玖仟零陆拾陆|玖仟零陆拾柒|玖仟零陆拾捌|玖仟零陆拾玖|玖仟零柒拾|玖仟零柒拾壹|玖仟零柒拾贰|玖仟零柒拾叁|玖仟零柒拾肆|玖仟零柒拾伍|玖仟零柒拾陆|玖仟零柒拾柒|玖仟零柒拾捌|玖仟零柒拾玖|玖仟零捌拾|玖仟零捌拾壹|玖仟零捌拾贰|玖仟零捌拾叁|玖仟零捌拾肆|玖仟零捌拾伍|玖仟零捌拾陆|玖仟零捌拾柒|玖仟零捌拾捌|玖仟零捌拾玖|玖仟零玖拾|玖仟零玖拾壹|玖仟零玖拾贰|玖仟零玖拾叁|玖仟零玖拾肆|玖仟零玖拾伍|玖仟零玖拾陆|玖仟零玖拾柒|玖仟零玖拾捌|玖仟零玖拾玖|'
+    '玖仟壹佰|玖仟壹佰零壹|玖仟壹佰零贰|玖仟壹佰零叁|玖仟壹佰零肆|玖仟壹佰零伍|玖仟壹佰零陆|玖仟壹佰零柒|玖仟壹佰零捌|玖仟壹佰零玖|玖仟壹佰壹拾|玖仟壹佰壹拾壹|玖仟壹佰壹拾贰|玖仟壹佰壹拾叁|玖仟壹佰壹拾肆|玖仟壹佰壹拾伍|玖仟壹佰壹拾陆|玖仟壹佰壹拾柒|玖仟壹佰壹拾捌|玖仟壹佰壹拾玖|玖仟壹佰贰拾|玖仟壹佰贰拾壹|玖仟壹佰贰拾贰|玖仟壹佰贰拾叁|玖仟壹佰贰拾肆|玖仟壹佰贰拾伍|玖仟壹佰贰拾陆|玖仟壹佰贰拾柒|玖仟壹佰贰拾捌|玖仟壹佰贰拾玖|玖仟壹佰叁拾|玖仟壹佰叁拾壹|玖仟壹佰叁拾贰|玖仟壹佰叁拾叁|玖仟壹佰叁拾肆|玖仟壹佰叁拾伍|玖仟壹佰叁拾陆|玖仟壹佰叁拾柒|玖仟壹佰叁拾捌|玖仟壹佰叁拾玖|玖仟壹佰肆拾|玖仟壹佰肆拾壹|玖仟壹佰肆拾贰|玖仟壹佰肆拾叁|玖仟壹佰肆拾肆|玖仟壹佰肆拾伍|玖仟壹佰肆拾陆|玖仟壹佰肆拾柒|玖仟壹佰肆拾捌|玖仟壹佰肆拾玖|玖仟壹佰伍拾|玖仟壹佰伍拾壹|玖仟壹佰伍拾贰|玖仟壹佰伍拾叁|玖仟壹佰伍拾肆|玖仟壹佰伍拾伍|玖仟壹佰伍拾陆|玖仟壹佰伍拾柒|玖仟壹佰伍拾捌|玖仟壹佰伍拾玖|玖仟壹佰陆拾|玖仟壹佰陆拾壹|玖仟壹佰陆拾贰|玖仟壹佰陆拾叁|玖仟壹佰陆拾肆|玖仟壹佰陆拾伍|玖仟壹佰陆拾陆|玖仟壹佰陆拾柒|玖仟壹佰陆拾捌|玖仟壹佰陆拾玖|玖仟壹佰柒拾|玖仟壹佰柒拾壹|玖仟壹佰柒拾贰|玖仟壹佰柒拾叁|玖仟壹佰柒拾肆|玖仟壹佰柒拾伍|玖仟壹佰柒拾陆|玖仟壹佰柒拾柒|玖仟壹佰柒拾捌|玖仟壹佰柒拾玖|玖仟壹佰捌拾|玖仟壹佰捌拾壹|玖仟壹佰捌拾贰|玖仟壹佰捌拾叁|玖仟壹佰捌拾肆|玖仟壹佰捌拾伍|玖仟壹佰捌拾陆|玖仟壹佰捌拾柒|玖仟壹佰捌拾捌|玖仟壹佰捌拾玖|玖仟壹佰玖拾|玖仟壹佰玖拾壹|玖仟壹佰玖拾贰|玖仟壹佰玖拾叁|玖仟壹佰玖拾肆|玖仟壹佰玖拾伍|玖仟壹佰玖拾陆|玖仟壹佰玖拾柒|玖仟壹佰玖拾捌|玖仟壹佰玖拾玖|'
+    '玖仟贰佰|玖仟贰佰零壹|玖仟贰佰零贰|玖仟贰佰零叁|玖仟贰佰零肆|玖仟贰佰零伍|玖仟贰佰零陆|玖仟贰佰零柒|玖仟贰佰零捌|玖仟贰佰零玖|玖仟贰佰壹拾|玖仟贰佰壹拾壹|玖仟贰佰壹拾贰|玖仟贰佰壹拾叁|玖仟贰佰壹拾肆|玖仟贰佰壹拾伍|玖仟贰佰壹拾陆|玖仟贰佰壹拾柒|玖仟贰佰壹拾捌|玖仟贰佰壹拾玖|玖仟贰佰贰拾|玖仟贰佰贰拾壹|玖仟贰佰贰拾贰|玖仟贰佰贰拾叁|玖仟贰佰贰拾肆|玖仟贰佰贰拾伍|玖仟贰佰贰拾陆|玖仟贰佰贰拾柒|玖仟贰佰贰拾捌|玖仟贰佰贰拾玖|玖仟贰佰叁拾|玖仟贰佰叁拾壹|玖仟贰佰叁拾贰|玖仟贰佰叁拾叁|玖仟贰佰叁拾肆|玖仟贰佰叁拾伍|玖仟贰佰叁拾陆|玖仟贰佰叁拾柒|玖仟贰佰叁拾捌|玖仟贰佰叁拾玖|玖仟贰佰肆拾|玖仟贰佰肆拾壹|玖仟贰佰肆拾贰|玖仟贰佰肆拾叁|玖仟贰佰肆拾肆|玖仟贰佰肆拾伍|玖仟贰佰肆拾陆|玖仟贰佰肆拾柒|玖仟贰佰肆拾捌|玖仟贰佰肆拾玖|玖仟贰佰伍拾|玖仟贰佰伍拾壹|玖仟贰佰伍拾贰|玖仟贰佰伍拾叁|玖仟贰佰伍拾肆|玖仟贰佰伍拾伍|玖仟贰佰伍拾陆|玖仟贰佰伍拾柒|玖仟贰佰伍拾捌|玖仟贰佰伍拾玖|玖仟贰佰陆拾|玖仟贰佰陆拾壹|玖仟贰佰陆拾贰|玖仟贰佰陆拾叁|玖仟贰佰陆拾肆|玖仟贰佰陆拾伍|玖仟贰佰陆拾陆|玖仟贰佰陆拾柒|玖仟贰佰陆拾捌|玖仟贰佰陆拾玖|玖仟贰佰柒拾|玖仟贰佰柒拾壹|玖仟贰佰柒拾贰|玖仟贰佰柒拾叁|玖仟贰佰柒拾肆|玖仟贰佰柒拾伍|玖仟贰佰柒拾陆|玖仟贰佰柒拾柒|玖仟贰佰柒拾捌|玖仟贰佰柒拾玖|玖仟贰佰捌拾|玖仟贰佰捌拾壹|玖仟贰佰捌拾贰|玖仟贰佰捌拾叁|玖仟贰佰捌拾肆|玖仟贰佰捌拾伍|玖仟贰佰捌拾陆|玖仟贰佰捌拾柒|玖仟贰佰捌拾捌|玖仟贰佰捌拾玖|玖仟贰佰玖拾|玖仟贰佰玖拾壹|玖仟贰佰玖拾贰|玖仟贰佰玖拾叁|玖仟贰佰玖拾肆|玖仟贰佰玖拾伍|玖仟贰佰玖拾陆|玖仟贰佰玖拾柒|玖仟贰佰玖拾捌|玖仟贰佰玖拾玖|'
+    '玖仟叁佰|玖仟叁佰零壹|玖仟叁佰零贰|玖仟叁佰零叁|玖仟叁佰零肆|玖仟叁佰零伍|玖仟叁佰零陆|玖仟叁佰零柒|玖仟叁佰零捌|玖仟叁佰零玖|玖仟叁佰壹拾|玖仟叁佰壹拾壹|玖仟叁佰壹拾贰|玖仟叁佰壹拾叁|玖仟叁佰壹拾肆|玖仟叁佰壹拾伍|玖仟叁佰壹拾陆|玖仟叁佰壹拾柒|玖仟叁佰壹拾捌|玖仟叁佰壹拾玖|玖仟叁佰贰拾|玖仟叁佰贰拾壹|玖仟叁佰贰拾贰|玖仟叁佰贰拾叁|玖仟叁佰贰拾肆|玖仟叁佰贰拾伍|玖仟叁佰贰拾陆|玖仟叁佰贰拾柒|玖仟叁佰贰拾捌|玖仟叁佰贰拾玖|玖仟叁佰叁拾|玖仟叁佰叁拾壹|玖仟叁佰叁拾贰|玖仟叁佰叁拾叁|玖仟叁佰叁拾肆|玖仟叁佰叁拾伍|玖仟叁佰叁拾陆|玖仟叁佰叁拾柒|玖仟叁佰叁拾捌|玖仟叁佰叁拾玖|玖仟叁佰肆拾|玖仟叁佰肆拾壹|玖仟叁佰肆拾贰|玖仟叁佰肆拾叁|玖仟叁佰肆拾肆|玖仟叁佰肆拾伍|玖仟叁佰肆拾陆|玖仟叁佰肆拾柒|玖仟叁佰肆拾捌|玖仟叁佰肆拾玖|玖仟叁佰伍拾|玖仟叁佰伍拾壹|玖仟叁佰伍拾贰|玖仟叁佰伍拾叁|玖仟叁佰伍拾肆|玖仟叁佰伍拾伍|玖仟叁佰伍拾陆|玖仟叁佰伍拾柒|玖仟叁佰伍拾捌|玖仟叁佰伍拾玖|玖仟叁佰陆拾|玖仟叁佰陆拾壹|玖仟叁佰陆拾贰|玖仟叁佰陆拾叁|玖仟叁佰陆拾肆|玖仟叁佰陆拾伍|玖仟叁佰陆拾陆|玖仟叁佰陆拾柒|玖仟叁佰陆拾捌|玖仟叁佰陆拾玖|玖仟叁佰柒拾|玖仟叁佰柒拾壹|玖仟叁佰柒拾贰|玖仟叁佰柒拾叁|玖仟叁佰柒拾肆|玖仟叁佰柒拾伍|玖仟叁佰柒拾陆|玖仟叁佰柒拾柒|玖仟叁佰柒拾捌|玖仟叁佰柒拾玖|玖仟叁佰捌拾|玖仟叁佰捌拾壹|玖仟叁佰捌拾贰|玖仟叁佰捌拾叁|玖仟叁佰捌拾肆|玖仟叁佰捌拾伍|玖仟叁佰捌拾陆|玖仟叁佰捌拾柒|玖仟叁佰捌拾捌|玖仟叁佰捌拾玖|玖仟叁佰玖拾|玖仟叁佰玖拾壹|玖仟叁佰玖拾贰|玖仟叁佰玖拾叁|玖仟叁佰玖拾肆|玖仟叁佰玖拾伍|玖仟叁佰玖拾陆|玖仟叁佰玖拾柒|玖仟叁佰玖拾捌|玖仟叁佰玖拾玖|'
+    '玖仟肆佰|玖仟肆佰零壹|玖仟肆佰零贰|玖仟肆佰零叁|玖仟肆佰零肆|玖仟肆佰零伍|玖仟肆佰零陆|玖仟肆佰零柒|玖仟肆佰零捌|玖仟肆佰零玖|玖仟肆佰壹拾|玖仟肆佰壹拾壹|玖仟肆佰壹拾贰|玖仟肆佰壹拾叁|玖仟肆佰壹拾肆|玖仟肆佰壹拾伍|玖仟肆佰壹拾陆|玖仟肆佰壹拾柒|玖仟肆佰壹拾捌|玖仟肆佰壹拾玖|玖仟肆佰贰拾|玖仟肆佰贰拾壹|玖仟肆佰贰拾贰|玖仟肆佰贰拾叁|玖仟肆佰贰拾肆|玖仟肆佰贰拾伍|玖仟肆佰贰拾陆|玖仟肆佰贰拾柒|玖仟肆佰贰拾捌|玖仟肆佰贰拾玖|玖仟肆佰叁拾|玖仟肆佰叁拾壹|玖仟肆佰叁拾贰|玖仟肆佰叁拾叁|玖仟肆佰叁拾肆|玖仟肆佰叁拾伍|玖仟肆佰叁拾陆|玖仟肆佰叁拾柒|玖仟肆佰叁拾捌|玖仟肆佰叁拾玖|玖仟肆佰肆拾|玖仟肆佰肆拾壹|玖仟肆佰肆拾贰|玖仟肆佰肆拾叁|玖仟肆佰肆拾肆|玖仟肆佰肆拾伍|玖仟肆佰肆拾陆|玖仟肆佰肆拾柒|玖仟肆佰肆拾捌|玖仟肆佰肆拾玖|玖仟肆佰伍拾|玖仟肆佰伍拾壹|玖仟肆佰伍拾贰|玖仟肆佰伍拾叁|玖仟肆佰伍拾肆|玖仟肆佰伍拾伍|玖仟肆佰伍拾陆|玖仟肆佰伍拾柒|玖仟肆佰伍拾捌|玖仟肆佰伍拾玖|玖仟肆佰陆拾|玖仟肆佰陆拾壹|玖仟肆佰陆拾贰|玖仟肆佰陆拾叁|玖仟肆佰陆拾肆|玖仟肆佰陆拾伍|玖仟肆佰陆拾陆|玖仟肆佰陆拾柒|玖仟肆佰陆拾捌|玖仟肆佰陆拾玖|玖仟肆佰柒拾|玖仟肆佰柒拾壹|玖仟肆佰柒拾贰|玖仟肆佰柒拾叁|玖仟肆佰柒拾肆|玖仟肆佰柒拾伍|玖仟肆佰柒拾陆|玖仟肆佰柒拾柒|玖仟肆佰柒拾捌|玖仟肆佰柒拾玖|玖仟肆佰捌拾|玖仟肆佰捌拾壹|玖仟肆佰捌拾贰|玖仟肆佰捌拾叁|玖仟肆佰捌拾肆|玖仟肆佰捌拾伍|玖仟肆佰捌拾陆|玖仟肆佰捌拾柒|玖仟肆佰捌拾捌|玖仟肆佰捌拾玖|玖仟肆佰玖拾|玖仟肆佰玖拾壹|玖仟肆佰玖拾贰|玖仟肆佰玖拾叁|玖仟肆佰玖拾肆|玖仟肆佰玖拾伍|玖仟肆佰玖拾陆|玖仟肆佰玖拾柒|玖仟肆佰玖拾捌|玖仟肆佰玖拾玖|'
+    '玖仟伍佰|玖仟伍佰零壹|玖仟伍佰零贰|玖仟伍佰零叁|玖仟伍佰零肆|玖仟伍佰零伍|玖仟伍佰零陆|玖仟伍佰零柒|玖仟伍佰零捌|玖仟伍佰零玖|玖仟伍佰壹拾|玖仟伍佰壹拾壹|玖仟伍佰壹拾贰|玖仟伍佰壹拾叁|玖仟伍佰壹拾肆|玖仟伍佰壹拾伍|玖仟伍佰壹拾陆|玖仟伍佰壹拾柒|玖仟伍佰壹拾捌|玖仟伍佰壹拾玖|玖仟伍佰贰拾|玖仟伍佰贰拾壹|玖仟伍佰贰拾贰|玖仟伍佰贰拾叁|玖仟伍佰贰拾肆|玖仟伍佰贰拾伍|玖仟伍佰贰拾陆|玖仟伍佰贰拾柒|玖仟伍佰贰拾捌|玖仟伍佰贰拾玖|玖仟伍佰叁拾|玖仟伍佰叁拾壹|玖仟伍佰叁拾贰|玖仟伍佰叁拾叁|玖仟伍佰叁拾肆|玖仟伍佰叁拾伍|玖仟伍佰叁拾陆|玖仟伍佰叁拾柒|玖仟伍佰叁拾捌|玖仟伍佰叁拾玖|玖仟伍佰肆拾|玖仟伍佰肆拾壹|玖仟伍佰肆拾贰|玖仟伍佰肆拾叁|玖仟伍佰肆拾肆|玖仟伍佰肆拾伍|玖仟伍佰肆拾陆|玖仟伍佰肆拾柒|玖仟伍佰肆拾捌|玖仟伍佰肆拾玖|玖仟伍佰伍拾|玖仟伍佰伍拾壹|玖仟伍佰伍拾贰|玖仟伍佰伍拾叁|玖仟伍佰伍拾肆|玖仟伍佰伍拾伍|玖仟伍佰伍拾陆|玖仟伍佰伍拾柒|玖仟伍佰伍拾捌|玖仟伍佰伍拾玖|玖仟伍佰陆拾|玖仟伍佰陆拾壹|玖仟伍佰陆拾贰|玖仟伍佰陆拾叁|玖仟伍佰陆拾肆|玖仟伍佰陆拾伍|玖仟伍佰陆拾陆|玖仟伍佰陆拾柒|玖仟伍佰陆拾捌|玖仟伍佰陆拾玖|玖仟伍佰柒拾|玖仟伍佰柒拾壹|玖仟伍佰柒拾贰|玖仟伍佰柒拾叁|玖仟伍佰柒拾肆|玖仟伍佰柒拾伍|玖仟伍佰柒拾陆|玖仟伍佰柒拾柒|玖仟伍佰柒拾捌|玖仟伍佰柒拾玖|玖仟伍佰捌拾|玖仟伍佰捌拾壹|玖仟伍佰捌拾贰|玖仟伍佰捌拾叁|玖仟伍佰捌拾肆|玖仟伍佰捌拾伍|玖仟伍佰捌拾陆|玖仟伍佰捌拾柒|玖仟伍佰捌拾捌|玖仟伍佰捌拾玖|玖仟伍佰玖拾|玖仟伍佰玖拾壹|玖仟伍佰玖拾贰|玖仟伍佰玖拾叁|玖仟伍佰玖拾肆|玖仟伍佰玖拾伍|玖仟伍佰玖拾陆|玖仟伍佰玖拾柒|玖仟伍佰玖拾捌|玖仟伍佰玖拾玖|'
+    '玖仟陆佰|玖仟陆佰零壹|玖仟陆佰零贰|玖仟陆佰零叁|玖仟陆佰零肆|玖仟陆佰零伍|玖仟陆佰零陆|玖仟陆佰零柒|玖仟陆佰零捌|玖仟陆佰零玖|玖仟陆佰壹拾|玖仟陆佰壹拾壹|玖仟陆佰壹拾贰|玖仟陆佰壹拾叁|玖仟陆佰壹拾肆|玖仟陆佰壹拾伍|玖仟陆佰壹拾陆|玖仟陆佰壹拾柒|玖仟陆佰壹拾捌|玖仟陆佰壹拾玖|玖仟陆佰贰拾|玖仟陆佰贰拾壹|玖仟陆佰贰拾贰|玖仟陆佰贰拾叁|玖仟陆佰贰拾肆|玖仟陆佰贰拾伍|玖仟陆佰贰拾陆|玖仟陆佰贰拾柒|玖仟陆佰贰拾捌|玖仟陆佰贰拾玖|玖仟陆佰叁拾|玖仟陆佰叁拾壹|玖仟陆佰叁拾贰|玖仟陆佰叁拾叁|玖仟陆佰叁拾肆|玖仟陆佰叁拾伍|玖仟陆佰叁拾陆|玖仟陆佰叁拾柒|玖仟陆佰叁拾捌|玖仟陆佰叁拾玖|玖仟陆佰肆拾|玖仟陆佰肆拾壹|玖仟陆佰肆拾贰|玖仟陆佰肆拾叁|玖仟陆佰肆拾肆|玖仟陆佰肆拾伍|玖仟陆佰肆拾陆|玖仟陆佰肆拾柒|玖仟陆佰肆拾捌|玖仟陆佰肆拾玖|玖仟陆佰伍拾|玖仟陆佰伍拾壹|玖仟陆佰伍拾贰|玖仟陆佰伍拾叁|玖仟陆佰伍拾肆|玖仟陆佰伍拾伍|玖仟陆佰伍拾陆|玖仟陆佰伍拾柒|玖仟陆佰伍拾捌|玖仟陆佰伍拾玖|玖仟陆佰陆拾|玖仟陆佰陆拾壹|玖仟陆佰陆拾贰|玖仟陆佰陆拾叁|玖仟陆佰陆拾肆|玖仟陆佰陆拾伍|玖仟陆佰陆拾陆|玖仟陆佰陆拾柒|玖仟陆佰陆拾捌|玖仟陆佰陆拾玖|玖仟陆佰柒拾|玖仟陆佰柒拾壹|玖仟陆佰柒拾贰|玖仟陆佰柒拾叁|玖仟陆佰柒拾肆|玖仟陆佰柒拾伍|玖仟陆佰柒拾陆|玖仟陆佰柒拾柒|玖仟陆佰柒拾捌|玖仟陆佰柒拾玖|玖仟陆佰捌拾|玖仟陆佰捌拾壹|玖仟陆佰捌拾贰|玖仟陆佰捌拾叁|玖仟陆佰捌拾肆|玖仟陆佰捌拾伍|玖仟陆佰捌拾陆|玖仟陆佰捌拾柒|玖仟陆佰捌拾捌|玖仟陆佰捌拾玖|玖仟陆佰玖拾|玖仟陆佰玖拾壹|玖仟陆佰玖拾贰|玖仟陆佰玖拾叁|玖仟陆佰玖拾肆|玖仟陆佰玖拾伍|玖仟陆佰玖拾陆|玖仟陆佰玖拾柒|玖仟陆佰玖拾捌|玖仟陆佰玖拾玖|'
+    '玖仟柒佰|玖仟柒佰零壹|玖仟柒佰零贰|玖仟柒佰零叁|玖仟柒佰零肆|玖仟柒佰零伍|玖仟柒佰零陆|玖仟柒佰零柒|玖仟柒佰零捌|玖仟柒佰零玖|玖仟柒佰壹拾|玖仟柒佰壹拾壹|玖仟柒佰壹拾贰|玖仟柒佰壹拾叁|玖仟柒佰壹拾肆|玖仟柒佰壹拾伍|玖仟柒佰壹拾陆|玖仟柒佰壹拾柒|玖仟柒佰壹拾捌|玖仟柒佰壹拾玖|玖仟柒佰贰拾|玖仟柒佰贰拾壹|玖仟柒佰贰拾贰|玖仟柒佰贰拾叁|玖仟柒佰贰拾肆|玖仟柒佰贰拾伍|玖仟柒佰贰拾陆|玖仟柒佰贰拾柒|玖仟柒佰贰拾捌|玖仟柒佰贰拾玖|玖仟柒佰叁拾|玖仟柒佰叁拾壹|玖仟柒佰叁拾贰|玖仟柒佰叁拾叁|玖仟柒佰叁拾肆|玖仟柒佰叁拾伍|玖仟柒佰叁拾陆|玖仟柒佰叁拾柒|玖仟柒佰叁拾捌|玖仟柒佰叁拾玖|玖仟柒佰肆拾|玖仟柒佰肆拾壹|玖仟柒佰肆拾贰|玖仟柒佰肆拾叁|玖仟柒佰肆拾肆|玖仟柒佰肆拾伍|玖仟柒佰肆拾陆|玖仟柒佰肆拾柒|玖仟柒佰肆拾捌|玖仟柒佰肆拾玖|玖仟柒佰伍拾|玖仟柒佰伍拾壹|玖仟柒佰伍拾贰|玖仟柒佰伍拾叁|玖仟柒佰伍拾肆|玖仟柒佰伍拾伍|玖仟柒佰伍拾陆|玖仟柒佰伍拾柒|玖仟柒佰伍拾捌|玖仟柒佰伍拾玖|玖仟柒佰陆拾|玖仟柒佰陆拾壹|玖仟柒佰陆拾贰|玖仟柒佰陆拾叁|玖仟柒佰陆拾肆|玖仟柒佰陆拾伍|玖仟柒佰陆拾陆|玖仟柒佰陆拾柒|玖仟柒佰陆拾捌|玖仟柒佰陆拾玖|玖仟柒佰柒拾|玖仟柒佰柒拾壹|玖仟柒佰柒拾贰|玖仟柒佰柒拾叁|玖仟柒佰柒拾肆|玖仟柒佰柒拾伍|玖仟柒佰柒拾陆|玖仟柒佰柒拾柒|玖仟柒佰柒拾捌|玖仟柒佰柒拾玖|玖仟柒佰捌拾|玖仟柒佰捌拾壹|玖仟柒佰捌拾贰|玖仟柒佰捌拾叁|玖仟柒佰捌拾肆|玖仟柒佰捌拾伍|玖仟柒佰捌拾陆|玖仟柒佰捌拾柒|玖仟柒佰捌拾捌|玖仟柒佰捌拾玖|玖仟柒佰玖拾|玖仟柒佰玖拾壹|玖仟柒佰玖拾贰|玖仟柒佰玖拾叁|玖仟柒佰玖拾肆|玖仟柒佰玖拾伍|玖仟柒佰玖拾陆|玖仟柒佰玖拾柒|玖仟柒佰玖拾捌|玖仟柒佰玖拾玖|'
+    '玖仟捌佰|玖仟捌佰零壹|玖仟捌佰零贰|玖仟捌佰零叁|玖仟捌佰零肆|玖仟捌佰零伍|玖仟捌佰零陆|玖仟捌佰零柒|玖仟捌佰零捌|玖仟捌佰零玖|玖仟捌佰壹拾|玖仟捌佰壹拾壹|玖仟捌佰壹拾贰|玖仟捌佰壹拾叁|玖仟捌佰壹拾肆|玖仟捌佰壹拾伍|玖仟捌佰壹拾陆|玖仟捌佰壹拾柒|玖仟捌佰壹拾捌|玖仟捌佰壹拾玖|玖仟捌佰贰拾|玖仟捌佰贰拾壹|玖仟捌佰贰拾贰|玖仟捌佰贰拾叁|玖仟捌佰贰拾肆|玖仟捌佰贰拾伍|玖仟捌佰贰拾陆|玖仟捌佰贰拾柒|玖仟捌佰贰拾捌|玖仟捌佰贰拾玖|玖仟捌佰叁拾|玖仟捌佰叁拾壹|玖仟捌佰叁拾贰|玖仟捌佰叁拾叁|玖仟捌佰叁拾肆|玖仟捌佰叁拾伍|玖仟捌佰叁拾陆|玖仟捌佰叁拾柒|玖仟捌佰叁拾捌|玖仟捌佰叁拾玖|玖仟捌佰肆拾|玖仟捌佰肆拾壹|玖仟捌佰肆拾贰|玖仟捌佰肆拾叁|玖仟捌佰肆拾肆|玖仟捌佰肆拾伍|玖仟捌佰肆拾陆|玖仟捌佰肆拾柒|玖仟捌佰肆拾捌|玖仟捌佰肆拾玖|玖仟捌佰伍拾|玖仟捌佰伍拾壹|玖仟捌佰伍拾贰|玖仟捌佰伍拾叁|玖仟捌佰伍拾肆|玖仟捌佰伍拾伍|玖仟捌佰伍拾陆|玖仟捌佰伍拾柒|玖仟捌佰伍拾捌|玖仟捌佰伍拾玖|玖仟捌佰陆拾|玖仟捌佰陆拾壹|玖仟捌佰陆拾贰|玖仟捌佰陆拾叁|玖仟捌佰陆拾肆|玖仟捌佰陆拾伍|玖仟捌佰陆拾陆|玖仟捌佰陆拾柒|玖仟捌佰陆拾捌|玖仟捌佰陆拾玖|玖仟捌佰柒拾|玖仟捌佰柒拾壹|玖仟捌佰柒拾贰|玖仟捌佰柒拾叁|玖仟捌佰柒拾肆|玖仟捌佰柒拾伍|玖仟捌佰柒拾陆|玖仟捌佰柒拾柒|玖仟捌佰柒拾捌|玖仟捌佰柒拾玖|玖仟捌佰捌拾|玖仟捌佰捌拾壹|玖仟捌佰捌拾贰|玖仟捌佰捌拾叁|玖仟捌佰捌拾肆|玖仟捌佰捌拾伍|玖仟捌佰捌拾陆|玖仟捌佰捌拾柒|玖仟捌佰捌拾捌|玖仟捌佰捌拾玖|玖仟捌佰玖拾|玖仟捌佰玖拾壹|玖仟捌佰玖拾贰|玖仟捌佰玖拾叁|玖仟捌佰玖拾肆|玖仟捌佰玖拾伍|玖仟捌佰玖拾陆|玖仟捌佰玖拾柒|玖仟捌佰玖拾捌|玖仟捌佰玖拾玖|'
+    '玖仟玖佰|玖仟玖佰零壹|玖仟玖佰零贰|玖仟玖佰零叁|玖仟玖佰零肆|玖仟玖佰零伍|玖仟玖佰零陆|玖仟玖佰零柒|玖仟玖佰零捌|玖仟玖佰零玖|玖仟玖佰壹拾|玖仟玖佰壹拾壹|玖仟玖佰壹拾贰|玖仟玖佰壹拾叁|玖仟玖佰壹拾肆|玖仟玖佰壹拾伍|玖仟玖佰壹拾陆|玖仟玖佰壹拾柒|玖仟玖佰壹拾捌|玖仟玖佰壹拾玖|玖仟玖佰贰拾|玖仟玖佰贰拾壹|玖仟玖佰贰拾贰|玖仟玖佰贰拾叁|玖仟玖佰贰拾肆|玖仟玖佰贰拾伍|玖仟玖佰贰拾陆|玖仟玖佰贰拾柒|玖仟玖佰贰拾捌|玖仟玖佰贰拾玖|玖仟玖佰叁拾|玖仟玖佰叁拾壹|玖仟玖佰叁拾贰|玖仟玖佰叁拾叁|玖仟玖佰叁拾肆|玖仟玖佰叁拾伍|玖仟玖佰叁拾陆|玖仟玖佰叁拾柒|玖仟玖佰叁拾捌|玖仟玖佰叁拾玖|玖仟玖佰肆拾|玖仟玖佰肆拾壹|玖仟玖佰肆拾贰|玖仟玖佰肆拾叁|玖仟玖佰肆拾肆|玖仟玖佰肆拾伍|玖仟玖佰肆拾陆|玖仟玖佰肆拾柒|玖仟玖佰肆拾捌|玖仟玖佰肆拾玖|玖仟玖佰伍拾|玖仟玖佰伍拾壹|玖仟玖佰伍拾贰|玖仟玖佰伍拾叁|玖仟玖佰伍拾肆|玖仟玖佰伍拾伍|玖仟玖佰伍拾陆|玖仟玖佰伍拾柒|玖仟玖佰伍拾捌|玖仟玖佰伍拾玖|玖仟玖佰陆拾|玖仟玖佰陆拾壹|玖仟玖佰陆拾贰|玖仟玖佰陆拾叁|玖仟玖佰陆拾肆|玖仟玖佰陆拾伍|玖仟玖佰陆拾陆|玖仟玖佰陆拾柒|玖仟玖佰陆拾捌|玖仟玖佰陆拾玖|玖仟玖佰柒拾|玖仟玖佰柒拾壹|玖仟玖佰柒拾贰|玖仟玖佰柒拾叁|玖仟玖佰柒拾肆|玖仟玖佰柒拾伍|玖仟玖佰柒拾陆|玖仟玖佰柒拾柒|玖仟玖佰柒拾捌|玖仟玖佰柒拾玖|玖仟玖佰捌拾|玖仟玖佰捌拾壹|玖仟玖佰捌拾贰|玖仟玖佰捌拾叁|玖仟玖佰捌拾肆|玖仟玖佰捌拾伍|玖仟玖佰捌拾陆|玖仟玖佰捌拾柒|玖仟玖佰捌拾捌|玖仟玖佰捌拾玖|玖仟玖佰玖拾|玖仟玖佰玖拾壹|玖仟玖佰玖拾贰|玖仟玖佰玖拾叁|玖仟玖佰玖拾肆|玖仟玖佰玖拾伍|玖仟玖佰玖拾陆|玖仟玖佰玖拾柒|玖仟玖佰玖拾捌|玖仟玖佰玖拾玖'
+)
+
+# 00-99 的角分转换结果
+DECIMALS = (
+    '整|壹分|贰分|叁分|肆分|伍分|陆分|柒分|捌分|玖分|壹角|壹角壹分|壹角贰分|壹角叁分|壹角肆分|壹角伍分|壹角陆分|壹角柒分|壹角捌分|壹角玖分|贰角|贰角壹分|贰角贰分|贰角叁分|贰角肆分|贰角伍分|贰角陆分|贰角柒分|贰角捌分|贰角玖分|叁角|叁角壹分|叁角贰分|叁角叁分|叁角肆分|叁角伍分|叁角陆分|叁角柒分|叁角捌分|叁角玖分|肆角|肆角壹分|肆角贰分|肆角叁分|肆角肆分|肆角伍分|肆角陆分|肆角柒分|肆角捌分|肆角玖分|伍角|伍角壹分|伍角贰分|伍角叁分|伍角肆分|伍角伍分|伍角陆分|伍角柒分|伍角捌分|伍角玖分|陆角|陆角壹分|陆角贰分|陆角叁分|陆角肆分|陆角伍分|陆角陆分|陆角柒分|陆角捌分|陆角玖分|柒角|柒角壹分|柒角贰分|柒角叁分|柒角肆分|柒角伍分|柒角陆分|柒角柒分|柒角捌分|柒角玖分|捌角|捌角壹分|捌角贰分|捌角叁分|捌角肆分|捌角伍分|捌角陆分|捌角柒分|捌角捌分|捌角玖分|玖角|玖角壹分|玖角贰分|玖角叁分|玖角肆分|玖角伍分|玖角陆分|玖角柒分|玖角捌分|玖角玖分'
+)
@@ -0,0 +1,175 @@
+"""asyncio 异步转换接口模块。
+
+此模块为异步服务提供不阻塞事件循环的转换接口：
+1. convert_async：同一时间窗口内的并发单次请求合并为一批统一转换
+2. convert_many_async：小批量分块转换并在块之间让出事件循环，
+   超过阈值的大批量交给线程池或进程池执行
+"""
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from typing import Dict, List, MutableMapping, Optional, Sequence
+
+from .chinese_currency import convert_many, convert_to_rmb
+
+# 合并单次请求的时间窗口（秒），0 表示合并同一轮事件循环内提交的请求
+DEFAULT_WINDOW = 0.0
+
+# 单批合并的最大请求数，达到后立即转换
+DEFAULT_MAX_BATCH = 1024
+
+# 超过该数量的批量转换交给执行器
+DEFAULT_OFFLOAD_THRESHOLD = 10000
+
+# 在事件循环内转换时，每转换多少个金额让出一次事件循环
+DEFAULT_CHUNK_SIZE = 512
+
+
+class Coalescer:
+    """
+    将并发的单次转换请求合并为批量转换。
+
+    同一批内相同的金额只转换一次，结果分发给所有等待它的请求。
+    每个实例只能在创建它的事件循环中使用。
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        """
+        初始化合并器。
+
+        Args:
+            window: 合并时间窗口（秒），0 表示合并同一轮事件循环内的请求
+            max_batch: 单批最大请求数
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        # 待转换的金额到等待其结果的 Future 列表，size 为请求总数
+        self._pending: Dict[str, List['asyncio.Future[str]']] = {}
+        self._size = 0
+        self._handle: Optional[asyncio.Handle] = None
+
+    def submit(self, amount: str) -> 'asyncio.Future[str]':
+        """
+        提交一个转换请求。
+
+        Args:
+            amount: 金额字符串
+
+        Returns:
+            asyncio.Future[str]: 转换结果，无效金额时为 ValueError 或 OverflowError
+        """
+        loop = asyncio.get_running_loop()
+        future: 'asyncio.Future[str]' = loop.create_future()
+        waiters = self._pending.get(amount)
+        if waiters is None:
+            self._pending[amount] = [future]
+        else:
+            waiters.append(future)
+        self._size += 1
+        if self._size >= self.max_batch:
+            self.flush()
+        elif self._handle is None:
+            if self.window > 0:
+                self._handle = loop.call_later(self.window, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        """立即转换所有待处理请求，每个不同的金额只转换一次。"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        self._size = 0
+        if not pending:
+            return
+        self.batches += 1
+        convert = convert_to_rmb
+        for amount, futures in pending.items():
+            waiting = [future for future in futures if not future.cancelled()]
+            if not waiting:
+                continue
+            try:
+                result = convert(amount)
+            except Exception as e:
+                # 任何异常都交给等待的请求，不能让它影响同批其他金额
+                for future in waiting:
+                    future.set_exception(e)
+                continue
+            for future in waiting:
+                future.set_result(result)
+
+
+# 每个事件循环各自的默认合并器
+_COALESCERS: MutableMapping[asyncio.AbstractEventLoop, Coalescer] = weakref.WeakKeyDictionary()
+
+
+def get_coalescer() -> Coalescer:
+    """
+    返回当前事件循环的默认合并器，不存在时创建。
+
+    Returns:
+        Coalescer: 默认合并器
+    """
+    loop = asyncio.get_running_loop()
+    coalescer = _COALESCERS.get(loop)
+    if coalescer is None:
+        coalescer = _COALESCERS[loop] = Coalescer()
+    return coalescer
+
+
+async def convert_async(amount: str) -> str:
+    """
+    异步转换单个金额，并发请求会被合并为一批转换。
+
+    Args:
+        amount: 数字金额字符串
+
+    Returns:
+        str: 人民币大写金额
+
+    Raises:
+        ValueError: 当输入格式无效时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    return await get_coalescer().submit(amount)
+
+
+async def convert_many_async(
+    amounts: Sequence[str],
+    executor: Optional[Executor] = None,
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[str]:
+    """
+    异步批量转换金额，按输入顺序返回结果。
+
+    数量不超过 offload_threshold 时在事件循环内分块转换，每块之后让出事件循环；
+    超过时交给执行器转换，事件循环保持响应。
+
+    Args:
+        amounts: 数字金额字符串序列
+        executor: 大批量转换使用的执行器，默认使用事件循环的默认线程池；
+                  传入进程池可避免与事件循环争用 GIL
+        offload_threshold: 交给执行器的数量阈值
+        chunk_size: 在事件循环内转换时每块的数量
+
+    Returns:
+        List[str]: 人民币大写金额列表
+
+    Raises:
+        ValueError: 当某个输入格式无效时抛出
+        OverflowError: 当某个数字超出范围时抛出
+    """
+    if len(amounts) > offload_threshold:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, convert_many, list(amounts))
+
+    results: List[str] = []
+    for start in range(0, len(amounts), chunk_size):
+        results.extend(convert_many(amounts[start:start + chunk_size]))
+        if start + chunk_size < len(amounts):
+            await asyncio.sleep(0)
+    return results
@@ -0,0 +1,220 @@
+"""Apache Arrow / Parquet 列转换模块。
+
+金额列中同一数值往往大量重复，Parquet 也常以字典编码存储。此模块按字典转换：
+1. 非字典列先在 Arrow 内部做字典编码，只把不同的取值交给 convert_to_rmb
+2. 每个取值只转换一次，结果以字典编码的字符串列返回，下标直接复用
+3. 无效金额在结果列中为空值，错误信息放在单独的错误列中
+4. convert_parquet 逐个行组读取和写出，内存占用与文件大小无关
+
+需要安装可选依赖：pip install rmb-converter[arrow]
+"""
+from typing import Optional, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover - 取决于运行环境
+    raise ImportError("Arrow 转换需要 pyarrow，请执行 pip install rmb-converter[arrow]") from e
+
+from .batch import Memo, convert_values
+from .input_processor import ROUND_TRUNCATE
+
+# 默认的结果列和错误列名
+DEFAULT_OUTPUT_COLUMN = 'rmb'
+DEFAULT_ERROR_COLUMN = 'rmb_error'
+
+# 结果列和错误列的类型
+RESULT_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+ArrowColumn = Union[pa.Array, pa.ChunkedArray]
+
+
+def _check_type(data_type: pa.DataType) -> None:
+    """
+    检查列类型是否为可转换的金额类型。
+
+    Args:
+        data_type: 列类型（字典列为其取值类型）
+
+    Raises:
+        ValueError: 当类型不受支持时抛出
+    """
+    if not (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+            or pa.types.is_decimal(data_type)):
+        raise ValueError(f"不支持的金额列类型: {data_type}")
+
+
+def _convert_values(values: pa.Array, rounding: str, memo: Memo) -> Tuple[pa.Array, pa.Array]:
+    """
+    逐个转换字典中的取值。
+
+    Args:
+        values: 字典取值
+        rounding: 舍入方式
+        memo: 已转换的取值，会被更新
+
+    Returns:
+        Tuple[pa.Array, pa.Array]: 与取值一一对应的结果和错误信息，转换失败时结果为空值
+    """
+    results, errors = convert_values(values.to_pylist(), rounding, memo)
+    return pa.array(results, type=pa.string()), pa.array(errors, type=pa.string())
+
+
+def _convert_chunk(chunk: pa.Array, rounding: str, memo: Memo) -> Tuple[pa.Array, pa.Array]:
+    """
+    转换一个数组块。
+
+    Args:
+        chunk: 金额数组，可以是字典数组
+        rounding: 舍入方式
+        memo: 已转换的取值
+
+    Returns:
+        Tuple[pa.Array, pa.Array]: 字典编码的结果数组和错误数组
+    """
+    if not pa.types.is_dictionary(chunk.type):
+        chunk = pc.dictionary_encode(chunk)
+    indices = chunk.indices.cast(pa.int32())
+    results, errors = _convert_values(chunk.dictionary, rounding, memo)
+
+    # Parquet 不支持取值中含空值的字典，空值由下标表示，字典中的空位填空字符串
+    no_index = pa.nulls(len(indices), pa.int32())
+    if errors.null_count == len(errors):
+        error_array = pa.DictionaryArray.from_arrays(no_index, pa.array([], pa.string()))
+    else:
+        has_error = pc.take(pc.is_valid(errors), indices)
+        error_array = pa.DictionaryArray.from_arrays(
+            pc.if_else(has_error, indices, no_index), errors.fill_null(''))
+
+    if results.null_count:
+        # 无效取值（以及字典中的空值）所在的行结果为空值
+        has_result = pc.take(pc.is_valid(results), indices)
+        indices = pc.if_else(has_result, indices, no_index)
+        results = results.fill_null('')
+    return pa.DictionaryArray.from_arrays(indices, results), error_array
+
+
+def convert_array(
+    amounts: ArrowColumn, rounding: str = ROUND_TRUNCATE, memo: Optional[Memo] = None
+) -> Tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    """
+    转换 Arrow 金额列，每个不同的取值只转换一次。
+
+    Args:
+        amounts: 金额列（Array 或 ChunkedArray），类型可以是字符串、整数、浮点数、
+                 decimal，或以它们为取值的字典类型
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+        memo: 跨多次调用复用的转换结果，默认只在本次调用内复用
+
+    Returns:
+        Tuple[pa.ChunkedArray, pa.ChunkedArray]: 字典编码的结果列和错误列，与输入等长；
+            空值和无效金额的结果为空值，无效金额的错误列为错误信息，其余为空值
+
+    Raises:
+        ValueError: 当列类型不受支持时抛出
+    """
+    if isinstance(amounts, pa.Array):
+        amounts = pa.chunked_array([amounts])
+    value_type = amounts.type
+    if pa.types.is_dictionary(value_type):
+        value_type = value_type.value_type
+    _check_type(value_type)
+
+    if memo is None:
+        memo = {}
+    results = []
+    errors = []
+    for chunk in amounts.chunks:
+        result, error = _convert_chunk(chunk, rounding, memo)
+        results.append(result)
+        errors.append(error)
+    return (pa.chunked_array(results, type=RESULT_TYPE),
+            pa.chunked_array(errors, type=RESULT_TYPE))
+
+
+def convert_table(
+    table: pa.Table,
+    column: str,
+    output_column: str = DEFAULT_OUTPUT_COLUMN,
+    error_column: str = DEFAULT_ERROR_COLUMN,
+    rounding: str = ROUND_TRUNCATE,
+    memo: Optional[Memo] = None,
+) -> pa.Table:
+    """
+    转换表中的金额列，在表末尾追加结果列和错误列。
+
+    Args:
+        table: Arrow 表
+        column: 金额列名
+        output_column: 结果列名
+        error_column: 错误列名
+        rounding: 舍入方式
+        memo: 跨多次调用复用的转换结果
+
+    Returns:
+        pa.Table: 追加了两列的新表
+
+    Raises:
+        ValueError: 当金额列不存在或类型不受支持时抛出
+    """
+    if column not in table.column_names:
+        raise ValueError(f"表中找不到列: {column}")
+    results, errors = convert_array(table.column(column), rounding, memo)
+    return table.append_column(output_column, results).append_column(error_column, errors)
+
+
+def convert_parquet(
+    input_path: str,
+    output_path: str,
+    column: str,
+    output_column: str = DEFAULT_OUTPUT_COLUMN,
+    error_column: str = DEFAULT_ERROR_COLUMN,
+    rounding: str = ROUND_TRUNCATE,
+) -> Tuple[int, int]:
+    """
+    逐个行组转换 Parquet 文件，写出追加了结果列和错误列的 Parquet 文件。
+
+    金额列按字典读取和写出，Parquet 中已字典编码的列无需展开为字符串。
+
+    Args:
+        input_path: 输入文件路径
+        output_path: 输出文件路径
+        column: 金额列名
+        output_column: 结果列名
+        error_column: 错误列名
+        rounding: 舍入方式
+
+    Returns:
+        Tuple[int, int]: 行数和无效金额的行数
+
+    Raises:
+        ValueError: 当金额列不存在或类型不受支持时抛出
+    """
+    if column not in pq.read_schema(input_path).names:
+        raise ValueError(f"表中找不到列: {column}")
+    source = pq.ParquetFile(input_path, read_dictionary=[column])
+
+    memo: Memo = {}
+    rows = 0
+    failed = 0
+    writer = None
+    try:
+        for index in range(source.num_row_groups):
+            table = convert_table(source.read_row_group(index), column, output_column,
+                                  error_column, rounding, memo)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+            failed += table.num_rows - table.column(error_column).null_count
+        if writer is None:
+            # 没有行组时也写出带结果列的空文件
+            empty = convert_table(source.schema_arrow.empty_table(), column, output_column,
+                                  error_column, rounding, memo)
+            writer = pq.ParquetWriter(output_path, empty.schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows, failed
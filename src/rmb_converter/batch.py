@@ -0,0 +1,286 @@
+"""批量转换引擎。
+
+数据框和列式数据中同一金额往往大量重复。各前端（arrow、pandas_ext、polars_ext）
+先用各自的原生哈希去重，只把不同的取值交给此模块转换，再按下标展开：
+1. 每个取值只转换一次，可跨多批复用已转换的结果
+2. 空值得到空值，不视为错误
+3. 无效金额不抛出异常，结果为 None，错误信息单独返回
+
+对于含少量无效行的金额字符串批次，validate_batch 和 convert_batch 以错误码代替异常，
+逐行不构造异常和回溯，返回紧凑的错误码数组和出错行下标。
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .chinese_currency import convert_to_rmb, format_rmb
+from .input_processor import (
+    ERROR_INVALID,
+    ERROR_NONE,
+    ERROR_OVERFLOW,
+    MAX_INTEGER_LENGTH,
+    ROUND_TRUNCATE,
+    ROUNDING_MODES,
+    _round_cents,
+    error_for,
+    scan_digits,
+)
+
+# 可复用的转换结果条目上限，超过后清空，避免取值极多时内存持续增长
+MEMO_LIMIT = 1 << 20
+
+Memo = Dict[Any, Tuple[Optional[str], Optional[str]]]
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    判断取值是否为空值：None、NaN（含 Decimal 的 sNaN），以及 pandas.NA 这类比较结果
+    不能转为 bool 的缺失值。
+
+    Args:
+        value: 金额取值
+
+    Returns:
+        bool: 空值时为 True
+    """
+    if value is None:
+        return True
+    if isinstance(value, Decimal):
+        # Decimal('sNaN') 参与比较会抛出 InvalidOperation，需直接判断
+        return value.is_nan()
+    try:
+        return bool(value != value)  # NaN 与自身不相等
+    except TypeError:
+        # pandas.NA 与任何值比较都得到 NA，对其取 bool 会抛出 TypeError
+        return True
+
+
+def convert_value(
+    value: Any, rounding: str = ROUND_TRUNCATE
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    转换单个取值，不抛出异常。
+
+    Args:
+        value: 金额，可以是字符串、Decimal、整数或浮点数（含 NumPy 标量）；
+               None、NaN 和 pandas.NA 视为空值
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: 结果和错误信息，二者至多一个不为 None
+    """
+    if _is_missing(value):
+        return None, None
+    # 字符串和 Decimal 直接转换；数值按其十进制文本转换
+    amount = value if isinstance(value, (str, Decimal)) else str(value)
+    try:
+        return convert_to_rmb(amount, rounding), None
+    except (ValueError, OverflowError) as e:
+        return None, str(e)
+
+
+def convert_values(
+    values: Iterable[Any], rounding: str = ROUND_TRUNCATE, memo: Optional[Memo] = None
+) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """
+    转换一组取值，不抛出异常。
+
+    Args:
+        values: 金额取值
+        rounding: 小数超过两位时的舍入方式
+        memo: 跨多批复用的转换结果，会被更新；默认不记录，取值应已去重
+
+    Returns:
+        Tuple[List[Optional[str]], List[Optional[str]]]: 与取值一一对应的结果和错误信息；
+            空值的结果和错误均为 None，无效金额的结果为 None
+    """
+    if memo is None:
+        # 调用方已去重，无需再记录
+        pairs = [convert_value(value, rounding) for value in values]
+        return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+    if len(memo) > MEMO_LIMIT:
+        memo.clear()
+    results: List[Optional[str]] = []
+    errors: List[Optional[str]] = []
+    for value in values:
+        try:
+            entry = memo.get(value)
+        except TypeError:
+            # 不可哈希的取值（如 Decimal('sNaN')、列表）逐行转换，不记录
+            entry = convert_value(value, rounding)
+        else:
+            if entry is None:
+                entry = memo[value] = convert_value(value, rounding)
+        results.append(entry[0])
+        errors.append(entry[1])
+    return results, errors
+
+
+class BatchResult:
+    """
+    convert_batch / validate_batch 的结果。
+
+    Attributes:
+        results: 与输入一一对应的转换结果，出错行为 None；只校验时为空列表
+        codes: 与输入一一对应的错误码（见 input_processor.ERROR_CODES），每行一个字节
+        error_rows: 出错行的下标，升序
+    """
+
+    __slots__ = ('results', 'codes', 'error_rows')
+
+    def __init__(
+        self, results: List[Optional[str]], codes: bytearray, error_rows: List[int]
+    ) -> None:
+        """
+        Args:
+            results: 转换结果
+            codes: 错误码
+            error_rows: 出错行的下标
+        """
+        self.results = results
+        self.codes = codes
+        self.error_rows = error_rows
+
+    def __len__(self) -> int:
+        """返回行数。"""
+        return len(self.codes)
+
+    def message(self, row: int) -> Optional[str]:
+        """
+        返回指定行的错误信息，与逐行转换抛出的异常消息一致。
+
+        Args:
+            row: 行下标
+
+        Returns:
+            Optional[str]: 错误信息，该行无错误时为 None
+        """
+        code = self.codes[row]
+        return str(error_for(code, MAX_INTEGER_LENGTH)) if code else None
+
+
+def _check_rounding(rounding: str) -> None:
+    """
+    在批次开始前检查舍入方式，避免逐行重复检查和报错。
+
+    Args:
+        rounding: 舍入方式
+
+    Raises:
+        ValueError: 当舍入方式不受支持时抛出
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"不支持的舍入方式: {rounding}")
+
+
+def _scan(amount: Any, rounding: str) -> Tuple[int, str, str]:
+    """
+    拆分并舍入一个金额，以错误码表示无效输入。
+
+    Args:
+        amount: 金额字符串，其他类型视为无效
+        rounding: 已检查过的舍入方式
+
+    Returns:
+        Tuple[int, str, str]: 错误码、整数部分和两位小数部分
+    """
+    if not isinstance(amount, str):
+        return ERROR_INVALID, '', ''
+    code, integer, fraction = scan_digits(amount)
+    if code:
+        return code, '', ''
+    if len(integer) == MAX_INTEGER_LENGTH and rounding != ROUND_TRUNCATE:
+        # 只有12位的全9整数在分位进位后才会溢出，极少出现
+        try:
+            return (ERROR_NONE, *_round_cents(integer, fraction, rounding))
+        except OverflowError:
+            return ERROR_OVERFLOW, '', ''
+    return (ERROR_NONE, *_round_cents(integer, fraction, rounding))
+
+
+def validate_batch(amounts: Sequence[Any], rounding: str = ROUND_TRUNCATE) -> BatchResult:
+    """
+    只校验一批金额的格式和整数位数（MAX_INTEGER_LENGTH），不做转换，逐行不抛出异常。
+
+    批内重复的金额字符串只校验一次。
+
+    Args:
+        amounts: 金额字符串
+        rounding: 小数超过两位时的舍入方式，进位可能使整数部分超出位数
+
+    Returns:
+        BatchResult: results 为空列表，codes 和 error_rows 与 convert_batch 一致
+
+    Raises:
+        ValueError: 当舍入方式不受支持时抛出
+    """
+    _check_rounding(rounding)
+    scan = scan_digits
+    carry_check = rounding != ROUND_TRUNCATE
+    # 批内已校验的金额及其错误码
+    seen: Dict[str, int] = {}
+    codes = bytearray(len(amounts))
+    error_rows: List[int] = []
+    for row, amount in enumerate(amounts):
+        if not isinstance(amount, str):
+            code = ERROR_INVALID
+        else:
+            code = seen.get(amount, -1)
+            if code < 0:
+                code, integer, _ = scan(amount)
+                # 只有可能在进位后溢出的金额才需要舍入
+                if not code and carry_check and len(integer) == MAX_INTEGER_LENGTH:
+                    code = _scan(amount, rounding)[0]
+                seen[amount] = code
+        if code:
+            codes[row] = code
+            error_rows.append(row)
+    return BatchResult([], codes, error_rows)
+
+
+def convert_batch(amounts: Sequence[Any], rounding: str = ROUND_TRUNCATE) -> BatchResult:
+    """
+    转换一批金额，逐行不抛出异常，无效行以错误码表示。
+
+    批内重复的金额字符串只解析和转换一次。
+
+    Args:
+        amounts: 金额字符串
+        rounding: 小数超过两位时的舍入方式
+
+    Returns:
+        BatchResult: 与输入一一对应的结果和错误码，以及出错行的下标
+
+    Raises:
+        ValueError: 当舍入方式不受支持时抛出
+    """
+    _check_rounding(rounding)
+    scan = scan_digits
+    round_cents = _round_cents
+    fmt = format_rmb
+    carry_check = rounding != ROUND_TRUNCATE
+    # 批内已处理的金额：结果字符串，或无效时的错误码
+    seen: Dict[str, Any] = {}
+    results: List[Optional[str]] = [None] * len(amounts)
+    codes = bytearray(len(amounts))
+    error_rows: List[int] = []
+    for row, amount in enumerate(amounts):
+        if not isinstance(amount, str):
+            entry: Any = ERROR_INVALID
+        else:
+            entry = seen.get(amount)
+            if entry is None:
+                code, integer, fraction = scan(amount)
+                if code:
+                    entry = code
+                elif carry_check and len(integer) == MAX_INTEGER_LENGTH:
+                    code, integer, decimal = _scan(amount, rounding)
+                    entry = code or fmt(integer, decimal)
+                else:
+                    entry = fmt(*round_cents(integer, fraction, rounding))
+                seen[amount] = entry
+        if entry.__class__ is int:
+            codes[row] = entry
+            error_rows.append(row)
+        else:
+            results[row] = entry
+    return BatchResult(results, codes, error_rows)
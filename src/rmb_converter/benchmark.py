@@ -0,0 +1,1014 @@
+"""性能基准测试模块。
+
+此模块按金额分布和转换层级测量耗时，并与基线结果比较：
+1. 生成贴近生产的金额分布（零售、工资、大额转账、零密集边界值）
+2. 对 process_number、convert_integer、format_rmb 和端到端转换分别计时
+3. 预热后多轮重复，报告 p50/p95/p99 延迟和每秒转换行数
+4. 结果写入 JSON，比较模式下性能退化超过阈值时以非零退出码结束
+5. 数据框模式比较 pandas/Polars 逐行 apply 与 rmb 访问器的整列转换耗时
+6. 批量模式在含指定比例无效行的数据上比较逐行 try/except 与以错误码返回的批量接口
+7. Zipf 模式在少数金额占多数调用、夹杂一次性大额金额的数据上比较前门缓存与同等条目数的 LRU
+8. 多线程模式在1到16个线程下比较共用缓存、线程缓存和不用缓存（只读预计算表）的吞吐量
+9. 分配模式用 tracemalloc 统计各转换层级每次调用留存的内存块和字节数，以及调用期间的峰值
+10. 规范化模式在带千位分隔符、¥/RMB 标记和全角数字的数据上比较 normalize_amount 与正则清洗
+11. 批量转换模式比较逐行调用 convert_to_rmb 与 convert_many 的吞吐量
+
+用法：
+    python -m rmb_converter.benchmark --output result.json
+    python -m rmb_converter.benchmark --baseline baseline.json --threshold 0.2
+    python -m rmb_converter.benchmark --frame-rows 1000000 --frame-rows 10000000
+    python -m rmb_converter.benchmark --error-rate 0.02
+    python -m rmb_converter.benchmark --zipf 1.0 --front-cache-bytes 1048576
+    python -m rmb_converter.benchmark --threads 1,2,4,8,16
+    python -m rmb_converter.benchmark --allocations
+    python -m rmb_converter.benchmark --normalize
+    python -m rmb_converter.benchmark --many
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .batch import convert_batch, validate_batch
+from .cache import (
+    CACHE_SCOPES,
+    ENTRY_BYTES,
+    cache_scope,
+    cache_stats,
+    clear_caches,
+    configure_cache,
+    configure_cache_scope,
+    configure_front_cache,
+    front_cache_stats,
+)
+from .chinese_currency import convert_integer, convert_many, convert_to_rmb, format_rmb
+from .input_processor import normalize_amount, process_number, validate_number
+from .latency import percentile
+from .report import format_table
+
+# 结果文件格式版本
+RESULT_VERSION = 1
+
+# 数据框基准支持的库
+FRAME_LIBRARIES = ('pandas', 'polars')
+
+# 多线程基准的默认线程数
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+# 多线程基准中关闭全部缓存层级、只读预计算表的方式
+SCOPE_UNCACHED = 'uncached'
+
+# 延迟报告各列的显示宽度：项目、p50、p95、p99、吞吐量
+REPORT_COLUMNS = (38, 10, 10, 10, 14)
+
+# 数据框和批量报告各列的显示宽度：项目、秒、吞吐量、命中率（仅部分结果含命中率）
+FRAME_COLUMNS = (38, 10, 14, 10)
+
+# 分配报告各列的显示宽度：项目、留存块、留存字节、峰值字节
+ALLOCATION_COLUMNS = (32, 10, 12, 12)
+
+# 零售常见标价
+_RETAIL_PRICES = (1, 2, 5, 9, 10, 15, 19, 20, 29, 39, 49, 50, 59, 99, 100, 128, 199, 299, 999)
+
+
+def _retail(rng: random.Random, count: int) -> List[str]:
+    """零售：以少量常见标价为主的小额金额。"""
+    cents = ('00', '00', '50', '80', '90', '99')
+    return [f"{rng.choice(_RETAIL_PRICES)}.{rng.choice(cents)}" for _ in range(count)]
+
+
+def _payroll(rng: random.Random, count: int) -> List[str]:
+    """工资：千元到数万元之间、以整百为主的金额。"""
+    return [f"{rng.randint(30, 600) * 100}.{rng.choice(('00', '00', '00', '50'))}"
+            for _ in range(count)]
+
+
+def _large_transfer(rng: random.Random, count: int) -> List[str]:
+    """大额转账：万元到千亿元之间均匀分布的金额。"""
+    return [f"{rng.randint(10 ** 4, 10 ** 11)}.{rng.randint(0, 99):02d}" for _ in range(count)]
+
+
+def _zero_heavy(rng: random.Random, count: int) -> List[str]:
+    """零密集边界值：各位多为零的12位以内金额，覆盖补零规则。"""
+    cases = []
+    for _ in range(count):
+        length = rng.randint(1, 12)
+        digits = ''.join(rng.choice('0000001') for _ in range(length - 1))
+        cases.append(f"{rng.randint(1, 9)}{digits}.{rng.choice(('00', '01', '10', '05'))}")
+    return cases
+
+
+# 金额分布：名称到生成函数的映射
+DISTRIBUTIONS: Dict[str, Callable[[random.Random, int], List[str]]] = {
+    'retail': _retail,
+    'payroll': _payroll,
+    'large_transfer': _large_transfer,
+    'zero_heavy': _zero_heavy,
+}
+
+
+# 无效行的样式：格式错误和整数部分超出12位
+_MALFORMED = ('abc', '', '1.2.3', '12a', '--1', '1e', '１２３', '1234567890123', '9e12')
+
+
+def make_error_corpus(
+    count: int, error_rate: float, distribution: str = 'payroll', seed: int = 0
+) -> List[str]:
+    """
+    生成含指定比例无效行的金额数据。
+
+    Args:
+        count: 行数
+        error_rate: 无效行的比例，取值 0-1
+        distribution: 有效金额的分布名称
+        seed: 随机种子
+
+    Returns:
+        List[str]: 金额字符串
+    """
+    rng = random.Random(seed)
+    amounts = DISTRIBUTIONS[distribution](rng, count)
+    for row in range(count):
+        if rng.random() < error_rate:
+            amounts[row] = rng.choice(_MALFORMED)
+    return amounts
+
+
+# 半角数字、小数点和逗号到全角的映射，用于生成 OCR 风格的输入
+_TO_FULLWIDTH = str.maketrans('0123456789.,', '０１２３４５６７８９．，')
+
+# 对照用的正则清洗流程：全角转半角、统一空格、去除货币标记、去除千位分隔符
+_REGEX_STEPS: Tuple[Tuple['re.Pattern[str]', Any], ...] = (
+    (re.compile('[\uff01-\uff5e]'), lambda match: chr(ord(match.group()) - 0xFEE0)),
+    (re.compile('[\u3000\u00a0]'), ' '),
+    (re.compile(r'^\s*([+-]?)\s*(?:[¥￥]|RMB)\s*', re.IGNORECASE), r'\1'),
+    (re.compile(r'(?<=\d),(?=\d{3}(?:\D|$))'), ''),
+)
+
+
+def make_messy_corpus(count: int, distribution: str = 'payroll', seed: int = 0) -> List[str]:
+    """
+    生成带千位分隔符、¥/RMB 标记或全角数字的金额数据，约三成保持原样。
+
+    Args:
+        count: 行数
+        distribution: 金额分布名称
+        seed: 随机种子
+
+    Returns:
+        List[str]: 金额字符串
+    """
+    rng = random.Random(seed)
+    amounts = DISTRIBUTIONS[distribution](rng, count)
+    for row, amount in enumerate(amounts):
+        integer, point, fraction = amount.partition('.')
+        grouped = f"{int(integer):,}{point}{fraction}"
+        kind = rng.random()
+        if kind < 0.3:
+            continue
+        if kind < 0.5:
+            amounts[row] = grouped
+        elif kind < 0.7:
+            amounts[row] = '¥' + grouped
+        elif kind < 0.85:
+            amounts[row] = 'RMB ' + amount
+        else:
+            amounts[row] = grouped.translate(_TO_FULLWIDTH)
+    return amounts
+
+
+def _best_rate(
+    run: Callable[[], Any], count: int, repeat: int,
+    reset: Optional[Callable[[], None]] = clear_caches,
+) -> Dict[str, float]:
+    """
+    对整批调用计时若干轮，取各轮最好成绩。
+
+    Args:
+        run: 处理整批数据的调用
+        count: 每轮处理的行数
+        repeat: 重复轮数
+        reset: 每轮开始前的调用，默认清空缓存；None 表示不做处理
+
+    Returns:
+        Dict[str, float]: 包含 seconds 和 rows_per_sec
+    """
+    best_ns = None
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        best_ns = elapsed if best_ns is None else min(best_ns, elapsed)
+    return {
+        'seconds': best_ns / 1e9 if best_ns else 0.0,
+        'rows_per_sec': count * 1e9 / best_ns if best_ns else 0.0,
+    }
+
+
+def _apply_each(func: Callable[[str], Any], rows: Sequence[str]) -> None:
+    """逐行调用函数，丢弃结果。"""
+    for row in rows:
+        func(row)
+
+
+def _apply_args(func: Callable[..., Any], args_list: Sequence[Tuple[Any, ...]]) -> None:
+    """逐组参数调用函数，丢弃结果。"""
+    for args in args_list:
+        func(*args)
+
+
+def _regex_normalize(amount: str) -> str:
+    """基线：依次套用 _REGEX_STEPS 中的正则清洗金额。"""
+    for pattern, replacement in _REGEX_STEPS:
+        amount = pattern.sub(replacement, amount)
+    return amount
+
+
+def run_normalize_suite(
+    count: int = 200000, repeat: int = 5, seed: int = 0, distribution: str = 'payroll'
+) -> Dict[str, Dict[str, float]]:
+    """
+    在带千位分隔符、货币标记和全角数字的数据上比较两种清洗方式，并以清洗后的转换耗时作参照。
+
+    Args:
+        count: 行数
+        repeat: 重复轮数
+        seed: 随机种子
+        distribution: 金额分布名称
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "normalize/方式"（regex、translate、convert_to_rmb），
+                                     值包含 seconds 和 rows_per_sec
+
+    Raises:
+        ValueError: 当两种清洗方式的解析结果不一致时抛出
+    """
+    amounts = make_messy_corpus(count, distribution, seed)
+    cleaned = [normalize_amount(amount) for amount in amounts]
+    if [process_number(amount) for amount in cleaned] != [
+            process_number(_regex_normalize(amount)) for amount in amounts]:
+        raise ValueError("normalize_amount 与正则清洗的解析结果不一致")
+
+    runs: Tuple[Tuple[str, Callable[[str], Any], List[str]], ...] = (
+        ('normalize/regex', _regex_normalize, amounts),
+        ('normalize/translate', normalize_amount, amounts),
+        ('normalize/convert_to_rmb', convert_to_rmb, cleaned),
+    )
+    results: Dict[str, Dict[str, float]] = {}
+    for name, func, rows in runs:
+        results[name] = _best_rate(partial(_apply_each, func, rows), count, repeat)
+    clear_caches()
+    return results
+
+
+def _convert_rows(amounts: Sequence[str]) -> List[Optional[str]]:
+    """基线：逐行转换，以 try/except 处理无效行。"""
+    results: List[Optional[str]] = []
+    for amount in amounts:
+        try:
+            results.append(convert_to_rmb(amount))
+        except (ValueError, OverflowError):
+            results.append(None)
+    return results
+
+
+def _validate_rows(amounts: Sequence[str]) -> List[int]:
+    """基线：逐行校验，以 try/except 收集无效行下标。"""
+    error_rows = []
+    for row, amount in enumerate(amounts):
+        try:
+            validate_number(amount)
+        except (ValueError, OverflowError):
+            error_rows.append(row)
+    return error_rows
+
+
+def run_batch_suite(
+    count: int = 200000, error_rate: float = 0.02, repeat: int = 5, seed: int = 0,
+    distribution: str = 'payroll',
+) -> Dict[str, Dict[str, float]]:
+    """
+    在含无效行的数据上比较逐行 try/except 与批量接口的吞吐量。
+
+    每种方式都对整批数据计时，取各轮最好成绩；每轮开始前清空缓存。
+
+    Args:
+        count: 行数
+        error_rate: 无效行的比例
+        repeat: 重复轮数
+        seed: 随机种子
+        distribution: 有效金额的分布名称
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "batch/方式"，值包含 seconds 和 rows_per_sec
+
+    Raises:
+        ValueError: 当批量接口与逐行处理的结果不一致时抛出
+    """
+    amounts = make_error_corpus(count, error_rate, distribution, seed)
+    if convert_batch(amounts).results != _convert_rows(amounts):
+        raise ValueError("convert_batch 的结果与逐行转换不一致")
+    if validate_batch(amounts).error_rows != _validate_rows(amounts):
+        raise ValueError("validate_batch 的结果与逐行校验不一致")
+
+    runs: Tuple[Tuple[str, Callable[[Sequence[str]], Any]], ...] = (
+        ('batch/convert_rows', _convert_rows),
+        ('batch/convert_batch', convert_batch),
+        ('batch/validate_rows', _validate_rows),
+        ('batch/validate_batch', validate_batch),
+    )
+    results: Dict[str, Dict[str, float]] = {}
+    for name, func in runs:
+        results[name] = _best_rate(partial(func, amounts), count, repeat)
+    clear_caches()
+    return results
+
+
+def _prepare_layers(cases: Sequence[str]) -> Dict[str, Tuple[Callable[..., Any], List[Any]]]:
+    """
+    为每个转换层级准备被测函数和对应输入。
+
+    Args:
+        cases: 金额字符串列表
+
+    Returns:
+        Dict[str, Tuple[Callable[..., Any], List[Any]]]: 层级名称到（函数, 参数元组列表）的映射
+    """
+    parts = [process_number(case) for case in cases]
+    return {
+        'process_number': (process_number, [(case,) for case in cases]),
+        'convert_integer': (convert_integer, [(integer,) for integer, _ in parts]),
+        'format_rmb': (format_rmb, parts),
+        'end_to_end': (convert_to_rmb, [(case,) for case in cases]),
+    }
+
+
+def measure_allocations(
+    func: Callable[..., Any], args: Sequence[Any], repeat: int = 1000
+) -> Dict[str, float]:
+    """
+    用 tracemalloc 测量一次调用的内存分配，只统计本包代码中分配的内存。
+
+    先调用一次预热（填充缓存），再重复调用并保留全部返回值，得到每次调用留存的块数和字节数
+    （返回值和新写入的缓存条目）；最后单独调用一次，得到调用期间的峰值，即同时存活的中间对象。
+    读取峰值本身要分配约64字节，因此峰值不会低于这一数值。
+
+    Args:
+        func: 被测函数
+        args: 调用参数
+        repeat: 重复次数
+
+    Returns:
+        Dict[str, float]: blocks、bytes 为每次调用平均留存的块数和字节数，
+            peak_bytes 为单次调用的峰值字节数
+    """
+    func(*args)
+    results: List[Any] = [None] * repeat
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    filters = [tracemalloc.Filter(True, os.path.join(package_dir, '*'))]
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        for index in range(repeat):
+            results[index] = func(*args)
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1] - current
+    finally:
+        if started:
+            tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    return {
+        'blocks': sum(stat.count_diff for stat in stats) / repeat,
+        'bytes': sum(stat.size_diff for stat in stats) / repeat,
+        'peak_bytes': float(peak),
+    }
+
+
+def run_allocation_suite(
+    amount: str = '120034560078.05', cached: bool = True
+) -> Dict[str, Dict[str, float]]:
+    """
+    测量各转换层级处理同一金额的内存分配。
+
+    Args:
+        amount: 金额字符串
+        cached: 为 False 时关闭全部缓存层级，测量查表转换本身，结束后恢复
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "alloc/层级名称"，值见 measure_allocations
+    """
+    saved_sizes = {name: stats['maxsize'] for name, stats in cache_stats().items()}
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        if not cached:
+            for name in saved_sizes:
+                configure_cache(name, 0)
+        for name, (func, args) in _prepare_layers([amount]).items():
+            results[f"alloc/{name}"] = measure_allocations(func, args[0])
+    finally:
+        for name, maxsize in saved_sizes.items():
+            configure_cache(name, maxsize)
+    return results
+
+
+def format_allocation_report(results: Dict[str, Dict[str, float]]) -> str:
+    """
+    将分配测量结果格式化为文本表格。
+
+    Args:
+        results: run_allocation_suite 的返回值
+
+    Returns:
+        str: 文本表格
+    """
+    rows = [
+        (key, f"{stats['blocks']:.2f}", f"{stats['bytes']:.0f}", f"{stats['peak_bytes']:.0f}")
+        for key, stats in results.items()
+    ]
+    return format_table(('项目', '留存块', '留存字节', '峰值字节'), rows, ALLOCATION_COLUMNS)
+
+
+def measure(
+    func: Callable[..., Any], args_list: Sequence[Tuple[Any, ...]], warmup: int = 1000,
+    repeat: int = 5,
+) -> Dict[str, float]:
+    """
+    测量函数在一组输入上的延迟分位数和吞吐量。
+
+    先整体计时若干轮，吞吐量取各轮最好成绩；再逐次计时若干轮采集延迟样本，
+    延迟分位数基于所有轮次的样本。
+
+    Args:
+        func: 被测函数
+        args_list: 每次调用的参数元组
+        warmup: 预热调用次数
+        repeat: 重复轮数
+
+    Returns:
+        Dict[str, float]: 包含 p50_ns、p95_ns、p99_ns、mean_ns 和 rows_per_sec
+    """
+    now = time.perf_counter_ns
+    for args in args_list[:warmup]:
+        func(*args)
+
+    rate = _best_rate(partial(_apply_args, func, args_list), len(args_list), repeat, reset=None)
+    samples: List[int] = []
+    for _ in range(repeat):
+        for args in args_list:
+            start = now()
+            func(*args)
+            samples.append(now() - start)
+
+    samples.sort()
+    return {
+        'p50_ns': percentile(samples, 0.50),
+        'p95_ns': percentile(samples, 0.95),
+        'p99_ns': percentile(samples, 0.99),
+        'mean_ns': sum(samples) / len(samples) if samples else 0.0,
+        'rows_per_sec': rate['rows_per_sec'],
+    }
+
+
+def run_suite(
+    count: int = 20000, repeat: int = 5, warmup: int = 1000, seed: int = 0,
+    distributions: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    运行完整的基准测试。
+
+    每个分布和层级开始前都会清空缓存，再经预热进入稳定状态。
+
+    Args:
+        count: 每个分布的用例数量
+        repeat: 重复轮数
+        warmup: 预热调用次数
+        seed: 随机种子，保证不同运行之间输入一致
+        distributions: 要运行的分布名称，默认全部
+
+    Returns:
+        Dict[str, Any]: 包含 version、meta 和 results 的结果，
+                        results 的键为 "分布/层级"
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for dist_name in distributions or DISTRIBUTIONS:
+        cases = DISTRIBUTIONS[dist_name](random.Random(seed), count)
+        for layer_name, (func, args_list) in _prepare_layers(cases).items():
+            clear_caches()
+            results[f"{dist_name}/{layer_name}"] = measure(func, args_list, warmup, repeat)
+    clear_caches()
+
+    return {
+        'version': RESULT_VERSION,
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'count': count,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def run_frame_suite(
+    rows: int, distribution: str = 'payroll', seed: int = 0,
+    libraries: Sequence[str] = FRAME_LIBRARIES,
+) -> Dict[str, Dict[str, float]]:
+    """
+    比较数据框整列转换与逐行 apply 的耗时，每种方式只运行一次。
+
+    pandas 的基线为 Series.apply(convert_to_rmb)，Polars 的基线为
+    map_elements(convert_to_rmb)；未安装的库会被跳过。每种方式开始前都会清空缓存。
+
+    Args:
+        rows: 行数
+        distribution: 金额分布名称
+        seed: 随机种子
+        libraries: 要运行的库，取值见 FRAME_LIBRARIES
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "库/方式/行数"，值包含 seconds 和 rows_per_sec
+
+    Raises:
+        ValueError: 当结果与逐行转换不一致时抛出
+    """
+    amounts = DISTRIBUTIONS[distribution](random.Random(seed), rows)
+    runs: List[Tuple[str, Callable[[], Any]]] = []
+    if 'pandas' in libraries:
+        try:
+            import pandas as pd
+
+            from . import pandas_ext  # noqa: F401  注册 rmb 访问器
+        except ImportError:
+            pass
+        else:
+            series = pd.Series(amounts)
+            runs.append(('pandas/apply', lambda: series.apply(convert_to_rmb).tolist()))
+            runs.append(('pandas/accessor', lambda: series.rmb.upper().tolist()))
+    if 'polars' in libraries:
+        try:
+            import polars as pl
+
+            from . import polars_ext  # noqa: F401  注册 rmb 命名空间
+        except ImportError:
+            pass
+        else:
+            frame = pl.DataFrame({'amount': amounts})
+            baseline = pl.col('amount').map_elements(convert_to_rmb, return_dtype=pl.String)
+            runs.append(('polars/map_elements',
+                         lambda: frame.select(baseline).to_series().to_list()))
+            runs.append(('polars/namespace',
+                         lambda: frame.select(pl.col('amount').rmb.upper()).to_series().to_list()))
+
+    results: Dict[str, Dict[str, float]] = {}
+    expected: Optional[List[Any]] = None
+    for name, run in runs:
+        clear_caches()
+        start = time.perf_counter_ns()
+        output = run()
+        elapsed = time.perf_counter_ns() - start
+        if expected is None:
+            expected = output
+        elif output != expected:
+            raise ValueError(f"{name} 的结果与逐行转换不一致")
+        results[f"{name}/{rows}"] = {
+            'seconds': elapsed / 1e9,
+            'rows_per_sec': rows * 1e9 / elapsed if elapsed else 0.0,
+        }
+    clear_caches()
+    return results
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2
+) -> List[str]:
+    """
+    比较两次结果，找出性能退化超过阈值的项目。
+
+    p50 延迟增加或吞吐量下降超过 threshold 比例即视为退化；
+    仅比较两次结果中都存在的项目。
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        threshold: 允许的退化比例，例如 0.2 表示 20%
+
+    Returns:
+        List[str]: 退化项目的说明，无退化时为空列表
+    """
+    regressions = []
+    for key, base in baseline['results'].items():
+        cur = current['results'].get(key)
+        if cur is None:
+            continue
+        if base['p50_ns'] and cur['p50_ns'] > base['p50_ns'] * (1 + threshold):
+            regressions.append(
+                f"{key}: p50 {base['p50_ns']:.0f}ns -> {cur['p50_ns']:.0f}ns")
+        if base['rows_per_sec'] and cur['rows_per_sec'] < base['rows_per_sec'] * (1 - threshold):
+            regressions.append(
+                f"{key}: 吞吐量 {base['rows_per_sec']:.0f} -> {cur['rows_per_sec']:.0f} 行/秒")
+    return regressions
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """
+    将结果格式化为文本表格。
+
+    Args:
+        result: run_suite 的返回值
+
+    Returns:
+        str: 文本表格
+    """
+    rows = [
+        (key, f"{stats['p50_ns']:.0f}", f"{stats['p95_ns']:.0f}", f"{stats['p99_ns']:.0f}",
+         f"{stats['rows_per_sec']:.0f}")
+        for key, stats in result['results'].items()
+    ]
+    return format_table(('项目', 'p50(ns)', 'p95(ns)', 'p99(ns)', '行/秒'), rows, REPORT_COLUMNS)
+
+
+def make_zipf_workload(
+    count: int, exponent: float = 1.0, distinct: int = 20000, scan_rate: float = 0.2,
+    seed: int = 0,
+) -> List[str]:
+    """
+    生成少数金额占多数调用的数据：常用金额按 Zipf 分布抽取，另夹杂一次性的大额金额。
+
+    Args:
+        count: 行数
+        exponent: Zipf 指数，越大越集中
+        distinct: 常用金额的个数
+        scan_rate: 一次性大额金额（只出现一次）的比例
+        seed: 随机种子
+
+    Returns:
+        List[str]: 金额字符串
+    """
+    rng = random.Random(seed)
+    population = sorted({f"{rng.randint(1, 99999)}.{rng.choice(('00', '00', '90', '99'))}"
+                         for _ in range(distinct * 2)})
+    rng.shuffle(population)
+    population = population[:distinct]
+    weights = [1 / rank ** exponent for rank in range(1, len(population) + 1)]
+    amounts = rng.choices(population, weights, k=count)
+    for row in range(count):
+        if rng.random() < scan_rate:
+            amounts[row] = f"{rng.randint(10 ** 9, 10 ** 11)}.{rng.randint(0, 99):02d}"
+    return amounts
+
+
+def run_many_suite(
+    count: int = 200000, repeat: int = 5, seed: int = 0,
+    distributions: Optional[Sequence[str]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    比较逐行调用 convert_to_rmb 与 convert_many 的吞吐量。
+
+    除各金额分布外，还在少数金额占多数调用的 Zipf 数据（见 make_zipf_workload）上比较。
+    每轮开始前清空缓存，取各轮最好成绩。
+
+    Args:
+        count: 每种数据的行数
+        repeat: 重复轮数
+        seed: 随机种子
+        distributions: 金额分布名称，默认全部
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "many/数据/方式"（loop、convert_many），
+                                     值包含 seconds 和 rows_per_sec
+
+    Raises:
+        ValueError: 当 convert_many 的结果与逐行转换不一致时抛出
+    """
+    workloads = {name: DISTRIBUTIONS[name](random.Random(seed), count)
+                 for name in distributions or DISTRIBUTIONS}
+    workloads['zipf'] = make_zipf_workload(count, seed=seed)
+
+    def loop(amounts: Sequence[str]) -> List[str]:
+        """基线：逐行调用 convert_to_rmb。"""
+        return [convert_to_rmb(amount) for amount in amounts]
+
+    results: Dict[str, Dict[str, float]] = {}
+    for workload, amounts in workloads.items():
+        if convert_many(amounts) != loop(amounts):
+            raise ValueError(f"{workload}: convert_many 的结果与逐行转换不一致")
+        for name, func in (('loop', loop), ('convert_many', convert_many)):
+            results[f"many/{workload}/{name}"] = _best_rate(partial(func, amounts), count, repeat)
+    clear_caches()
+    return results
+
+
+def run_zipf_suite(
+    count: int = 200000, exponent: float = 1.0, max_bytes: int = 1 << 20, repeat: int = 3,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    在 Zipf 分布的数据上比较无前门缓存、同一内存预算的 LRU 和前门缓存。
+
+    每轮开始前清空缓存，计时包含缓存从空到稳定的过程，取各轮最好成绩。
+
+    Args:
+        count: 行数
+        exponent: Zipf 指数
+        max_bytes: 前门缓存的内存预算（字节）
+        repeat: 重复轮数
+        seed: 随机种子
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "zipf/方式"，值包含 seconds、rows_per_sec，
+            缓存方式另含 hit_rate
+
+    Raises:
+        ValueError: 当各方式的结果不一致时抛出
+    """
+    amounts = make_zipf_workload(count, exponent, seed=seed)
+    expected = [convert_to_rmb(amount) for amount in amounts]
+
+    def timed(func: Callable[[str], str], reset: Callable[[], None]) -> Tuple[float, List[str]]:
+        """对整批数据计时，返回最好成绩（秒）和最后一轮的结果。"""
+        best = None
+        results: List[str] = []
+        for _ in range(repeat):
+            clear_caches()
+            reset()
+            start = time.perf_counter_ns()
+            results = [func(amount) for amount in amounts]
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return (best or 0) / 1e9, results
+
+    suite: Dict[str, Dict[str, float]] = {}
+    seconds, _ = timed(convert_to_rmb, lambda: None)
+    suite['zipf/none'] = {'seconds': seconds, 'rows_per_sec': count / seconds}
+
+    configure_front_cache(max_bytes)
+    try:
+        front_seconds, results = timed(convert_to_rmb, lambda: None)
+        stats = front_cache_stats()
+    finally:
+        configure_front_cache(None)
+    if results != expected:
+        raise ValueError("前门缓存的结果与直接转换不一致")
+
+    # LRU 按同一内存预算折算条目数，不需要影子队列，条目数多于前门缓存
+    lru = lru_cache(maxsize=max_bytes // ENTRY_BYTES)(convert_to_rmb)
+    lru_seconds, lru_results = timed(lru, lru.cache_clear)
+    if lru_results != expected:
+        raise ValueError("LRU 的结果与直接转换不一致")
+    suite['zipf/lru'] = {'seconds': lru_seconds, 'rows_per_sec': count / lru_seconds,
+                         'hit_rate': lru.cache_info().hits / count}
+    suite['zipf/front_cache'] = {'seconds': front_seconds, 'rows_per_sec': count / front_seconds,
+                                 'hit_rate': stats['hits'] / count if stats else 0.0}
+    clear_caches()
+    return suite
+
+
+def gil_enabled() -> bool:
+    """
+    返回当前解释器是否启用了 GIL（自由线程版 CPython 可关闭 GIL）。
+
+    Returns:
+        bool: 是否启用 GIL
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def _convert_threaded(amounts: Sequence[str], threads: int) -> Tuple[float, List[str]]:
+    """
+    将数据均分给多个线程同时转换。
+
+    Args:
+        amounts: 金额字符串
+        threads: 线程数
+
+    Returns:
+        Tuple[float, List[str]]: 从各线程同时开始到全部结束的耗时（秒）和按原顺序排列的结果
+    """
+    step = -(-len(amounts) // threads)
+    parts: List[List[str]] = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        """转换第 index 段数据。"""
+        chunk = amounts[index * step:(index + 1) * step]
+        convert = convert_to_rmb
+        barrier.wait()
+        parts[index] = [convert(amount) for amount in chunk]
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter_ns()
+    for thread in workers:
+        thread.join()
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+    return elapsed, [result for part in parts for result in part]
+
+
+def run_thread_suite(
+    threads: Sequence[int] = THREAD_COUNTS,
+    count: int = 200000,
+    distribution: str = 'payroll',
+    repeat: int = 3,
+    seed: int = 0,
+    scopes: Sequence[str] = CACHE_SCOPES + (SCOPE_UNCACHED,),
+) -> Dict[str, Dict[str, float]]:
+    """
+    在不同线程数下测量转换吞吐量。
+
+    总行数固定，均分给各线程；每轮开始前清空缓存，取各轮最好成绩。
+    结束后恢复原有的缓存容量和作用域。
+
+    Args:
+        threads: 线程数
+        count: 总行数
+        distribution: 金额分布名称
+        repeat: 重复轮数
+        seed: 随机种子
+        scopes: 缓存方式，取值为 cache.CACHE_SCOPES 或 SCOPE_UNCACHED（关闭全部缓存层级）
+
+    Returns:
+        Dict[str, Dict[str, float]]: 键为 "threads/方式/线程数"，值包含 seconds 和 rows_per_sec
+
+    Raises:
+        ValueError: 当多线程转换的结果与单线程不一致时抛出
+    """
+    amounts = DISTRIBUTIONS[distribution](random.Random(seed), count)
+    expected = [convert_to_rmb(amount) for amount in amounts]
+    saved_scope = cache_scope()
+    saved_sizes = {name: stats['maxsize'] for name, stats in cache_stats().items()}
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for scope in scopes:
+            for name, maxsize in saved_sizes.items():
+                configure_cache(name, 0 if scope == SCOPE_UNCACHED else maxsize)
+            configure_cache_scope(saved_scope if scope == SCOPE_UNCACHED else scope)
+            for thread_count in threads:
+                best = None
+                for _ in range(repeat):
+                    clear_caches()
+                    seconds, converted = _convert_threaded(amounts, thread_count)
+                    if converted != expected:
+                        raise ValueError(f"{thread_count} 个线程的转换结果与单线程不一致")
+                    best = seconds if best is None else min(best, seconds)
+                results[f"threads/{scope}/{thread_count}"] = {
+                    'seconds': best or 0.0,
+                    'rows_per_sec': count / best if best else 0.0,
+                }
+    finally:
+        configure_cache_scope(saved_scope)
+        for name, maxsize in saved_sizes.items():
+            configure_cache(name, maxsize)
+        clear_caches()
+    return results
+
+
+def format_frame_report(results: Dict[str, Dict[str, float]]) -> str:
+    """
+    将数据框或批量基准结果格式化为文本表格。
+
+    Args:
+        results: run_frame_suite、run_batch_suite、run_zipf_suite、run_thread_suite、
+                 run_normalize_suite 或 run_many_suite 的返回值，
+                 含 hit_rate 时追加命中率
+
+    Returns:
+        str: 文本表格
+    """
+    rows = []
+    for key, stats in results.items():
+        row = [key, f"{stats['seconds']:.2f}", f"{stats['rows_per_sec']:.0f}"]
+        if 'hit_rate' in stats:
+            row.append(f"{stats['hit_rate']:.1%}")
+        rows.append(row)
+    headers = ('项目', '秒', '行/秒', '命中率')
+    if not any('hit_rate' in stats for stats in results.values()):
+        headers = headers[:3]
+    return format_table(headers, rows, FRAME_COLUMNS)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行入口：运行基准测试，可选写出 JSON 并与基线比较。
+
+    Args:
+        argv: 命令行参数，默认读取 sys.argv
+
+    Returns:
+        int: 退出码，存在性能退化时为1
+    """
+    parser = argparse.ArgumentParser(description='人民币大写转换性能基准测试')
+    parser.add_argument('--count', type=int, default=20000, help='每个分布的用例数量')
+    parser.add_argument('--repeat', type=int, default=5, help='重复轮数')
+    parser.add_argument('--warmup', type=int, default=1000, help='预热调用次数')
+    parser.add_argument('--seed', type=int, default=0, help='随机种子')
+    parser.add_argument('--distribution', action='append', choices=sorted(DISTRIBUTIONS),
+                        help='只运行指定分布，可重复指定')
+    parser.add_argument('--output', help='结果 JSON 文件路径')
+    parser.add_argument('--baseline', help='用于比较的基线 JSON 文件路径')
+    parser.add_argument('--threshold', type=float, default=0.2, help='允许的退化比例')
+    parser.add_argument('--frame-rows', type=int, action='append',
+                        help='改为运行数据框基准，指定行数，可重复指定')
+    parser.add_argument('--error-rate', type=float,
+                        help='改为运行批量基准，指定无效行的比例（例如 0.02）')
+    parser.add_argument('--zipf', type=float, metavar='EXPONENT',
+                        help='改为运行前门缓存基准，指定 Zipf 指数（例如 1.0）')
+    parser.add_argument('--front-cache-bytes', type=int, default=1 << 20,
+                        help='前门缓存基准的内存预算（字节）')
+    parser.add_argument('--threads', type=lambda value: [int(n) for n in value.split(',')],
+                        help='改为运行多线程基准，指定逗号分隔的线程数（例如 1,2,4,8,16）')
+    parser.add_argument('--allocations', action='store_true',
+                        help='改为统计各转换层级每次调用的内存分配（开启与关闭缓存）')
+    parser.add_argument('--many', action='store_true',
+                        help='改为比较逐行 convert_to_rmb 与 convert_many 的吞吐量')
+    parser.add_argument('--normalize', action='store_true',
+                        help='改为比较 normalize_amount 与正则清洗带千位分隔符、'
+                             '货币标记和全角数字的金额')
+    args = parser.parse_args(argv)
+
+    if args.many:
+        print(format_frame_report(run_many_suite(args.count * 10, args.repeat, args.seed,
+                                                 args.distribution)))
+        return 0
+
+    if args.normalize:
+        for distribution in args.distribution or ('payroll',):
+            print(distribution)
+            print(format_frame_report(run_normalize_suite(args.count * 10, args.repeat, args.seed,
+                                                          distribution)))
+        return 0
+
+    if args.allocations:
+        for cached in (True, False):
+            print('开启缓存' if cached else '关闭缓存')
+            print(format_allocation_report(run_allocation_suite(cached=cached)))
+        return 0
+
+    if args.threads:
+        distribution = args.distribution[0] if args.distribution else 'payroll'
+        print(f"Python {platform.python_version()}，GIL {'开启' if gil_enabled() else '关闭'}，"
+              f"CPU {os.cpu_count()} 个")
+        print(format_frame_report(run_thread_suite(args.threads, args.count * 10, distribution,
+                                                   args.repeat, args.seed)))
+        return 0
+
+    if args.zipf is not None:
+        print(format_frame_report(run_zipf_suite(args.count, args.zipf, args.front_cache_bytes,
+                                                 args.repeat, args.seed)))
+        return 0
+
+    if args.error_rate is not None:
+        for distribution in args.distribution or ('payroll',):
+            print(f"{distribution}（无效行 {args.error_rate:.0%}）")
+            print(format_frame_report(run_batch_suite(args.count, args.error_rate, args.repeat,
+                                                      args.seed, distribution)))
+        return 0
+
+    if args.frame_rows:
+        # 数据框基准默认使用重复较多的工资分布
+        distribution = args.distribution[0] if args.distribution else 'payroll'
+        for rows in args.frame_rows:
+            print(format_frame_report(run_frame_suite(rows, distribution, args.seed)))
+        return 0
+
+    result = run_suite(args.count, args.repeat, args.warmup, args.seed, args.distribution)
+    print(format_report(result))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"\n性能退化超过 {args.threshold:.0%}：", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\n与基线相比无超过 {args.threshold:.0%} 的退化")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
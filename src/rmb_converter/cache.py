@@ -0,0 +1,495 @@
+"""转换缓存管理模块。
+
+此模块统一管理转换流程各层级的缓存，包括：
+1. 按层级注册缓存并配置容量，容量为0时关闭该层缓存
+2. 统计各层的命中、未命中和淘汰次数
+3. 一次性清空所有缓存
+4. 可选的前门缓存（TwoQueueCache），以原始输入为键缓存完整结果，按 2Q 策略抵抗扫描
+5. 缓存作用域：各线程共用一份缓存（默认），或每个线程各自一份（见 configure_cache_scope）
+
+各层默认容量可通过环境变量 RMB_CONVERTER_CACHE_SIZES 覆盖，
+格式为逗号分隔的 "层级=容量"，例如 "format_rmb=4096,convert_digit=0"；
+容量写作 none 表示不限大小。缓存作用域可通过环境变量 RMB_CONVERTER_CACHE_SCOPE
+设置为 shared 或 thread。前门缓存默认关闭，可通过环境变量
+RMB_CONVERTER_FRONT_CACHE_BYTES 设置内存预算（字节）开启。
+"""
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# 覆盖默认容量的环境变量
+CACHE_SIZES_ENV = 'RMB_CONVERTER_CACHE_SIZES'
+
+# 设置缓存作用域的环境变量
+CACHE_SCOPE_ENV = 'RMB_CONVERTER_CACHE_SCOPE'
+
+# 缓存作用域：所有线程共用一份缓存；每个线程各自一份缓存
+SCOPE_SHARED = 'shared'
+SCOPE_THREAD = 'thread'
+CACHE_SCOPES = (SCOPE_SHARED, SCOPE_THREAD)
+
+# 开启前门缓存并设置其内存预算（字节）的环境变量
+FRONT_CACHE_BYTES_ENV = 'RMB_CONVERTER_FRONT_CACHE_BYTES'
+
+# 前门缓存只缓存不超过此长度的金额字符串，ENTRY_BYTES 按此长度估算；
+# 更长的输入（如很长的小数位或前导零）直接转换，不写入缓存
+FRONT_KEY_MAX_LENGTH = 24
+
+# 前门缓存每个条目的估算内存（字节）：键和结果字符串、有序字典的槽位和链表节点，
+# 按 FRONT_KEY_MAX_LENGTH 长的键（含选项元组）、12位整数含角分的最长结果取上限
+ENTRY_BYTES = 400
+
+# 影子队列中每个键的估算内存（字节）
+GHOST_BYTES = 160
+
+# 2Q 中试用队列（A1in）和影子队列（A1out）各占内存预算的比例，其余归主队列（Am）
+PROBATION_SHARE = 0.2
+GHOST_SHARE = 0.2
+
+
+class CacheLevel:
+    """
+    单个缓存层级。
+
+    底层使用 functools.lru_cache，调整容量或作用域时重建缓存。
+
+    共用作用域下所有线程共用一个 lru_cache，每次命中都会修改其内部链表，在无 GIL 的
+    CPython 上多线程会争用同一把锁。线程作用域下每个线程首次调用时各建一个 lru_cache，
+    命中只修改本线程的缓存；容量按线程计，统计数据为存活线程之和。
+
+    Attributes:
+        name: 层级名称
+        func: 被缓存的原始函数
+        maxsize: 缓存容量，0 表示关闭，None 表示不限大小
+        scope: 缓存作用域，取值见 CACHE_SCOPES
+        call: 实际调用的函数（带缓存或原始函数）
+    """
+
+    def __init__(
+        self, name: str, func: Callable[..., Any], maxsize: Optional[int],
+        scope: str = SCOPE_SHARED,
+    ) -> None:
+        """
+        初始化缓存层级。
+
+        Args:
+            name: 层级名称
+            func: 被缓存的原始函数
+            maxsize: 缓存容量，0 表示关闭，None 表示不限大小
+            scope: 缓存作用域，取值见 CACHE_SCOPES
+        """
+        self.name = name
+        self.func = func
+        self.maxsize = maxsize
+        self.scope = scope
+        self.call: Callable[..., Any] = func
+        # 线程作用域下各线程的缓存，线程结束后自动移除
+        self._thread_caches: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.configure(maxsize, scope)
+
+    def configure(self, maxsize: Optional[int], scope: Optional[str] = None) -> None:
+        """
+        设置缓存容量和作用域，并清空已有缓存。
+
+        Args:
+            maxsize: 缓存容量，0 表示关闭，None 表示不限大小
+            scope: 缓存作用域，默认保持不变
+
+        Raises:
+            ValueError: 当容量为负数或作用域不受支持时抛出
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"缓存容量不能为负数: {maxsize}")
+        if scope is not None and scope not in CACHE_SCOPES:
+            raise ValueError(f"不支持的缓存作用域: {scope}")
+        self.maxsize = maxsize
+        if scope is not None:
+            self.scope = scope
+        with self._lock:
+            self._thread_caches = weakref.WeakSet()
+        if maxsize == 0:
+            self.call = self.func
+        elif self.scope == SCOPE_THREAD:
+            self.call = self._thread_call(maxsize)
+        else:
+            self.call = lru_cache(maxsize=maxsize)(self.func)
+
+    def _thread_call(self, maxsize: Optional[int]) -> Callable[..., Any]:
+        """
+        生成线程作用域下的调用函数，每个线程首次调用时创建自己的缓存。
+
+        Args:
+            maxsize: 每个线程的缓存容量
+
+        Returns:
+            Callable[..., Any]: 调用函数
+        """
+        local = threading.local()
+        func = self.func
+        caches = self._thread_caches
+        lock = self._lock
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            try:
+                thread_call = local.call
+            except AttributeError:
+                thread_call = local.call = lru_cache(maxsize=maxsize)(func)
+                with lock:
+                    caches.add(thread_call)
+            return thread_call(*args, **kwargs)
+
+        return call
+
+    def _caches(self) -> List[Any]:
+        """
+        返回当前的全部 lru_cache。
+
+        Returns:
+            List[Any]: 共用作用域下为一个，线程作用域下为各存活线程的缓存，关闭时为空
+        """
+        if self.maxsize == 0:
+            return []
+        if self.scope == SCOPE_THREAD:
+            with self._lock:
+                return list(self._thread_caches)
+        return [self.call]
+
+    def clear(self) -> None:
+        """清空缓存及统计数据。"""
+        for cache in self._caches():
+            cache.cache_clear()
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        """
+        返回缓存统计数据。
+
+        每次未命中都会写入一条记录，因此淘汰次数等于未命中次数减去当前条目数。
+
+        Returns:
+            Dict[str, Optional[int]]: 包含 hits、misses、evictions、size、maxsize；
+                线程作用域下前四项为各线程之和，maxsize 为每个线程的容量
+        """
+        if self.maxsize == 0:
+            return {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 0}
+        hits = misses = size = 0
+        for cache in self._caches():
+            info = cache.cache_info()
+            hits += info.hits
+            misses += info.misses
+            size += info.currsize
+        return {
+            'hits': hits,
+            'misses': misses,
+            'evictions': max(misses - size, 0),
+            'size': size,
+            'maxsize': self.maxsize,
+        }
+
+
+class TwoQueueCache:
+    """
+    抗扫描的结果缓存（2Q 策略）。
+
+    新键先进入先进先出的试用队列（A1in），被挤出时只把键记入影子队列（A1out）；
+    影子队列中的键再次未命中时才进入按 LRU 淘汰的主队列（Am）。只出现一次的键
+    （例如一次性的大额金额）只会在试用队列中流过，无法冲掉主队列中的常用金额。
+
+    三个队列都是有序字典，容量按条目数计（由内存预算除以 ENTRY_BYTES / GHOST_BYTES 得到），
+    命中和写入只有几次字典操作，均不加锁。条目大小是估算值，调用方只应写入长度受限的键
+    和结果（见 FRONT_KEY_MAX_LENGTH）。
+
+    Attributes:
+        max_bytes: 内存预算（字节）
+        hits: 命中次数
+        misses: 未命中次数
+        promotions: 从影子队列进入主队列的次数
+        evictions: 从主队列淘汰的次数
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Args:
+            max_bytes: 内存预算（字节）
+
+        Raises:
+            ValueError: 当预算不足以容纳各队列的一个条目时抛出
+        """
+        probation_bytes = int(max_bytes * PROBATION_SHARE)
+        ghost_bytes = int(max_bytes * GHOST_SHARE)
+        self._probation_capacity = probation_bytes // ENTRY_BYTES
+        self._ghost_capacity = ghost_bytes // GHOST_BYTES
+        self._main_capacity = (max_bytes - probation_bytes - ghost_bytes) // ENTRY_BYTES
+        if min(self._probation_capacity, self._ghost_capacity, self._main_capacity) < 1:
+            raise ValueError(f"前门缓存的内存预算过小: {max_bytes}")
+        self.max_bytes = max_bytes
+        # 主队列最久未用的在前，试用队列和影子队列最早进入的在前
+        self._main: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._probation: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._ghost: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.promotions = 0
+        self.evictions = 0
+
+    def peek(self, key: Hashable) -> Any:
+        """
+        查找缓存的结果，与 get 相同但不计入命中和未命中次数，用于辅助键的查找。
+
+        Args:
+            key: 键
+
+        Returns:
+            Any: 缓存的值，未命中时为 None
+        """
+        value = self._main.get(key)
+        if value is None:
+            # 试用队列中的命中不调整顺序，短时间内的重复访问不代表常用
+            return self._probation.get(key)
+        try:
+            self._main.move_to_end(key)
+        except KeyError:  # 已被其他线程淘汰
+            pass
+        return value
+
+    def get(self, key: Hashable) -> Any:
+        """
+        查找缓存的结果。
+
+        Args:
+            key: 键
+
+        Returns:
+            Any: 缓存的值，未命中时为 None
+        """
+        value = self._main.get(key)
+        if value is None:
+            value = self._probation.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+        else:
+            try:
+                self._main.move_to_end(key)
+            except KeyError:  # 已被其他线程淘汰
+                pass
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        写入未命中的结果：曾被挤出试用队列的键进入主队列，其余进入试用队列。
+
+        不加锁：各有序字典的单个操作是原子的，并发写入至多使队列短暂超出容量一个条目，
+        或使同一键被重复写入。
+
+        Args:
+            key: 键
+            value: 值，不能为 None
+        """
+        ghost = self._ghost
+        probation = self._probation
+        try:
+            if key in ghost:
+                del ghost[key]
+                main = self._main
+                if len(main) >= self._main_capacity:
+                    main.popitem(last=False)
+                    self.evictions += 1
+                main[key] = value
+                self.promotions += 1
+            elif key not in probation:
+                if len(probation) >= self._probation_capacity:
+                    ghost[probation.popitem(last=False)[0]] = None
+                    if len(ghost) > self._ghost_capacity:
+                        ghost.popitem(last=False)
+                probation[key] = value
+        except KeyError:  # 其他线程已删除同一键或清空了队列
+            pass
+
+    def clear(self) -> None:
+        """清空各队列及统计数据。"""
+        self._main.clear()
+        self._probation.clear()
+        self._ghost.clear()
+        self.hits = self.misses = self.promotions = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        返回缓存统计数据。
+
+        Returns:
+            Dict[str, int]: 包含 hits、misses、promotions、evictions、
+                size（主队列与试用队列的条目数）、ghosts（影子队列的键数）、
+                bytes（估算内存）、max_bytes
+        """
+        size = len(self._main) + len(self._probation)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'promotions': self.promotions,
+            'evictions': self.evictions,
+            'size': size,
+            'ghosts': len(self._ghost),
+            'bytes': size * ENTRY_BYTES + len(self._ghost) * GHOST_BYTES,
+            'max_bytes': self.max_bytes,
+        }
+
+
+# 已注册的缓存层级
+_LEVELS: Dict[str, CacheLevel] = {}
+
+# 新注册层级使用的缓存作用域，由 configure_cache_scope 设置
+_SCOPE = os.environ.get(CACHE_SCOPE_ENV, SCOPE_SHARED)
+
+# 前门缓存，None 表示关闭；由 configure_front_cache 设置
+FRONT_CACHE: Optional[TwoQueueCache] = None
+
+
+def _parse_env_sizes() -> Dict[str, Optional[int]]:
+    """
+    解析环境变量中的缓存容量配置。
+
+    Returns:
+        Dict[str, Optional[int]]: 层级名称到容量的映射
+
+    Raises:
+        ValueError: 当配置格式无效时抛出
+    """
+    sizes: Dict[str, Optional[int]] = {}
+    for item in os.environ.get(CACHE_SIZES_ENV, '').split(','):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"{CACHE_SIZES_ENV} 格式无效: {item}")
+        value = value.strip().lower()
+        sizes[name.strip()] = None if value == 'none' else int(value)
+    return sizes
+
+
+def cached(level: str, maxsize: Optional[int]) -> Callable[[F], F]:
+    """
+    将函数注册为一个可配置的缓存层级。
+
+    Args:
+        level: 层级名称
+        maxsize: 默认缓存容量，0 表示关闭，None 表示不限大小
+
+    Returns:
+        Callable[[F], F]: 装饰器
+    """
+    def decorator(func: F) -> F:
+        cache = CacheLevel(level, func, _parse_env_sizes().get(level, maxsize), _SCOPE)
+        _LEVELS[level] = cache
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return cache.call(*args, **kwargs)
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def configure_cache(level: str, maxsize: Optional[int]) -> None:
+    """
+    调整指定层级的缓存容量，已有缓存会被清空。
+
+    Args:
+        level: 层级名称，见 cache_stats() 的键
+        maxsize: 缓存容量，0 表示关闭，None 表示不限大小
+
+    Raises:
+        KeyError: 当层级不存在时抛出
+        ValueError: 当容量为负数时抛出
+    """
+    _LEVELS[level].configure(maxsize)
+
+
+def configure_cache_scope(scope: str) -> None:
+    """
+    设置所有缓存层级的作用域，已有缓存会被清空，容量不变。
+
+    多线程转换时，线程作用域避免各线程在同一个 lru_cache 上争用；
+    代价是每个线程各自预热，内存占用随线程数增长。
+
+    Args:
+        scope: 缓存作用域，取值见 CACHE_SCOPES
+
+    Raises:
+        ValueError: 当作用域不受支持时抛出
+    """
+    global _SCOPE
+    if scope not in CACHE_SCOPES:
+        raise ValueError(f"不支持的缓存作用域: {scope}")
+    _SCOPE = scope
+    for cache in _LEVELS.values():
+        cache.configure(cache.maxsize, scope)
+
+
+def cache_scope() -> str:
+    """
+    返回当前的缓存作用域。
+
+    Returns:
+        str: 取值见 CACHE_SCOPES
+    """
+    return _SCOPE
+
+
+def cache_stats() -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    返回所有缓存层级的统计数据。
+
+    Returns:
+        Dict[str, Dict[str, Optional[int]]]: 层级名称到统计数据的映射
+    """
+    return {name: cache.stats() for name, cache in _LEVELS.items()}
+
+
+def configure_front_cache(max_bytes: Optional[int]) -> None:
+    """
+    开启、调整或关闭前门缓存，已有缓存会被丢弃。
+
+    开启后 convert_to_rmb 先以原始输入查找完整结果，未命中时再以解析后的
+    整数和角分查找，都未命中才格式化。
+
+    Args:
+        max_bytes: 内存预算（字节），0 或 None 表示关闭
+
+    Raises:
+        ValueError: 当预算为负数时抛出
+    """
+    global FRONT_CACHE
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"前门缓存的内存预算必须为正数: {max_bytes}")
+    FRONT_CACHE = TwoQueueCache(max_bytes) if max_bytes else None
+
+
+def front_cache_stats() -> Optional[Dict[str, int]]:
+    """
+    返回前门缓存的统计数据。
+
+    Returns:
+        Optional[Dict[str, int]]: 统计数据，见 TwoQueueCache.stats；未开启时为 None
+    """
+    return None if FRONT_CACHE is None else FRONT_CACHE.stats()
+
+
+def clear_caches() -> None:
+    """清空所有缓存层级（含前门缓存）及其统计数据。"""
+    for cache in _LEVELS.values():
+        cache.clear()
+    if FRONT_CACHE is not None:
+        FRONT_CACHE.clear()
+
+
+if os.environ.get(FRONT_CACHE_BYTES_ENV):
+    configure_front_cache(int(os.environ[FRONT_CACHE_BYTES_ENV]))
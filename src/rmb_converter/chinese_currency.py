@@ -4,11 +4,37 @@
 1. 数字到中文大写的基础转换
 2. 人民币金额的格式化
 3. 完整的货币金额转换服务
+4. 按输出风格（见 styles 模块）预先生成的整套转换表
 """
-from functools import lru_cache
-from typing import List, Dict, Tuple
-
-from .input_processor import process_number
+from typing import (
+    TYPE_CHECKING,
+    AnyStr,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import cache as _cache
+from .cache import TwoQueueCache, cached
+from .input_processor import (
+    MAX_INTEGER_LENGTH,
+    ROUND_TRUNCATE,
+    normalize_amount,
+    process_number,
+    process_value,
+    split_cents,
+)
+from .styles import STYLE_STANDARD, style_definition
+from .units import UNITS_WANYI, WANYI_UNITS, ZHAOJING_UNITS, max_integer_length, wanyi_unit
+
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 # 数字到中文大写的映射
 DIGITS: Dict[int, str] = {
@@ -38,50 +64,40 @@ CURRENCY_UNITS = {
     'ZHENG': '整'
 }
 
-def _generate_four_digits_cache() -> Dict[str, str]:
+# 预计算表的版本号，修改生成逻辑后递增并运行 tablegen 重新生成 _tables 模块
+TABLES_VERSION = 1
+
+# _tables 模块中表项之间的分隔符
+TABLE_SEPARATOR = '|'
+
+def _generate_four_digits_cache() -> Tuple[str, ...]:
     """
-    生成四位数的预计算缓存。
-    包括：
-    1. 0-100 的所有数字
-    2. 1000-9999 中的整千、整百数字
+    生成四位数的完整预计算表。
+
+    表中包含 0-9999 全部数字的转换结果，直接以整数为下标索引。
+    从高位到低位逐位处理，遇到零时只记录待补的零，
+    等到后面出现非零数字时再补一个“零”，因此无需回看剩余数字。
     """
-    cache = {}
-    
-    # 处理 0-100
-    for i in range(101):
-        num_str = str(i)
+    table = ['零']
+
+    for num in range(1, 10000):
         result = []
-        num = int(num_str)
-        if num == 0:
-            cache['0'] = '零'
-            continue
-            
-        digits = str(num).zfill(4)
-        last_was_zero = True
-        
-        for j, digit in enumerate(digits):
+        pending_zero = False
+
+        for j, digit in enumerate(f'{num:04d}'):
             digit_int = int(digit)
             if digit_int == 0:
-                if not last_was_zero and j < 3 and any(int(d) > 0 for d in digits[j+1:]):
-                    result.append('零')
-                last_was_zero = True
+                # 已有非零数字时才需要补零，前导零直接忽略
+                pending_zero = bool(result)
             else:
+                if pending_zero:
+                    result.append('零')
+                    pending_zero = False
                 result.append(DIGITS[digit_int] + UNITS[3 - j])
-                last_was_zero = False
-        
-        cache[num_str] = ''.join(result).rstrip('零')
-    
-    # 处理整千、整百数字
-    for i in range(1, 10):
-        # 整千
-        num_str = str(i * 1000)
-        cache[num_str] = DIGITS[i] + '仟'
-        
-        # 整百
-        num_str = str(i * 100)
-        cache[num_str] = DIGITS[i] + '佰'
-    
-    return cache
+
+        table.append(''.join(result))
+
+    return tuple(table)
 
 def _generate_decimal_cache() -> Dict[str, str]:
     """
@@ -108,13 +124,197 @@ def _generate_decimal_cache() -> Dict[str, str]:
     
     return cache
 
-# 预计算常用的四位数转换结果
-COMMON_FOUR_DIGITS = _generate_four_digits_cache()
+def _load_tables() -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    """
+    读取预计算表。
+
+    优先使用 _tables 模块中的字面量，导入时只需拆分字符串；
+    该模块缺失或版本与 TABLES_VERSION 不符时退回现场生成。
+
+    Returns:
+        Tuple[Tuple[str, ...], Dict[str, str]]: 四位数表和角分表
+    """
+    try:
+        from . import _tables
+    except ImportError:
+        return _generate_four_digits_cache(), _generate_decimal_cache()
+    if getattr(_tables, 'TABLES_VERSION', None) != TABLES_VERSION:
+        return _generate_four_digits_cache(), _generate_decimal_cache()
+    decimals = _tables.DECIMALS.split(TABLE_SEPARATOR)
+    return (tuple(_tables.FOUR_DIGITS.split(TABLE_SEPARATOR)),
+            {f'{i:02d}': text for i, text in enumerate(decimals)})
+
+# 预计算 0-9999 全部四位数转换结果（以整数为下标）和所有小数部分转换结果
+FOUR_DIGITS, COMMON_DECIMALS = _load_tables()
+
+# 节的分类，SECTION_CLASSES[节的值]：全零、不足千（以零开头）、满千
+SECTION_ZERO = 0
+SECTION_LEADING_ZERO = 1
+SECTION_FULL = 2
+SECTION_CLASSES = (bytes((SECTION_ZERO,)) + bytes((SECTION_LEADING_ZERO,)) * 999
+                   + bytes((SECTION_FULL,)) * 9000)
+
+# 整数转换状态机的状态：刚输出一个非零节（其单位待定）；其后又出现了全零节
+STATE_SECTION = 0
+STATE_GAP = 1
+
+# 状态转移表，SECTION_TRANSITIONS[状态][节的分类] = (下一状态, 节前缀)，前缀为 None 表示不输出本节。
+# 节的末尾零由其后的单位吸收，不影响输出；非零节前是否补“零”只取决于
+# 中间是否隔着全零节，以及本节是否以零开头
+SECTION_TRANSITIONS = (
+    ((STATE_GAP, None), (STATE_SECTION, '零'), (STATE_SECTION, '')),
+    ((STATE_GAP, None), (STATE_SECTION, '零'), (STATE_SECTION, '零')),
+)
+
+# format_rmb 中整数部分之后的后缀，下标为角分：“元”、角分之间按需补的“零”和角分
+YUAN_SUFFIXES = {
+    decimal: CURRENCY_UNITS['YUAN'] + ('零' if decimal[0] == '0' != decimal[1] else '') + text
+    for decimal, text in COMMON_DECIMALS.items()
+}
+
+# 整数部分为零时的完整结果，下标为角分
+ZERO_YUAN_RESULTS = dict(COMMON_DECIMALS, **{
+    '00': f"零{CURRENCY_UNITS['YUAN']}{CURRENCY_UNITS['ZHENG']}"})
+
+class IntegerTables(Generic[AnyStr]):
+    """
+    整数转换引擎（见 convert_integer_with）使用的一套表，元素为 str 或预先编码的 bytes。
+
+    标准写法、各输出风格（StyleTables）和各输出编码（encoded.EncodedTables）
+    共用同一个引擎，只是表不同。
+
+    Attributes:
+        empty: 与表元素同类型的空值，用于拼接结果
+        lead_digits: 最高节使用的四位数表
+        four_digits: 其余各节使用的四位数表
+        transitions: 状态转移表，结构见 SECTION_TRANSITIONS
+        wanyi_units: 前8节的万万亿式单位，结构见 units.WANYI_UNITS
+        zhaojing_units: 万进中数的节单位
+    """
 
-# 预计算所有小数部分转换结果
-COMMON_DECIMALS = _generate_decimal_cache()
+    def __init__(
+        self,
+        empty: AnyStr,
+        lead_digits: Sequence[AnyStr],
+        four_digits: Sequence[AnyStr],
+        transitions: Sequence[Sequence[Tuple[int, Optional[AnyStr]]]],
+        wanyi_units: Sequence[Sequence[AnyStr]],
+        zhaojing_units: Sequence[AnyStr],
+    ) -> None:
+        """
+        Args:
+            empty: 与表元素同类型的空值
+            lead_digits: 最高节使用的四位数表
+            four_digits: 其余各节使用的四位数表
+            transitions: 状态转移表
+            wanyi_units: 前8节的万万亿式单位
+            zhaojing_units: 万进中数的节单位
+        """
+        self.empty = empty
+        self.lead_digits = lead_digits
+        self.four_digits = four_digits
+        self.transitions = transitions
+        self.wanyi_units = wanyi_units
+        self.zhaojing_units = zhaojing_units
+
+    def long_unit(self, section: int, lower: int) -> AnyStr:
+        """
+        返回前8节以外的万万亿式单位，参数见 units.wanyi_unit。
+
+        Args:
+            section: 节的序号
+            lower: 其后的下一个非零节的序号，没有时为 -1
+
+        Returns:
+            AnyStr: 节单位
+        """
+        return wanyi_unit(section, lower)  # type: ignore[return-value]
+
+# 标准写法的表，直接引用预计算表，不做复制
+STANDARD_TABLES: IntegerTables[str] = IntegerTables(
+    '', FOUR_DIGITS, FOUR_DIGITS, SECTION_TRANSITIONS, WANYI_UNITS, ZHAOJING_UNITS)
+
+class StyleTables(IntegerTables[str]):
+    """
+    一种输出风格的整套转换表，由标准写法的表逐字替换得到。
+
+    Attributes:
+        style: 风格名称
+        prefix: 前缀
+        translation: 逐字替换表，供 str.translate 使用
+        lead_digits: 最高节使用的四位数表，已拼接前缀
+        transitions: 状态转移表，节前缀已替换
+        yuan_suffixes: 整数部分之后的后缀
+        zero_yuan_results: 整数部分为零时的完整结果，已拼接前缀
+    """
+
+    def __init__(self, style: str) -> None:
+        """
+        Args:
+            style: 风格名称，取值见 styles.style_names()
+
+        Raises:
+            ValueError: 当风格不存在时抛出
+        """
+        replacements, prefix = style_definition(style)
+        translation = str.maketrans(replacements)
+        self.style = style
+        self.prefix = prefix
+        self.translation = translation
+        four_digits = tuple(text.translate(translation) for text in FOUR_DIGITS)
+        super().__init__(
+            '',
+            tuple(prefix + text for text in four_digits),
+            four_digits,
+            tuple(
+                tuple((state, None if text is None else text.translate(translation))
+                      for state, text in row)
+                for row in SECTION_TRANSITIONS
+            ),
+            tuple(tuple(unit.translate(translation) for unit in row) for row in WANYI_UNITS),
+            tuple(unit.translate(translation) for unit in ZHAOJING_UNITS),
+        )
+        self.yuan_suffixes = {decimal: text.translate(translation)
+                              for decimal, text in YUAN_SUFFIXES.items()}
+        self.zero_yuan_results = {decimal: prefix + text.translate(translation)
+                                  for decimal, text in ZERO_YUAN_RESULTS.items()}
+
+    def long_unit(self, section: int, lower: int) -> str:
+        """
+        返回前8节以外的万万亿式单位，已按风格替换。
+
+        Args:
+            section: 节的序号
+            lower: 其后的下一个非零节的序号，没有时为 -1
+
+        Returns:
+            str: 节单位
+        """
+        return wanyi_unit(section, lower).translate(self.translation)
+
+# 已生成的各风格的表
+_STYLE_TABLES: Dict[str, StyleTables] = {}
+
+def get_style_tables(style: str) -> StyleTables:
+    """
+    返回指定风格的表，首次使用时生成。
+
+    Args:
+        style: 风格名称
+
+    Returns:
+        StyleTables: 该风格的转换表
 
-@lru_cache(maxsize=128)
+    Raises:
+        ValueError: 当风格不存在时抛出
+    """
+    tables = _STYLE_TABLES.get(style)
+    if tables is None:
+        tables = _STYLE_TABLES[style] = StyleTables(style)
+    return tables
+
+# 单个数字只是一次字典查找，缓存得不偿失，默认关闭
+@cached('convert_digit', 0)
 def convert_digit(digit: int) -> str:
     """
     将个位数字转换为中文大写。
@@ -137,32 +337,9 @@ def convert_four_digits(number: str) -> str:
     Returns:
         转换后的中文大写字符串
     """
-    # 检查是否在预计算结果中
-    if number in COMMON_FOUR_DIGITS:
-        return COMMON_FOUR_DIGITS[number]
-    
-    result = []
-    num = int(number)
-    if num == 0:
-        return '零'
-    
-    # 补齐四位
-    number = number.zfill(4)
-    last_was_zero = True
-    
-    for i, digit in enumerate(number):
-        digit_int = int(digit)
-        if digit_int == 0:
-            if not last_was_zero and i < 3 and any(int(d) > 0 for d in number[i+1:]):
-                result.append('零')
-            last_was_zero = True
-        else:
-            result.append(DIGITS[digit_int] + UNITS[3 - i])
-            last_was_zero = False
-    
-    return ''.join(result).rstrip('零')
+    return FOUR_DIGITS[int(number)]
 
-@lru_cache(maxsize=1024)
+@cached('process_segment', 1024)
 def _process_segment(segment: str, position: int, has_next_nonzero: bool) -> Tuple[str, bool]:
     """
     处理数字段，返回转换结果和是否需要添加零。
@@ -186,66 +363,95 @@ def _process_segment(segment: str, position: int, has_next_nonzero: bool) -> Tup
     
     return result, needs_zero
 
-@lru_cache(maxsize=1024)
-def convert_integer(number: str) -> str:
+def convert_integer_with(
+    number: str, tables: IntegerTables[AnyStr], units: str = UNITS_WANYI
+) -> AnyStr:
     """
-    将整数转换为中文大写。
+    按给定的表将整数转换为中文大写，标准写法、各输出风格和各输出编码共用此引擎。
+
+    耗时与位数成线性关系：从高位到低位逐节扫描一次，由状态机（见 SECTION_TRANSITIONS）
+    按节的分类决定是否输出“零”，每个字符只输出一次，不做回看或替换。
+    万万亿式的单位取决于下一个非零节，因此每个非零节的单位推迟到遇到下一个非零节
+    （或扫描结束）时再输出。
 
     Args:
         number: 要转换的整数字符串
+        tables: 转换表，结果与表元素同类型
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
 
     Returns:
-        转换后的中文大写字符串
+        AnyStr: 转换后的中文大写
+
+    Raises:
+        ValueError: 当单位体系不受支持时抛出
+        OverflowError: 当位数超出单位体系的范围时抛出
+    """
+    number = number.lstrip('0')
+    length = len(number)
+    if length <= 4:
+        return tables.lead_digits[int(number) if number else 0]
+    wanyi = units == UNITS_WANYI
+    if not wanyi:
+        limit = max_integer_length(units)
+        if limit is not None and length > limit:
+            raise OverflowError(f"整数部分超出{limit}位限制")
+
+    # 从高位起每4位一节，最高节可能不足4位（去掉前导零后必不为零）；节的序号从个位节起为0
+    head = (length - 1) % 4 + 1
+    pending = (length - 1) >> 2  # 上一个非零节的序号，其单位尚未输出
+    result = [tables.lead_digits[int(number[:head])]]
+    append = result.append
+    four_digits = tables.four_digits
+    classes = SECTION_CLASSES
+    transitions = tables.transitions
+    wanyi_units = tables.wanyi_units
+    zhaojing_units = tables.zhaojing_units
+    state = STATE_SECTION
+    section = pending
+    for start in range(head, length, 4):
+        section -= 1
+        value = int(number[start:start + 4])
+        state, prefix = transitions[state][classes[value]]
+        if prefix is None:
+            continue
+        if not wanyi:
+            append(zhaojing_units[pending])
+        elif pending < len(wanyi_units):
+            append(wanyi_units[pending][section + 1])
+        else:
+            append(tables.long_unit(pending, section))
+        append(prefix)
+        append(four_digits[value])
+        pending = section
+
+    if not wanyi:
+        append(zhaojing_units[pending])
+    elif pending < len(wanyi_units):
+        append(wanyi_units[pending][0])
+    else:
+        append(tables.long_unit(pending, -1))
+    return tables.empty.join(result)
+
+@cached('convert_integer', 1024)
+def convert_integer(number: str, units: str = UNITS_WANYI) -> str:
     """
-    if number == '0':
-        return '零'
+    将整数转换为中文大写，逐节规则见 convert_integer_with。
 
-    # 从右向左每4位分割
-    segments: List[str] = []
-    while number:
-        segments.append(number[-4:])
-        number = number[:-4]
-    segments.reverse()
+    Args:
+        number: 要转换的整数字符串
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
 
-    result = []
-    last_was_zero = False
-    
-    for i, segment in enumerate(segments):
-        segment_value = int(segment)
-        if segment_value == 0:
-            # 如果后面还有非零数字，且上一个字符不是零，添加零
-            if i < len(segments) - 1 and any(int(s) > 0 for s in segments[i+1:]):
-                if not (result and result[-1].endswith('零')):
-                    result.append('零')
-            last_was_zero = True
-            continue
-        
-        # 当前段的处理
-        converted = convert_four_digits(str(segment_value))
-        
-        # 处理零的连接
-        if last_was_zero and result and not result[-1].endswith('零'):
-            result.append('零')
-        result.append(converted)
-        
-        # 添加单位（万、亿等）
-        if i < len(segments) - 1:
-            result.append(LARGE_UNITS[len(segments) - i - 1])
-            # 检查是否需要在单位后添加零
-            next_segment = int(segments[i + 1])
-            if next_segment > 0 and next_segment < 1000:
-                result.append('零')
-        
-        # 更新零的状态
-        last_was_zero = converted.endswith('零')
+    Returns:
+        转换后的中文大写字符串
 
-    # 合并结果并处理多余的零
-    result = ''.join(result)
-    while '零零' in result:
-        result = result.replace('零零', '零')
-    return result.strip('零')
+    Raises:
+        ValueError: 当单位体系不受支持时抛出
+        OverflowError: 当位数超出单位体系的范围时抛出
+    """
+    return convert_integer_with(number, STANDARD_TABLES, units)
 
-@lru_cache(maxsize=100)
+# 角分部分直接查预计算表，缓存得不偿失，默认关闭
+@cached('convert_decimal', 0)
 def convert_decimal(decimal: str) -> str:
     """
     将小数部分转换为中文大写。
@@ -274,48 +480,269 @@ def convert_decimal(decimal: str) -> str:
     
     return ''.join(result)
 
-@lru_cache(maxsize=1024)
-def format_rmb(integer: str, decimal: str) -> str:
+@cached('format_rmb', 1024)
+def format_rmb(integer: str, decimal: str, units: str = UNITS_WANYI) -> str:
     """
     格式化人民币金额。
 
+    角分部分连同“元”和按需补的“零”一起预先生成（见 YUAN_SUFFIXES），
+    整数部分之后只需拼接一次。
+
     Args:
         integer: 整数部分
         decimal: 小数部分
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
 
     Returns:
         格式化后的人民币金额字符串
     """
-    if integer == '0' and decimal == '00':
-        return f"零{CURRENCY_UNITS['YUAN']}{CURRENCY_UNITS['ZHENG']}"
-    
-    result = []
-    if integer != '0':
-        result.append(convert_integer(integer) + CURRENCY_UNITS['YUAN'])
-    
-    decimal_part = convert_decimal(decimal)
-    if decimal_part != CURRENCY_UNITS['ZHENG']:
-        if integer != '0' and decimal[0] == '0' and decimal[1] != '0':
-            result.append('零')
-        result.append(decimal_part)
-    else:
-        result.append(decimal_part)
-    
-    return ''.join(result)
+    if integer == '0':
+        return ZERO_YUAN_RESULTS[decimal]
+    return convert_integer(integer, units) + YUAN_SUFFIXES[decimal]
+
+@cached('format_rmb_styled', 1024)
+def format_rmb_styled(
+    integer: str, decimal: str, style: str = STYLE_STANDARD, units: str = UNITS_WANYI
+) -> str:
+    """
+    按指定输出风格格式化人民币金额。
+
+    各风格的表在首次使用时生成（见 StyleTables），此后与 format_rmb 同样只做查表和拼接。
+
+    Args:
+        integer: 整数部分
+        decimal: 小数部分
+        style: 输出风格，取值见 styles.style_names()
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
 
-def convert_to_rmb(amount: str) -> str:
+    Returns:
+        格式化后的人民币金额字符串
+
+    Raises:
+        ValueError: 当风格不存在时抛出
     """
-    将数字金额转换为人民币大写格式。
+    tables = get_style_tables(style)
+    if integer == '0':
+        return tables.zero_yuan_results[decimal]
+    return convert_integer_with(integer, tables, units) + tables.yuan_suffixes[decimal]
+
+def _front_key(amount: str, rounding: str, units: Optional[str], style: Optional[str]) -> object:
+    """
+    返回前门缓存的键：默认选项下为金额字符串本身，否则连同选项组成元组。
 
     Args:
         amount: 数字金额字符串
+        rounding: 舍入方式
+        units: 大数单位体系
+        style: 输出风格
+
+    Returns:
+        object: 键
+    """
+    if rounding == ROUND_TRUNCATE and units is None and style is None:
+        return amount
+    return (amount, rounding, units, style)
+
+def _convert_front_miss(
+    front: TwoQueueCache, key: object, amount: str, rounding: str,
+    units: Optional[str], style: Optional[str],
+) -> str:
+    """
+    前门缓存未命中时，解析金额并以规范写法（两位小数）查找，仍未命中才格式化。
+
+    规范写法本身也是合法输入，因此与原始输入共用同一键空间：输入已是规范写法时
+    只占一个条目，"99"、"099.0" 等其他写法则共用 "99.00" 的结果。
+    整数部分超过12位（指定单位体系时）的结果超出 cache.ENTRY_BYTES 的估算，不写入缓存。
+
+    Args:
+        front: 前门缓存
+        key: 原始输入对应的键
+        amount: 数字金额字符串
+        rounding: 舍入方式
+        units: 大数单位体系，None 表示按 spec.md 限制12位
+        style: 输出风格，None 表示标准写法
 
     Returns:
         str: 人民币大写金额
 
     Raises:
-        ValueError: 当输入格式无效时抛出
+        ValueError: 当输入格式无效或风格不存在时抛出
         OverflowError: 当数字超出范围时抛出
     """
-    integer_part, decimal_part = process_number(amount)
-    return format_rmb(integer_part, decimal_part) 
\ No newline at end of file
+    if units is None:
+        integer_part, decimal_part = process_number(amount, rounding)
+    else:
+        integer_part, decimal_part = process_number(amount, rounding, max_integer_length(units))
+    cacheable = len(integer_part) <= MAX_INTEGER_LENGTH
+    normalized = _front_key(f"{integer_part}.{decimal_part}", ROUND_TRUNCATE, units, style)
+    result = None if normalized == key or not cacheable else front.peek(normalized)
+    if result is None:
+        if style is None or style == STYLE_STANDARD:
+            result = format_rmb(integer_part, decimal_part, units or UNITS_WANYI)
+        else:
+            result = format_rmb_styled(integer_part, decimal_part, style, units or UNITS_WANYI)
+        if not cacheable:
+            return result
+        if normalized != key:
+            front.put(normalized, result)
+    front.put(key, result)
+    return result
+
+def convert_to_rmb(
+    amount: Union[str, 'Decimal', int, float],
+    rounding: str = ROUND_TRUNCATE,
+    units: Optional[str] = None,
+    style: Optional[str] = None,
+    normalize: bool = False,
+) -> str:
+    """
+    将数字金额转换为人民币大写格式。
+
+    开启前门缓存（见 cache.configure_front_cache）后，字符串金额先以原始输入查找完整结果，
+    命中时无需解析。
+
+    Args:
+        amount: 数字金额字符串、Decimal、整数或浮点数；浮点数按其 repr 转换（见
+                input_processor.process_value），精确金额请传入字符串或 Decimal
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+        units: 大数单位体系，见 units.UNIT_SYSTEMS；默认为 None，
+               按 spec.md 限制整数部分最多12位
+        style: 输出风格，见 styles.style_names()；默认为 None，即标准写法
+        normalize: 是否接受 "1,234.50"、"¥1,234"、"RMB 500" 和全角数字等写法，
+                   见 input_processor.normalize_amount；只作用于字符串金额
+
+    Returns:
+        str: 人民币大写金额
+
+    Raises:
+        ValueError: 当输入格式无效、类型不受支持（如 bool、None）或风格不存在时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    if normalize and amount.__class__ is str:
+        amount = normalize_amount(amount)
+    front = _cache.FRONT_CACHE
+    if (front is not None and amount.__class__ is str
+            and len(amount) <= _cache.FRONT_KEY_MAX_LENGTH):
+        # 开启前门缓存时先以原始输入查找，命中则无需解析；键的规则见 _front_key，
+        # 过长的输入不查找也不写入，以免超出按条目估算的内存预算
+        if rounding == ROUND_TRUNCATE and units is None and style is None:
+            key: object = amount
+        else:
+            key = (amount, rounding, units, style)
+        result = front.get(key)
+        if result is None:
+            result = _convert_front_miss(front, key, amount, rounding, units, style)
+        return result
+
+    if units is not None or style is not None:
+        max_length = MAX_INTEGER_LENGTH if units is None else max_integer_length(units)
+        if isinstance(amount, str):
+            integer_part, decimal_part = process_number(amount, rounding, max_length)
+        else:
+            integer_part, decimal_part = process_value(amount, rounding, max_length)
+        if style is None or style == STYLE_STANDARD:
+            return format_rmb(integer_part, decimal_part, units or UNITS_WANYI)
+        return format_rmb_styled(integer_part, decimal_part, style, units or UNITS_WANYI)
+
+    if isinstance(amount, str):
+        integer_part, decimal_part = process_number(amount, rounding)
+    else:
+        integer_part, decimal_part = process_value(amount, rounding)
+    return format_rmb(integer_part, decimal_part)
+
+def convert_cents(cents: int) -> str:
+    """
+    将以分为单位的整数金额转换为人民币大写格式。
+
+    Args:
+        cents: 以分为单位的金额，例如 12345 表示 123.45 元
+
+    Returns:
+        str: 人民币大写金额
+
+    Raises:
+        ValueError: 当输入不是整数时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    return format_rmb(*split_cents(cents))
+
+# iter_convert 批内去重记录的条目上限，超过后清空，使内存占用与批量大小无关
+MANY_MEMO_LIMIT = 1 << 16
+
+def iter_convert(
+    amounts: Iterable[Union[str, 'Decimal']],
+    rounding: str = ROUND_TRUNCATE,
+    units: Optional[str] = None,
+    style: Optional[str] = None,
+    normalize: bool = False,
+) -> Iterator[str]:
+    """
+    逐个惰性转换金额，适用于大批量数据。
+
+    与逐次调用 convert_to_rmb 的结果完全一致。批内重复的金额字符串只转换一次，
+    之后只需一次字典查找（记录最多 MANY_MEMO_LIMIT 条，满后清空）；默认选项下
+    未重复的金额直接解析并查表，不经过 convert_to_rmb 的选项分派。
+    结果按输入顺序逐个产出，内存占用与批量大小无关。
+
+    Args:
+        amounts: 数字金额字符串或 Decimal 的可迭代对象
+        rounding: 小数超过两位时的舍入方式，见 convert_to_rmb
+        units: 大数单位体系，见 convert_to_rmb
+        style: 输出风格，见 convert_to_rmb
+        normalize: 是否规范化输入，见 convert_to_rmb
+
+    Yields:
+        str: 人民币大写金额
+
+    Raises:
+        ValueError: 当某个输入格式无效时抛出
+        OverflowError: 当某个数字超出范围时抛出
+    """
+    # 开启前门缓存或使用非默认选项时，未重复的金额交给 convert_to_rmb
+    direct = (rounding == ROUND_TRUNCATE and units is None and style is None
+              and not normalize and _cache.FRONT_CACHE is None)
+    process = process_number
+    fmt = format_rmb
+    convert = convert_to_rmb
+    memo: Dict[str, str] = {}
+    lookup = memo.get
+    for amount in amounts:
+        if amount.__class__ is not str:
+            yield convert(amount, rounding, units, style, normalize)
+            continue
+        result = lookup(amount)
+        if result is None:
+            if direct:
+                result = fmt(*process(amount))
+            else:
+                result = convert(amount, rounding, units, style, normalize)
+            if len(memo) >= MANY_MEMO_LIMIT:
+                memo.clear()
+            memo[amount] = result
+        yield result
+
+def convert_many(
+    amounts: Iterable[Union[str, 'Decimal']],
+    rounding: str = ROUND_TRUNCATE,
+    units: Optional[str] = None,
+    style: Optional[str] = None,
+    normalize: bool = False,
+) -> List[str]:
+    """
+    批量转换金额，按输入顺序返回结果列表。
+
+    Args:
+        amounts: 数字金额字符串或 Decimal 的可迭代对象
+        rounding: 小数超过两位时的舍入方式，见 convert_to_rmb
+        units: 大数单位体系，见 convert_to_rmb
+        style: 输出风格，见 convert_to_rmb
+        normalize: 是否规范化输入，见 convert_to_rmb
+
+    Returns:
+        List[str]: 人民币大写金额列表
+
+    Raises:
+        ValueError: 当某个输入格式无效时抛出
+        OverflowError: 当某个数字超出范围时抛出
+    """
+    return list(iter_convert(amounts, rounding, units, style, normalize))
@@ -1,34 +1,77 @@
-"""命令行接口模块。"""
-import sys
-from typing import Optional
+"""命令行接口模块。
 
-import click
+命令行入口 run 对最常见的单个金额转换直接处理，不导入 click；
+带选项的调用和子命令交给 commands 模块中的 click 命令。
+"""
+import sys
+from typing import Any, List, Optional
 
 from .chinese_currency import convert_to_rmb
 
-@click.command()
-@click.argument('amount', required=False)
-def main(amount: Optional[str] = None) -> int:
+# 子命令名称，对应 commands 模块中的同名命令
+SUBCOMMANDS = ('serve', 'parquet')
+
+
+def __getattr__(name: str) -> Any:
+    """
+    按需导入 click 命令，保持 cli.main 和各子命令的导入路径可用。
+
+    Args:
+        name: 属性名
+
+    Returns:
+        Any: commands 模块中的同名命令
+
+    Raises:
+        AttributeError: 当属性不存在时抛出
+    """
+    if name == 'main' or name in SUBCOMMANDS:
+        from . import commands
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _convert_one(amount: str) -> int:
     """
-    命令行入口函数。
+    转换单个金额并输出，结果与 click 命令一致。
 
     Args:
-        amount: 要转换的金额字符串
+        amount: 金额字符串
 
     Returns:
         int: 退出码
     """
-    if not amount:
-        click.echo("请输入一个数字金额", err=True)
-        sys.exit(1)
-    
     try:
         result = convert_to_rmb(amount)
-        click.echo(result)
-        return 0
     except (ValueError, OverflowError) as e:
-        click.echo(f"错误: {str(e)}", err=True)
-        sys.exit(1)
+        sys.stderr.write(f"错误: {str(e)}\n")
+        return 1
+    sys.stdout.write(result + '\n')
+    return 0
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """
+    命令分发入口：首个参数为子命令时执行该子命令，否则执行转换。
+
+    Args:
+        argv: 命令行参数，默认读取 sys.argv
+
+    Returns:
+        int: 退出码
+    """
+    args = sys.argv[1:] if argv is None else argv
+    # 唯一参数是金额时无需解析选项
+    if len(args) == 1 and args[0] and not args[0].startswith('-') and args[0] not in SUBCOMMANDS:
+        return _convert_one(args[0])
+
+    from . import commands
+
+    if args and args[0] in SUBCOMMANDS:
+        command = getattr(commands, args[0])
+        return command.main(args[1:], prog_name=f'rmb-converter {args[0]}')
+    return commands.main.main(args, prog_name='rmb-converter')
+
 
 if __name__ == '__main__':
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(run())
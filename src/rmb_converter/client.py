@@ -0,0 +1,156 @@
+"""转换服务客户端模块。
+
+通过长连接访问 server 模块提供的转换服务，支持 TCP 端口和 Unix 域套接字。
+"""
+import http.client
+import json
+import socket
+from typing import Any, Dict, Iterable, List, Optional
+
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class _TCPHTTPConnection(http.client.HTTPConnection):
+    """关闭 Nagle 算法的 HTTP 连接，避免小请求因延迟确认而停顿。"""
+
+    def connect(self) -> None:
+        """建立连接并设置 TCP_NODELAY。"""
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """通过 Unix 域套接字通信的 HTTP 连接。"""
+
+    def __init__(self, path: str, timeout: Optional[float] = None) -> None:
+        """
+        初始化连接。
+
+        Args:
+            path: 套接字文件路径
+            timeout: 超时时间（秒）
+        """
+        super().__init__('localhost', timeout=timeout)
+        self.unix_path = path
+
+    def connect(self) -> None:
+        """连接到 Unix 域套接字。"""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class RMBClient:
+    """
+    转换服务客户端，复用同一个长连接。
+
+    非线程安全，多线程使用时每个线程应各自创建客户端。
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_socket: Optional[str] = None,
+        timeout: Optional[float] = 10.0,
+    ) -> None:
+        """
+        初始化客户端。
+
+        Args:
+            host: 服务主机地址
+            port: 服务端口
+            unix_socket: Unix 域套接字路径，指定时忽略 host 和 port
+            timeout: 超时时间（秒）
+        """
+        if unix_socket:
+            self.connection: http.client.HTTPConnection = _UnixHTTPConnection(
+                unix_socket, timeout)
+        else:
+            self.connection = _TCPHTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method: str, path: str, body: Optional[str] = None) -> str:
+        """
+        发送请求并返回响应文本。
+
+        Args:
+            method: HTTP 方法
+            path: 请求路径
+            body: 请求体
+
+        Returns:
+            str: 响应文本
+
+        Raises:
+            ValueError: 当服务返回错误时抛出
+        """
+        payload = body.encode('utf-8') if body is not None else None
+        self.connection.request(method, path, body=payload)
+        response = self.connection.getresponse()
+        text = response.read().decode('utf-8')
+        if response.status != 200:
+            raise ValueError(text)
+        return text
+
+    def convert(self, amount: str) -> str:
+        """
+        转换单个金额。
+
+        Args:
+            amount: 金额字符串
+
+        Returns:
+            str: 人民币大写金额
+
+        Raises:
+            ValueError: 当金额无效时抛出
+        """
+        return self._request('POST', '/convert', amount)
+
+    def convert_batch(self, amounts: Iterable[str]) -> List[str]:
+        """
+        批量转换金额，无效金额对应的结果以“错误: ”开头。
+
+        每个金额都以换行符结尾发送，空金额也对应一行结果。
+
+        Args:
+            amounts: 金额字符串的可迭代对象
+
+        Returns:
+            List[str]: 与输入一一对应的结果
+
+        Raises:
+            ValueError: 当金额中含有换行符、服务返回错误或结果行数与金额数不一致时抛出
+        """
+        amounts = list(amounts)
+        if any('\n' in amount for amount in amounts):
+            raise ValueError("金额中不能包含换行符")
+        text = self._request('POST', '/batch', ''.join(amount + '\n' for amount in amounts))
+        results = text.split('\n')
+        if not results[-1]:
+            results.pop()
+        if len(results) != len(amounts):
+            raise ValueError(f"结果行数 {len(results)} 与金额数 {len(amounts)} 不一致")
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取服务端统计数据。
+
+        Returns:
+            Dict[str, Any]: 请求数和延迟分位数
+        """
+        return json.loads(self._request('GET', '/stats'))
+
+    def close(self) -> None:
+        """关闭连接。"""
+        self.connection.close()
+
+    def __enter__(self) -> 'RMBClient':
+        """进入上下文。"""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """退出上下文时关闭连接。"""
+        self.close()
@@ -0,0 +1,299 @@
+"""基于 click 的命令行命令。
+
+cli.run 只在需要解析选项时才导入此模块，单个金额的转换不会加载 click。
+"""
+import io
+import sys
+from typing import Optional
+
+import click
+
+from .chinese_currency import convert_to_rmb
+from .encoded import ENCODINGS, NEWLINE, convert_stream_encoded, encode_rmb, normalize_encoding
+from .input_processor import ROUND_TRUNCATE, ROUNDING_MODES
+from .stream import FORMATS, convert_stream
+
+# 流式模式下的读写缓冲区大小
+STREAM_BUFFER_SIZE = 1 << 20
+
+def _encoding_option(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[str]:
+    """
+    校验并规范化 --encoding 选项。
+
+    Args:
+        ctx: click 上下文
+        param: 选项
+        value: 选项值
+
+    Returns:
+        Optional[str]: 编码的规范名称，未指定时为 None
+
+    Raises:
+        click.BadParameter: 当编码不受支持时抛出
+    """
+    if value is None:
+        return None
+    try:
+        return normalize_encoding(value)
+    except ValueError as e:
+        raise click.BadParameter(f"{e}（可选: {', '.join(ENCODINGS)}）") from e
+
+@click.command()
+@click.argument('amount', required=False)
+@click.option('--stdin', 'use_stdin', is_flag=True, help='从标准输入逐行读取金额')
+@click.option('--input', '-i', 'input_path', type=click.Path(exists=True, dir_okay=False),
+              help='从文件逐行读取金额')
+@click.option('--format', '-f', 'fmt', type=click.Choice(FORMATS), default='text',
+              show_default=True, help='流式模式的记录格式')
+@click.option('--column', '-c', help='CSV/TSV 列名或 JSONL 键名')
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=1, show_default=True,
+              help='并行转换 --input 文件的工作进程数')
+@click.option('--profile', is_flag=True, help='流式模式结束后输出各阶段耗时统计')
+@click.option('--profile-output', type=click.Path(dir_okay=False, writable=True),
+              help='将 cProfile 结果写入指定文件（隐含 --profile）')
+@click.option('--encoding', '-e', callback=_encoding_option,
+              help=f"按指定编码直接输出字节（{', '.join(ENCODINGS)}）")
+def main(
+    amount: Optional[str] = None,
+    use_stdin: bool = False,
+    input_path: Optional[str] = None,
+    fmt: str = 'text',
+    column: Optional[str] = None,
+    workers: int = 1,
+    profile: bool = False,
+    profile_output: Optional[str] = None,
+    encoding: Optional[str] = None,
+) -> int:
+    """
+    命令行入口函数。
+
+    Args:
+        amount: 要转换的金额字符串
+        use_stdin: 是否从标准输入流式读取
+        input_path: 流式读取的输入文件路径
+        fmt: 流式模式的记录格式
+        column: 金额所在的列名或键名
+        workers: 并行转换的工作进程数
+        profile: 是否输出各阶段耗时统计
+        profile_output: cProfile 结果文件路径
+        encoding: 输出编码，为 None 时按标准输出的文本编码输出
+
+    Returns:
+        int: 退出码
+    """
+    if use_stdin or input_path:
+        if profile or profile_output:
+            sys.exit(_run_profiled(input_path, fmt, column, workers, profile_output, encoding))
+        sys.exit(_run_stream(input_path, fmt, column, workers, encoding))
+
+    if not amount:
+        click.echo("请输入一个数字金额", err=True)
+        sys.exit(1)
+
+    try:
+        if encoding:
+            sys.stdout.buffer.write(encode_rmb(amount, encoding) + NEWLINE)
+        else:
+            click.echo(convert_to_rmb(amount))
+        return 0
+    except (ValueError, OverflowError) as e:
+        click.echo(f"错误: {str(e)}", err=True)
+        sys.exit(1)
+
+def _run_stream(
+    input_path: Optional[str],
+    fmt: str,
+    column: Optional[str],
+    workers: int = 1,
+    encoding: Optional[str] = None,
+) -> int:
+    """
+    执行流式转换。
+
+    指定编码时，纯文本格式直接写出预先编码的字节；其他格式和并行转换
+    通过该编码的文本包装写出。
+
+    Args:
+        input_path: 输入文件路径，为 None 时读取标准输入
+        fmt: 记录格式
+        column: 金额所在的列名或键名
+        workers: 工作进程数，大于1时并行转换输入文件
+        encoding: 输出编码，为 None 时按标准输出的文本编码输出
+
+    Returns:
+        int: 退出码，存在无效行时为1
+    """
+    outfile = sys.stdout
+    errfile = sys.stderr
+    if workers > 1 and not input_path:
+        click.echo("错误: 并行转换需要使用 --input 指定文件", err=True)
+        return 1
+
+    binary = None
+    direct = False
+    if encoding:
+        outfile.flush()
+        binary = sys.stdout.buffer
+        direct = fmt == 'text' and workers == 1
+        if not direct:
+            outfile = io.TextIOWrapper(binary, encoding=encoding, newline='')
+
+    try:
+        if direct:
+            if input_path:
+                with open(input_path, encoding='utf-8', newline='',
+                          buffering=STREAM_BUFFER_SIZE) as infile:
+                    converted, failed = convert_stream_encoded(infile, binary, encoding, errfile)
+            else:
+                converted, failed = convert_stream_encoded(sys.stdin, binary, encoding, errfile)
+        elif workers > 1:
+            # multiprocessing 导入较慢，只在并行转换时加载
+            from .parallel import convert_file_parallel
+
+            converted, failed = convert_file_parallel(
+                input_path, outfile, workers, fmt, column, errfile)
+        elif input_path:
+            with open(input_path, encoding='utf-8', newline='',
+                      buffering=STREAM_BUFFER_SIZE) as infile:
+                converted, failed = convert_stream(infile, outfile, fmt, column, errfile)
+        else:
+            infile = sys.stdin
+            converted, failed = convert_stream(infile, outfile, fmt, column, errfile)
+    except ValueError as e:
+        click.echo(f"错误: {str(e)}", err=True)
+        return 1
+    finally:
+        outfile.flush()
+        if binary is not None:
+            if not direct:
+                # 只卸下包装，不关闭标准输出
+                outfile.detach()
+            binary.flush()
+
+    if failed:
+        click.echo(f"共 {converted + failed} 行，{failed} 行无效", err=True)
+        return 1
+    return 0
+
+def _run_profiled(
+    input_path: Optional[str],
+    fmt: str,
+    column: Optional[str],
+    workers: int,
+    profile_output: Optional[str],
+    encoding: Optional[str] = None,
+) -> int:
+    """
+    在分阶段计时下执行流式转换，结束后向标准错误输出统计。
+
+    Args:
+        input_path: 输入文件路径，为 None 时读取标准输入
+        fmt: 记录格式
+        column: 金额所在的列名或键名
+        workers: 工作进程数
+        profile_output: cProfile 结果文件路径，为 None 时不启用 cProfile
+        encoding: 输出编码
+
+    Returns:
+        int: 退出码
+    """
+    if workers > 1:
+        click.echo("错误: 分阶段计时不支持并行转换", err=True)
+        return 1
+
+    from . import metrics
+
+    profiler = None
+    if profile_output:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    metrics.reset_metrics()
+    metrics.enable_metrics()
+    try:
+        if profiler is not None:
+            exit_code = profiler.runcall(_run_stream, input_path, fmt, column, 1, encoding)
+        else:
+            exit_code = _run_stream(input_path, fmt, column, 1, encoding)
+    finally:
+        metrics.disable_metrics()
+
+    click.echo(metrics.format_metrics(metrics.get_metrics()), err=True)
+    if profiler is not None:
+        profiler.dump_stats(profile_output)
+        click.echo(f"cProfile 结果已写入 {profile_output}", err=True)
+    return exit_code
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='监听的主机地址')
+@click.option('--port', type=int, default=8765, show_default=True, help='监听端口')
+@click.option('--unix', 'unix_socket', type=click.Path(dir_okay=False),
+              help='改为监听 Unix 域套接字')
+def serve(host: str = '127.0.0.1', port: int = 8765, unix_socket: Optional[str] = None) -> int:
+    """
+    启动常驻转换服务。
+
+    Args:
+        host: 监听的主机地址
+        port: 监听端口
+        unix_socket: Unix 域套接字路径，指定时忽略 host 和 port
+
+    Returns:
+        int: 退出码
+    """
+    from .server import serve as run_server
+
+    address = unix_socket or f"http://{host}:{port}"
+    click.echo(f"转换服务已启动: {address}", err=True)
+    run_server(host, port, unix_socket)
+    return 0
+
+@click.command()
+@click.argument('input_path', type=click.Path(exists=True, dir_okay=False))
+@click.argument('output_path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--column', '-c', required=True, help='金额列名')
+@click.option('--output-column', default='rmb', show_default=True, help='结果列名')
+@click.option('--error-column', default='rmb_error', show_default=True, help='错误信息列名')
+@click.option('--rounding', type=click.Choice(ROUNDING_MODES), default=ROUND_TRUNCATE,
+              show_default=True, help='小数超过两位时的舍入方式')
+def parquet(
+    input_path: str,
+    output_path: str,
+    column: str,
+    output_column: str = 'rmb',
+    error_column: str = 'rmb_error',
+    rounding: str = ROUND_TRUNCATE,
+) -> int:
+    """
+    逐个行组转换 Parquet 文件中的金额列，追加结果列和错误列后写出。
+
+    Args:
+        input_path: 输入 Parquet 文件路径
+        output_path: 输出 Parquet 文件路径
+        column: 金额列名
+        output_column: 结果列名
+        error_column: 错误信息列名
+        rounding: 舍入方式
+
+    Returns:
+        int: 退出码
+    """
+    try:
+        from .arrow import convert_parquet
+    except ImportError as e:
+        click.echo(f"错误: {str(e)}", err=True)
+        sys.exit(1)
+
+    try:
+        rows, failed = convert_parquet(input_path, output_path, column, output_column,
+                                       error_column, rounding)
+    except ValueError as e:
+        click.echo(f"错误: {str(e)}", err=True)
+        sys.exit(1)
+
+    if failed:
+        click.echo(f"共 {rows} 行，{failed} 行无效", err=True)
+        sys.exit(1)
+    return 0
@@ -0,0 +1,261 @@
+"""按指定编码直接输出字节的转换模块。
+
+银行导出文件常要求 GB18030 或 GBK 编码。逐行先得到 str 再 encode 会使热路径上的
+工作量和临时对象加倍，此模块改为直接拼接预先编码的表：
+1. 每种支持的编码在首次使用时预先编码四位数表、节单位、状态机前缀和角分后缀
+2. 整数部分由 chinese_currency.convert_integer_with 按预先编码的表逐节输出字节，不生成中间 str
+3. 结果直接追加到调用方提供的 bytearray，convert_stream_encoded 攒满缓冲区后整块写出
+
+输出与 convert_to_rmb(...).encode(encoding) 逐字节一致。
+"""
+import codecs
+from typing import IO, BinaryIO, Dict, Optional, Tuple
+
+from .cache import cached
+from .chinese_currency import (
+    FOUR_DIGITS,
+    SECTION_TRANSITIONS,
+    YUAN_SUFFIXES,
+    ZERO_YUAN_RESULTS,
+    IntegerTables,
+    convert_integer_with,
+)
+from .input_processor import ROUND_TRUNCATE, process_number
+from .stream import iter_amounts
+from .units import UNITS_WANYI, WANYI_UNITS, ZHAOJING_UNITS, wanyi_unit
+
+# 支持的输出编码（codecs 的规范名称）
+ENCODINGS = ('utf-8', 'gb18030', 'gbk')
+
+# 各编码下的换行符相同
+NEWLINE = b'\n'
+
+# convert_stream_encoded 的输出缓冲区大小，攒满后整块写出
+FLUSH_SIZE = 1 << 16
+
+
+class EncodedTables(IntegerTables[bytes]):
+    """一种编码下预先编码的转换表。"""
+
+    def __init__(self, encoding: str) -> None:
+        """
+        Args:
+            encoding: 编码的规范名称
+        """
+        self.encoding = encoding
+        four_digits = tuple(text.encode(encoding) for text in FOUR_DIGITS)
+        super().__init__(
+            b'',
+            four_digits,
+            four_digits,
+            tuple(
+                tuple((state, None if prefix is None else prefix.encode(encoding))
+                      for state, prefix in row)
+                for row in SECTION_TRANSITIONS
+            ),
+            tuple(tuple(unit.encode(encoding) for unit in row) for row in WANYI_UNITS),
+            tuple(unit.encode(encoding) for unit in ZHAOJING_UNITS),
+        )
+        self.yuan_suffixes = {decimal: text.encode(encoding)
+                              for decimal, text in YUAN_SUFFIXES.items()}
+        self.zero_yuan_results = {decimal: text.encode(encoding)
+                                  for decimal, text in ZERO_YUAN_RESULTS.items()}
+
+    def long_unit(self, section: int, lower: int) -> bytes:
+        """
+        返回前8节以外的万万亿式单位，已按本编码编码。
+
+        Args:
+            section: 节的序号
+            lower: 其后的下一个非零节的序号，没有时为 -1
+
+        Returns:
+            bytes: 编码后的节单位
+        """
+        return wanyi_unit(section, lower).encode(self.encoding)
+
+
+# 已生成的各编码的表
+_TABLES: Dict[str, EncodedTables] = {}
+
+
+def normalize_encoding(encoding: str) -> str:
+    """
+    将编码名称规范化，例如 'GB18030'、'utf8' 分别规范为 'gb18030'、'utf-8'。
+
+    Args:
+        encoding: 编码名称
+
+    Returns:
+        str: 规范名称，取值见 ENCODINGS
+
+    Raises:
+        ValueError: 当编码不受支持时抛出
+    """
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        name = encoding
+    if name not in ENCODINGS:
+        raise ValueError(f"不支持的输出编码: {encoding}")
+    return name
+
+
+def get_tables(encoding: str) -> EncodedTables:
+    """
+    返回指定编码的表，首次使用时生成。
+
+    Args:
+        encoding: 编码名称
+
+    Returns:
+        EncodedTables: 预先编码的表
+
+    Raises:
+        ValueError: 当编码不受支持时抛出
+    """
+    tables = _TABLES.get(encoding)
+    if tables is None:
+        encoding = normalize_encoding(encoding)
+        tables = _TABLES.get(encoding)
+        if tables is None:
+            tables = _TABLES[encoding] = EncodedTables(encoding)
+    return tables
+
+
+def encode_integer(number: str, tables: EncodedTables, units: str = UNITS_WANYI) -> bytes:
+    """
+    将整数直接转换为编码后的中文大写，逐节规则见 chinese_currency.convert_integer_with。
+
+    Args:
+        number: 要转换的整数字符串
+        tables: 目标编码的表
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
+
+    Returns:
+        bytes: 编码后的中文大写
+
+    Raises:
+        ValueError: 当单位体系不受支持时抛出
+        OverflowError: 当位数超出单位体系的范围时抛出
+    """
+    return convert_integer_with(number, tables, units)
+
+
+@cached('format_rmb_encoded', 1024)
+def format_rmb_encoded(
+    integer: str, decimal: str, encoding: str = 'utf-8', units: str = UNITS_WANYI
+) -> bytes:
+    """
+    格式化人民币金额并直接输出编码后的字节。
+
+    Args:
+        integer: 整数部分
+        decimal: 小数部分
+        encoding: 输出编码，取值见 ENCODINGS
+        units: 大数单位体系，取值见 units.UNIT_SYSTEMS
+
+    Returns:
+        bytes: 编码后的人民币大写金额
+
+    Raises:
+        ValueError: 当编码不受支持时抛出
+    """
+    tables = get_tables(encoding)
+    if integer == '0':
+        return tables.zero_yuan_results[decimal]
+    return encode_integer(integer, tables, units) + tables.yuan_suffixes[decimal]
+
+
+def encode_rmb(amount: str, encoding: str = 'utf-8', rounding: str = ROUND_TRUNCATE) -> bytes:
+    """
+    将数字金额转换为编码后的人民币大写，等价于 convert_to_rmb(amount).encode(encoding)。
+
+    Args:
+        amount: 数字金额字符串
+        encoding: 输出编码，取值见 ENCODINGS
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+
+    Returns:
+        bytes: 编码后的人民币大写金额
+
+    Raises:
+        ValueError: 当输入格式无效或编码不受支持时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    integer, decimal = process_number(amount, rounding)
+    return format_rmb_encoded(integer, decimal, get_tables(encoding).encoding)
+
+
+def append_rmb(
+    buffer: bytearray, amount: str, encoding: str = 'utf-8', rounding: str = ROUND_TRUNCATE
+) -> int:
+    """
+    将数字金额转换为编码后的人民币大写，追加到 buffer 末尾。
+
+    Args:
+        buffer: 输出缓冲区
+        amount: 数字金额字符串
+        encoding: 输出编码，取值见 ENCODINGS
+        rounding: 小数超过两位时的舍入方式
+
+    Returns:
+        int: 追加的字节数
+
+    Raises:
+        ValueError: 当输入格式无效或编码不受支持时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    data = encode_rmb(amount, encoding, rounding)
+    buffer += data
+    return len(data)
+
+
+def convert_stream_encoded(
+    infile: IO[str],
+    outfile: BinaryIO,
+    encoding: str = 'utf-8',
+    errfile: Optional[IO[str]] = None,
+    rounding: str = ROUND_TRUNCATE,
+) -> Tuple[int, int]:
+    """
+    逐行转换纯文本输入中的金额，按指定编码直接写出字节，每行一个结果。
+
+    结果先追加到内部的 bytearray，超过 FLUSH_SIZE 后整块写出；
+    无效行写入 errfile 后继续处理后续行。
+
+    Args:
+        infile: 输入文本流，每行一个金额
+        outfile: 输出二进制流
+        encoding: 输出编码，取值见 ENCODINGS
+        errfile: 错误信息输出流，为 None 时不报告错误
+        rounding: 小数超过两位时的舍入方式
+
+    Returns:
+        Tuple[int, int]: 成功转换的行数和无效行数
+
+    Raises:
+        ValueError: 当编码不受支持时抛出
+    """
+    encoding = get_tables(encoding).encoding
+    process = process_number
+    fmt = format_rmb_encoded
+    buffer = bytearray()
+    converted = 0
+    failed = 0
+    for line_no, amount in iter_amounts(infile):
+        try:
+            buffer += fmt(*process(amount, rounding), encoding)
+        except (ValueError, OverflowError) as e:
+            failed += 1
+            if errfile is not None:
+                errfile.write(f"第{line_no}行: 错误: {e} ({amount!r})\n")
+            continue
+        buffer += NEWLINE
+        converted += 1
+        if len(buffer) >= FLUSH_SIZE:
+            outfile.write(buffer)
+            buffer.clear()
+    if buffer:
+        outfile.write(buffer)
+    return converted, failed
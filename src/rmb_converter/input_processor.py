@@ -2,17 +2,122 @@
 
 This module handles input validation and processing for RMB numbers.
 """
-from typing import Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 # 常量定义
 MAX_INTEGER_LENGTH = 12  # 最大整数位数（万亿级）
 
-def validate_number(input_str: str) -> float:
+# 小数部分超过两位时的舍入方式
+ROUND_TRUNCATE = 'truncate'  # 直接截断（默认，见 spec.md）
+ROUND_HALF_UP = 'half-up'  # 四舍五入
+ROUND_HALF_EVEN = 'half-even'  # 四舍六入五成双（银行家舍入）
+ROUNDING_MODES = (ROUND_TRUNCATE, ROUND_HALF_UP, ROUND_HALF_EVEN)
+
+# 整数部分的上限（不含）
+_MAX_YUAN = 10 ** MAX_INTEGER_LENGTH
+
+# 不限整数位数时，科学记数法展开后的整数位数上限，避免 "1e999999999" 耗尽内存
+MAX_EXPANDED_LENGTH = 1 << 16
+
+# 错误码：无错误、格式无效、整数部分超出位数限制
+ERROR_NONE = 0
+ERROR_INVALID = 1
+ERROR_OVERFLOW = 2
+ERROR_CODES = (ERROR_NONE, ERROR_INVALID, ERROR_OVERFLOW)
+
+# 0-99 对应的两位小数字符串
+_CENT_STRINGS: Tuple[str, ...] = tuple(f'{i:02d}' for i in range(100))
+
+# 不足两位的小数数字串补零后的结果
+_PADDED_CENTS: Dict[str, str] = {'': _CENT_STRINGS[0]}
+_PADDED_CENTS.update((str(i), _CENT_STRINGS[i * 10]) for i in range(10))
+
+# 规范化前端：全角 ASCII 字符（全角数字、小数点、逗号、正负号、字母）转为半角，
+# 全角空格和不换行空格转为空格，全角人民币符号转为 ¥。
+# ASCII 字符和 ¥ 也映射为自身：str.translate 查不到的字符要走异常路径，比查到慢数倍
+_NORMALIZE_TABLE: Dict[int, int] = {i: i for i in range(0x80)}
+_NORMALIZE_TABLE.update({0xFF01 + i: 0x21 + i for i in range(94)})
+_NORMALIZE_TABLE.update({0x3000: 0x20, 0xA0: 0x20, 0xA5: 0xA5, 0xFFE5: 0xA5})
+
+# 允许出现在金额前的货币标记（RMB 不区分大小写）
+CURRENCY_PREFIXES = ('¥', 'RMB')
+
+def normalize_amount(input_str: str) -> str:
+    """
+    将带千位分隔符、货币标记或全角字符的金额规范为 process_number 接受的写法。
+
+    先按预编译的表做一次 str.translate（纯 ASCII 输入跳过这一步），再按位置校验千位分隔符：
+    分隔符只能出现在整数部分，首组1-3位，其后每组恰好3位。
+
+    Args:
+        input_str: 输入的字符串，例如 "1,234,567.89"、"¥1,234.00"、"RMB 500"、"１２３．４５"
+
+    Returns:
+        str: 去除货币标记和千位分隔符后的金额字符串，保留正负号，其余字符交由 process_number 校验
+             例如："-¥1,234.5" -> "-1234.5"
+
+    Raises:
+        ValueError: 当千位分隔符位置不正确或货币标记后没有金额时抛出
+    """
+    text = input_str if input_str.isascii() else input_str.translate(_NORMALIZE_TABLE)
+    text = text.strip()
+    sign = text[:1]
+    if sign in ('+', '-'):
+        text = text[1:]
+    else:
+        sign = ''
+    prefixed = True
+    first = text[:1]
+    if first == '¥':
+        text = text[1:].lstrip()
+    elif first in ('R', 'r') and text[:3].upper() == 'RMB':
+        text = text[3:].lstrip()
+    else:
+        prefixed = False
+    if prefixed:
+        if not sign and text[:1] in ('+', '-'):
+            # 正负号也可以写在货币标记之后，例如 "¥-5"
+            sign = text[:1]
+            text = text[1:]
+        if not text:
+            raise ValueError("输入必须为有效数字")
+    if ',' in text:
+        text = _strip_separators(text)
+    return sign + text if sign else text
+
+def _strip_separators(text: str) -> str:
+    """
+    校验并去除千位分隔符。
+
+    Args:
+        text: 不含正负号和货币标记的金额字符串
+
+    Returns:
+        str: 去除分隔符后的字符串
+
+    Raises:
+        ValueError: 当分隔符不在整数部分，或分组不是首组1-3位、其余每组3位时抛出
+    """
+    head = text.find(',')
+    point = text.find('.')
+    end = len(text) if point < 0 else point
+    groups = (end - head) >> 2
+    # 逗号只能出现在 head, head+4, ... 各位置，且整数部分在最后一个逗号后恰好3位
+    if not (0 < head <= 3 and (end - head) & 3 == 0
+            and text.count(',') == groups and text[head:end:4] == ',' * groups):
+        raise ValueError("输入必须为有效数字")
+    return text.replace(',', '')
+
+def validate_number(input_str: str, normalize: bool = False) -> float:
     """
     验证输入字符串是否为合法数字，并检查整数部分是否超过限制。
 
     Args:
         input_str: 输入的字符串
+        normalize: 是否先接受千位分隔符、¥/RMB 标记和全角字符，见 normalize_amount
 
     Returns:
         float: 转换后的浮点数
@@ -21,28 +126,207 @@ def validate_number(input_str: str) -> float:
         ValueError: 当输入不是有效数字时抛出
         OverflowError: 当整数部分超过12位时抛出
     """
-    try:
-        # 使用float()函数验证输入是否为合法数字，同时处理正负数、科学记数法等格式
-        number = float(input_str)
-        
-        # 使用abs()处理负数，确保负号不影响位数计算
-        # 使用int()去除小数部分，只关注整数位数
-        # 使用lstrip('0')去除前导零，确保正确计算位数
-        # 例如："-000123.45" -> "123"
-        integer_part = str(int(abs(number))).lstrip('0')
-        
-        if len(integer_part) > MAX_INTEGER_LENGTH:
-            raise OverflowError(f"整数部分超出{MAX_INTEGER_LENGTH}位限制")
-        return number
-    except ValueError:
-        raise ValueError("输入必须为有效数字")
+    # 直接按数字字符校验格式和整数位数，不经过浮点数，避免精度损失
+    if normalize:
+        input_str = normalize_amount(input_str)
+    _split_digits(input_str)
+    return float(input_str)
+
+def scan_digits(
+    input_str: str, max_length: Optional[int] = MAX_INTEGER_LENGTH
+) -> Tuple[int, str, str]:
+    """
+    按字符拆分金额字符串，不抛出异常，以错误码表示无效输入。
+
+    支持正负号、首尾空白和科学记数法（如 "1.5e3"），全程只做字符串操作，
+    因此对任意位数都是精确的。
+
+    Args:
+        input_str: 输入的字符串
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Tuple[int, str, str]: 错误码（见 ERROR_CODES）、去除前导零的整数数字串（可能为空）
+                             和完整的小数数字串；有错误时两个数字串均为空
+                             例如："-000123.45" -> (ERROR_NONE, "123", "45")
+                                  "1.5e3" -> (ERROR_NONE, "1500", "")
+    """
+    text = input_str.strip()
+    if text[:1] in ('+', '-'):
+        text = text[1:]
+
+    exponent = 0
+    if 'e' in text or 'E' in text:
+        text, _, exp_str = text.replace('E', 'e').partition('e')
+        if exp_str[:1] in ('+', '-'):
+            exp_digits = exp_str[1:]
+        else:
+            exp_digits = exp_str
+        if not (exp_digits.isascii() and exp_digits.isdigit()):
+            return ERROR_INVALID, '', ''
+        exponent = int(exp_str)
+
+    integer, _, fraction = text.partition('.')
+    # 两部分分别校验，不为校验另拼字符串；两部分不能都为空
+    if not (text.isascii() and (integer or fraction)
+            and (not integer or integer.isdigit()) and (not fraction or fraction.isdigit())):
+        return ERROR_INVALID, '', ''
+
+    if exponent:
+        # 移动小数点：point 为小数点在 digits 中的位置
+        digits = integer + fraction
+        point = len(integer) + exponent
+        significant = digits.lstrip('0')
+        if not significant:
+            return ERROR_NONE, '', ''
+        limit = MAX_EXPANDED_LENGTH if max_length is None else max_length
+        if point - (len(digits) - len(significant)) > limit:
+            return ERROR_OVERFLOW, '', ''
+        if point <= 0:
+            # 小数点后至少有一个零时，只需保留舍入所需的位数
+            fraction = '0' * min(-point, 3) + digits
+            integer = ''
+        else:
+            digits = digits.ljust(point, '0')
+            integer, fraction = digits[:point], digits[point:]
+
+    integer = integer.lstrip('0')
+    if max_length is not None and len(integer) > max_length:
+        return ERROR_OVERFLOW, '', ''
+    return ERROR_NONE, integer, fraction
+
+def error_for(code: int, max_length: Optional[int] = MAX_INTEGER_LENGTH) -> Exception:
+    """
+    返回错误码对应的异常，消息与抛出异常的接口一致。
+
+    Args:
+        code: 错误码，不能为 ERROR_NONE
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Exception: ERROR_OVERFLOW 为 OverflowError，其余为 ValueError
+    """
+    if code == ERROR_OVERFLOW:
+        limit = MAX_EXPANDED_LENGTH if max_length is None else max_length
+        return OverflowError(f"整数部分超出{limit}位限制")
+    return ValueError("输入必须为有效数字")
+
+def _split_digits(
+    input_str: str, max_length: Optional[int] = MAX_INTEGER_LENGTH
+) -> Tuple[str, str]:
+    """
+    按字符拆分金额字符串，返回整数部分和小数部分的数字串。
+
+    Args:
+        input_str: 输入的字符串
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Tuple[str, str]: 去除前导零的整数数字串（可能为空）和完整的小数数字串，见 scan_digits
+
+    Raises:
+        ValueError: 当输入不是有效数字时抛出
+        OverflowError: 当整数部分超过 max_length 位时抛出
+    """
+    code, integer, fraction = scan_digits(input_str, max_length)
+    if code:
+        raise error_for(code, max_length)
+    return integer, fraction
 
-def process_number(input_str: str) -> Tuple[str, str]:
+def _round_cents(
+    integer: str, fraction: str, rounding: str, max_length: Optional[int] = MAX_INTEGER_LENGTH
+) -> Tuple[str, str]:
+    """
+    将小数部分按舍入方式规整为两位。
+
+    Args:
+        integer: 去除前导零的整数数字串（可能为空）
+        fraction: 小数数字串
+        rounding: 舍入方式，取值见 ROUNDING_MODES
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Tuple[str, str]: 整数部分和两位小数部分
+
+    Raises:
+        ValueError: 当舍入方式不受支持时抛出
+        OverflowError: 当进位后整数部分超过 max_length 位时抛出
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"不支持的舍入方式: {rounding}")
+    if len(fraction) == 2:
+        # 最常见的情况：恰好两位小数，无需补位或舍入
+        return integer or '0', fraction
+
+    if len(fraction) < 2:
+        # 不足两位时无需舍入，取预先生成的补零结果，不另建字符串
+        return integer or '0', _PADDED_CENTS[fraction]
+
+    cents = fraction[:2]
+    rest = fraction[2:]
+    if rounding == ROUND_TRUNCATE:
+        return integer or '0', cents
+
+    first = rest[0]
+    if rounding == ROUND_HALF_UP:
+        round_up = first >= '5'
+    else:
+        # 银行家舍入：恰好为5时向偶数舍入；100为偶数，因此只看分位的奇偶
+        round_up = first > '5' or (
+            first == '5' and (rest[1:].strip('0') != '' or int(cents[1]) % 2 == 1)
+        )
+
+    if not round_up:
+        return integer or '0', cents
+
+    value = int(cents) + 1
+    if value < 100:
+        return integer or '0', _CENT_STRINGS[value]
+
+    # 分位进位到元：在字符串上加一，不受整数与字符串转换的位数限制
+    kept = integer.rstrip('9')
+    nines = len(integer) - len(kept)
+    if kept:
+        integer = kept[:-1] + chr(ord(kept[-1]) + 1) + '0' * nines
+    else:
+        integer = '1' + '0' * nines
+    if max_length is not None and len(integer) > max_length:
+        raise OverflowError(f"整数部分超出{max_length}位限制")
+    return integer, '00'
+
+def parse_amount(input_str: str, rounding: str = ROUND_TRUNCATE) -> Tuple[int, int]:
+    """
+    精确解析金额字符串，返回整数元和分。
+
+    Args:
+        input_str: 输入的数字字符串
+        rounding: 小数超过两位时的舍入方式，取值见 ROUNDING_MODES
+
+    Returns:
+        Tuple[int, int]: 元和分（0-99），均为非负整数
+                        例如："-123.456" -> (123, 45)
+
+    Raises:
+        ValueError: 当输入无效或舍入方式不受支持时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    integer, cents = _round_cents(*_split_digits(input_str), rounding)
+    return int(integer), int(cents)
+
+def process_number(
+    input_str: str,
+    rounding: str = ROUND_TRUNCATE,
+    max_length: Optional[int] = MAX_INTEGER_LENGTH,
+    normalize: bool = False,
+) -> Tuple[str, str]:
     """
     处理输入的数字字符串，返回规范化的整数和小数部分。
 
     Args:
         input_str: 输入的数字字符串
+        rounding: 小数超过两位时的舍入方式，取值见 ROUNDING_MODES，默认截断
+        max_length: 整数部分的最大位数，None 表示不限，见 units.max_integer_length
+        normalize: 是否先接受千位分隔符、¥/RMB 标记和全角字符，见 normalize_amount
 
     Returns:
         Tuple[str, str]: 包含整数部分和小数部分的元组
@@ -54,17 +338,105 @@ def process_number(input_str: str) -> Tuple[str, str]:
         ValueError: 当输入无效时抛出
         OverflowError: 当数字超出范围时抛出
     """
-    # 首先验证输入的合法性
-    number = validate_number(input_str)
-    
-    # 使用abs()处理负数，因为人民币大写金额使用"负"字来表示负数
-    # 使用.2f格式化确保小数部分始终为两位
-    formatted = f"{abs(number):.2f}"
-    
-    # 分割整数和小数部分
-    parts = formatted.split('.')
-    
-    # 处理整数部分：
-    # 1. lstrip('0')去除前导零
-    # 2. or '0' 处理特殊情况：如果整数部分全为零，返回"0"而不是空字符串
-    return parts[0].lstrip('0') or '0', parts[1] 
\ No newline at end of file
+    # 直接在字符串上拆分和舍入，不经过浮点数，保证任意位数的精度
+    # 负号被忽略，因为人民币大写金额不表示正负
+    if normalize:
+        input_str = normalize_amount(input_str)
+    code, integer, fraction = scan_digits(input_str, max_length)
+    if code:
+        raise error_for(code, max_length)
+    return _round_cents(integer, fraction, rounding, max_length)
+
+def split_cents(cents: int) -> Tuple[str, str]:
+    """
+    将以分为单位的整数金额拆分为规范化的整数和小数部分。
+
+    Args:
+        cents: 以分为单位的金额，负数按绝对值处理
+
+    Returns:
+        Tuple[str, str]: 与 process_number 相同格式的整数部分和两位小数部分
+                        例如：12345 -> ("123", "45")
+
+    Raises:
+        ValueError: 当输入不是整数（含 bool）时抛出
+        OverflowError: 当整数部分超过12位时抛出
+    """
+    if not isinstance(cents, int) or isinstance(cents, bool):
+        raise ValueError("输入必须为有效数字")
+    yuan, fen = divmod(abs(cents), 100)
+    if yuan >= _MAX_YUAN:
+        raise OverflowError(f"整数部分超出{MAX_INTEGER_LENGTH}位限制")
+    return str(yuan), _CENT_STRINGS[fen]
+
+def process_decimal(
+    value: 'Decimal', rounding: str = ROUND_TRUNCATE, max_length: Optional[int] = MAX_INTEGER_LENGTH
+) -> Tuple[str, str]:
+    """
+    处理 Decimal 金额，返回规范化的整数和小数部分。
+
+    直接取 value.as_tuple() 的数字和指数拆分整数与小数部分，再按字符串路径舍入，
+    不做 Decimal 运算，因此结果不受上下文精度（默认28位）及其舍入方式的影响。
+
+    Args:
+        value: Decimal 金额
+        rounding: 小数超过两位时的舍入方式，取值见 ROUNDING_MODES
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Tuple[str, str]: 与 process_number 相同格式的整数部分和两位小数部分
+
+    Raises:
+        ValueError: 当输入不是有限数或舍入方式不受支持时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    if not value.is_finite():
+        raise ValueError("输入必须为有效数字")
+    _, digit_tuple, exponent = value.as_tuple()
+    digits = ''.join(map(str, digit_tuple)).lstrip('0')
+    if not digits:
+        return _round_cents('', '', rounding, max_length)
+    # point 为小数点在 digits 中的位置
+    point = len(digits) + int(exponent)
+    limit = MAX_EXPANDED_LENGTH if max_length is None else max_length
+    if point > limit:
+        raise OverflowError(f"整数部分超出{limit}位限制")
+    if point <= 0:
+        # 与 scan_digits 相同：小数点后至少有一个零时，只需保留舍入所需的位数
+        integer, fraction = '', '0' * min(-point, 3) + digits
+    else:
+        digits = digits.ljust(point, '0')
+        integer, fraction = digits[:point], digits[point:]
+    return _round_cents(integer, fraction, rounding, max_length)
+
+def process_value(
+    value: Union[int, float, 'Decimal'],
+    rounding: str = ROUND_TRUNCATE,
+    max_length: Optional[int] = MAX_INTEGER_LENGTH,
+) -> Tuple[str, str]:
+    """
+    处理非字符串金额，返回规范化的整数和小数部分。
+
+    Decimal 交给 process_decimal；整数按十进制文本处理；浮点数按其最短往返表示（repr）处理，
+    例如 1.5 按 "1.5"、0.1 按 "0.1"，与 batch.convert_value 对数值的处理一致。
+
+    Args:
+        value: Decimal、整数或浮点数，bool 不视为金额
+        rounding: 小数超过两位时的舍入方式，取值见 ROUNDING_MODES
+        max_length: 整数部分的最大位数，None 表示不限
+
+    Returns:
+        Tuple[str, str]: 与 process_number 相同格式的整数部分和两位小数部分
+
+    Raises:
+        ValueError: 当类型不受支持、不是有限数或舍入方式不受支持时抛出
+        OverflowError: 当数字超出范围时抛出
+    """
+    # 只有传入非字符串金额时才需要 decimal 模块，字符串路径不加载它
+    from decimal import Decimal
+
+    if isinstance(value, Decimal):
+        return process_decimal(value, rounding, max_length)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"不支持的金额类型: {type(value).__name__}")
+    return process_number(repr(value), rounding, max_length)
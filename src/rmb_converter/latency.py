@@ -0,0 +1,22 @@
+"""延迟统计工具模块。
+
+此模块提供基准测试、压力测试和转换服务共用的分位数计算，不依赖其他模块。
+"""
+from typing import Sequence
+
+
+def percentile(sorted_values: Sequence[int], fraction: float) -> float:
+    """
+    计算已排序数据的分位数（最近秩法）。
+
+    Args:
+        sorted_values: 升序排列的数据
+        fraction: 分位，取值 0-1
+
+    Returns:
+        float: 分位数，数据为空时为0
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(fraction * len(sorted_values) + 0.5) - 1))
+    return float(sorted_values[index])
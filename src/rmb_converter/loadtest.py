@@ -0,0 +1,126 @@
+"""转换服务压力测试脚本。
+
+多个线程各自通过长连接向本机转换服务发送请求，报告客户端延迟分位数和吞吐量，
+并附上服务端统计。未指定服务地址时会在进程内启动一个临时服务。
+
+用法：
+    python -m rmb_converter.loadtest --requests 20000 --concurrency 8
+    python -m rmb_converter.loadtest --unix /tmp/rmb.sock --batch-size 1000
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .benchmark import DISTRIBUTIONS
+from .client import RMBClient
+from .latency import percentile
+from .server import create_server
+
+
+def run_load_test(
+    client_kwargs: Dict[str, Any],
+    requests: int = 10000,
+    concurrency: int = 4,
+    batch_size: int = 1,
+    distribution: str = 'retail',
+) -> Dict[str, float]:
+    """
+    对转换服务施加负载。
+
+    Args:
+        client_kwargs: 创建 RMBClient 的参数
+        requests: 总请求数
+        concurrency: 并发线程数
+        batch_size: 每个请求的金额数，大于1时使用批量接口
+        distribution: 金额分布名称，见 benchmark.DISTRIBUTIONS
+
+    Returns:
+        Dict[str, float]: 包含 requests、rows_per_sec、p50_ns、p99_ns
+    """
+    per_thread = max(1, requests // concurrency)
+    latencies: List[List[int]] = [[] for _ in range(concurrency)]
+
+    def worker(index: int) -> None:
+        cases = DISTRIBUTIONS[distribution](random.Random(index), batch_size * per_thread)
+        samples = latencies[index]
+        now = time.perf_counter_ns
+        with RMBClient(**client_kwargs) as client:
+            for i in range(per_thread):
+                start = now()
+                if batch_size > 1:
+                    client.convert_batch(cases[i * batch_size:(i + 1) * batch_size])
+                else:
+                    client.convert(cases[i])
+                samples.append(now() - start)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    samples = sorted(sample for thread_samples in latencies for sample in thread_samples)
+    return {
+        'requests': len(samples),
+        'rows_per_sec': len(samples) * batch_size / duration if duration else 0.0,
+        'p50_ns': percentile(samples, 0.50),
+        'p99_ns': percentile(samples, 0.99),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行入口。
+
+    Args:
+        argv: 命令行参数，默认读取 sys.argv
+
+    Returns:
+        int: 退出码
+    """
+    parser = argparse.ArgumentParser(description='人民币大写转换服务压力测试')
+    parser.add_argument('--host', default=None, help='服务主机地址，不指定时启动临时服务')
+    parser.add_argument('--port', type=int, default=None, help='服务端口')
+    parser.add_argument('--unix', default=None, help='Unix 域套接字路径')
+    parser.add_argument('--requests', type=int, default=10000, help='总请求数')
+    parser.add_argument('--concurrency', type=int, default=4, help='并发线程数')
+    parser.add_argument('--batch-size', type=int, default=1, help='每个请求的金额数')
+    parser.add_argument('--distribution', default='retail', choices=sorted(DISTRIBUTIONS),
+                        help='金额分布')
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.unix and args.host is None and args.port is None:
+        client_kwargs: Dict[str, Any] = {'unix_socket': args.unix}
+    elif args.host is not None or args.port is not None:
+        client_kwargs = {'host': args.host or '127.0.0.1', 'port': args.port or 8765}
+    else:
+        server = create_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client_kwargs = {'host': '127.0.0.1', 'port': server.server_address[1]}
+
+    try:
+        result = run_load_test(client_kwargs, args.requests, args.concurrency,
+                               args.batch_size, args.distribution)
+        with RMBClient(**client_kwargs) as client:
+            server_stats = client.stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print(f"请求数: {result['requests']:.0f}")
+    print(f"吞吐量: {result['rows_per_sec']:.0f} 行/秒")
+    print(f"客户端延迟: p50 {result['p50_ns'] / 1e3:.1f}微秒, p99 {result['p99_ns'] / 1e3:.1f}微秒")
+    print(f"服务端延迟: p50 {server_stats['p50_ns'] / 1e3:.1f}微秒, "
+          f"p99 {server_stats['p99_ns'] / 1e3:.1f}微秒")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""转换流程分阶段计时模块。
+
+此模块按需统计转换流程各阶段的调用次数、累计耗时和异常次数：
+1. enable_metrics() 将各阶段函数替换为计时包装，disable_metrics() 恢复原函数
+2. 未启用时不做任何替换，热路径没有额外开销
+3. get_metrics() 返回各阶段的统计数据
+
+各阶段耗时为包含式计时，例如 format_rmb 的耗时包含其内部调用的
+convert_integer。计数器未加锁，多线程下的统计为近似值。
+"""
+import time
+from functools import wraps
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+from . import chinese_currency, encoded, input_processor, stream
+from .report import format_table
+
+# 统计表各列的显示宽度：阶段、调用次数、累计耗时、平均耗时、异常率
+METRICS_COLUMNS = (20, 12, 12, 12, 10)
+
+# 被计时的阶段：(所在模块, 函数名)。替换模块属性后，模块内按全局名称的调用都会经过计时包装。
+# 按编码直接输出的流式转换（encoded.convert_stream_encoded）不经过 convert_to_rmb，
+# 其 process_number 与字符串路径共用计数器，格式化阶段单独统计。
+STAGES: Tuple[Tuple[ModuleType, str], ...] = (
+    (chinese_currency, 'convert_to_rmb'),
+    (stream, 'convert_to_rmb'),
+    (chinese_currency, 'process_number'),
+    (encoded, 'process_number'),
+    (input_processor, 'scan_digits'),
+    (chinese_currency, 'format_rmb'),
+    (chinese_currency, 'convert_integer'),
+    (encoded, 'format_rmb_encoded'),
+    (encoded, 'encode_integer'),
+)
+
+# 各阶段的 [调用次数, 累计纳秒, 异常次数]
+# 同名阶段（如流式模块引用的 convert_to_rmb）共用一组计数器
+_COUNTERS: Dict[str, List[int]] = {name: [0, 0, 0] for _, name in STAGES}
+
+# 启用期间被替换的原函数
+_ORIGINALS: Dict[Tuple[ModuleType, str], Callable[..., Any]] = {}
+
+
+def _timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    生成记录调用次数、耗时和异常的包装函数。
+
+    Args:
+        name: 阶段名称
+        func: 原函数
+
+    Returns:
+        Callable[..., Any]: 计时包装函数
+    """
+    counter = _COUNTERS[name]
+    now = time.perf_counter_ns
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = now()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            counter[2] += 1
+            raise
+        finally:
+            counter[0] += 1
+            counter[1] += now() - start
+
+    return wrapper
+
+
+def metrics_enabled() -> bool:
+    """
+    返回是否已启用分阶段计时。
+
+    Returns:
+        bool: 已启用时为 True
+    """
+    return bool(_ORIGINALS)
+
+
+def enable_metrics() -> None:
+    """启用分阶段计时，重复调用无副作用。"""
+    if _ORIGINALS:
+        return
+    for module, name in STAGES:
+        original = getattr(module, name)
+        _ORIGINALS[(module, name)] = original
+        setattr(module, name, _timed(name, original))
+
+
+def disable_metrics() -> None:
+    """停用分阶段计时并恢复原函数，已统计的数据保留。"""
+    for (module, name), original in _ORIGINALS.items():
+        setattr(module, name, original)
+    _ORIGINALS.clear()
+
+
+def reset_metrics() -> None:
+    """清零所有阶段的统计数据。"""
+    for counter in _COUNTERS.values():
+        counter[:] = [0, 0, 0]
+
+
+def get_metrics() -> Dict[str, Dict[str, float]]:
+    """
+    返回各阶段的统计数据。
+
+    Returns:
+        Dict[str, Dict[str, float]]: 阶段名称到统计数据的映射，统计数据包含
+            calls（调用次数）、total_ns（累计纳秒）、errors（异常次数）、
+            mean_ns（平均纳秒）和 error_rate（异常比例）
+    """
+    metrics = {}
+    for name, (calls, total_ns, errors) in _COUNTERS.items():
+        metrics[name] = {
+            'calls': calls,
+            'total_ns': total_ns,
+            'errors': errors,
+            'mean_ns': total_ns / calls if calls else 0.0,
+            'error_rate': errors / calls if calls else 0.0,
+        }
+    return metrics
+
+
+def format_metrics(metrics: Dict[str, Dict[str, float]]) -> str:
+    """
+    将统计数据格式化为文本表格。
+
+    Args:
+        metrics: get_metrics 的返回值
+
+    Returns:
+        str: 文本表格
+    """
+    rows = [
+        (name, f"{stats['calls']:.0f}", f"{stats['total_ns'] / 1e6:.2f}",
+         f"{stats['mean_ns']:.0f}", f"{stats['error_rate']:.2%}")
+        for name, stats in metrics.items()
+    ]
+    headers = ('阶段', '调用次数', '累计(ms)', '平均(ns)', '异常率')
+    return format_table(headers, rows, METRICS_COLUMNS)
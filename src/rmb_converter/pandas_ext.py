@@ -0,0 +1,112 @@
+"""pandas Series 访问器模块。
+
+导入此模块后，Series 上注册 rmb 访问器：
+
+    df['amount'].rmb.upper()
+
+整列先用 pd.factorize 去重，只把不同的取值交给 batch 模块转换，再按下标展开：
+1. 空值（None、NaN、NA）的结果为空值
+2. 无效金额不抛出异常，结果为空值，错误信息由 errors() 或 convert() 返回
+
+需要安装可选依赖：pip install rmb-converter[pandas]
+"""
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as e:  # pragma: no cover - 取决于运行环境
+    raise ImportError("pandas 访问器需要 pandas，请执行 pip install rmb-converter[pandas]") from e
+
+from .batch import convert_values
+from .input_processor import ROUND_TRUNCATE
+
+# convert() 返回的结果列和错误列名，与 arrow 模块一致
+OUTPUT_COLUMN = 'rmb'
+ERROR_COLUMN = 'rmb_error'
+
+
+def _expand(codes: np.ndarray, values: List[Optional[str]]) -> np.ndarray:
+    """
+    按 factorize 的下标展开去重后的转换结果。
+
+    Args:
+        codes: 每行对应的取值下标，空值为-1
+        values: 与去重取值一一对应的结果
+
+    Returns:
+        np.ndarray: 每行的结果，对象数组
+    """
+    # 末尾追加 None，下标-1（空值）正好取到它
+    table = np.empty(len(values) + 1, dtype=object)
+    table[:-1] = values
+    return table.take(codes)
+
+
+def convert_series(
+    series: pd.Series, rounding: str = ROUND_TRUNCATE
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    转换金额列，每个不同的取值只转换一次。
+
+    Args:
+        series: 金额列，取值可以是字符串、Decimal、整数或浮点数
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: 与输入同索引的结果列和错误列；
+            空值和无效金额的结果为空值，无效金额的错误列为错误信息，其余为空值
+    """
+    codes, uniques = pd.factorize(series)
+    results, errors = convert_values(uniques.tolist(), rounding)
+    return (pd.Series(_expand(codes, results), index=series.index, name=series.name),
+            pd.Series(_expand(codes, errors), index=series.index, name=series.name))
+
+
+@pd.api.extensions.register_series_accessor('rmb')
+class RmbAccessor:
+    """Series.rmb 访问器。"""
+
+    def __init__(self, series: pd.Series) -> None:
+        """
+        Args:
+            series: 金额列
+        """
+        self._series = series
+
+    def upper(self, rounding: str = ROUND_TRUNCATE) -> pd.Series:
+        """
+        转换为人民币大写，无效金额和空值的结果为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pd.Series: 结果列
+        """
+        return convert_series(self._series, rounding)[0]
+
+    def errors(self, rounding: str = ROUND_TRUNCATE) -> pd.Series:
+        """
+        返回每行的错误信息，可转换的行和空值为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pd.Series: 错误列
+        """
+        return convert_series(self._series, rounding)[1]
+
+    def convert(self, rounding: str = ROUND_TRUNCATE) -> pd.DataFrame:
+        """
+        一次转换同时返回结果和错误信息。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pd.DataFrame: 与输入同索引，包含 rmb 和 rmb_error 两列
+        """
+        results, errors = convert_series(self._series, rounding)
+        return pd.DataFrame({OUTPUT_COLUMN: results, ERROR_COLUMN: errors})
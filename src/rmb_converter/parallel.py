@@ -0,0 +1,224 @@
+"""多进程并行文件转换模块。
+
+此模块将大文件按行边界切分为字节区间，由进程池并行转换，并按原始行序写出结果：
+1. 父进程通过内存映射定位分块边界，不读取文件内容
+2. 各工作进程映射同一文件并只解码自己负责的字节区间
+3. 结果按分块顺序写出，与单进程流式转换的输出完全一致
+
+分块只在换行符处切分，因此 CSV 中包含换行符的引号字段不受支持。
+"""
+import io
+import mmap
+import multiprocessing
+import os
+import threading
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from .stream import DELIMITERS, convert_stream
+
+# 默认分块大小（字节）
+DEFAULT_CHUNK_SIZE = 4 << 20
+
+# 默认每个工作进程同时派发的分块数
+IN_FLIGHT_PER_WORKER = 2
+
+# 工作进程内已映射的文件，避免每个分块重复打开
+_MAPPED: Dict[str, mmap.mmap] = {}
+
+
+def _map_file(path: str) -> mmap.mmap:
+    """
+    以只读方式映射文件，同一进程内复用映射。
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        mmap.mmap: 文件的只读内存映射
+    """
+    mapped = _MAPPED.get(path)
+    if mapped is None:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _MAPPED[path] = mapped
+    return mapped
+
+
+def split_chunks(mapped: mmap.mmap, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    将映射文件按行边界切分为字节区间。
+
+    Args:
+        mapped: 文件的内存映射
+        chunk_size: 目标分块大小（字节）
+
+    Returns:
+        List[Tuple[int, int]]: 按文件顺序排列的 [起始, 结束) 字节区间
+    """
+    size = len(mapped)
+    chunks = []
+    start = 0
+    while start < size:
+        end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def _convert_chunk(
+    task: Tuple[str, int, int, int, str, Optional[str], str]
+) -> Tuple[str, str, int, int]:
+    """
+    转换一个分块，返回格式化后的输出。
+
+    Args:
+        task: 文件路径、起始字节、结束字节、首行行号、记录格式、列名和表头行
+
+    Returns:
+        Tuple[str, str, int, int]: 输出文本、错误信息、成功行数和无效行数
+    """
+    path, start, end, line_no, fmt, column, header = task
+    text = _map_file(path)[start:end].decode('utf-8')
+    if start > 0 and header:
+        # 非首块需补上表头，表头的行号记为首行的前一行
+        text = header + text
+        line_no -= 1
+    outfile = io.StringIO()
+    errfile = io.StringIO()
+    converted, failed = convert_stream(
+        io.StringIO(text, newline=''), outfile, fmt, column, errfile,
+        start=line_no, write_header=start == 0,
+    )
+    return outfile.getvalue(), errfile.getvalue(), converted, failed
+
+
+def _iter_tasks(
+    path: str,
+    mapped: mmap.mmap,
+    chunks: List[Tuple[int, int]],
+    fmt: str,
+    column: Optional[str],
+    header: str,
+) -> Iterator[Tuple[str, int, int, int, str, Optional[str], str]]:
+    """
+    逐个生成各分块的转换任务，并计算每块首行的全局行号。
+
+    行号在任务即将派发时才按分块统计换行符，不单独预先扫描整个文件。
+
+    Args:
+        path: 文件路径
+        mapped: 文件的内存映射
+        chunks: 字节区间列表
+        fmt: 记录格式
+        column: 金额所在的列名或键名
+        header: CSV/TSV 表头行，无表头时为空字符串
+
+    Yields:
+        Tuple[str, int, int, int, str, Optional[str], str]: 分块转换任务
+    """
+    line_no = 1
+    for start, end in chunks:
+        yield path, start, end, line_no, fmt, column, header
+        line_no += mapped[start:end].count(b'\n')
+
+
+def _throttle(
+    tasks: Iterator[Tuple[str, int, int, int, str, Optional[str], str]],
+    slots: threading.Semaphore,
+    stopped: threading.Event,
+) -> Iterator[Tuple[str, int, int, int, str, Optional[str], str]]:
+    """
+    限制已派发但尚未被取走结果的分块数量。
+
+    进程池在后台线程中读取任务，每派发一块先占用一个名额，父进程写出该块结果后归还，
+    因此缓存在内存中的结果不超过名额数。
+
+    Args:
+        tasks: 分块转换任务
+        slots: 名额
+        stopped: 父进程提前结束时设置，之后不再派发
+
+    Yields:
+        Tuple[str, int, int, int, str, Optional[str], str]: 分块转换任务
+    """
+    for task in tasks:
+        slots.acquire()
+        if stopped.is_set():
+            return
+        yield task
+
+
+def convert_file_parallel(
+    path: str,
+    outfile: IO[str],
+    workers: int,
+    fmt: str = 'text',
+    column: Optional[str] = None,
+    errfile: Optional[IO[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_in_flight: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    使用进程池并行转换文件，按原始行序写出结果。
+
+    同时派发的分块数有上限，内存占用约为 max_in_flight 个分块的输出，与文件大小无关。
+
+    Args:
+        path: 输入文件路径（UTF-8 编码）
+        outfile: 输出文本流
+        workers: 工作进程数
+        fmt: 记录格式，取值见 stream.FORMATS
+        column: 金额所在的列名或键名
+        errfile: 错误信息输出流，为 None 时不报告错误
+        chunk_size: 目标分块大小（字节）
+        max_in_flight: 已派发但尚未写出的分块数上限，默认为工作进程数的 IN_FLIGHT_PER_WORKER 倍
+
+    Returns:
+        Tuple[int, int]: 成功转换的行数和无效行数
+
+    Raises:
+        ValueError: 当格式不受支持或表头中找不到指定列时抛出
+    """
+    if workers < 1:
+        raise ValueError("工作进程数必须大于0")
+    if max_in_flight is None:
+        max_in_flight = workers * IN_FLIGHT_PER_WORKER
+    elif max_in_flight < 1:
+        raise ValueError("同时派发的分块数必须大于0")
+
+    if os.path.getsize(path) == 0:
+        return convert_stream(io.StringIO(), outfile, fmt, column, errfile)
+
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        chunks = split_chunks(mapped, chunk_size)
+        header = ''
+        if column is not None and fmt in DELIMITERS:
+            first_end = mapped.find(b'\n')
+            header = mapped[:len(mapped) if first_end == -1 else first_end + 1].decode('utf-8')
+            # 提前校验列名，避免在工作进程中失败
+            convert_stream(io.StringIO(header), io.StringIO(), fmt, column)
+
+        converted = 0
+        failed = 0
+        slots = threading.Semaphore(max_in_flight)
+        stopped = threading.Event()
+        tasks = _throttle(_iter_tasks(path, mapped, chunks, fmt, column, header), slots, stopped)
+        with multiprocessing.Pool(workers) as pool:
+            try:
+                for out, err, chunk_converted, chunk_failed in pool.imap(_convert_chunk, tasks):
+                    slots.release()
+                    outfile.write(out)
+                    if errfile is not None and err:
+                        errfile.write(err)
+                    converted += chunk_converted
+                    failed += chunk_failed
+            finally:
+                # 唤醒可能在等待名额的派发线程，使其结束
+                stopped.set()
+                slots.release()
+    finally:
+        mapped.close()
+    return converted, failed
@@ -0,0 +1,139 @@
+"""Polars 命名空间模块。
+
+导入此模块后，表达式和 Series 上注册 rmb 命名空间：
+
+    df.with_columns(pl.col('amount').rmb.upper().alias('rmb'))
+    df['amount'].rmb.upper()
+
+整列先用 unique 去重，只把不同的取值交给 batch 模块转换，再按取值下标展开：
+1. 空值和 NaN 的结果为空值
+2. 无效金额不抛出异常，结果为空值，错误信息由 errors() 返回
+
+需要安装可选依赖：pip install rmb-converter[polars]
+"""
+from typing import Tuple
+
+try:
+    import polars as pl
+except ImportError as e:  # pragma: no cover - 取决于运行环境
+    raise ImportError("Polars 命名空间需要 polars，请执行 pip install rmb-converter[polars]") from e
+
+from .batch import convert_values
+from .input_processor import ROUND_TRUNCATE
+
+
+def _check_dtype(dtype: pl.DataType) -> None:
+    """
+    检查列类型是否为可转换的金额类型。
+
+    Args:
+        dtype: 列类型
+
+    Raises:
+        ValueError: 当类型不受支持时抛出
+    """
+    if not (dtype in (pl.String, pl.Categorical, pl.Null) or dtype.is_numeric()):
+        raise ValueError(f"不支持的金额列类型: {dtype}")
+
+
+def convert_series(
+    series: pl.Series, rounding: str = ROUND_TRUNCATE
+) -> Tuple[pl.Series, pl.Series]:
+    """
+    转换金额列，每个不同的取值只转换一次。
+
+    Args:
+        series: 金额列，类型可以是字符串、整数、浮点数或 Decimal
+        rounding: 小数超过两位时的舍入方式，见 input_processor.ROUNDING_MODES
+
+    Returns:
+        Tuple[pl.Series, pl.Series]: 与输入等长、同名的 String 类型结果列和错误列；
+            空值和无效金额的结果为空值，无效金额的错误列为错误信息，其余为空值
+
+    Raises:
+        ValueError: 当列类型不受支持时抛出
+    """
+    _check_dtype(series.dtype)
+    if series.dtype == pl.Categorical:
+        series = series.cast(pl.String)
+    uniques = series.drop_nulls().unique()
+    results, errors = convert_values(uniques.to_list(), rounding)
+    # 每行映射为取值下标（空值仍为空值），结果列和错误列共用一次 replace_strict
+    codes = series.replace_strict(uniques, pl.int_range(len(uniques), dtype=pl.UInt32, eager=True),
+                                  default=None, return_dtype=pl.UInt32)
+    return (pl.Series(series.name, results, dtype=pl.String).gather(codes),
+            pl.Series(series.name, errors, dtype=pl.String).gather(codes))
+
+
+@pl.api.register_series_namespace('rmb')
+class RmbSeriesNamespace:
+    """Series.rmb 命名空间。"""
+
+    def __init__(self, series: pl.Series) -> None:
+        """
+        Args:
+            series: 金额列
+        """
+        self._series = series
+
+    def upper(self, rounding: str = ROUND_TRUNCATE) -> pl.Series:
+        """
+        转换为人民币大写，无效金额和空值的结果为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pl.Series: 结果列
+        """
+        return convert_series(self._series, rounding)[0]
+
+    def errors(self, rounding: str = ROUND_TRUNCATE) -> pl.Series:
+        """
+        返回每行的错误信息，可转换的行和空值为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pl.Series: 错误列
+        """
+        return convert_series(self._series, rounding)[1]
+
+
+@pl.api.register_expr_namespace('rmb')
+class RmbExprNamespace:
+    """Expr.rmb 命名空间，在每批数据上调用 convert_series。"""
+
+    def __init__(self, expr: pl.Expr) -> None:
+        """
+        Args:
+            expr: 金额列表达式
+        """
+        self._expr = expr
+
+    def upper(self, rounding: str = ROUND_TRUNCATE) -> pl.Expr:
+        """
+        转换为人民币大写，无效金额和空值的结果为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pl.Expr: 结果列表达式
+        """
+        return self._expr.map_batches(lambda series: convert_series(series, rounding)[0],
+                                      return_dtype=pl.String, is_elementwise=True)
+
+    def errors(self, rounding: str = ROUND_TRUNCATE) -> pl.Expr:
+        """
+        返回每行的错误信息，可转换的行和空值为空值。
+
+        Args:
+            rounding: 小数超过两位时的舍入方式
+
+        Returns:
+            pl.Expr: 错误列表达式
+        """
+        return self._expr.map_batches(lambda series: convert_series(series, rounding)[1],
+                                      return_dtype=pl.String, is_elementwise=True)
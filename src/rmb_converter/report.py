@@ -0,0 +1,60 @@
+"""文本表格工具模块。
+
+基准测试报告和阶段统计共用的表格格式化。表头多为中文，中文字符在终端中占两列，
+因此按显示宽度而不是字符数补齐，使表头与数据行对齐。
+"""
+import unicodedata
+from typing import Iterable, List, Sequence
+
+
+def display_width(text: str) -> int:
+    """
+    计算文本在终端中的显示宽度，全角和宽字符计为两列。
+
+    Args:
+        text: 文本
+
+    Returns:
+        int: 显示宽度
+    """
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+
+def _pad(text: str, width: int, left: bool) -> str:
+    """
+    按显示宽度将文本补齐到指定列数，超出时原样返回。
+
+    Args:
+        text: 文本
+        width: 目标显示宽度
+        left: 为 True 时左对齐，否则右对齐
+
+    Returns:
+        str: 补齐后的文本
+    """
+    padding = ' ' * max(width - display_width(text), 0)
+    return text + padding if left else padding + text
+
+
+def format_table(
+    headers: Sequence[str], rows: Iterable[Sequence[str]], widths: Sequence[int]
+) -> str:
+    """
+    将已格式化的单元格排成文本表格，首列左对齐，其余列右对齐。
+
+    Args:
+        headers: 表头
+        rows: 数据行，每行的单元格数可少于表头，缺少的列留空
+        widths: 各列的显示宽度，表头和数据行共用；多于表头的部分忽略
+
+    Returns:
+        str: 文本表格
+    """
+    widths = widths[:len(headers)]
+    lines: List[str] = []
+    for cells in (headers, *rows):
+        cells = [*cells, *[''] * (len(widths) - len(cells))]
+        lines.append(''.join(
+            _pad(cell, width, index == 0)
+            for index, (cell, width) in enumerate(zip(cells, widths))))
+    return '\n'.join(lines)
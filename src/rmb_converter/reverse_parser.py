@@ -0,0 +1,172 @@
+"""人民币大写金额反向解析模块。
+
+此模块将 convert_to_rmb 生成的大写金额解析回以分为单位的整数，包括：
+1. 单次线性扫描完成词法检查和数值累加
+2. 与正向转换结果比对，确保输入为规范写法
+3. 出错时报告错误字符的位置
+"""
+from typing import Dict, Iterable, List
+
+from .chinese_currency import CURRENCY_UNITS, DIGITS, LARGE_UNITS, UNITS, convert_cents
+
+# 大写数字到数值的映射（不含零）
+_DIGIT_VALUES: Dict[str, int] = {char: value for value, char in DIGITS.items() if value}
+
+# 拾佰仟到倍数的映射
+_UNIT_VALUES: Dict[str, int] = {unit: 10 ** i for i, unit in enumerate(UNITS) if unit}
+
+_ZERO = DIGITS[0]
+_WAN = LARGE_UNITS[1]
+_YI = LARGE_UNITS[2]
+_YUAN = CURRENCY_UNITS['YUAN']
+_JIAO = CURRENCY_UNITS['JIAO']
+_FEN = CURRENCY_UNITS['FEN']
+_ZHENG = CURRENCY_UNITS['ZHENG']
+
+
+class RMBParseError(ValueError):
+    """
+    大写金额解析错误。
+
+    Attributes:
+        position: 出错字符在输入中的下标
+    """
+
+    def __init__(self, message: str, position: int) -> None:
+        """
+        初始化解析错误。
+
+        Args:
+            message: 错误描述
+            position: 出错字符在输入中的下标
+        """
+        super().__init__(f"{message}（位置 {position}）")
+        self.position = position
+
+
+def _scan(text: str) -> int:
+    """
+    线性扫描大写金额，返回以分为单位的数值。
+
+    只检查字符和单位的排列是否合法，不检查零的写法是否规范。
+
+    Args:
+        text: 大写金额字符串
+
+    Returns:
+        int: 以分为单位的金额
+
+    Raises:
+        RMBParseError: 当出现非法字符或单位排列错误时抛出
+    """
+    high = 0  # 亿以上部分
+    mid = 0  # 万段
+    section = 0  # 当前四位段
+    digit = None  # 尚未与单位结合的数字
+    last_unit = 10000  # 当前段内上一个单位的倍数，保证单位递减
+    seen_wan = False
+    seen_yi = False
+    yuan = None
+    jiao = 0
+    fen = 0
+    stage = 0  # 0: 整数部分，1: 元之后，2: 角之后，3: 分或整之后
+
+    for pos, char in enumerate(text):
+        if stage == 3:
+            raise RMBParseError("金额结尾之后不应再有字符", pos)
+
+        if char in _DIGIT_VALUES:
+            if digit is not None:
+                raise RMBParseError("数字之后缺少单位", pos)
+            digit = _DIGIT_VALUES[char]
+        elif char == _ZERO:
+            if digit is not None:
+                raise RMBParseError("数字之后缺少单位", pos)
+        elif char in _UNIT_VALUES:
+            unit = _UNIT_VALUES[char]
+            if stage or digit is None or unit >= last_unit:
+                raise RMBParseError(f"“{char}”的位置不正确", pos)
+            section += digit * unit
+            digit = None
+            last_unit = unit
+        elif char == _WAN or char == _YI:
+            if stage or seen_wan or (char == _YI and seen_yi):
+                raise RMBParseError(f"“{char}”的位置不正确", pos)
+            section += digit or 0
+            if not section:
+                raise RMBParseError(f"“{char}”之前缺少数字", pos)
+            if char == _YI:
+                high, seen_yi = section, True
+            else:
+                mid, seen_wan = section, True
+            section, digit, last_unit = 0, None, 10000
+        elif char == _YUAN:
+            if stage:
+                raise RMBParseError(f"“{char}”的位置不正确", pos)
+            yuan = (high * 10000 + mid) * 10000 + section + (digit or 0)
+            digit, stage = None, 1
+        elif char == _JIAO or char == _FEN:
+            # 没有“元”时，角分之前不能出现整数部分
+            integer_pending = stage == 0 and (section or seen_wan or seen_yi)
+            if digit is None or (char == _JIAO and stage > 1) or integer_pending:
+                raise RMBParseError(f"“{char}”的位置不正确", pos)
+            if char == _JIAO:
+                jiao, stage = digit, 2
+            else:
+                fen, stage = digit, 3
+            digit = None
+        elif char == _ZHENG:
+            if stage != 1:
+                raise RMBParseError(f"“{char}”的位置不正确", pos)
+            stage = 3
+        else:
+            raise RMBParseError(f"无法识别的字符“{char}”", pos)
+
+    if not text:
+        raise RMBParseError("输入不能为空", 0)
+    if digit is not None or stage == 0:
+        raise RMBParseError("金额缺少“元”“角”“分”或“整”结尾", len(text))
+    return (yuan or 0) * 100 + jiao * 10 + fen
+
+
+def parse_rmb(text: str) -> int:
+    """
+    将人民币大写金额解析为以分为单位的整数。
+
+    只接受规范写法，即 parse_rmb(convert_cents(x)) == x，
+    且 convert_cents(parse_rmb(text)) == text。
+
+    Args:
+        text: 大写金额字符串，例如 "壹万零伍元叁角肆分"
+
+    Returns:
+        int: 以分为单位的金额，例如 1000534
+
+    Raises:
+        RMBParseError: 当输入非法或不是规范写法时抛出，position 指向出错字符
+    """
+    cents = _scan(text)
+    expected = convert_cents(cents)
+    if expected != text:
+        position = next(
+            (i for i, (actual, wanted) in enumerate(zip(text, expected)) if actual != wanted),
+            min(len(text), len(expected)))
+        raise RMBParseError(f"不是规范的大写金额，应为“{expected}”", position)
+    return cents
+
+
+def parse_many(texts: Iterable[str]) -> List[int]:
+    """
+    批量解析人民币大写金额，按输入顺序返回以分为单位的整数列表。
+
+    Args:
+        texts: 大写金额字符串的可迭代对象
+
+    Returns:
+        List[int]: 以分为单位的金额列表
+
+    Raises:
+        RMBParseError: 当某个输入非法或不是规范写法时抛出
+    """
+    parse = parse_rmb
+    return [parse(text) for text in texts]
@@ -0,0 +1,290 @@
+"""常驻转换服务模块。
+
+此模块在本机 HTTP 端口或 Unix 域套接字上提供转换服务，避免每次转换都启动解释器：
+1. GET /convert?amount=1234.56 或 POST /convert（请求体为金额）转换单个金额
+2. POST /batch 转换以换行符结尾的多个金额，按行返回结果，无效行返回“错误: ...”
+3. GET /stats 返回请求数和最近请求的 p50/p99 服务端延迟
+
+使用 HTTP/1.1 长连接，同一连接上的流水线请求按顺序处理。
+"""
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from .chinese_currency import convert_to_rmb
+from .latency import percentile
+
+# 默认监听地址
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# 用于计算延迟分位数的最近请求数
+LATENCY_WINDOW = 10000
+
+# 单个请求体的大小上限（字节）
+MAX_BODY_SIZE = 64 << 20
+
+# 服务启动时预热用的金额
+_WARMUP_AMOUNTS = ('0', '0.01', '1234.56', '100010001.01', '999999999999.99')
+
+
+class _StatsMixin:
+    """为服务器对象提供请求计数和延迟记录。"""
+
+    def init_stats(self) -> None:
+        """初始化统计数据。"""
+        self.latencies: Deque[int] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.conversions = 0
+        self.stats_lock = threading.Lock()
+
+    def record(self, elapsed_ns: int, conversions: int) -> None:
+        """
+        记录一次请求。
+
+        Args:
+            elapsed_ns: 服务端处理耗时（纳秒）
+            conversions: 本次请求转换的金额数
+        """
+        with self.stats_lock:
+            self.requests += 1
+            self.conversions += conversions
+            self.latencies.append(elapsed_ns)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        返回统计数据。
+
+        Returns:
+            Dict[str, Any]: 包含 requests、conversions、window、p50_ns、p99_ns
+        """
+        with self.stats_lock:
+            samples = sorted(self.latencies)
+            requests, conversions = self.requests, self.conversions
+        return {
+            'requests': requests,
+            'conversions': conversions,
+            'window': len(samples),
+            'p50_ns': percentile(samples, 0.50),
+            'p99_ns': percentile(samples, 0.99),
+        }
+
+
+class ConversionHTTPServer(_StatsMixin, ThreadingHTTPServer):
+    """监听 TCP 端口的转换服务。"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Any) -> None:
+        """
+        初始化服务。
+
+        Args:
+            address: (主机, 端口)
+        """
+        super().__init__(address, ConversionHandler)
+        self.init_stats()
+
+
+class ConversionUnixServer(_StatsMixin, socketserver.ThreadingMixIn,
+                           socketserver.UnixStreamServer):
+    """监听 Unix 域套接字的转换服务。"""
+
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        """
+        初始化服务，已存在的套接字文件会被替换。
+
+        Args:
+            path: 套接字文件路径
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, ConversionHandler)
+        self.init_stats()
+
+    def server_close(self) -> None:
+        """关闭服务并删除套接字文件。"""
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+ConversionServer = Union[ConversionHTTPServer, ConversionUnixServer]
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """处理转换请求。"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'rmb-converter'
+    # 缓冲响应，使响应头和响应体尽量在一次写入中发出；
+    # 每个请求处理完后 handle_one_request 会刷新缓冲区
+    wbufsize = -1
+    server: ConversionServer
+
+    def setup(self) -> None:
+        """建立连接；TCP 连接关闭 Nagle 算法，避免与延迟确认叠加造成停顿。"""
+        super().setup()
+        if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        """处理 GET 请求。"""
+        start = time.perf_counter_ns()
+        url = urlsplit(self.path)
+        if url.path == '/convert':
+            amounts = parse_qs(url.query).get('amount')
+            if not amounts:
+                self._send(400, "错误: 缺少 amount 参数")
+            else:
+                self._convert_one(amounts[0], start)
+        elif url.path == '/stats':
+            self._send(200, json.dumps(self.server.stats()), 'application/json')
+        else:
+            self._send(404, "错误: 未知路径")
+
+    def do_POST(self) -> None:
+        """处理 POST 请求。"""
+        start = time.perf_counter_ns()
+        body = self._read_body()
+        if body is None:
+            return
+        path = urlsplit(self.path).path
+        if path == '/convert':
+            self._convert_one(body.strip(), start)
+        elif path == '/batch':
+            self._convert_batch(body, start)
+        else:
+            self._send(404, "错误: 未知路径")
+
+    def _read_body(self) -> Optional[str]:
+        """
+        读取请求体。
+
+        Returns:
+            Optional[str]: 请求体文本，请求无效时返回 None（已发送错误响应）
+        """
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self._send(411, "错误: 缺少 Content-Length")
+            return None
+        try:
+            size = int(length)
+        except ValueError:
+            size = -1
+        if size < 0 or size > MAX_BODY_SIZE:
+            self.close_connection = True
+            self._send(413, "错误: 请求体大小无效")
+            return None
+        return self.rfile.read(size).decode('utf-8', errors='replace')
+
+    def _convert_one(self, amount: str, start: int) -> None:
+        """
+        转换单个金额并响应。
+
+        Args:
+            amount: 金额字符串
+            start: 请求开始时间（纳秒）
+        """
+        try:
+            result = convert_to_rmb(amount)
+        except (ValueError, OverflowError) as e:
+            self._send(400, f"错误: {e}")
+        else:
+            self._send(200, result)
+        self.server.record(time.perf_counter_ns() - start, 1)
+
+    def _convert_batch(self, body: str, start: int) -> None:
+        """
+        按行转换多个金额并响应，每行输出对应一行输入。
+
+        每个金额以换行符结尾，最后一个金额的换行符可以省略。只按 '\n' 拆分，
+        因此空金额也会得到一行结果，不会像 splitlines() 那样丢掉末尾的空行。
+
+        Args:
+            body: 按行分隔的金额
+            start: 请求开始时间（纳秒）
+        """
+        lines = body.split('\n')
+        if not lines[-1]:
+            lines.pop()
+        results = []
+        append = results.append
+        for line in lines:
+            try:
+                append(convert_to_rmb(line))
+            except (ValueError, OverflowError) as e:
+                append(f"错误: {e}")
+        self._send(200, '\n'.join(results) + '\n' if results else '')
+        self.server.record(time.perf_counter_ns() - start, len(lines))
+
+    def _send(
+        self, status: int, body: str, content_type: str = 'text/plain; charset=utf-8'
+    ) -> None:
+        """
+        发送响应。
+
+        Args:
+            status: HTTP 状态码
+            body: 响应体
+            content_type: 响应类型
+        """
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """不逐条记录访问日志，避免影响吞吐量。"""
+
+
+def create_server(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket: Optional[str] = None
+) -> ConversionServer:
+    """
+    创建并预热转换服务，但不开始监听循环。
+
+    Args:
+        host: 监听的主机地址
+        port: 监听端口，0 表示由系统分配
+        unix_socket: Unix 域套接字路径，指定时忽略 host 和 port
+
+    Returns:
+        ConversionServer: 服务对象，调用 serve_forever() 开始处理请求
+    """
+    for amount in _WARMUP_AMOUNTS:
+        convert_to_rmb(amount)
+    if unix_socket:
+        return ConversionUnixServer(unix_socket)
+    return ConversionHTTPServer((host, port))
+
+
+def serve(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket: Optional[str] = None
+) -> None:
+    """
+    启动转换服务并一直运行，直到被中断。
+
+    Args:
+        host: 监听的主机地址
+        port: 监听端口
+        unix_socket: Unix 域套接字路径，指定时忽略 host 和 port
+    """
+    server = create_server(host, port, unix_socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,140 @@
+"""流式批量转换模块。
+
+此模块逐行读取输入并逐行写出转换结果，内存占用与输入大小无关，包括：
+1. 从纯文本、CSV/TSV 或 JSONL 记录中提取金额
+2. 以文本、CSV/TSV 或 JSONL 格式写出结果
+3. 报告无效行但不中断处理
+"""
+import csv
+import json
+from typing import IO, Iterator, Optional, Tuple
+
+from .chinese_currency import convert_to_rmb
+
+# 支持的记录格式
+FORMATS = ('text', 'csv', 'tsv', 'jsonl')
+
+# CSV/TSV 的字段分隔符
+DELIMITERS = {
+    'csv': ',',
+    'tsv': '\t',
+}
+
+# 输出结果中的字段名
+OUTPUT_FIELDS = ('line', 'amount', 'rmb')
+
+
+def iter_amounts(
+    infile: IO[str], fmt: str = 'text', column: Optional[str] = None, start: int = 1
+) -> Iterator[Tuple[int, str]]:
+    """
+    从输入流中逐行提取金额。
+
+    未指定 column 时每行即为一个金额；指定 column 时，CSV/TSV 输入按首行表头
+    取对应列，JSONL 输入按键名取值。空行会被跳过。
+
+    Args:
+        infile: 输入文本流
+        fmt: 记录格式，取值见 FORMATS
+        column: 金额所在的列名或键名
+        start: 输入首行的行号，用于分块处理时保持全局行号
+
+    Yields:
+        Tuple[int, str]: 行号和金额字符串
+
+    Raises:
+        ValueError: 当格式不受支持或表头中找不到指定列时抛出
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"不支持的格式: {fmt}")
+
+    if column is None or fmt == 'text':
+        for line_no, line in enumerate(infile, start):
+            amount = line.strip()
+            if amount:
+                yield line_no, amount
+        return
+
+    if fmt == 'jsonl':
+        for line_no, line in enumerate(infile, start):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)[column]
+            except (ValueError, TypeError, KeyError):
+                value = ''
+            yield line_no, '' if value is None else str(value)
+        return
+
+    reader = csv.reader(infile, delimiter=DELIMITERS[fmt])
+    header = next(reader, None)
+    if header is None:
+        return
+    try:
+        index = header.index(column)
+    except ValueError as e:
+        raise ValueError(f"表头中找不到列: {column}") from e
+    # 表头占首行
+    for line_no, row in enumerate(reader, start + 1):
+        if not row:
+            continue
+        yield line_no, row[index].strip() if index < len(row) else ''
+
+
+def convert_stream(
+    infile: IO[str],
+    outfile: IO[str],
+    fmt: str = 'text',
+    column: Optional[str] = None,
+    errfile: Optional[IO[str]] = None,
+    start: int = 1,
+    write_header: bool = True,
+) -> Tuple[int, int]:
+    """
+    流式转换输入中的所有金额，并逐行写出结果。
+
+    每行都通过 convert_to_rmb 转换；无效行写入 errfile 后继续处理后续行。
+
+    Args:
+        infile: 输入文本流
+        outfile: 输出文本流
+        fmt: 记录格式，取值见 FORMATS
+        column: 金额所在的列名或键名
+        errfile: 错误信息输出流，为 None 时不报告错误
+        start: 输入首行的行号
+        write_header: CSV/TSV 输出时是否写出表头
+
+    Returns:
+        Tuple[int, int]: 成功转换的行数和无效行数
+
+    Raises:
+        ValueError: 当格式不受支持或表头中找不到指定列时抛出
+    """
+    converted = 0
+    failed = 0
+    write = outfile.write
+
+    if fmt in DELIMITERS:
+        writer = csv.writer(outfile, delimiter=DELIMITERS[fmt], lineterminator='\n')
+        if write_header:
+            writer.writerow(OUTPUT_FIELDS)
+
+    for line_no, amount in iter_amounts(infile, fmt, column, start):
+        try:
+            result = convert_to_rmb(amount)
+        except (ValueError, OverflowError) as e:
+            failed += 1
+            if errfile is not None:
+                errfile.write(f"第{line_no}行: 错误: {e} ({amount!r})\n")
+            continue
+
+        converted += 1
+        if fmt == 'text':
+            write(result + '\n')
+        elif fmt == 'jsonl':
+            record = dict(zip(OUTPUT_FIELDS, (line_no, amount, result)))
+            write(json.dumps(record, ensure_ascii=False) + '\n')
+        else:
+            writer.writerow((line_no, amount, result))
+
+    return converted, failed
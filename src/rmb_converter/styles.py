@@ -0,0 +1,101 @@
+"""输出风格模块。
+
+不同的对方单位要求不同的写法，各风格以相对标准写法的逐字替换和前缀定义：
+1. STYLE_STANDARD（默认）：壹贰叁……、万、亿、元
+2. STYLE_ROUND：以“圆”代替“元”
+3. STYLE_PREFIXED：前加“人民币”
+4. STYLE_TRADITIONAL：繁体，貳、參、陸、萬、億等，适用于港台文件
+5. STYLE_SIMPLIFIED：小写数字一二三……和十百千，适用于内部报表
+
+chinese_currency 在首次使用某风格时按定义生成整套转换表，此后与标准写法同样查表，
+不再逐次替换字符。可用 register_style 在已有风格上组合出新风格，例如：
+
+    register_style('hk', {'元': '圓'}, base=STYLE_TRADITIONAL)
+"""
+from typing import Dict, Optional, Tuple
+
+STYLE_STANDARD = 'standard'
+STYLE_ROUND = 'round'
+STYLE_PREFIXED = 'prefixed'
+STYLE_TRADITIONAL = 'traditional'
+STYLE_SIMPLIFIED = 'simplified'
+
+# 各风格的定义：(逐字替换, 前缀)，替换作用于标准写法的输出字符
+_DEFINITIONS: Dict[str, Tuple[Dict[str, str], str]] = {
+    STYLE_STANDARD: ({}, ''),
+    STYLE_ROUND: ({'元': '圆'}, ''),
+    STYLE_PREFIXED: ({}, '人民币'),
+    STYLE_TRADITIONAL: ({
+        '贰': '貳', '叁': '參', '陆': '陸', '万': '萬', '亿': '億',
+        '沟': '溝', '涧': '澗', '载': '載',
+    }, ''),
+    STYLE_SIMPLIFIED: ({
+        '壹': '一', '贰': '二', '叁': '三', '肆': '四', '伍': '五',
+        '陆': '六', '柒': '七', '捌': '八', '玖': '九',
+        '拾': '十', '佰': '百', '仟': '千',
+    }, ''),
+}
+
+
+def style_names() -> Tuple[str, ...]:
+    """
+    返回已定义的风格名称。
+
+    Returns:
+        Tuple[str, ...]: 风格名称，按定义顺序
+    """
+    return tuple(_DEFINITIONS)
+
+
+def style_definition(style: str) -> Tuple[Dict[str, str], str]:
+    """
+    返回风格的定义。
+
+    Args:
+        style: 风格名称，取值见 style_names()
+
+    Returns:
+        Tuple[Dict[str, str], str]: 逐字替换（单字到字符串）和前缀
+
+    Raises:
+        ValueError: 当风格不存在时抛出
+    """
+    if style not in _DEFINITIONS:
+        raise ValueError(f"不支持的输出风格: {style}")
+    replacements, prefix = _DEFINITIONS[style]
+    return dict(replacements), prefix
+
+
+def register_style(
+    name: str,
+    replacements: Optional[Dict[str, str]] = None,
+    prefix: Optional[str] = None,
+    base: str = STYLE_STANDARD,
+) -> None:
+    """
+    在已有风格之上定义新风格。
+
+    先按 base 的替换，再按 replacements 替换其结果，因此 replacements 的键
+    应是 base 风格输出中的字符。
+
+    Args:
+        name: 新风格名称
+        replacements: 追加的逐字替换，键必须是单个字符
+        prefix: 前缀，默认沿用 base 的前缀
+        base: 基础风格
+
+    Raises:
+        ValueError: 当名称已存在、基础风格不存在或替换的键不是单个字符时抛出
+    """
+    if name in _DEFINITIONS:
+        raise ValueError(f"输出风格已存在: {name}")
+    base_replacements, base_prefix = style_definition(base)
+    replacements = replacements or {}
+    for key in replacements:
+        if len(key) != 1:
+            raise ValueError(f"替换的键必须是单个字符: {key!r}")
+    table = str.maketrans(replacements)
+    combined = {key: value.translate(table) for key, value in base_replacements.items()}
+    for key, value in replacements.items():
+        combined.setdefault(key, value)
+    _DEFINITIONS[name] = (combined, base_prefix if prefix is None else prefix)
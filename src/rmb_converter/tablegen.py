@@ -0,0 +1,92 @@
+"""预计算表生成脚本。
+
+chinese_currency 在导入时直接读取 _tables 模块中的字面量，避免每次启动都重新生成表。
+修改生成逻辑后应递增 chinese_currency.TABLES_VERSION 并重新生成：
+
+    python -m src.rmb_converter.tablegen
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .chinese_currency import (
+    TABLE_SEPARATOR,
+    TABLES_VERSION,
+    _generate_decimal_cache,
+    _generate_four_digits_cache,
+)
+
+# 生成的模块路径
+TABLES_PATH = Path(__file__).with_name('_tables.py')
+
+# 字面量中每行的表项数
+_ITEMS_PER_LINE = 100
+
+
+def _render_string(name: str, items: Sequence[str]) -> List[str]:
+    """
+    将表项拼接为一个分隔字符串，按行拆成相邻的字符串字面量。
+
+    Args:
+        name: 变量名
+        items: 表项
+
+    Returns:
+        List[str]: 源码行
+    """
+    lines = [f'{name} = (']
+    for start in range(0, len(items), _ITEMS_PER_LINE):
+        chunk = TABLE_SEPARATOR.join(items[start:start + _ITEMS_PER_LINE])
+        if start + _ITEMS_PER_LINE < len(items):
+            chunk += TABLE_SEPARATOR
+        lines.append(f'    {chunk!r}')
+    lines.append(')')
+    return lines
+
+
+def render() -> str:
+    """
+    生成 _tables 模块的源码。
+
+    Returns:
+        str: 模块源码
+    """
+    decimals = _generate_decimal_cache()
+    lines = [
+        '"""预计算转换表（由 python -m src.rmb_converter.tablegen 生成，请勿手工修改）。"""',
+        '',
+        '# ruff: noqa: E501',
+        '',
+        f'TABLES_VERSION = {TABLES_VERSION}',
+        '',
+        '# 0-9999 的四位数转换结果',
+        *_render_string('FOUR_DIGITS', _generate_four_digits_cache()),
+        '',
+        '# 00-99 的角分转换结果',
+        *_render_string('DECIMALS', [decimals[f'{i:02d}'] for i in range(100)]),
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    重新生成 _tables 模块。
+
+    Args:
+        argv: 命令行参数，默认读取 sys.argv
+
+    Returns:
+        int: 退出码
+    """
+    parser = argparse.ArgumentParser(description='重新生成人民币大写转换的预计算表模块')
+    parser.add_argument('output', nargs='?', type=Path, default=TABLES_PATH,
+                        help='输出路径，默认覆盖包内的 _tables.py')
+    args = parser.parse_args(argv)
+    args.output.write_text(render(), encoding='utf-8')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""大数单位体系模块。
+
+整数部分每四位为一节，各单位体系决定节后的单位：
+1. UNITS_WANYI（万万亿式，默认）：万、亿、万亿、亿亿……，高位单位由低位单位叠加而成，
+   例如 10^16 为“亿亿”，10^24 为“亿亿亿”，位数不限
+2. UNITS_ZHAOJING（万进中数）：万、亿、兆、京、垓、秭、穰、沟、涧、正、载、极，
+   每节一个单位，最多52位
+
+两种体系在12位以内的结果相同，也与 spec.md 规定的格式一致。
+"""
+from typing import Optional
+
+UNITS_WANYI = 'wanyi'
+UNITS_ZHAOJING = 'zhaojing'
+UNIT_SYSTEMS = (UNITS_WANYI, UNITS_ZHAOJING)
+
+# 万进中数的节单位，下标为节的序号（从个位节起为0）
+ZHAOJING_UNITS = ('', '万', '亿', '兆', '京', '垓', '秭', '穰', '沟', '涧', '正', '载', '极')
+
+# 各单位体系能表示的最大整数位数，None 表示不限
+_MAX_LENGTHS = {
+    UNITS_WANYI: None,
+    UNITS_ZHAOJING: 4 * len(ZHAOJING_UNITS),
+}
+
+
+def max_integer_length(units: str) -> Optional[int]:
+    """
+    返回单位体系能表示的最大整数位数。
+
+    Args:
+        units: 单位体系，取值见 UNIT_SYSTEMS
+
+    Returns:
+        Optional[int]: 最大位数，None 表示不限
+
+    Raises:
+        ValueError: 当单位体系不受支持时抛出
+    """
+    if units not in _MAX_LENGTHS:
+        raise ValueError(f"不支持的单位体系: {units}")
+    return _MAX_LENGTHS[units]
+
+
+def wanyi_unit(section: int, lower: int) -> str:
+    """
+    返回万万亿式中非零的第 section 节之后的单位。
+
+    奇数节带“万”。偶数节边界带亿级单位：第 2 节为“亿”（10^8），第 4 节为“亿亿”（10^16），
+    第 8 节为四个“亿”（10^32）……即 2^t 个“亿”，t 为 边界/2 的二进制末尾零的个数；
+    该单位管辖从边界起的 2^(t+1) 节，只写在其中最低的非零节之后，
+    因此取决于本节与下一个非零节之间有哪些边界。
+
+    Args:
+        section: 节的序号（从个位节起为0）
+        lower: 下一个非零节的序号，没有则为-1
+
+    Returns:
+        str: 单位
+    """
+    unit = '万' if section & 1 else ''
+    for boundary in range(section & ~1, max(lower, 0), -2):
+        half = boundary >> 1
+        if section < boundary + 2 * (half & -half):
+            unit += '亿' * (half & -half)
+    return unit
+
+
+# 常用的前8节（32位以内）的万万亿式单位，WANYI_UNITS[section][lower + 1]
+WANYI_UNITS = tuple(
+    tuple(wanyi_unit(section, lower) for lower in range(-1, section)) for section in range(8)
+)
@@ -0,0 +1,108 @@
+"""基于 NumPy 的向量化转换模块。
+
+此模块将以分为单位的整数数组整体转换为人民币大写，输出与 convert_to_rmb 逐个转换完全一致：
+1. 用向量化 divmod 拆分出亿、万、个三个四位段和角分
+2. 用数组运算判定每段前是否需要补“零”
+3. 从预计算的分段表和角分表中按下标取值，只做三次逐元素字符串拼接
+
+需要安装可选依赖：pip install rmb-converter[numpy]
+"""
+from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - 取决于运行环境
+    raise ImportError("向量化转换需要 numpy，请执行 pip install rmb-converter[numpy]") from e
+
+from .chinese_currency import COMMON_DECIMALS, CURRENCY_UNITS, FOUR_DIGITS, LARGE_UNITS
+from .input_processor import MAX_INTEGER_LENGTH
+
+# 以分为单位的金额上限（不含）
+MAX_CENTS = 10 ** (MAX_INTEGER_LENGTH + 2)
+
+
+def _build_segment_table(unit: str) -> np.ndarray:
+    """
+    生成带单位的四位段表。
+
+    Args:
+        unit: 段单位（''、'万' 或 '亿'）
+
+    Returns:
+        np.ndarray: 形状为 (2, 10000) 的对象数组，第一维表示是否在段前补“零”，
+                    段值为0时为空字符串
+    """
+    plain = [''] + [FOUR_DIGITS[i] + unit for i in range(1, 10000)]
+    zero_prefixed = [''] + ['零' + text for text in plain[1:]]
+    return np.array([plain, zero_prefixed], dtype=object)
+
+
+def _build_tail_table() -> np.ndarray:
+    """
+    生成“元”及角分部分的表。
+
+    Returns:
+        np.ndarray: 形状为 (2, 100) 的对象数组，第一维表示整数部分是否非零，
+                    第二维为分数（0-99）
+    """
+    yuan = CURRENCY_UNITS['YUAN']
+    without_yuan = []
+    with_yuan = []
+    for cents in range(100):
+        decimal_part = COMMON_DECIMALS[f'{cents:02d}']
+        without_yuan.append(decimal_part)
+        # 角为零而分不为零时，元与分之间补“零”
+        zero = '零' if cents and cents < 10 else ''
+        with_yuan.append(yuan + zero + decimal_part)
+    without_yuan[0] = f"零{yuan}{CURRENCY_UNITS['ZHENG']}"
+    return np.array([without_yuan, with_yuan], dtype=object)
+
+
+# 个、万、亿三段的预计算表
+_SEGMENT_TABLES: Tuple[np.ndarray, np.ndarray, np.ndarray] = (
+    _build_segment_table(LARGE_UNITS[0]),
+    _build_segment_table(LARGE_UNITS[1]),
+    _build_segment_table(LARGE_UNITS[2]),
+)
+
+# 元及角分的预计算表
+_TAIL_TABLE = _build_tail_table()
+
+
+def convert_cents_array(cents: np.ndarray) -> np.ndarray:
+    """
+    批量将以分为单位的整数数组转换为人民币大写。
+
+    Args:
+        cents: 以分为单位的一维整数数组，负数按绝对值处理
+
+    Returns:
+        np.ndarray: 与输入等长的对象数组，元素为人民币大写字符串
+
+    Raises:
+        ValueError: 当输入不是一维整数数组时抛出
+        OverflowError: 当存在整数部分超过12位的金额时抛出
+    """
+    values = np.asarray(cents)
+    if values.ndim != 1 or not np.issubdtype(values.dtype, np.integer):
+        raise ValueError("输入必须为一维整数数组")
+    # 无符号数组转换为 int64 前先检查范围，否则 2**63 以上的值会回绕成负数
+    if values.dtype.kind == 'u' and values.size and values.max() >= MAX_CENTS:
+        raise OverflowError(f"整数部分超出{MAX_INTEGER_LENGTH}位限制")
+    values = np.abs(values.astype(np.int64))
+    # int64 最小值取绝对值后仍为负数
+    if values.size and ((values.max() >= MAX_CENTS) or (values.min() < 0)):
+        raise OverflowError(f"整数部分超出{MAX_INTEGER_LENGTH}位限制")
+
+    yuan, fen = np.divmod(values, 100)
+    upper, low = np.divmod(yuan, 10000)
+    high, mid = np.divmod(upper, 10000)
+
+    # 非最高段前补零的条件：上面有非零段，且该段不足四位或紧邻的上一段为零
+    mid_zero = (high > 0) & (mid < 1000)
+    low_zero = (upper > 0) & ((low < 1000) | (mid == 0))
+
+    result = _SEGMENT_TABLES[2][0, high]
+    result = result + _SEGMENT_TABLES[1][mid_zero.astype(np.intp), mid]
+    result = result + _SEGMENT_TABLES[0][low_zero.astype(np.intp), low]
+    return result + _TAIL_TABLE[(yuan > 0).astype(np.intp), fen]
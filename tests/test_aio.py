@@ -0,0 +1,114 @@
+"""asyncio 异步转换接口模块的测试用例。"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from src.rmb_converter import aio
+from src.rmb_converter.aio import Coalescer, convert_async, convert_many_async, get_coalescer
+from src.rmb_converter.chinese_currency import convert_to_rmb
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_convert_async_coalesces_concurrent_requests() -> None:
+    """测试并发的单次请求被合并为一批，且结果与同步转换一致。"""
+    amounts = [f"{i}.{i % 100:02d}" for i in range(100)]
+
+    async def run() -> List[str]:
+        results = await asyncio.gather(*(convert_async(a) for a in amounts))
+        assert get_coalescer().batches == 1
+        return list(results)
+
+    assert asyncio.run(run()) == [convert_to_rmb(a) for a in amounts]
+
+
+def test_convert_async_error() -> None:
+    """测试无效金额只影响对应请求。"""
+    async def run() -> list:
+        return await asyncio.gather(convert_async('1'), convert_async('abc'),
+                                    return_exceptions=True)
+
+    ok, error = asyncio.run(run())
+    assert ok == '壹元整'
+    assert isinstance(error, ValueError)
+
+
+def test_coalescer_window_and_max_batch() -> None:
+    """测试时间窗口合并与达到批量上限时立即转换。"""
+    async def run() -> Coalescer:
+        coalescer = Coalescer(window=0.01, max_batch=3)
+        futures = [coalescer.submit(str(i)) for i in range(5)]
+        # 前3个达到上限立即完成，后2个等待时间窗口
+        assert all(f.done() for f in futures[:3])
+        assert not futures[3].done()
+        assert await asyncio.gather(*futures) == [convert_to_rmb(str(i)) for i in range(5)]
+        return coalescer
+
+    assert asyncio.run(run()).batches == 2
+
+
+def test_coalescer_converts_distinct_amounts_once(monkeypatch: 'MonkeyPatch') -> None:
+    """测试同一批内重复的金额只转换一次，结果和错误分发给所有请求。"""
+    calls: List[str] = []
+
+    def counting(amount: str) -> str:
+        calls.append(amount)
+        return convert_to_rmb(amount)
+
+    monkeypatch.setattr(aio, 'convert_to_rmb', counting)
+
+    async def run() -> None:
+        coalescer = Coalescer()
+        futures = [coalescer.submit(a) for a in ['1', '2', '1', 'abc', '1', 'abc']]
+        futures[4].cancel()
+        results = await asyncio.gather(*futures[:4], futures[5], return_exceptions=True)
+        assert results[:3] == ['壹元整', '贰元整', '壹元整']
+        assert all(isinstance(r, ValueError) for r in results[3:])
+        assert coalescer.batches == 1
+
+    asyncio.run(run())
+    assert sorted(calls) == ['1', '2', 'abc']
+
+
+def test_coalescer_unexpected_error_only_fails_its_requests(monkeypatch: 'MonkeyPatch') -> None:
+    """测试某个金额抛出意外异常时只影响等待它的请求，同批其他请求照常完成。"""
+
+    def failing(amount: str) -> str:
+        if amount == 'bad':
+            raise TypeError('unsupported')
+        return convert_to_rmb(amount)
+
+    monkeypatch.setattr(aio, 'convert_to_rmb', failing)
+
+    async def run() -> None:
+        coalescer = Coalescer()
+        futures = [coalescer.submit(a) for a in ['1', 'bad', '2', 'bad']]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        assert results[0] == '壹元整'
+        assert results[2] == '贰元整'
+        assert all(isinstance(r, TypeError) for r in results[1::2])
+        assert all(future.done() for future in futures)
+
+    asyncio.run(run())
+
+
+def test_convert_many_async_inline_and_offloaded() -> None:
+    """测试事件循环内分块转换与交给执行器转换的结果一致。"""
+    amounts = [f"{i * 7}.{i % 100:02d}" for i in range(1000)]
+    expected = [convert_to_rmb(a) for a in amounts]
+
+    async def run() -> None:
+        assert await convert_many_async(amounts, chunk_size=64) == expected
+        with ThreadPoolExecutor(1) as executor:
+            assert await convert_many_async(amounts, executor, offload_threshold=10) == expected
+        with pytest.raises(ValueError):
+            await convert_many_async(['1', 'abc'], offload_threshold=1)
+
+    asyncio.run(run())
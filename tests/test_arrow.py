@@ -0,0 +1,108 @@
+"""Arrow / Parquet 列转换模块的测试用例。"""
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.rmb_converter.arrow import (  # noqa: E402
+    convert_array,
+    convert_parquet,
+    convert_table,
+)
+from src.rmb_converter.chinese_currency import convert_to_rmb  # noqa: E402
+from src.rmb_converter.cli import run  # noqa: E402
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_convert_array_nulls_and_errors() -> None:
+    """测试无效金额得到空值和错误信息，空值输入保持为空。"""
+    results, errors = convert_array(pa.array(['1', 'abc', None, '1', '1' * 13]))
+    assert pa.types.is_dictionary(results.type)
+    assert results.to_pylist() == ['壹元整', None, None, '壹元整', None]
+    assert errors.to_pylist() == [None, '输入必须为有效数字', None, None, '整数部分超出12位限制']
+
+
+def test_convert_array_types() -> None:
+    """测试整数、浮点数、decimal 和字典列。"""
+    assert convert_array(pa.array([1, None, 1]))[0].to_pylist() == ['壹元整', None, '壹元整']
+    assert convert_array(pa.array([2.5]))[0].to_pylist() == ['贰元伍角']
+    decimals = pa.array([Decimal('1.23')], type=pa.decimal128(10, 2))
+    assert convert_array(decimals)[0].to_pylist() == ['壹元贰角叁分']
+    encoded = pa.chunked_array([pa.array(['1', 'x']).dictionary_encode(),
+                                pa.array(['x', '2']).dictionary_encode()])
+    results, errors = convert_array(encoded)
+    assert results.to_pylist() == ['壹元整', None, None, '贰元整']
+    assert errors.to_pylist() == [None, '输入必须为有效数字', '输入必须为有效数字', None]
+
+    with pytest.raises(ValueError, match="不支持的金额列类型"):
+        convert_array(pa.array([True]))
+
+
+def test_convert_array_converts_each_value_once(monkeypatch: "MonkeyPatch") -> None:
+    """测试重复取值跨数组块只转换一次。"""
+    calls = []
+
+    def counting(amount: str, rounding: str) -> str:
+        calls.append(amount)
+        return convert_to_rmb(amount, rounding)
+
+    monkeypatch.setattr('src.rmb_converter.batch.convert_to_rmb', counting)
+    amounts = pa.chunked_array([pa.array(['9.9', '1', '9.9'] * 100), pa.array(['1', '2'])])
+    results, _ = convert_array(amounts)
+    assert len(results) == 302
+    assert sorted(calls) == ['1', '2', '9.9']
+
+
+def test_convert_table_rounding() -> None:
+    """测试追加结果列和错误列，并支持舍入方式。"""
+    table = pa.table({'id': [1, 2], 'amount': ['1.005', 'bad']})
+    result = convert_table(table, 'amount', rounding='half-up')
+    assert result.column_names == ['id', 'amount', 'rmb', 'rmb_error']
+    assert result.column('rmb').to_pylist() == ['壹元零壹分', None]
+
+    with pytest.raises(ValueError, match="表中找不到列"):
+        convert_table(table, 'price')
+
+
+def test_convert_parquet_row_groups(tmp_path: Path) -> None:
+    """测试逐个行组转换 Parquet 文件，结果列保持字典编码。"""
+    source = tmp_path / 'in.parquet'
+    target = tmp_path / 'out.parquet'
+    amounts = ['12.5', '0.01', 'oops', None] * 50
+    pq.write_table(pa.table({'amount': amounts}), source, row_group_size=30)
+
+    assert convert_parquet(str(source), str(target), 'amount') == (200, 50)
+    output = pq.ParquetFile(target, read_dictionary=['rmb'])
+    assert output.num_row_groups == pq.ParquetFile(source).num_row_groups
+    table = output.read()
+    assert pa.types.is_dictionary(table.schema.field('rmb').type)
+    assert table.column('rmb').to_pylist()[:4] == ['壹拾贰元伍角', '壹分', None, None]
+    assert table.column('rmb_error').to_pylist()[:4] == [None, None, '输入必须为有效数字', None]
+
+
+def test_cli_parquet(tmp_path: Path, capsys: "CaptureFixture[str]") -> None:
+    """测试 parquet 子命令。"""
+    source = tmp_path / 'in.parquet'
+    target = tmp_path / 'out.parquet'
+    pq.write_table(pa.table({'price': ['1', '2']}), source)
+
+    with pytest.raises(SystemExit) as exc_info:
+        run(['parquet', str(source), str(target), '--column', 'price',
+             '--output-column', 'upper'])
+    assert exc_info.value.code == 0
+    assert pq.read_table(target).column('upper').to_pylist() == ['壹元整', '贰元整']
+
+    with pytest.raises(SystemExit) as exc_info:
+        run(['parquet', str(source), str(target), '--column', 'amount'])
+    assert exc_info.value.code == 1
+    assert "表中找不到列: amount" in capsys.readouterr().err
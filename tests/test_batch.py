@@ -0,0 +1,146 @@
+"""批量去重转换引擎的测试用例。"""
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+import pytest
+
+from src.rmb_converter.batch import convert_batch, convert_value, convert_values, validate_batch
+from src.rmb_converter.chinese_currency import convert_to_rmb
+from src.rmb_converter.input_processor import ERROR_INVALID, ERROR_OVERFLOW
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_convert_value_types() -> None:
+    """测试字符串、Decimal、整数、浮点数、空值和 NaN。"""
+    assert convert_value('1.5') == ('壹元伍角', None)
+    assert convert_value(Decimal('1.005'), 'half-up') == ('壹元零壹分', None)
+    assert convert_value(7) == ('柒元整', None)
+    assert convert_value(2.5) == ('贰元伍角', None)
+    assert convert_value(None) == (None, None)
+    assert convert_value(float('nan')) == (None, None)
+    assert convert_value(Decimal('NaN')) == (None, None)
+    assert convert_value(Decimal('sNaN')) == (None, None)
+    assert convert_value('abc') == (None, '输入必须为有效数字')
+    assert convert_value(float('inf')) == (None, '输入必须为有效数字')
+
+
+def test_convert_values_memo(monkeypatch: "MonkeyPatch") -> None:
+    """测试重复取值只转换一次，memo 跨调用复用。"""
+    calls: List[str] = []
+
+    def counting(amount: str, rounding: str) -> str:
+        calls.append(amount)
+        return convert_to_rmb(amount, rounding)
+
+    monkeypatch.setattr('src.rmb_converter.batch.convert_to_rmb', counting)
+    memo: dict = {}
+    results, errors = convert_values(['1', 'x', '1', None], memo=memo)
+    assert results == ['壹元整', None, '壹元整', None]
+    assert errors == [None, '输入必须为有效数字', None, None]
+    expected: Tuple[List[Optional[str]], List[Optional[str]]] = (['壹元整'], [None])
+    assert convert_values(['1'], memo=memo) == expected
+    assert calls == ['1', 'x']
+
+
+def test_convert_values_memo_limit(monkeypatch: "MonkeyPatch") -> None:
+    """测试 memo 超过上限时被清空。"""
+    monkeypatch.setattr('src.rmb_converter.batch.MEMO_LIMIT', 2)
+    memo: dict = {}
+    convert_values(['1', '2', '3'], memo=memo)
+    assert len(memo) == 3
+    convert_values(['4'], memo=memo)
+    assert list(memo) == ['4']
+
+
+def test_convert_values_unhashable() -> None:
+    """测试不可哈希的取值逐行转换，不写入 memo，也不影响其他行。"""
+    memo: dict = {}
+    results, errors = convert_values([Decimal('sNaN'), '1', [1]], memo=memo)
+    assert results == [None, '壹元整', None]
+    assert errors[:2] == [None, None]
+    assert errors[2] is not None
+    assert list(memo) == ['1']
+
+
+_BATCH = ['1.5', 'abc', '1' * 13, None, '1.5', '0', '999999999999.999', '', 42]
+
+
+def _expected(amounts: List[Any], rounding: str) -> List[Optional[str]]:
+    """
+    逐行调用 convert_to_rmb 得到参照结果。
+
+    Args:
+        amounts: 金额
+        rounding: 舍入方式
+
+    Returns:
+        List[Optional[str]]: 结果，抛出异常的行为 None
+    """
+    expected: List[Optional[str]] = []
+    for amount in amounts:
+        try:
+            expected.append(convert_to_rmb(amount, rounding) if isinstance(amount, str) else None)
+        except (ValueError, OverflowError):
+            expected.append(None)
+    return expected
+
+
+def test_convert_batch() -> None:
+    """测试 convert_batch 的结果、错误码、出错行和错误信息。"""
+    result = convert_batch(_BATCH)
+    assert len(result) == len(_BATCH)
+    assert result.results == _expected(_BATCH, 'truncate')
+    assert list(result.codes) == [0, ERROR_INVALID, ERROR_OVERFLOW, ERROR_INVALID, 0, 0, 0,
+                                  ERROR_INVALID, ERROR_INVALID]
+    assert result.error_rows == [1, 2, 3, 7, 8]
+    assert result.message(0) is None
+    assert result.message(1) == '输入必须为有效数字'
+    assert result.message(2) == '整数部分超出12位限制'
+
+
+def test_convert_batch_carry_overflow() -> None:
+    """测试进位后超出位数的金额得到溢出错误码。"""
+    result = convert_batch(_BATCH, 'half-up')
+    assert result.results == _expected(_BATCH, 'half-up')
+    assert result.codes[6] == ERROR_OVERFLOW
+    assert result.error_rows == [1, 2, 3, 6, 7, 8]
+    assert convert_batch(['999999999999.994'], 'half-up').results == [
+        convert_to_rmb('999999999999.994', 'half-up')]
+
+
+def test_convert_batch_dedupe(monkeypatch: "MonkeyPatch") -> None:
+    """测试批内重复的金额只转换一次。"""
+    calls: List[Tuple[str, str]] = []
+
+    def counting(integer: str, decimal: str) -> str:
+        calls.append((integer, decimal))
+        return convert_to_rmb(f"{integer or '0'}.{decimal}")
+
+    monkeypatch.setattr('src.rmb_converter.batch.format_rmb', counting)
+    result = convert_batch(['1', '2', '1', '1'])
+    assert result.results == ['壹元整', '贰元整', '壹元整', '壹元整']
+    assert calls == [('1', '00'), ('2', '00')]
+
+
+def test_validate_batch() -> None:
+    """测试 validate_batch 的错误码与 convert_batch 一致。"""
+    for rounding in ('truncate', 'half-up', 'half-even'):
+        checked = validate_batch(_BATCH, rounding)
+        converted = convert_batch(_BATCH, rounding)
+        assert checked.results == []
+        assert checked.codes == converted.codes
+        assert checked.error_rows == converted.error_rows
+
+
+def test_batch_invalid_rounding() -> None:
+    """测试不支持的舍入方式在批次开始前报错。"""
+    with pytest.raises(ValueError, match="不支持的舍入方式"):
+        convert_batch(['1'], 'ceiling')
+    with pytest.raises(ValueError, match="不支持的舍入方式"):
+        validate_batch(['1'], 'ceiling')
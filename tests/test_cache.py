@@ -0,0 +1,295 @@
+"""转换缓存管理模块的测试用例。"""
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator
+
+import pytest
+
+from src.rmb_converter import cache as cache_module
+from src.rmb_converter.cache import (
+    ENTRY_BYTES,
+    FRONT_KEY_MAX_LENGTH,
+    SCOPE_SHARED,
+    SCOPE_THREAD,
+    TwoQueueCache,
+    cache_scope,
+    cache_stats,
+    cached,
+    clear_caches,
+    configure_cache,
+    configure_cache_scope,
+    configure_front_cache,
+    front_cache_stats,
+)
+from src.rmb_converter.chinese_currency import (
+    _process_segment,
+    convert_decimal,
+    convert_digit,
+    convert_integer,
+    convert_to_rmb,
+    format_rmb,
+    format_rmb_styled,
+)
+from src.rmb_converter.encoded import format_rmb_encoded
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+@pytest.fixture
+def format_cache() -> Iterator[None]:
+    """在测试前后恢复 format_rmb 缓存层的默认配置。"""
+    maxsize = cache_stats()['format_rmb']['maxsize']
+    clear_caches()
+    yield
+    configure_cache('format_rmb', maxsize)
+    clear_caches()
+
+
+def test_cache_stats_levels() -> None:
+    """测试所有转换层级都已注册。"""
+    assert set(cache_stats()) >= {
+        'convert_digit', 'process_segment', 'convert_integer', 'convert_decimal', 'format_rmb',
+    }
+
+
+def test_cache_hits_misses_evictions(format_cache: None) -> None:
+    """测试命中、未命中和淘汰计数。"""
+    configure_cache('format_rmb', 2)
+    for amount in ('1', '1', '2', '3', '1'):
+        convert_to_rmb(amount)
+    stats = cache_stats()['format_rmb']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 4
+    assert stats['size'] == 2
+    assert stats['evictions'] == 2
+    assert stats['maxsize'] == 2
+
+    clear_caches()
+    assert cache_stats()['format_rmb']['misses'] == 0
+
+
+def test_cache_disabled(format_cache: None) -> None:
+    """测试容量为0时关闭缓存且结果不变。"""
+    configure_cache('format_rmb', 0)
+    assert convert_to_rmb('1234.56') == '壹仟贰佰叁拾肆元伍角陆分'
+    assert cache_stats()['format_rmb'] == {
+        'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 0,
+    }
+
+
+def test_configure_cache_errors() -> None:
+    """测试无效配置。"""
+    with pytest.raises(KeyError):
+        configure_cache('no_such_level', 10)
+    with pytest.raises(ValueError, match="缓存容量不能为负数"):
+        configure_cache('format_rmb', -1)
+
+
+def test_cached_env_override(monkeypatch: "MonkeyPatch") -> None:
+    """测试通过环境变量覆盖默认容量。"""
+    # 使用副本注册，避免测试层级残留在全局注册表中
+    monkeypatch.setattr(cache_module, '_LEVELS', dict(cache_module._LEVELS))
+    monkeypatch.setenv('RMB_CONVERTER_CACHE_SIZES', 'test_env_level=7, other=none')
+    square = cached('test_env_level', 100)(lambda x: x * x)
+    assert square(3) == 9
+    assert cache_stats()['test_env_level']['maxsize'] == 7
+
+
+@pytest.fixture
+def front_cache() -> Iterator[None]:
+    """在测试中开启前门缓存，测试后关闭。"""
+    configure_front_cache(100000)
+    yield
+    configure_front_cache(None)
+
+
+def test_two_queue_promotion() -> None:
+    """测试新键先进入试用队列，被挤出后再次未命中才进入主队列。"""
+    cache = TwoQueueCache(10000)  # 试用队列5条，影子队列12个键，主队列15条
+    cache.put('a', 'A')
+    assert cache.get('a') == 'A'
+    for key in 'bcdef':
+        cache.put(key, key.upper())
+    assert cache.get('a') is None  # 已被挤入影子队列
+    cache.put('a', 'A')
+    assert cache.stats()['promotions'] == 1
+    for key in 'ghijklmnop':
+        cache.put(key, key.upper())
+    assert cache.get('a') == 'A'
+    assert cache.peek('z') is None
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['size'] == 6
+    assert stats['bytes'] <= stats['max_bytes'] == 10000
+
+
+def test_two_queue_scan_resistance() -> None:
+    """测试一次性的键无法冲掉主队列中的常用键。"""
+    cache = TwoQueueCache(10000)
+    hot = [f'hot{i}' for i in range(10)]
+    for _ in range(2):
+        for key in hot:
+            if cache.get(key) is None:
+                cache.put(key, key)
+        for i in range(5):
+            cache.put(f'warmup{i}', i)
+    assert all(cache.get(key) == key for key in hot)
+    for i in range(1000):
+        cache.put(f'scan{i}', i)
+    assert all(cache.get(key) == key for key in hot)
+    assert cache.stats()['evictions'] == 0
+
+
+def test_two_queue_capacity() -> None:
+    """测试各队列不超出容量，预算过小时报错。"""
+    cache = TwoQueueCache(10000)
+    for key in range(30):
+        cache.put(key, key)
+        for filler in range(5):
+            cache.put(f'filler{key}-{filler}', filler)
+        cache.put(key, key)  # 已在影子队列中，进入主队列
+    stats = cache.stats()
+    assert stats['promotions'] == 30
+    assert stats['evictions'] == 15
+    assert stats['size'] == 20
+    assert stats['ghosts'] == 11  # 影子队列已满，最后一个键进入主队列后让出一位
+    assert cache.get(14) is None
+    assert cache.get(29) == 29
+    cache.clear()
+    assert cache.stats()['size'] == cache.stats()['hits'] == 0
+    with pytest.raises(ValueError, match="前门缓存的内存预算过小"):
+        TwoQueueCache(ENTRY_BYTES)
+
+
+@pytest.mark.usefixtures('front_cache')
+def test_front_cache_convert() -> None:
+    """测试开启前门缓存后结果不变，不同写法共用规范写法的结果。"""
+    for _ in range(2):
+        assert convert_to_rmb('99') == '玖拾玖元整'
+        assert convert_to_rmb('99.00') == '玖拾玖元整'
+        assert convert_to_rmb('99.005', 'half-up') == '玖拾玖元零壹分'
+        assert convert_to_rmb('99', style='round') == '玖拾玖圆整'
+    stats = front_cache_stats()
+    assert stats is not None
+    # 第一轮 "99.00" 命中 "99" 写入的规范写法，第二轮全部命中
+    assert stats['hits'] == 5
+    assert stats['misses'] == 3
+
+    with pytest.raises(ValueError):
+        convert_to_rmb('abc')
+    with pytest.raises(ValueError):
+        convert_to_rmb('abc')
+    assert front_cache_stats()['size'] == 6
+    clear_caches()
+    assert front_cache_stats()['hits'] == 0
+
+
+@pytest.mark.usefixtures('front_cache')
+def test_front_cache_skips_long_entries() -> None:
+    """测试超长的输入和超过12位整数的结果不写入前门缓存，结果不变。"""
+    long_amount = '1.5' + '0' * FRONT_KEY_MAX_LENGTH
+    big_amount = '1' + '0' * 20
+    for _ in range(2):
+        assert convert_to_rmb(long_amount) == '壹元伍角'
+        assert convert_to_rmb('0' * FRONT_KEY_MAX_LENGTH + '7') == '柒元整'
+        assert convert_to_rmb(big_amount, units='zhaojing') == '壹垓元整'
+    stats = front_cache_stats()
+    assert stats is not None
+    assert stats['size'] == 0
+    assert stats['hits'] == 0
+    # 只有大额金额的短输入被查找过
+    assert stats['misses'] == 2
+
+
+def test_configure_front_cache() -> None:
+    """测试前门缓存的开关和无效预算。"""
+    assert front_cache_stats() is None
+    configure_front_cache(1 << 20)
+    try:
+        assert front_cache_stats()['max_bytes'] == 1 << 20
+    finally:
+        configure_front_cache(0)
+    assert front_cache_stats() is None
+    with pytest.raises(ValueError, match="前门缓存的内存预算必须为正数"):
+        configure_front_cache(-1)
+
+
+@pytest.fixture
+def thread_scope() -> Iterator[None]:
+    """在测试中使用线程作用域，测试后恢复共用作用域。"""
+    configure_cache_scope(SCOPE_THREAD)
+    yield
+    configure_cache_scope(SCOPE_SHARED)
+    clear_caches()
+
+
+@pytest.mark.usefixtures('thread_scope')
+def test_thread_scope() -> None:
+    """测试线程作用域下各线程各自缓存，结果不变，统计数据为各线程之和。"""
+    assert cache_scope() == SCOPE_THREAD
+    amounts = [f'{value}.{value % 100:02d}' for value in range(1, 201)]
+    expected = {amount: convert_to_rmb(amount) for amount in amounts}
+    results: Dict[int, Dict[str, str]] = {}
+    done = threading.Barrier(5)
+    release = threading.Event()
+
+    def worker(index: int) -> None:
+        """每个线程把全部金额转换两遍，等待主线程读取统计数据后退出。"""
+        for _ in range(2):
+            results[index] = {amount: convert_to_rmb(amount) for amount in amounts}
+        done.wait()
+        release.wait()
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    done.wait()
+    stats = cache_stats()['format_rmb']
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert all(result == expected for result in results.values())
+    # 主线程和4个工作线程各未命中200次，工作线程第二遍全部命中
+    assert stats['misses'] == 5 * 200
+    assert stats['hits'] == 4 * 200
+    assert stats['maxsize'] == 1024
+    # 线程结束后其缓存随之释放
+    assert cache_stats()['format_rmb']['misses'] == 200
+    clear_caches()
+    assert cache_stats()['format_rmb']['misses'] == 0
+
+
+def test_configure_cache_scope_errors() -> None:
+    """测试无效的缓存作用域。"""
+    with pytest.raises(ValueError, match="不支持的缓存作用域: global"):
+        configure_cache_scope('global')
+    assert cache_scope() == SCOPE_SHARED
+
+
+def test_cached_keyword_arguments() -> None:
+    """测试缓存函数在各作用域下都接受关键字参数，结果与位置参数一致。"""
+    scope = cache_scope()
+    try:
+        for current in (SCOPE_SHARED, SCOPE_THREAD):
+            configure_cache_scope(current)
+            assert format_rmb(integer='12', decimal='05') == format_rmb('12', '05')
+            assert format_rmb('12', '05') == '壹拾贰元零伍分'
+            assert convert_integer('12', units='zhaojing') == convert_integer('12', 'zhaojing')
+            assert convert_digit(digit=3) == convert_digit(3)
+            assert _process_segment(
+                segment='0120', position=1, has_next_nonzero=False
+            ) == _process_segment('0120', 1, False)
+            assert convert_decimal(decimal='05') == convert_decimal('05')
+            assert format_rmb_styled(
+                integer='12', decimal='05', style='standard'
+            ) == format_rmb_styled('12', '05', 'standard')
+            assert format_rmb_encoded(
+                integer='12', decimal='05', encoding='gb18030'
+            ) == format_rmb_encoded('12', '05', 'gb18030')
+    finally:
+        configure_cache_scope(scope)
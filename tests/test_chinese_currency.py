@@ -1,16 +1,34 @@
 """人民币数字转中文大写模块的测试用例。"""
+import itertools
+import random
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
 
 from src.rmb_converter.chinese_currency import (
+    DIGITS,
+    FOUR_DIGITS,
+    SECTION_CLASSES,
+    SECTION_FULL,
+    SECTION_LEADING_ZERO,
+    SECTION_ZERO,
+    STANDARD_TABLES,
+    UNITS,
+    convert_cents,
+    convert_decimal,
     convert_digit,
     convert_four_digits,
     convert_integer,
-    convert_decimal,
-    format_rmb,
+    convert_integer_with,
+    convert_many,
     convert_to_rmb,
+    format_rmb,
+    get_style_tables,
+    iter_convert,
 )
+from src.rmb_converter.encoded import get_tables
+from src.rmb_converter.units import UNITS_WANYI, UNITS_ZHAOJING, ZHAOJING_UNITS
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -52,6 +70,36 @@ def test_convert_four_digits() -> None:
     assert convert_four_digits('0100') == '壹佰'
 
 
+def _reference_four_digits(number: str) -> str:
+    """逐位转换四位数的原始算法，用作预计算表的参照。"""
+    result = []
+    if int(number) == 0:
+        return '零'
+
+    number = number.zfill(4)
+    last_was_zero = True
+
+    for i, digit in enumerate(number):
+        digit_int = int(digit)
+        if digit_int == 0:
+            if not last_was_zero and i < 3 and any(int(d) > 0 for d in number[i+1:]):
+                result.append('零')
+            last_was_zero = True
+        else:
+            result.append(DIGITS[digit_int] + UNITS[3 - i])
+            last_was_zero = False
+
+    return ''.join(result).rstrip('零')
+
+
+def test_four_digits_table() -> None:
+    """测试完整的四位数预计算表与逐位算法结果一致。"""
+    assert len(FOUR_DIGITS) == 10000
+    for num in range(10000):
+        assert FOUR_DIGITS[num] == _reference_four_digits(str(num)), num
+        assert convert_four_digits(str(num)) == FOUR_DIGITS[num]
+
+
 def test_convert_integer() -> None:
     """测试整数转换。"""
     # 测试零
@@ -150,6 +198,10 @@ def test_convert_to_rmb() -> None:
     assert convert_to_rmb('1000.01') == '壹仟元零壹分'
     assert convert_to_rmb('10000.00') == '壹万元整'
     
+    # 测试小数截断与舍入
+    assert convert_to_rmb('123.456') == '壹佰贰拾叁元肆角伍分'
+    assert convert_to_rmb('123.456', 'half-up') == '壹佰贰拾叁元肆角陆分'
+
     # 测试科学记数法
     assert convert_to_rmb('1e3') == '壹仟元整'
     assert convert_to_rmb('1.5e3') == '壹仟伍佰元整'
@@ -163,4 +215,237 @@ def test_convert_to_rmb() -> None:
         convert_to_rmb('abc')
     
     with pytest.raises(OverflowError, match="整数部分超出12位限制"):
-        convert_to_rmb('1000000000000.00') 
\ No newline at end of file
+        convert_to_rmb('1000000000000.00')
+
+
+def test_convert_many() -> None:
+    """测试批量转换与逐个转换结果一致且保持输入顺序。"""
+    amounts = ['0', '0.01', '1234.56', '1000.01', '100100100', '-1000.10']
+    assert convert_many(amounts) == [convert_to_rmb(a) for a in amounts]
+    assert convert_many([]) == []
+
+
+def test_convert_many_options(monkeypatch: "MonkeyPatch") -> None:
+    """测试批量转换的选项、Decimal 输入和去重记录的容量上限。"""
+    amounts = ['1.005', '1.005', '1' + '0' * 16, Decimal('2.5')]
+    assert convert_many(amounts, 'half-up', units=UNITS_ZHAOJING, style='round') == [
+        convert_to_rmb(a, 'half-up', units=UNITS_ZHAOJING, style='round') for a in amounts]
+    assert convert_many(['¥1,234'], normalize=True) == ['壹仟贰佰叁拾肆元整']
+
+    monkeypatch.setattr('src.rmb_converter.chinese_currency.MANY_MEMO_LIMIT', 2)
+    amounts = [str(value % 5) for value in range(50)]
+    assert convert_many(amounts) == [convert_to_rmb(a) for a in amounts]
+
+
+def test_iter_convert() -> None:
+    """测试惰性批量转换。"""
+    results = iter_convert(iter(['1', 'abc']))
+    assert next(results) == '壹元整'
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        next(results)
+
+
+def test_convert_cents() -> None:
+    """测试以分为单位的整数金额转换。"""
+    assert convert_cents(0) == '零元整'
+    assert convert_cents(1) == '壹分'
+    assert convert_cents(123456) == convert_to_rmb('1234.56')
+    assert convert_cents(100001) == '壹仟元零壹分'
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_cents(10 ** 14)
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        convert_cents(True)
+
+
+def test_convert_to_rmb_decimal() -> None:
+    """测试 Decimal 输入。"""
+    assert convert_to_rmb(Decimal('1234.56')) == '壹仟贰佰叁拾肆元伍角陆分'
+    assert convert_to_rmb(Decimal('0.05')) == '伍分'
+    assert convert_to_rmb(Decimal('0.00999999999999999999999999999999')) == '零元整'
+    assert convert_to_rmb(Decimal('999999999999.999999999999999999')) == \
+        '玖仟玖佰玖拾玖亿玖仟玖佰玖拾玖万玖仟玖佰玖拾玖元玖角玖分'
+    assert convert_to_rmb(Decimal('1.005'), 'half-up') == '壹元零壹分'
+
+
+def _reference_wanyi(n: int) -> str:
+    """按万万亿式的层级定义递归转换：高位部分接亿级单位，再接低位部分。"""
+    if n < 10 ** 8:
+        high, low = divmod(n, 10 ** 4)
+        if not high:
+            return FOUR_DIGITS[low]
+        text = FOUR_DIGITS[high] + '万'
+        if low:
+            text += ('零' if low < 1000 else '') + FOUR_DIGITS[low]
+        return text
+    width = 8
+    while 10 ** (width * 2) <= n:
+        width *= 2
+    high, low = divmod(n, 10 ** width)
+    text = _reference_wanyi(high) + '亿' * (width // 8)
+    if low:
+        # 高位部分末节为零或低位部分以零开头时，中间隔着零
+        skipped = high % 10 ** 4 == 0 or low < 10 ** (width - 1)
+        text += ('零' if skipped else '') + _reference_wanyi(low)
+    return text
+
+
+def _reference_zhaojing(n: int) -> str:
+    """按万进中数逐个单位递归转换。"""
+    section = (len(str(n)) - 1) // 4
+    high, low = divmod(n, 10 ** (4 * section))
+    text = FOUR_DIGITS[high] + ZHAOJING_UNITS[section]
+    if section and low:
+        text += ('零' if low < 10 ** (4 * section - 1) else '') + _reference_zhaojing(low)
+    return text
+
+
+def _random_integer(rng: random.Random, length: int) -> str:
+    """生成指定位数、零的比例随机的整数字符串。"""
+    zero_ratio = rng.random()
+    digits = [rng.choice('123456789')]
+    for _ in range(length - 1):
+        digits.append('0' if rng.random() < zero_ratio else rng.choice('123456789'))
+    return ''.join(digits)
+
+
+def test_convert_integer_unit_systems() -> None:
+    """测试超过12位的整数在两种单位体系下的转换。"""
+    assert convert_integer('1' + '0' * 12) == '壹万亿'
+    assert convert_integer('1' + '0' * 16) == '壹亿亿'
+    assert convert_integer('1' + '0' * 15 + '1') == '壹亿亿零壹'
+    assert convert_integer('1000100000000') == '壹万零壹亿'
+    assert convert_integer('1000000010000') == '壹万亿零壹万'
+    assert convert_integer('3000024708001') == '叁万亿零贰仟肆佰柒拾万捌仟零壹'
+    assert convert_integer('1' + '0' * 12, UNITS_ZHAOJING) == '壹兆'
+    assert convert_integer('1' + '0' * 16, UNITS_ZHAOJING) == '壹京'
+    assert convert_integer('1000100000000', UNITS_ZHAOJING) == '壹兆零壹亿'
+    assert convert_integer('9' * 52, UNITS_ZHAOJING).endswith('玖佰玖拾玖')
+
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        convert_integer('1' * 53, UNITS_ZHAOJING)
+    with pytest.raises(ValueError, match="不支持的单位体系"):
+        convert_integer('123456789', 'roman')
+
+
+def test_convert_integer_with_tables() -> None:
+    """测试同一引擎按标准、风格和编码的表输出，结果只差逐字替换或编码。"""
+    style_tables = get_style_tables('traditional')
+    encoded_tables = get_tables('gb18030')
+    for number in ('0', '7', '100010001', '1' + '0' * 36, '1000000000000000000000000000000001'):
+        for units in (UNITS_WANYI, UNITS_ZHAOJING):
+            expected = convert_integer(number, units)
+            assert convert_integer_with(number, STANDARD_TABLES, units) == expected
+            assert convert_integer_with(number, style_tables, units) == (
+                expected.translate(style_tables.translation))
+            assert convert_integer_with(number, encoded_tables, units) == (
+                expected.encode('gb18030'))
+
+
+def test_convert_integer_matches_reference() -> None:
+    """测试任意位数的整数与按定义递归转换的结果一致。"""
+    rng = random.Random(0)
+    for _ in range(3000):
+        number = _random_integer(rng, rng.randint(1, 200))
+        assert convert_integer(number, UNITS_WANYI) == _reference_wanyi(int(number)), number
+        if len(number) <= 52:
+            assert convert_integer(number, UNITS_ZHAOJING) == _reference_zhaojing(int(number))
+
+
+# 各类节的代表值：全零；不足千；满千。后两类都含末尾零和中间零的情形
+_SECTION_SAMPLES = (0, 1, 10, 100, 101, 110, 999, 1000, 1001, 1010, 1100, 9999)
+
+
+def _reference_format(integer: str, decimal: str) -> str:
+    """按 spec.md 的规则拼接整数部分、“元”和角分。"""
+    jiao, fen = int(decimal[0]), int(decimal[1])
+    tail = (DIGITS[jiao] + '角' if jiao else '') + (DIGITS[fen] + '分' if fen else '')
+    if integer == '0':
+        return tail or '零元整'
+    zero = '零' if fen and not jiao else ''
+    return _reference_wanyi(int(integer)) + '元' + zero + (tail or '整')
+
+
+def test_section_classes() -> None:
+    """测试节的分类表。"""
+    assert len(SECTION_CLASSES) == 10000
+    assert SECTION_CLASSES[0] == SECTION_ZERO
+    assert {SECTION_CLASSES[v] for v in range(1, 1000)} == {SECTION_LEADING_ZERO}
+    assert {SECTION_CLASSES[v] for v in range(1000, 10000)} == {SECTION_FULL}
+
+
+def test_convert_integer_section_patterns() -> None:
+    """穷举节的组合，与按定义递归转换的结果比较。
+
+    1-4节取全部代表值的组合；5-8节取全部节分类序列（每类一个代表值）；
+    另外每个四位值都分别放在高、中、低节各比较一次。
+    """
+    patterns = [values for count in range(1, 5)
+                for values in itertools.product(_SECTION_SAMPLES, repeat=count)]
+    patterns += [values for count in range(5, 9)
+                 for values in itertools.product((0, 101, 1010), repeat=count)]
+    patterns += [values for value in range(10000)
+                 for values in ((value, 0, 0), (1, value, 1), (1, 0, value))]
+    for values in patterns:
+        number = ''.join(f'{value:04d}' for value in values)
+        assert convert_integer(number) == _reference_wanyi(int(number)), number
+        if int(number):
+            assert convert_integer(number, UNITS_ZHAOJING) == _reference_zhaojing(int(number))
+
+
+def test_format_rmb_all_decimals() -> None:
+    """测试各类整数部分与全部角分组合的衔接。"""
+    for integer in ('0', '1', '10', '1000', '100000000', '100000001', '120000'):
+        for cents in range(100):
+            decimal = f'{cents:02d}'
+            assert format_rmb(integer, decimal) == _reference_format(integer, decimal)
+
+
+def test_convert_to_rmb_units() -> None:
+    """测试指定单位体系后可转换超过12位的金额。"""
+    assert convert_to_rmb('1' + '0' * 16 + '.5', units=UNITS_ZHAOJING) == '壹京元伍角'
+    assert convert_to_rmb('1' + '0' * 16 + '.5', units=UNITS_WANYI) == '壹亿亿元伍角'
+    assert convert_to_rmb('9' * 20 + '.995', 'half-up', UNITS_ZHAOJING) == '壹垓元整'
+    assert convert_to_rmb('1e20', units=UNITS_WANYI) == '壹万亿亿元整'
+    assert convert_to_rmb(Decimal('1' * 30 + '.125'), 'half-even', UNITS_ZHAOJING) == (
+        convert_to_rmb('1' * 30 + '.12', units=UNITS_ZHAOJING))
+    assert convert_to_rmb('1234.56', units=UNITS_ZHAOJING) == '壹仟贰佰叁拾肆元伍角陆分'
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_to_rmb('1' * 13)
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        convert_to_rmb('1' * 53, units=UNITS_ZHAOJING)
+    with pytest.raises(ValueError, match="不支持的单位体系"):
+        convert_to_rmb('1', units='roman')
+
+
+def test_convert_to_rmb_normalize() -> None:
+    """测试 convert_to_rmb 开启规范化后接受千位分隔符、货币标记和全角数字。"""
+    expected = '壹佰贰拾叁万肆仟伍佰陆拾柒元捌角玖分'
+    for amount in ('1,234,567.89', '¥1,234,567.89', 'RMB 1234567.89', '１，２３４，５６７．８９'):
+        assert convert_to_rmb(amount, normalize=True) == expected
+    assert convert_to_rmb('¥1,234', style='prefixed', normalize=True) == '人民币壹仟贰佰叁拾肆元整'
+    assert convert_to_rmb(Decimal('1234'), normalize=True) == '壹仟贰佰叁拾肆元整'
+    with pytest.raises(ValueError):
+        convert_to_rmb('1,234')
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        convert_to_rmb('12,34', normalize=True)
+
+
+def test_convert_to_rmb_numeric() -> None:
+    """测试整数和浮点数金额，以及不受支持的类型。"""
+    assert convert_to_rmb(7) == '柒元整'
+    assert convert_to_rmb(-3) == '叁元整'
+    assert convert_to_rmb(1.5) == '壹元伍角'
+    assert convert_to_rmb(0.1) == '壹角'
+    assert convert_to_rmb(1.005, 'half-up') == '壹元零壹分'  # 按 repr "1.005" 舍入
+    assert convert_to_rmb(123456789012, style='round') == (
+        '壹仟贰佰叁拾肆亿伍仟陆佰柒拾捌万玖仟零壹拾贰圆整')
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_to_rmb(10 ** 12)
+    for value in (float('nan'), float('inf')):
+        with pytest.raises(ValueError, match="输入必须为有效数字"):
+            convert_to_rmb(value)
+    for value, name in ((True, 'bool'), (None, 'NoneType'), ([1], 'list')):
+        with pytest.raises(ValueError, match=f"不支持的金额类型: {name}"):
+            convert_to_rmb(value)  # type: ignore[arg-type]
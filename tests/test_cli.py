@@ -1,9 +1,11 @@
 """命令行接口测试模块。"""
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
 from click.testing import CliRunner
 
-from src.rmb_converter.cli import main
+from src.rmb_converter.cli import main, run
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -42,4 +44,112 @@ def test_cli_overflow_input() -> None:
     runner = CliRunner()
     result = runner.invoke(main, ['1000000000000.00'])
     assert result.exit_code == 1
-    assert '错误' in result.output 
\ No newline at end of file
+    assert '错误' in result.output 
+
+def test_cli_stdin_stream() -> None:
+    """测试从标准输入流式转换。"""
+    runner = CliRunner()
+    result = runner.invoke(main, ['--stdin'], input="100\n0.5\n")
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ['壹佰元整', '伍角']
+
+
+def test_cli_input_file_stream(tmp_path: Path) -> None:
+    """测试从 CSV 文件流式转换，无效行报告后继续处理。"""
+    path = tmp_path / 'amounts.csv'
+    path.write_text("id,amount\na,1\nb,abc\nc,10\n", encoding='utf-8')
+    runner = CliRunner()
+    result = runner.invoke(main, ['--input', str(path), '--format', 'csv', '--column', 'amount'])
+    assert result.exit_code == 1
+    assert 'line,amount,rmb' in result.output
+    assert '2,1,壹元整' in result.output
+    assert '4,10,壹拾元整' in result.output
+    assert '第3行' in result.output
+
+
+def test_cli_stream_missing_column() -> None:
+    """测试流式模式下列名不存在的情况。"""
+    runner = CliRunner()
+    result = runner.invoke(main, ['--stdin', '-f', 'csv', '-c', 'amount'], input="id\n1\n")
+    assert result.exit_code == 1
+    assert '表头中找不到列' in result.output
+
+
+def test_cli_workers(tmp_path: Path) -> None:
+    """测试多进程并行转换文件。"""
+    path = tmp_path / 'amounts.txt'
+    path.write_text("1\n2\n3\n", encoding='utf-8')
+    runner = CliRunner()
+    result = runner.invoke(main, ['--input', str(path), '--workers', '2'])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ['壹元整', '贰元整', '叁元整']
+
+    result = runner.invoke(main, ['--stdin', '--workers', '2'], input="1\n")
+    assert result.exit_code == 1
+    assert '--input' in result.output
+
+
+def test_cli_profile(tmp_path: Path) -> None:
+    """测试流式模式下输出分阶段统计并写出 cProfile 文件。"""
+    profile_path = tmp_path / 'convert.prof'
+    runner = CliRunner()
+    result = runner.invoke(main, ['--stdin', '--profile-output', str(profile_path)],
+                           input="1\n2.5\n")
+    assert result.exit_code == 0
+    assert 'convert_to_rmb' in result.output
+    assert 'format_rmb' in result.output
+    assert profile_path.exists()
+
+    result = runner.invoke(main, ['--stdin', '--profile', '--workers', '2'], input="1\n")
+    assert result.exit_code == 1
+
+    result = runner.invoke(main, ['--stdin', '--profile', '--encoding', 'gbk'], input="1\n2.5\n")
+    assert result.exit_code == 0
+    assert result.stdout_bytes == '壹元整\n贰元伍角\n'.encode('gbk')
+    rows = {line.split()[0]: line.split()[1] for line in result.stderr.splitlines()[1:]
+            if line.strip()}
+    assert rows['format_rmb_encoded'] == '2'
+
+
+def test_cli_encoding() -> None:
+    """测试按指定编码直接输出字节。"""
+    runner = CliRunner()
+    result = runner.invoke(main, ['--encoding', 'GB18030', '12.5'])
+    assert result.exit_code == 0
+    assert result.stdout_bytes == '壹拾贰元伍角\n'.encode('gb18030')
+
+    result = runner.invoke(main, ['--stdin', '-e', 'gbk'], input="1\nabc\n0.5\n")
+    assert result.exit_code == 1
+    assert result.stdout_bytes == '壹元整\n伍角\n'.encode('gbk')
+
+    result = runner.invoke(main, ['--stdin', '-e', 'gbk', '--format', 'jsonl', '--column', 'a'],
+                           input='{"a": "1"}\n')
+    assert result.exit_code == 0
+    assert '壹元整' in result.stdout_bytes.decode('gbk')
+
+    result = runner.invoke(main, ['--encoding', 'latin-1', '1'])
+    assert result.exit_code == 2
+    assert '不支持的输出编码' in result.output
+
+
+def test_run_dispatch(monkeypatch: "MonkeyPatch") -> None:
+    """测试命令分发：serve 启动服务，其他参数执行转换。"""
+    calls = []
+    monkeypatch.setattr('src.rmb_converter.server.serve', lambda *args: calls.append(args))
+    with pytest.raises(SystemExit) as exc_info:
+        run(['serve', '--port', '9999'])
+    assert exc_info.value.code == 0
+    assert calls == [('127.0.0.1', 9999, None)]
+
+    with pytest.raises(SystemExit) as exc_info:
+        run(['--workers', '1', '1'])
+    assert exc_info.value.code == 0
+
+
+def test_run_single_amount(capsys: "CaptureFixture[str]") -> None:
+    """测试单个金额直接转换，输出与 click 命令一致。"""
+    assert run(['1234.56']) == 0
+    assert capsys.readouterr().out == "壹仟贰佰叁拾肆元伍角陆分\n"
+
+    assert run(['abc']) == 1
+    assert capsys.readouterr().err == "错误: 输入必须为有效数字\n"
@@ -0,0 +1,98 @@
+"""按编码直接输出字节的转换模块的测试用例。"""
+import io
+import random
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from src.rmb_converter.benchmark import DISTRIBUTIONS
+from src.rmb_converter.chinese_currency import convert_integer, convert_to_rmb
+from src.rmb_converter.encoded import (
+    ENCODINGS,
+    FLUSH_SIZE,
+    append_rmb,
+    convert_stream_encoded,
+    encode_integer,
+    encode_rmb,
+    get_tables,
+    normalize_encoding,
+)
+from src.rmb_converter.units import UNITS_WANYI, UNITS_ZHAOJING
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_normalize_encoding() -> None:
+    """测试编码名称规范化。"""
+    assert normalize_encoding('GB18030') == 'gb18030'
+    assert normalize_encoding('utf8') == 'utf-8'
+    assert normalize_encoding('cp936') == 'gbk'
+    assert get_tables('GBK') is get_tables('gbk')
+    for name in ('latin-1', 'no-such-codec'):
+        with pytest.raises(ValueError, match="不支持的输出编码"):
+            normalize_encoding(name)
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+def test_encode_rmb_matches_str(encoding: str) -> None:
+    """测试各编码下的结果与先转换再编码逐字节一致。"""
+    rng = random.Random(0)
+    amounts = ['0', '0.05', '0.5', '1.05', '100000000001.01', '1.005']
+    for generate in DISTRIBUTIONS.values():
+        amounts += generate(rng, 500)
+    for amount in amounts:
+        assert encode_rmb(amount, encoding) == convert_to_rmb(amount).encode(encoding), amount
+    assert encode_rmb('1.005', encoding, 'half-up') == '壹元零壹分'.encode(encoding)
+
+
+def test_encode_integer_unit_systems() -> None:
+    """测试超过32位的万万亿式单位和万进中数单位。"""
+    tables = get_tables('gb18030')
+    for number in ('1' + '0' * 40 + '1', '9' * 60, '1' * 52, '00'):
+        assert encode_integer(number, tables) == convert_integer(number).encode('gb18030')
+        if len(number) <= 52:
+            assert encode_integer(number, tables, UNITS_ZHAOJING) == (
+                convert_integer(number, UNITS_ZHAOJING).encode('gb18030'))
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        encode_integer('1' * 53, tables, UNITS_ZHAOJING)
+    assert encode_integer('1' * 53, tables, UNITS_WANYI)
+
+
+def test_append_rmb() -> None:
+    """测试追加到调用方提供的 bytearray。"""
+    buffer = bytearray(b'>')
+    assert append_rmb(buffer, '12', 'gbk') == len('壹拾贰元整'.encode('gbk'))
+    assert buffer == b'>' + '壹拾贰元整'.encode('gbk')
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        append_rmb(buffer, 'abc')
+
+
+def test_convert_stream_encoded() -> None:
+    """测试流式转换：跳过空行，报告无效行，超过缓冲区大小时分块写出。"""
+    outfile = io.BytesIO()
+    errfile = io.StringIO()
+    counts = convert_stream_encoded(io.StringIO("1\n\nabc\n0.5\n"), outfile, 'gb18030', errfile)
+    assert counts == (2, 1)
+    assert outfile.getvalue() == '壹元整\n伍角\n'.encode('gb18030')
+    assert errfile.getvalue() == "第3行: 错误: 输入必须为有效数字 ('abc')\n"
+
+    writes: List[int] = []
+
+    class Recorder(io.BytesIO):
+        """记录每次写出的字节数。"""
+
+        def write(self, data: bytes) -> int:  # type: ignore[override]
+            """记录并写出。"""
+            writes.append(len(data))
+            return super().write(data)
+
+    rows = FLUSH_SIZE // 10 * 2
+    recorder = Recorder()
+    assert convert_stream_encoded(io.StringIO("1\n" * rows), recorder, 'utf-8') == (rows, 0)
+    assert len(writes) > 1
+    assert recorder.getvalue() == '壹元整\n'.encode('utf-8') * rows
@@ -1,9 +1,27 @@
 """输入处理模块的测试用例。"""
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
 
-from src.rmb_converter.input_processor import validate_number, process_number
+from src.rmb_converter.input_processor import (
+    ERROR_INVALID,
+    ERROR_NONE,
+    ERROR_OVERFLOW,
+    MAX_EXPANDED_LENGTH,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_TRUNCATE,
+    error_for,
+    normalize_amount,
+    parse_amount,
+    process_decimal,
+    process_number,
+    process_value,
+    scan_digits,
+    split_cents,
+    validate_number,
+)
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -51,7 +69,8 @@ def test_validate_number_length() -> None:
 
 def test_process_number_valid() -> None:
     """测试数字处理功能。"""
-    assert process_number("123.456") == ("123", "46")
+    # 默认截断至两位小数
+    assert process_number("123.456") == ("123", "45")
     assert process_number("0.1") == ("0", "10")
     assert process_number("1000") == ("1000", "00")
     assert process_number("-123.45") == ("123", "45")
@@ -67,10 +86,218 @@ def test_process_number_invalid() -> None:
         process_number("1000000000000.00")
 
 
+def test_process_number_rejects_float_only_forms() -> None:
+    """测试 float() 接受但不属于金额写法的输入被拒绝，全角数字可经规范化接受。"""
+    for text in ('1_000', '1_000.5', '１２３', '１２３．４５', '٣', 'inf', 'nan', 'infinity'):
+        with pytest.raises(ValueError, match="输入必须为有效数字"):
+            process_number(text)
+    assert process_number('１２３．４５', normalize=True) == ('123', '45')
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        process_number('1_000', normalize=True)
+
+
 def test_process_number_negative() -> None:
     """测试负数处理的特殊情况。"""
     assert process_number("-0") == ("0", "00")
     assert process_number("-0.0") == ("0", "00")
     assert process_number("-000123.45") == ("123", "45")
     assert process_number("-0.45") == ("0", "45")
-    assert process_number("-1.00") == ("1", "00") 
\ No newline at end of file
+    assert process_number("-1.00") == ("1", "00")
+
+
+def test_process_number_exponent() -> None:
+    """测试科学记数法输入。"""
+    assert process_number("1e3") == ("1000", "00")
+    assert process_number("1.5e3") == ("1500", "00")
+    assert process_number("12345e-2") == ("123", "45")
+    assert process_number("5e-3") == ("0", "00")
+    assert process_number("0e999999") == ("0", "00")
+    assert process_number("1e-999999") == ("0", "00")
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        process_number("1e12")
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        process_number("1e999999999")
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        process_number("1e")
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        process_number("1e1.5")
+
+
+def test_process_number_rejects_non_ascii_and_specials() -> None:
+    """测试拒绝特殊值和非ASCII数字。"""
+    for text in ("inf", "nan", "1_000", "１２３", ".", "", "+", "1.2.3", "-.e1"):
+        with pytest.raises(ValueError, match="输入必须为有效数字"):
+            process_number(text)
+
+
+def test_process_number_exact_precision() -> None:
+    """测试12位整数范围内的分位精确无误。"""
+    assert process_number("999999999999.99") == ("999999999999", "99")
+    assert process_number("123456789012.07") == ("123456789012", "07")
+    assert process_number("  000.10  ") == ("0", "10")
+    assert process_number(".5") == ("0", "50")
+    assert process_number("5.") == ("5", "00")
+
+
+def test_process_number_rounding_modes() -> None:
+    """测试截断、四舍五入和银行家舍入。"""
+    assert process_number("1.005", ROUND_TRUNCATE) == ("1", "00")
+    assert process_number("1.005", ROUND_HALF_UP) == ("1", "01")
+    assert process_number("1.004", ROUND_HALF_UP) == ("1", "00")
+    assert process_number("1.005", ROUND_HALF_EVEN) == ("1", "00")
+    assert process_number("1.015", ROUND_HALF_EVEN) == ("1", "02")
+    assert process_number("1.0051", ROUND_HALF_EVEN) == ("1", "01")
+    assert process_number("1.0050", ROUND_HALF_EVEN) == ("1", "00")
+    assert process_number("9.999", ROUND_HALF_UP) == ("10", "00")
+    assert process_number("0.995", ROUND_HALF_EVEN) == ("1", "00")
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        process_number("999999999999.995", ROUND_HALF_UP)
+    with pytest.raises(ValueError, match="不支持的舍入方式"):
+        process_number("1.00", "ceiling")
+
+
+def test_parse_amount() -> None:
+    """测试解析为整数元和分。"""
+    assert parse_amount("-000123.456") == (123, 45)
+    assert parse_amount("0") == (0, 0)
+    assert parse_amount("999999999999.99") == (999999999999, 99)
+    assert parse_amount("0.125", ROUND_HALF_EVEN) == (0, 12)
+
+
+def test_split_cents() -> None:
+    """测试以分为单位的整数金额拆分。"""
+    assert split_cents(0) == ("0", "00")
+    assert split_cents(5) == ("0", "05")
+    assert split_cents(12345) == ("123", "45")
+    assert split_cents(-100) == ("1", "00")
+    assert split_cents(99999999999999) == ("999999999999", "99")
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        split_cents(100000000000000)
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        split_cents(1.5)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        split_cents(True)
+
+
+def test_process_decimal() -> None:
+    """测试 Decimal 金额处理与舍入方式。"""
+    assert process_decimal(Decimal("123.456")) == ("123", "45")
+    assert process_decimal(Decimal("123.456"), ROUND_HALF_UP) == ("123", "46")
+    assert process_decimal(Decimal("0.125"), ROUND_HALF_EVEN) == ("0", "12")
+    assert process_decimal(Decimal("-0.1")) == ("0", "10")
+    assert process_decimal(Decimal("1E+3")) == ("1000", "00")
+    assert process_decimal(Decimal("0E+20")) == ("0", "00")
+    assert process_decimal(Decimal("999999999999.99")) == ("999999999999", "99")
+    # 超出 Decimal 默认 28 位精度的小数位不能被上下文舍入
+    assert process_decimal(Decimal("0.00999999999999999999999999999999")) == ("0", "00")
+    assert process_decimal(Decimal("999999999999.999999999999999999")) == ("999999999999", "99")
+    assert process_decimal(Decimal("1E-999999999"), ROUND_HALF_UP) == ("0", "00")
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        process_decimal(Decimal("1000000000000"))
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        process_decimal(Decimal("999999999999.995"), ROUND_HALF_UP)
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        process_decimal(Decimal("NaN"))
+    with pytest.raises(ValueError, match="不支持的舍入方式"):
+        process_decimal(Decimal("1"), "ceiling")
+
+
+def test_process_number_max_length() -> None:
+    """测试整数位数上限可调整或取消。"""
+    assert process_number('1' * 20 + '.5', max_length=52) == ('1' * 20, '50')
+    assert process_number('1' * 100, max_length=None) == ('1' * 100, '00')
+    assert process_number('9' * 100 + '.995', ROUND_HALF_UP, None) == ('1' + '0' * 100, '00')
+    assert process_number('1e30', max_length=None) == ('1' + '0' * 30, '00')
+
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        process_number('1' * 53, max_length=52)
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        process_number('9' * 52 + '.999', ROUND_HALF_UP, 52)
+    with pytest.raises(OverflowError, match=f"整数部分超出{MAX_EXPANDED_LENGTH}位限制"):
+        process_number('1e999999999', max_length=None)
+
+
+def test_process_decimal_max_length() -> None:
+    """测试超出 Decimal 默认精度的金额仍然精确。"""
+    value = Decimal('1' * 40 + '.125')
+    assert process_decimal(value, max_length=None) == ('1' * 40, '12')
+    assert process_decimal(value, ROUND_HALF_UP, None) == ('1' * 40, '13')
+    with pytest.raises(OverflowError, match="整数部分超出52位限制"):
+        process_decimal(Decimal('1E+52'), max_length=52)
+
+
+def test_scan_digits() -> None:
+    """测试 scan_digits 以错误码表示无效输入，不抛出异常。"""
+    assert scan_digits('-000123.45') == (ERROR_NONE, '123', '45')
+    assert scan_digits('1.5e3') == (ERROR_NONE, '1500', '')
+    assert scan_digits('0') == (ERROR_NONE, '', '')
+    for invalid in ('', 'abc', '1.2.3', '１２', 'nan', '1e'):
+        assert scan_digits(invalid) == (ERROR_INVALID, '', '')
+    assert scan_digits('1' * 13) == (ERROR_OVERFLOW, '', '')
+    assert scan_digits('1' * 13, None) == (ERROR_NONE, '1' * 13, '')
+    assert scan_digits('1e999999999', None) == (ERROR_OVERFLOW, '', '')
+
+
+def test_error_for() -> None:
+    """测试错误码对应的异常与 process_number 抛出的一致。"""
+    for amount in ('abc', '1' * 13, '1e999999999'):
+        with pytest.raises((ValueError, OverflowError)) as excinfo:
+            process_number(amount)
+        code = scan_digits(amount)[0]
+        error = error_for(code)
+        assert type(error) is excinfo.type
+        assert str(error) == str(excinfo.value)
+    assert str(error_for(ERROR_OVERFLOW, None)) == f"整数部分超出{MAX_EXPANDED_LENGTH}位限制"
+
+
+def test_normalize_amount() -> None:
+    """测试千位分隔符、货币标记和全角字符的规范化。"""
+    assert normalize_amount('1,234,567.89') == '1234567.89'
+    assert normalize_amount('¥1,234.00') == '1234.00'
+    assert normalize_amount('RMB 500') == '500'
+    assert normalize_amount('rmb12') == '12'
+    assert normalize_amount('１２３．４５') == '123.45'
+    assert normalize_amount('￥１，２３４．５') == '1234.5'
+    assert normalize_amount('\u3000-¥1,234.5 ') == '-1234.5'
+    assert normalize_amount('¥-5') == '-5'
+    assert normalize_amount('1234.56') == '1234.56'
+    assert normalize_amount('1e3') == '1e3'
+
+
+@pytest.mark.parametrize('amount', [
+    '1,23', '1234,567', ',123', '1,,234', '1,234.5,6', '12,3456', '1,234e5', '1,234,',
+    '¥', 'RMB', '- ¥5', '¥ 1 ,234',
+])
+def test_normalize_amount_strict(amount: str) -> None:
+    """测试千位分隔符位置不正确或货币标记后没有金额时报错。"""
+    with pytest.raises(ValueError, match="输入必须为有效数字"):
+        process_number(amount, normalize=True)
+
+
+def test_process_number_normalize() -> None:
+    """测试规范化前端默认关闭，开启后与规范写法结果一致。"""
+    for amount in ('1,234.56', '¥1,234.56', 'RMB 1234.56', '１２３４．５６'):
+        with pytest.raises(ValueError):
+            process_number(amount)
+        assert process_number(amount, normalize=True) == ('1234', '56')
+    assert process_number('¥1,234.565', ROUND_HALF_UP, normalize=True) == ('1234', '57')
+    with pytest.raises(OverflowError):
+        process_number('¥1,000,000,000,000', normalize=True)
+    with pytest.raises(ValueError):
+        process_number('5¥', normalize=True)
+    assert validate_number('¥1,234.5', normalize=True) == 1234.5
+
+
+def test_process_value() -> None:
+    """测试非字符串金额的处理。"""
+    assert process_value(Decimal('1.239')) == ('1', '23')
+    assert process_value(1234) == ('1234', '00')
+    assert process_value(0.29) == ('0', '29')
+    assert process_value(2.675, ROUND_HALF_UP) == ('2', '68')
+    assert process_value(10 ** 20, max_length=None) == ('1' + '0' * 20, '00')
+    with pytest.raises(ValueError, match="不支持的金额类型: bool"):
+        process_value(False)
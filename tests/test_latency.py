@@ -0,0 +1,21 @@
+"""延迟统计工具模块的测试用例。"""
+from typing import TYPE_CHECKING
+
+from src.rmb_converter.latency import percentile
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_percentile() -> None:
+    """测试最近秩法分位数。"""
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) == 0.0
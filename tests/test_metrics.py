@@ -0,0 +1,92 @@
+"""转换流程分阶段计时模块的测试用例。"""
+import io
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from src.rmb_converter import chinese_currency, encoded
+from src.rmb_converter.chinese_currency import convert_many
+from src.rmb_converter.metrics import (
+    METRICS_COLUMNS,
+    disable_metrics,
+    enable_metrics,
+    format_metrics,
+    get_metrics,
+    metrics_enabled,
+    reset_metrics,
+)
+from src.rmb_converter.report import display_width
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+@pytest.fixture
+def metrics() -> Iterator[None]:
+    """启用计时并在测试结束后恢复。"""
+    reset_metrics()
+    chinese_currency.format_rmb.cache.clear()  # type: ignore[attr-defined]
+    encoded.format_rmb_encoded.cache.clear()  # type: ignore[attr-defined]
+    enable_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+def test_metrics_disabled_restores_functions() -> None:
+    """测试停用后恢复原函数，未启用时不计数。"""
+    original = chinese_currency.format_rmb
+    enable_metrics()
+    enable_metrics()
+    assert metrics_enabled()
+    assert chinese_currency.format_rmb is not original
+    disable_metrics()
+    assert not metrics_enabled()
+    assert chinese_currency.format_rmb is original
+
+    reset_metrics()
+    chinese_currency.convert_to_rmb('1')
+    assert get_metrics()['convert_to_rmb']['calls'] == 0
+
+
+def test_metrics_counts_stages(metrics: None) -> None:
+    """测试各阶段的调用次数、耗时和异常率。"""
+    # 批内重复的金额只转换一次；第二批的相同金额命中 format_rmb 缓存
+    convert_many(['1234.56', '1234.56'])
+    convert_many(['1234.56'])
+    with pytest.raises(ValueError):
+        chinese_currency.convert_to_rmb('abc')
+
+    stats = get_metrics()
+    assert stats['process_number']['calls'] == 3
+    assert stats['process_number']['errors'] == 1
+    assert stats['process_number']['error_rate'] == pytest.approx(1 / 3)
+    assert stats['scan_digits']['calls'] == 3
+    # 第二次相同金额命中 format_rmb 缓存，不再调用 convert_integer
+    assert stats['format_rmb']['calls'] == 2
+    assert stats['convert_integer']['calls'] == 1
+    assert stats['convert_to_rmb']['calls'] == 1
+    assert stats['format_rmb']['total_ns'] > 0
+    table = format_metrics(stats).splitlines()
+    assert table[0].split() == ['阶段', '调用次数', '累计(ms)', '平均(ns)', '异常率']
+    assert [line.split()[0] for line in table[1:]] == list(stats)
+    # 中文表头与数据行按显示宽度对齐
+    assert {display_width(line) for line in table} == {sum(METRICS_COLUMNS)}
+
+
+def test_metrics_counts_encoded_stream(metrics: None) -> None:
+    """测试按编码直接输出的流式转换也计入各阶段。"""
+    outfile = io.BytesIO()
+    assert encoded.convert_stream_encoded(io.StringIO('100000\nabc\n'), outfile) == (1, 1)
+    assert outfile.getvalue() == '壹拾万元整\n'.encode()
+
+    stats = get_metrics()
+    assert stats['process_number']['calls'] == 2
+    assert stats['process_number']['errors'] == 1
+    assert stats['format_rmb_encoded']['calls'] == 1
+    assert stats['encode_integer']['calls'] == 1
+    assert stats['convert_to_rmb']['calls'] == 0
@@ -0,0 +1,70 @@
+"""pandas Series 访问器的测试用例。"""
+from decimal import Decimal
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from src.rmb_converter.batch import convert_value  # noqa: E402
+from src.rmb_converter.chinese_currency import convert_to_rmb  # noqa: E402
+from src.rmb_converter.pandas_ext import convert_series  # noqa: E402
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_upper_nulls_and_errors() -> None:
+    """测试无效金额和空值得到空值，保留索引和列名。"""
+    series = pd.Series(['1', 'abc', None, '1', float('nan')], index=list('abcde'), name='amount')
+    result = series.rmb.upper()
+    assert list(result.index) == list('abcde')
+    assert result.name == 'amount'
+    assert result.isna().tolist() == [False, True, True, False, True]
+    assert result.dropna().tolist() == ['壹元整', '壹元整']
+    errors = series.rmb.errors()
+    assert errors.isna().tolist() == [True, False, True, True, True]
+    assert errors['b'] == '输入必须为有效数字'
+
+
+def test_upper_types() -> None:
+    """测试浮点数、可空整数、Decimal 和字符串类型列。"""
+    assert pd.Series([2.5, 1.0]).rmb.upper().tolist() == ['贰元伍角', '壹元整']
+    assert pd.Series([1, None], dtype='Int64').rmb.upper().notna().tolist() == [True, False]
+    assert pd.Series([Decimal('1.005')]).rmb.upper('half-up').tolist() == ['壹元零壹分']
+    assert pd.Series(['3'], dtype='string').rmb.upper().tolist() == ['叁元整']
+    assert len(pd.Series([], dtype=float).rmb.upper()) == 0
+
+
+def test_convert_value_pandas_na() -> None:
+    """测试 pandas.NA 与自身比较结果不能转为 bool，仍视为空值。"""
+    assert convert_value(pd.NA) == (None, None)
+    assert convert_value(pd.NaT) == (None, None)
+    assert pd.Series(['1', pd.NA], dtype=object).rmb.upper().isna().tolist() == [False, True]
+
+
+def test_convert_frame() -> None:
+    """测试 convert 一次返回结果列和错误列。"""
+    frame = pd.Series(['1', 'x'], index=[10, 20]).rmb.convert()
+    assert list(frame.columns) == ['rmb', 'rmb_error']
+    assert list(frame.index) == [10, 20]
+    assert frame.loc[20, 'rmb_error'] == '输入必须为有效数字'
+
+
+def test_converts_each_value_once(monkeypatch: "MonkeyPatch") -> None:
+    """测试重复取值只转换一次，结果与逐行转换一致。"""
+    calls: List[str] = []
+
+    def counting(amount: str, rounding: str) -> str:
+        calls.append(amount)
+        return convert_to_rmb(amount, rounding)
+
+    monkeypatch.setattr('src.rmb_converter.batch.convert_to_rmb', counting)
+    amounts = ['9.9', '1', '9.9', '2'] * 100
+    results, _ = convert_series(pd.Series(amounts))
+    assert results.tolist() == [convert_to_rmb(a) for a in amounts]
+    assert sorted(calls) == ['1', '2', '9.9']
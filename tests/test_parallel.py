@@ -0,0 +1,107 @@
+"""多进程并行文件转换模块的测试用例。"""
+import io
+import mmap
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+
+from src.rmb_converter.parallel import _throttle, convert_file_parallel, split_chunks
+from src.rmb_converter.stream import convert_stream
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def _serial(path: Path, fmt: str = 'text', column: Optional[str] = None) -> tuple:
+    """使用单进程流式转换得到参考输出。"""
+    outfile = io.StringIO()
+    errfile = io.StringIO()
+    with open(path, encoding='utf-8', newline='') as infile:
+        counts = convert_stream(infile, outfile, fmt, column, errfile)
+    return outfile.getvalue(), errfile.getvalue(), counts
+
+
+def _parallel(path: Path, fmt: str = 'text', column: Optional[str] = None) -> tuple:
+    """使用小分块并行转换，确保产生多个分块。"""
+    outfile = io.StringIO()
+    errfile = io.StringIO()
+    counts = convert_file_parallel(str(path), outfile, 2, fmt, column, errfile, chunk_size=64)
+    return outfile.getvalue(), errfile.getvalue(), counts
+
+
+def test_split_chunks_on_line_boundaries(tmp_path: Path) -> None:
+    """测试分块边界均落在换行符之后且覆盖整个文件。"""
+    path = tmp_path / 'amounts.txt'
+    path.write_bytes(b''.join(f"{i}.{i % 100:02d}\n".encode() for i in range(500)) + b'7')
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    chunks = split_chunks(mapped, 100)
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == len(mapped)
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        assert end == start
+        assert mapped[end - 1:end] == b'\n'
+    mapped.close()
+
+
+def test_convert_file_parallel_matches_serial(tmp_path: Path) -> None:
+    """测试并行转换的输出顺序和错误报告与单进程一致。"""
+    path = tmp_path / 'amounts.txt'
+    lines = [f"{i * 37}.{i % 100:02d}" if i % 50 else 'bad' for i in range(1, 400)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    assert _parallel(path) == _serial(path)
+    assert _parallel(path, 'jsonl') == _serial(path, 'jsonl')
+
+
+def test_convert_file_parallel_csv_column(tmp_path: Path) -> None:
+    """测试并行转换 CSV 列时每个分块都能正确识别表头。"""
+    path = tmp_path / 'ledger.csv'
+    rows = [f"r{i},{i}.5" for i in range(300)]
+    path.write_text('id,amount\n' + '\n'.join(rows) + '\n', encoding='utf-8')
+    result = _parallel(path, 'csv', 'amount')
+    assert result == _serial(path, 'csv', 'amount')
+    assert result[0].count('line,amount,rmb') == 1
+
+    with pytest.raises(ValueError, match="表头中找不到列"):
+        _parallel(path, 'csv', 'price')
+
+
+def test_convert_file_parallel_empty(tmp_path: Path) -> None:
+    """测试空文件。"""
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    assert _parallel(path) == ('', '', (0, 0))
+
+
+def test_throttle_bounds_in_flight() -> None:
+    """测试派发的任务数不超过名额，归还名额后继续派发，结束后不再派发。"""
+    slots = threading.Semaphore(2)
+    stopped = threading.Event()
+    tasks = _throttle(iter(range(10)), slots, stopped)
+    assert [next(tasks), next(tasks)] == [0, 1]
+    assert not slots.acquire(blocking=False)
+    slots.release()
+    assert next(tasks) == 2
+    stopped.set()
+    slots.release()
+    assert list(tasks) == []
+
+
+def test_convert_file_parallel_max_in_flight(tmp_path: Path) -> None:
+    """测试每次只派发一个分块时输出不变，以及无效的上限。"""
+    path = tmp_path / 'amounts.txt'
+    lines = [f"{i * 37}.{i % 100:02d}" if i % 50 else 'bad' for i in range(1, 400)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    outfile = io.StringIO()
+    errfile = io.StringIO()
+    counts = convert_file_parallel(str(path), outfile, 2, 'jsonl', None, errfile, chunk_size=64,
+                                   max_in_flight=1)
+    assert (outfile.getvalue(), errfile.getvalue(), counts) == _serial(path, 'jsonl')
+    with pytest.raises(ValueError, match="同时派发的分块数必须大于0"):
+        convert_file_parallel(str(path), io.StringIO(), 2, max_in_flight=0)
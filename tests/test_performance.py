@@ -1,177 +1,614 @@
-"""性能测试模块。"""
+"""性能测试模块。
+
+基准测试的计时、分布和比较逻辑位于 rmb_converter.benchmark；
+此处用较小的规模运行各项基准，校验结果结构、调用次数、内存分配预算和各实现的结果一致，
+并打印报告（pytest -s 可见）。
+比较各实现相对快慢的计时测试标记为 perf，受机器负载影响，默认不运行；
+需要时用 pytest -m perf 运行。
+完整规模的测量与基线比较请运行 python -m src.rmb_converter.benchmark。
+"""
+import asyncio
+import importlib.util
+import io
+import json
+import os
 import random
-import time
-from typing import List, Dict, Any
+import subprocess
+import sys
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
-from src.rmb_converter.chinese_currency import convert_to_rmb
+import pytest
 
-def generate_test_cases(count: int = 1000) -> List[str]:
-    """
-    生成测试用例。
+from src.rmb_converter.aio import convert_async, convert_many_async
+from src.rmb_converter.benchmark import (
+    ALLOCATION_COLUMNS,
+    DISTRIBUTIONS,
+    FRAME_COLUMNS,
+    REPORT_COLUMNS,
+    compare,
+    format_allocation_report,
+    format_frame_report,
+    format_report,
+    main,
+    measure,
+    run_allocation_suite,
+    run_batch_suite,
+    run_frame_suite,
+    run_many_suite,
+    run_normalize_suite,
+    run_suite,
+    run_thread_suite,
+    run_zipf_suite,
+)
+from src.rmb_converter.cache import cache_scope, cache_stats, clear_caches, configure_cache
+from src.rmb_converter.chinese_currency import (
+    convert_cents,
+    convert_integer,
+    convert_many,
+    convert_to_rmb,
+)
+from src.rmb_converter.latency import percentile
+from src.rmb_converter.parallel import convert_file_parallel
+from src.rmb_converter.report import display_width
 
-    Args:
-        count: 测试用例数量
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+# 项目根目录，子进程在此目录下以 src.rmb_converter 导入包
+ROOT = Path(__file__).resolve().parents[1]
+
+# chinese_currency 模块自身（不含依赖）的导入耗时上限（微秒），实测约4毫秒；
+# 现场生成四位数表约需数十毫秒，超过此上限说明导入路径退化
+IMPORT_BUDGET_US = 8000
+
+# 导入 chinese_currency 时本包各模块自身导入耗时之和的上限（微秒），实测约7毫秒；
+# 依赖模块（input_processor、cache 等）的导入退化也会被计入
+PACKAGE_IMPORT_BUDGET_US = 14000
+
+# 首次转换的耗时上限（微秒）；惰性生成表会使首次调用超过此上限
+FIRST_CALL_BUDGET_US = 5000
+
+# 各层级处理12位金额时每次调用的内存分配上限：(留存块数, 峰值字节数)。
+# 峰值含读取统计本身约64字节。process_number 留存返回的元组（元组空闲列表耗尽前不计）
+# 和整数、角分两个字符串；开启缓存时其余层级不留存新对象，关闭缓存时只留存结果字符串
+ALLOCATION_BUDGETS = {
+    True: {
+        'process_number': (3.1, 160),
+        'convert_integer': (0.1, 96),
+        'format_rmb': (0.1, 96),
+        'end_to_end': (0.1, 160),
+    },
+    False: {
+        'process_number': (3.1, 160),
+        'convert_integer': (1.1, 384),
+        'format_rmb': (1.1, 384),
+        'end_to_end': (1.1, 480),
+    },
+}
+
+# 单个金额转换不应加载的模块
+HEAVY_MODULES = ('click', 'decimal', 'multiprocessing', 'csv', 'json')
+
+
+def _run_python(args: List[str]) -> Tuple[str, str]:
+    """在新解释器中运行代码，返回标准输出和标准错误。"""
+    result = subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    return result.stdout, result.stderr
 
-    Returns:
-        List[str]: 测试用例列表
-    """
-    cases = []
-    for _ in range(count):
-        # 生成1到11位的随机整数
-        integer = random.randint(1, 99999999999)
-        # 生成0到99的随机小数
-        decimal = random.randint(0, 99)
-        # 组合成金额字符串
-        amount = f"{integer}.{decimal:02d}"
-        cases.append(amount)
-    return cases
-
-def test_performance() -> Dict[str, Any]:
-    """
-    测试转换性能。
-    
-    Returns:
-        Dict[str, Any]: 性能测试结果
-    """
-    # 生成测试用例
-    test_cases = generate_test_cases()
-    
-    # 预热缓存
-    for case in test_cases[:10]:
-        convert_to_rmb(case)
-    
-    # 计时开始
-    start_time = time.time()
-    
-    # 执行转换
-    for case in test_cases:
-        convert_to_rmb(case)
-    
-    # 计算耗时
-    duration = time.time() - start_time
-    
-    # 计算平均耗时（毫秒）
-    avg_time = (duration / len(test_cases)) * 1000
-    
-    print(f"\n性能测试结果:")
-    print(f"总用例数: {len(test_cases)}")
-    print(f"总耗时: {duration:.2f}秒")
-    print(f"平均耗时: {avg_time:.2f}毫秒")
-    
-    return {
-        "total_cases": len(test_cases),
-        "duration": duration,
-        "avg_time_ms": avg_time
-    }
 
-def test_performance_different_scenarios() -> Dict[str, Dict[str, Any]]:
+def _import_self_times(module: str) -> List[Dict[str, int]]:
+    """用 python -X importtime 导入三次，返回每次各模块自身的导入耗时（微秒）。"""
+    runs = []
+    for _ in range(3):
+        _, stderr = _run_python(['-X', 'importtime', '-c', f'import {module}'])
+        times = {}
+        for line in stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[0].startswith('import time:'):
+                try:
+                    times[fields[2].strip()] = int(fields[0].split(':')[1])
+                except ValueError:
+                    continue  # 表头行
+        assert module in times, module
+        runs.append(times)
+    return runs
+
+
+def _allocations(amount: str, cached: bool = True) -> Dict[str, Dict[str, float]]:
     """
-    测试不同场景下的转换性能。
-    
-    Returns:
-        Dict[str, Dict[str, Any]]: 各场景测试结果
+    在新解释器中运行 run_allocation_suite。
+
+    峰值按全部已跟踪内存计算，覆盖率统计等跟踪函数的分配会被计入，因此不在测试进程内测量。
     """
-    scenarios = {
-        "小数": [f"0.{i:02d}" for i in range(100)],  # 测试小数部分
-        "整数": [str(i) for i in range(1, 101)],     # 测试预计算的整数
-        "大数": [f"{10**i}" for i in range(12)],     # 测试大数处理
-        "复杂数": [f"{i}.{j:02d}" for i in range(1000, 1100) for j in range(0, 100, 10)]  # 测试复杂情况
-    }
-    
-    results = {}
-    
-    for scenario_name, cases in scenarios.items():
-        # 预热缓存
-        for case in cases[:5]:
-            convert_to_rmb(case)
-        
-        # 计时开始
-        start_time = time.time()
-        
-        # 执行转换
+    code = ("import json\n"
+            "from src.rmb_converter.benchmark import run_allocation_suite\n"
+            f"print(json.dumps(run_allocation_suite({amount!r}, {cached!r})))\n")
+    stdout, _ = _run_python(['-c', code])
+    return json.loads(stdout)
+
+
+def _interleaved_rates(
+    runs: Dict[str, Tuple[Callable[..., Any], List[Tuple[Any, ...]]]], rounds: int = 5
+) -> Dict[str, float]:
+    """轮流测量各实现并取各自最好的吞吐量（次/秒），避免机器负载的漂移只落在其中一方。"""
+    rates = dict.fromkeys(runs, 0.0)
+    for _ in range(rounds):
+        for name, (func, args_list) in runs.items():
+            clear_caches()
+            stats = measure(func, args_list, warmup=0, repeat=1)
+            rates[name] = max(rates[name], stats['rows_per_sec'])
+    return rates
+
+
+def _fake_result(p50_ns: float, rows_per_sec: float) -> Dict[str, Any]:
+    """构造只含一个项目的结果。"""
+    stats = {'p50_ns': p50_ns, 'p95_ns': p50_ns, 'p99_ns': p50_ns, 'mean_ns': p50_ns,
+             'rows_per_sec': rows_per_sec}
+    return {'version': 1, 'meta': {}, 'results': {'retail/end_to_end': stats}}
+
+
+def test_distributions_are_valid_amounts() -> None:
+    """测试各分布生成的金额都能被转换。"""
+    for name, generate in DISTRIBUTIONS.items():
+        cases = generate(random.Random(0), 200)
+        assert len(cases) == 200, name
         for case in cases:
             convert_to_rmb(case)
-        
-        # 计算耗时
-        duration = time.time() - start_time
-        avg_time = (duration / len(cases)) * 1000
-        
-        print(f"\n{scenario_name}测试结果:")
-        print(f"用例数: {len(cases)}")
-        print(f"总耗时: {duration:.3f}秒")
-        print(f"平均耗时: {avg_time:.3f}毫秒")
-        
-        results[scenario_name] = {
-            "total_cases": len(cases),
-            "duration": duration,
-            "avg_time_ms": avg_time
-        }
-    
-    return results
-
-def test_performance_stress() -> Dict[str, Any]:
-    """
-    压力测试。
-    
-    Returns:
-        Dict[str, Any]: 压力测试结果
-    """
-    # 生成大量数据，但为了减少执行时间，控制数量
-    test_cases = generate_test_cases(3000)
-    
-    # 预热缓存
-    for case in test_cases[:50]:
-        convert_to_rmb(case)
-    
-    # 多次重复执行
-    iterations = 3  # 减少迭代次数
-    times = []
-    
-    for i in range(iterations):
-        start_time = time.time()
-        for case in test_cases:
-            convert_to_rmb(case)
-        duration = time.time() - start_time
-        times.append(duration)
-        
-        print(f"\n第 {i+1} 轮测试:")
-        print(f"总耗时: {duration:.3f}秒")
-        print(f"平均耗时: {(duration/len(test_cases))*1000:.3f}毫秒")
-    
-    print(f"\n总体结果:")
-    print(f"最快耗时: {min(times):.3f}秒")
-    print(f"最慢耗时: {max(times):.3f}秒")
-    print(f"平均耗时: {sum(times)/len(times):.3f}秒")
-    
-    return {
-        "iterations": iterations,
-        "total_cases": len(test_cases),
-        "min_time": min(times),
-        "max_time": max(times),
-        "avg_time": sum(times)/len(times),
-        "all_times": times
+
+
+def test_measure() -> None:
+    """测试计时结果的结构和分位数顺序。"""
+    stats = measure(convert_to_rmb, [('1234.56',), ('0.01',)] * 50, warmup=10, repeat=2)
+    assert 0 < stats['p50_ns'] <= stats['p95_ns'] <= stats['p99_ns']
+    assert stats['rows_per_sec'] > 0
+
+
+def test_run_suite() -> None:
+    """测试完整基准覆盖所有分布和层级，并打印报告。"""
+    result = run_suite(count=300, repeat=2, warmup=50)
+    layers = {'process_number', 'convert_integer', 'format_rmb', 'end_to_end'}
+    assert set(result['results']) == {f"{d}/{layer}" for d in DISTRIBUTIONS for layer in layers}
+    assert result['meta']['count'] == 300
+    json.dumps(result)
+    report = format_report(result)
+    print('\n' + report)
+    assert {display_width(line) for line in report.splitlines()} == {sum(REPORT_COLUMNS)}
+
+
+def test_compare_detects_regression() -> None:
+    """测试超过阈值的退化会被报告，阈值内的波动不会。"""
+    baseline = _fake_result(1000, 1e6)
+    assert compare(_fake_result(1100, 0.9e6), baseline, 0.2) == []
+    regressions = compare(_fake_result(1300, 0.7e6), baseline, 0.2)
+    assert len(regressions) == 2
+    assert all(line.startswith('retail/end_to_end') for line in regressions)
+
+
+def test_benchmark_main_baseline(tmp_path: Path) -> None:
+    """测试写出 JSON 结果并与基线比较的命令行流程。"""
+    output = tmp_path / 'result.json'
+    args = ['--count', '200', '--repeat', '1', '--warmup', '10', '--distribution', 'retail']
+    assert main(args + ['--output', str(output)]) == 0
+    result = json.loads(output.read_text(encoding='utf-8'))
+    assert 'retail/end_to_end' in result['results']
+
+    # 基线比当前快得多时应判定为退化
+    baseline = tmp_path / 'baseline.json'
+    for stats in result['results'].values():
+        stats['p50_ns'] /= 100
+        stats['rows_per_sec'] *= 100
+    baseline.write_text(json.dumps(result), encoding='utf-8')
+    assert main(args + ['--baseline', str(baseline)]) == 1
+
+
+def test_performance_parallel() -> None:
+    """测试不同工作进程数下的并行文件转换吞吐量。"""
+    rng = random.Random(0)
+    cases = [f"{rng.randint(1, 99999999999)}.{rng.randint(0, 99):02d}" for _ in range(20000)]
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(cases) + '\n')
+
+    try:
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            stats = measure(
+                lambda w: convert_file_parallel(path, io.StringIO(), w, chunk_size=64 << 10),
+                [(workers,)], warmup=0, repeat=2,
+            )
+            rows_per_sec = len(cases) * stats['rows_per_sec']
+            assert rows_per_sec > 0
+            print(f"\n{workers} 个进程: {rows_per_sec:.0f} 行/秒")
+    finally:
+        os.remove(path)
+
+
+def _typed_inputs(count: int) -> Tuple[List[int], List[str], List[Decimal]]:
+    """生成同一组金额的整数分、字符串和 Decimal 三种形式。"""
+    rng = random.Random(0)
+    cents = [rng.randint(0, 9999999999999) for _ in range(count)]
+    strings = [f"{c // 100}.{c % 100:02d}" for c in cents]
+    decimals = [Decimal(c).scaleb(-2) for c in cents]
+    return cents, strings, decimals
+
+
+def test_typed_inputs_match() -> None:
+    """测试字符串、整数分和 Decimal 三种输入路径的结果一致。"""
+    cents, strings, decimals = _typed_inputs(5000)
+    expected = [convert_to_rmb(s) for s in strings]
+    assert [convert_cents(c) for c in cents] == expected
+    assert [convert_to_rmb(d) for d in decimals] == expected
+
+
+@pytest.mark.perf
+def test_performance_typed_inputs() -> None:
+    """比较字符串、整数分和 Decimal 三种输入路径的吞吐量。"""
+    cents, strings, decimals = _typed_inputs(5000)
+    runs = {
+        "字符串": (convert_to_rmb, [(s,) for s in strings]),
+        "Decimal": (convert_to_rmb, [(d,) for d in decimals]),
+        "整数分": (convert_cents, [(c,) for c in cents]),
     }
+    rates = _interleaved_rates(runs)
+    for name, rate in rates.items():
+        print(f"\n{name}: {rate:.0f} 行/秒")
+    # 整数分不解析文本，实测与字符串路径相当；Decimal 拆分数字元组，实测约为字符串路径的一半
+    assert rates["整数分"] > 0.7 * rates["字符串"]
+    assert rates["Decimal"] > 0.3 * rates["字符串"]
+
+
+@pytest.mark.perf
+def test_performance_vectorized() -> None:
+    """比较向量化转换与逐个转换整数分数组，结果必须一致。"""
+    np = pytest.importorskip("numpy")
+    from src.rmb_converter.vectorized import convert_cents_array
+
+    values = np.random.default_rng(0).integers(0, 10 ** 13, size=50000, dtype=np.int64)
+    scalar = [convert_cents(value) for value in values.tolist()]
+    assert convert_cents_array(values).tolist() == scalar
+
+    clear_caches()
+    scalar_stats = measure(lambda v: [convert_cents(x) for x in v.tolist()], [(values,)],
+                           warmup=0, repeat=3)
+    vector_stats = measure(convert_cents_array, [(values,)], warmup=0, repeat=3)
+    speedup = vector_stats['rows_per_sec'] / scalar_stats['rows_per_sec']
+    print(f"\n向量化加速比: {speedup:.1f}x")
+    # 实测约10倍
+    assert speedup > 3
+
+
+@pytest.mark.perf
+def test_performance_cache_levels() -> None:
+    """逐层关闭缓存，比较各分布下的吞吐量，判断哪些缓存层值得保留。"""
+    defaults = {name: stats['maxsize'] for name, stats in cache_stats().items()}
+    configs: Dict[str, Dict[str, Any]] = {"默认": {}, "全部关闭": dict.fromkeys(defaults, 0)}
+    for name in defaults:
+        configs[f"关闭{name}"] = {name: 0}
+
+    rates: Dict[Tuple[str, str], float] = {}
+    try:
+        for dist_name, generate in DISTRIBUTIONS.items():
+            args_list = [(case,) for case in generate(random.Random(0), 5000)]
+            for config_name, config in configs.items():
+                for name, maxsize in defaults.items():
+                    configure_cache(name, config.get(name, maxsize))
+                stats = measure(convert_to_rmb, args_list, warmup=500, repeat=2)
+                rates[dist_name, config_name] = stats['rows_per_sec']
+                print(f"\n{dist_name} / {config_name}: {stats['rows_per_sec']:.0f} 行/秒")
+    finally:
+        for name, maxsize in defaults.items():
+            configure_cache(name, maxsize)
+        clear_caches()
+
+    # 金额重复多的 payroll 分布上默认缓存实测约快一倍；
+    # 几乎不重复的 large_transfer 上缓存只有少量维护开销
+    assert rates['payroll', "默认"] > 1.3 * rates['payroll', "全部关闭"]
+    for dist_name in DISTRIBUTIONS:
+        assert rates[dist_name, "默认"] > 0.6 * rates[dist_name, "全部关闭"], dist_name
+
+
+@pytest.mark.perf
+def test_performance_event_loop_latency() -> None:
+    """比较混合负载下同步批量转换与异步接口对事件循环延迟的影响。"""
+    rng = random.Random(0)
+    big_batch = DISTRIBUTIONS['large_transfer'](rng, 60000)
+    singles = DISTRIBUTIONS['retail'](rng, 2000)
+
+    async def mixed_load(use_async: bool) -> Dict[str, float]:
+        lags: list = []
+        stop = asyncio.Event()
+
+        async def ticker() -> None:
+            loop = asyncio.get_running_loop()
+            while not stop.is_set():
+                expected = loop.time() + 0.001
+                await asyncio.sleep(0.001)
+                lags.append(loop.time() - expected)
+
+        async def single_requests() -> None:
+            for start in range(0, len(singles), 100):
+                chunk = singles[start:start + 100]
+                if use_async:
+                    await asyncio.gather(*(convert_async(a) for a in chunk))
+                else:
+                    for amount in chunk:
+                        convert_to_rmb(amount)
+                await asyncio.sleep(0)
+
+        async def batch_request() -> None:
+            if use_async:
+                await convert_many_async(big_batch, offload_threshold=10000)
+            else:
+                convert_many(big_batch)
+
+        tick = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0.005)
+        await asyncio.gather(single_requests(), batch_request())
+        stop.set()
+        await tick
+        lags.sort()
+        return {'p99_ms': percentile(lags, 0.99) * 1e3, 'max_ms': lags[-1] * 1e3}
+
+    results = {}
+    for name, use_async in (("同步调用", False), ("异步接口", True)):
+        clear_caches()
+        stats = results[name] = asyncio.run(mixed_load(use_async))
+        print(f"\n{name}: 事件循环延迟 p99 {stats['p99_ms']:.1f}毫秒, "
+              f"最大 {stats['max_ms']:.1f}毫秒")
+    # 同步批量转换整段阻塞事件循环；异步接口实测的最大延迟低一个数量级以上
+    assert results["异步接口"]['max_ms'] < results["同步调用"]['max_ms'] / 4
+
+
+@pytest.mark.perf
+def test_import_time_budget() -> None:
+    """测试导入转换模块不会现场生成预计算表。"""
+    runs = _import_self_times('src.rmb_converter.chinese_currency')
+    self_us = min(times['src.rmb_converter.chinese_currency'] for times in runs)
+    package_us = min(
+        sum(us for name, us in times.items() if name.startswith('src.rmb_converter'))
+        for times in runs)
+    print(f"\nchinese_currency 导入耗时: {self_us / 1e3:.1f}毫秒，"
+          f"本包合计: {package_us / 1e3:.1f}毫秒")
+    assert self_us < IMPORT_BUDGET_US
+    assert package_us < PACKAGE_IMPORT_BUDGET_US
+
+
+def _first_call() -> Tuple[int, str]:
+    """在新进程中用命令行入口转换单个金额，返回耗时（微秒）和已加载的重量级模块。"""
+    code = (
+        "import sys, time\n"
+        "from src.rmb_converter.cli import run\n"
+        "start = time.perf_counter_ns()\n"
+        "run(['100010001.01'])\n"
+        "print((time.perf_counter_ns() - start) // 1000)\n"
+        "print(' '.join(m for m in sys.modules if m.split('.')[0] in %r))\n" % (HEAVY_MODULES,)
+    )
+    stdout, _ = _run_python(['-c', code])
+    result, elapsed, loaded = (stdout.splitlines() + [''])[:3]
+    assert result == '壹亿零壹万零壹元零壹分'
+    return int(elapsed), loaded
+
+
+def test_first_call_modules() -> None:
+    """测试单个金额的命令行转换不加载重量级模块。"""
+    assert _first_call()[1] == ''
+
+
+@pytest.mark.perf
+def test_first_call_budget() -> None:
+    """测试新进程中首次转换的耗时。"""
+    elapsed = min(_first_call()[0] for _ in range(3))
+    print(f"\n首次转换耗时: {elapsed}微秒")
+    assert elapsed < FIRST_CALL_BUDGET_US
+
+
+@pytest.mark.perf
+def test_performance_integer_length_scaling() -> None:
+    """测试整数转换的每位耗时不随位数增长（12 到 1000 位）。"""
+    rng = random.Random(0)
+    func = convert_integer.cache.func  # 绕过缓存，只测引擎本身
+    per_digit = {}
+    for length in (12, 48, 100, 250, 500, 1000):
+        cases = [(rng.choice('123456789') + ''.join(rng.choice('0123456789')
+                                                    for _ in range(length - 1)),)
+                 for _ in range(200)]
+        stats = measure(func, cases, warmup=20, repeat=3)
+        per_digit[length] = stats['p50_ns'] / length
+        print(f"\n{length} 位: p50 {stats['p50_ns']:.0f}ns, 每位 {per_digit[length]:.0f}ns")
+    # 线性算法的每位耗时大致恒定；逐节回看的平方算法在 1000 位时会高出数十倍
+    assert per_digit[1000] < 4 * min(per_digit.values())
+
+
+@pytest.mark.perf
+def test_performance_arrow_dictionary() -> None:
+    """比较按字典转换 Arrow 列与逐行转换，结果必须一致。"""
+    pa = pytest.importorskip("pyarrow")
+    from src.rmb_converter.arrow import convert_array
+
+    rng = random.Random(0)
+    prices = DISTRIBUTIONS['retail'](rng, 500)
+    amounts = [rng.choice(prices) for _ in range(100000)]
+    column = pa.array(amounts)
+    assert convert_array(column)[0].to_pylist() == [convert_to_rmb(a) for a in amounts]
+
+    clear_caches()
+    row_stats = measure(lambda values: [convert_to_rmb(a) for a in values], [(amounts,)],
+                        warmup=0, repeat=3)
+    dict_stats = measure(convert_array, [(column,)], warmup=0, repeat=3)
+    speedup = dict_stats['rows_per_sec'] / row_stats['rows_per_sec']
+    print(f"\n按字典转换加速比（500 个不同取值）: {speedup:.1f}x")
+    # 实测约40倍
+    assert speedup > 5
+
+
+@pytest.mark.perf
+def test_performance_frame_accessors() -> None:
+    """比较数据框 rmb 访问器与逐行 apply，结果必须一致（完整规模见 --frame-rows）。"""
+    if not any(importlib.util.find_spec(name) for name in ('pandas', 'polars')):
+        pytest.skip("需要 pandas 或 polars")
+    results = run_frame_suite(100000)
+    print("\n" + "\n".join(f"{key}: {stats['rows_per_sec']:.0f} 行/秒"
+                            for key, stats in results.items()))
+    for library, baseline, batch in (('pandas', 'apply', 'accessor'),
+                                     ('polars', 'map_elements', 'namespace')):
+        if f"{library}/{baseline}/100000" in results:
+            assert (results[f"{library}/{batch}/100000"]['rows_per_sec']
+                    > results[f"{library}/{baseline}/100000"]['rows_per_sec'])
+
+
+@pytest.mark.perf
+def test_performance_encoded_output() -> None:
+    """比较预先编码的字节输出与先转换再编码，结果必须一致。"""
+    from src.rmb_converter.encoded import encode_rmb
+
+    amounts = DISTRIBUTIONS['payroll'](random.Random(0), 20000)
+
+    def via_str(values: List[str]) -> bytearray:
+        """先得到 str 再编码。"""
+        buffer = bytearray()
+        for amount in values:
+            buffer += convert_to_rmb(amount).encode('gb18030')
+            buffer += b'\n'
+        return buffer
+
+    def direct(values: List[str]) -> bytearray:
+        """直接拼接预先编码的表。"""
+        buffer = bytearray()
+        for amount in values:
+            buffer += encode_rmb(amount, 'gb18030')
+            buffer += b'\n'
+        return buffer
+
+    assert direct(amounts) == via_str(amounts)
+    rates = _interleaved_rates({'str': (via_str, [(amounts,)]), 'bytes': (direct, [(amounts,)])})
+    print(f"\nGB18030 直接输出字节: {len(amounts) * rates['bytes']:.0f} 行/秒，"
+          f"先转换再编码: {len(amounts) * rates['str']:.0f} 行/秒")
+    # 实测直接输出字节约快三成以上
+    assert rates['bytes'] > rates['str']
+
+
+def test_performance_batch_error_codes() -> None:
+    """比较以错误码代替异常的批量接口与逐行 try/except，结果必须一致。"""
+    results = run_batch_suite(20000, 0.02, repeat=3)
+    print("\n" + "\n".join(f"{key}: {stats['rows_per_sec']:.0f} 行/秒"
+                            for key, stats in results.items()))
+    assert set(results) == {'batch/convert_rows', 'batch/convert_batch',
+                            'batch/validate_rows', 'batch/validate_batch'}
+
+
+@pytest.mark.perf
+def test_performance_output_style() -> None:
+    """比较按风格查表与对标准结果逐个 str.replace，结果必须一致。"""
+    amounts = DISTRIBUTIONS['large_transfer'](random.Random(0), 20000)
+    replacements = (('贰', '貳'), ('叁', '參'), ('陆', '陸'), ('万', '萬'), ('亿', '億'))
+
+    def replaced(values: List[str]) -> List[str]:
+        """先按标准写法转换，再逐个替换。"""
+        results = []
+        for amount in values:
+            result = convert_to_rmb(amount)
+            for old, new in replacements:
+                result = result.replace(old, new)
+            results.append(result)
+        return results
+
+    def styled(values: List[str]) -> List[str]:
+        """直接按繁体风格的表转换。"""
+        return [convert_to_rmb(amount, style='traditional') for amount in values]
+
+    assert styled(amounts) == replaced(amounts)
+    rates = _interleaved_rates({'replace': (replaced, [(amounts,)]),
+                                'style': (styled, [(amounts,)])})
+    print(f"\n繁体风格查表: {len(amounts) * rates['style']:.0f} 行/秒，"
+          f"标准结果再替换: {len(amounts) * rates['replace']:.0f} 行/秒")
+    # 实测查表约快两到五成
+    assert rates['style'] > 1.1 * rates['replace']
+
+
+def test_performance_front_cache_zipf() -> None:
+    """在 Zipf 分布夹杂一次性大额金额的数据上，前门缓存的命中率不低于同一预算的 LRU。"""
+    results = run_zipf_suite(50000, 1.0, 1 << 19, repeat=1)
+    report = format_frame_report(results)
+    print("\n" + report)
+    assert {display_width(line) for line in report.splitlines()} == {sum(FRAME_COLUMNS)}
+    assert results['zipf/front_cache']['hit_rate'] >= results['zipf/lru']['hit_rate']
+
+
+def test_performance_thread_scaling() -> None:
+    """多线程转换结果与单线程一致，结束后恢复缓存配置。"""
+    sizes = {name: stats['maxsize'] for name, stats in cache_stats().items()}
+    results = run_thread_suite((1, 4), 20000, repeat=1)
+    print("\n" + format_frame_report(results))
+    assert set(results) == {
+        f'threads/{scope}/{count}' for scope in ('shared', 'thread', 'uncached') for count in (1, 4)
+    }
+    assert all(result['rows_per_sec'] > 0 for result in results.values())
+    assert cache_scope() == 'shared'
+    assert {name: stats['maxsize'] for name, stats in cache_stats().items()} == sizes
+
+
+@pytest.mark.parametrize('cached', (True, False))
+def test_performance_allocation_budget(cached: bool) -> None:
+    """测试各转换层级每次调用留存的内存块和调用期间的峰值不超出预算。"""
+    results = _allocations('120034560078.05', cached)
+    report = format_allocation_report(results)
+    print("\n" + report)
+    # 中文表头与数据行按显示宽度对齐
+    assert {display_width(line) for line in report.splitlines()} == {sum(ALLOCATION_COLUMNS)}
+    for stage, (blocks, peak_bytes) in ALLOCATION_BUDGETS[cached].items():
+        stats = results[f'alloc/{stage}']
+        assert stats['blocks'] <= blocks, stage
+        assert stats['peak_bytes'] <= peak_bytes, stage
+
+
+def test_allocation_suite_restores_caches() -> None:
+    """测试关闭缓存测量分配后恢复原有的缓存配置。"""
+    sizes = {name: stats['maxsize'] for name, stats in cache_stats().items()}
+    assert set(run_allocation_suite('1.05', cached=False)) >= {'alloc/end_to_end'}
+    assert {name: stats['maxsize'] for name, stats in cache_stats().items()} == sizes
+
+
+def test_performance_allocation_short_fraction() -> None:
+    """测试小数不足两位或没有小数时，缓存命中的转换不分配新的角分字符串。"""
+    for amount in ('7', '0.5', '100000001'):
+        assert _allocations(amount)['alloc/end_to_end']['peak_bytes'] <= 64, amount
+
+
+def test_normalize_suite() -> None:
+    """测试清洗基准中 normalize_amount 与正则清洗的解析结果一致。"""
+    results = run_normalize_suite(2000, repeat=1)
+    assert set(results) == {'normalize/regex', 'normalize/translate', 'normalize/convert_to_rmb'}
+
+
+@pytest.mark.perf
+def test_performance_normalize() -> None:
+    """比较 normalize_amount 与正则清洗，预编译的 str.translate 表应快于正则。"""
+    results = run_normalize_suite(20000, repeat=5)
+    print("\n" + format_frame_report(results))
+    # 实测 translate 的耗时为正则的 0.35-0.6 倍
+    assert (results['normalize/translate']['seconds']
+            < 0.75 * results['normalize/regex']['seconds'])
+
+
+def test_many_suite() -> None:
+    """测试批量基准中 convert_many 与逐行转换的结果一致。"""
+    results = run_many_suite(2000, repeat=1, distributions=['payroll'])
+    assert set(results) == {f'many/{workload}/{name}' for workload in ('payroll', 'zipf')
+                            for name in ('loop', 'convert_many')}
+
 
-def run_all_tests() -> None:
-    """运行所有性能测试。"""
-    print("=" * 50)
-    print("开始基本性能测试")
-    print("=" * 50)
-    test_performance()
-    
-    print("\n" + "=" * 50)
-    print("开始不同场景性能测试")
-    print("=" * 50)
-    test_performance_different_scenarios()
-    
-    print("\n" + "=" * 50)
-    print("开始压力测试")
-    print("=" * 50)
-    test_performance_stress()
-    
-    print("\n" + "=" * 50)
-    print("所有性能测试完成")
-    print("=" * 50)
-
-if __name__ == '__main__':
-    run_all_tests() 
\ No newline at end of file
+@pytest.mark.perf
+def test_performance_convert_many() -> None:
+    """在金额大量重复的数据上，convert_many 批内去重后应明显快于逐行调用 convert_to_rmb。"""
+    results = run_many_suite(50000, repeat=3, distributions=['payroll'])
+    print("\n" + format_frame_report(results))
+    for workload in ('payroll', 'zipf'):
+        assert (results[f'many/{workload}/convert_many']['seconds']
+                < 0.8 * results[f'many/{workload}/loop']['seconds']), workload
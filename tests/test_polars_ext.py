@@ -0,0 +1,59 @@
+"""Polars 命名空间的测试用例。"""
+from decimal import Decimal
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from src.rmb_converter.chinese_currency import convert_to_rmb  # noqa: E402
+from src.rmb_converter.polars_ext import convert_series  # noqa: E402
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_expr_nulls_and_errors() -> None:
+    """测试表达式命名空间：无效金额和空值得到空值，错误信息单独返回。"""
+    frame = pl.DataFrame({'amount': ['1', 'abc', None, '1']})
+    result = frame.select(
+        pl.col('amount').rmb.upper().alias('rmb'),
+        pl.col('amount').rmb.errors().alias('rmb_error'),
+    )
+    assert result['rmb'].to_list() == ['壹元整', None, None, '壹元整']
+    assert result['rmb_error'].to_list() == [None, '输入必须为有效数字', None, None]
+    lazy = frame.lazy().select(pl.col('amount').rmb.upper()).collect()
+    assert lazy['amount'].to_list() == ['壹元整', None, None, '壹元整']
+
+
+def test_series_types() -> None:
+    """测试浮点数（含 NaN）、整数、Decimal 和分类类型列。"""
+    floats = pl.Series('f', [2.5, float('nan'), None])
+    assert floats.rmb.upper().to_list() == ['贰元伍角', None, None]
+    assert floats.rmb.upper().name == 'f'
+    assert pl.Series([1, None]).rmb.upper().to_list() == ['壹元整', None]
+    assert pl.Series([Decimal('1.23')]).rmb.upper().to_list() == ['壹元贰角叁分']
+    assert pl.Series(['1', '1'], dtype=pl.Categorical).rmb.upper().to_list() == ['壹元整'] * 2
+    assert pl.Series([], dtype=pl.String).rmb.upper().dtype == pl.String
+
+    with pytest.raises(ValueError, match="不支持的金额列类型"):
+        pl.Series([True]).rmb.upper()
+
+
+def test_converts_each_value_once(monkeypatch: "MonkeyPatch") -> None:
+    """测试重复取值只转换一次，结果与逐行转换一致。"""
+    calls: List[str] = []
+
+    def counting(amount: str, rounding: str) -> str:
+        calls.append(amount)
+        return convert_to_rmb(amount, rounding)
+
+    monkeypatch.setattr('src.rmb_converter.batch.convert_to_rmb', counting)
+    amounts = ['9.9', '1', '9.9', '2'] * 100
+    results, _ = convert_series(pl.Series(amounts), 'half-up')
+    assert results.to_list() == [convert_to_rmb(a) for a in amounts]
+    assert sorted(calls) == ['1', '2', '9.9']
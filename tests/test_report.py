@@ -0,0 +1,38 @@
+"""文本表格工具模块的测试用例。"""
+from typing import TYPE_CHECKING
+
+from src.rmb_converter.report import display_width, format_table
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_display_width() -> None:
+    """测试中文和全角字符计为两列。"""
+    assert display_width('abc') == 3
+    assert display_width('项目') == 4
+    assert display_width('累计(ms)') == 8
+    assert display_width('１２') == 4
+    assert display_width('') == 0
+
+
+def test_format_table() -> None:
+    """测试表头和数据行按显示宽度对齐，首列左对齐，其余列右对齐。"""
+    table = format_table(('项目', '行/秒'), [('a', '12'), ('bb', '3')], (6, 8))
+    assert table.splitlines() == [
+        '项目     行/秒',
+        'a           12',
+        'bb           3',
+    ]
+    assert {display_width(line) for line in table.splitlines()} == {14}
+
+
+def test_format_table_short_rows() -> None:
+    """测试缺少的列留空，多于表头的列宽被忽略。"""
+    table = format_table(('项目', '秒', '命中率'), [('a', '1', '50%'), ('b', '2')], (6, 4, 8, 5))
+    assert {display_width(line) for line in table.splitlines()} == {18}
+    assert table.splitlines()[2] == 'b        2        '
@@ -0,0 +1,62 @@
+"""人民币大写金额反向解析模块的测试用例。"""
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.rmb_converter.chinese_currency import convert_cents, convert_to_rmb
+from src.rmb_converter.reverse_parser import RMBParseError, parse_many, parse_rmb
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_parse_rmb_examples() -> None:
+    """测试常见金额的解析。"""
+    assert parse_rmb('壹万零伍元叁角肆分') == 1000534
+    assert parse_rmb('零元整') == 0
+    assert parse_rmb('伍分') == 5
+    assert parse_rmb('壹角') == 10
+    assert parse_rmb('壹仟元零壹分') == 100001
+    assert parse_rmb('壹亿零壹拾万零壹佰元整') == 10010010000
+    assert parse_rmb(convert_to_rmb('999999999999.99')) == 99999999999999
+
+
+def test_parse_rmb_round_trip() -> None:
+    """测试 parse_rmb(convert_cents(x)) == x。"""
+    rng = random.Random(0)
+    cases = [rng.randrange(10 ** rng.randint(1, 14)) for _ in range(20000)]
+    cases += [int(format(i, '014b')) for i in range(1 << 14)]
+    for cents in cases:
+        assert parse_rmb(convert_cents(cents)) == cents
+
+
+def test_parse_rmb_rejects_with_position() -> None:
+    """测试非法和非规范输入的错误位置。"""
+    cases = {
+        '': 0,
+        '壹万零伍元叁角肆X': 8,
+        '壹壹元整': 1,
+        '壹万零零伍元整': 3,
+        '壹拾万元整整': 5,
+        '壹佰拾元整': 2,
+        '壹元': 2,
+        '万元整': 0,
+        '壹万零伍': 4,
+        '壹元零伍角': 2,
+    }
+    for text, position in cases.items():
+        with pytest.raises(RMBParseError) as exc_info:
+            parse_rmb(text)
+        assert exc_info.value.position == position, text
+        assert isinstance(exc_info.value, ValueError)
+
+
+def test_parse_many() -> None:
+    """测试批量解析保持输入顺序。"""
+    assert parse_many(['壹元整', '伍角', '零元整']) == [100, 50, 0]
+    assert parse_many([]) == []
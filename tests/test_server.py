@@ -0,0 +1,99 @@
+"""常驻转换服务与客户端的测试用例。"""
+import socket
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from src.rmb_converter.client import RMBClient
+from src.rmb_converter.loadtest import run_load_test
+from src.rmb_converter.server import ConversionServer, create_server
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def _start(server: ConversionServer) -> Iterator[ConversionServer]:
+    """在后台线程运行服务，结束后关闭。"""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def http_server() -> Iterator[ConversionServer]:
+    """启动监听随机端口的服务。"""
+    yield from _start(create_server(port=0))
+
+
+def test_convert_and_batch(http_server: ConversionServer) -> None:
+    """测试单个转换、批量转换和错误响应。"""
+    with RMBClient(port=http_server.server_address[1]) as client:
+        assert client.convert('1234.56') == '壹仟贰佰叁拾肆元伍角陆分'
+        assert client.convert_batch(['1', 'abc', '0.5']) == [
+            '壹元整', '错误: 输入必须为有效数字', '伍角',
+        ]
+        with pytest.raises(ValueError, match="输入必须为有效数字"):
+            client.convert('abc')
+        # 末尾的空金额和空批量都不能被丢掉或多出一行
+        assert client.convert_batch(['1', '']) == ['壹元整', '错误: 输入必须为有效数字']
+        assert client.convert_batch(['']) == ['错误: 输入必须为有效数字']
+        assert client.convert_batch([]) == []
+        with pytest.raises(ValueError, match="换行符"):
+            client.convert_batch(['1\n2'])
+        stats = client.stats()
+    assert stats['requests'] == 6
+    assert stats['conversions'] == 8
+    assert 0 < stats['p50_ns'] <= stats['p99_ns']
+
+
+def test_get_convert_and_unknown_path(http_server: ConversionServer) -> None:
+    """测试 GET 查询参数与未知路径。"""
+    with RMBClient(port=http_server.server_address[1]) as client:
+        assert client._request('GET', '/convert?amount=100') == '壹佰元整'
+        with pytest.raises(ValueError, match="未知路径"):
+            client._request('GET', '/nothing')
+
+
+def test_pipelined_requests(http_server: ConversionServer) -> None:
+    """测试同一连接上一次性发送的多个请求按顺序得到响应。"""
+    requests = b''.join(
+        f"GET /convert?amount={amount} HTTP/1.1\r\nHost: x\r\n\r\n".encode()
+        for amount in ('1', '2', '3')
+    )
+    with socket.create_connection(('127.0.0.1', http_server.server_address[1])) as sock:
+        sock.sendall(requests)
+        data = b''
+        while data.count('元整'.encode()) < 3:
+            chunk = sock.recv(65536)
+            assert chunk
+            data += chunk
+    text = data.decode('utf-8')
+    assert text.index('壹元整') < text.index('贰元整') < text.index('叁元整')
+    assert text.count('HTTP/1.1 200') == 3
+
+
+def test_unix_socket(tmp_path: Path) -> None:
+    """测试通过 Unix 域套接字访问服务。"""
+    path = str(tmp_path / 'rmb.sock')
+    for _ in _start(create_server(unix_socket=path)):
+        with RMBClient(unix_socket=path) as client:
+            assert client.convert('0.01') == '壹分'
+    assert not Path(path).exists()
+
+
+def test_load_test(http_server: ConversionServer) -> None:
+    """测试压力测试脚本的统计结果。"""
+    result = run_load_test({'port': http_server.server_address[1]}, requests=40,
+                           concurrency=2, batch_size=5)
+    assert result['requests'] == 40
+    assert result['rows_per_sec'] > 0
+    assert result['p50_ns'] <= result['p99_ns']
@@ -0,0 +1,67 @@
+"""流式批量转换模块的测试用例。"""
+import io
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.rmb_converter.stream import convert_stream, iter_amounts
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_iter_amounts_text() -> None:
+    """测试逐行读取纯文本金额并跳过空行。"""
+    infile = io.StringIO("1\n\n 2.5 \n")
+    assert list(iter_amounts(infile)) == [(1, '1'), (3, '2.5')]
+
+
+def test_iter_amounts_csv_column() -> None:
+    """测试按列名读取 CSV 金额。"""
+    infile = io.StringIO("id,amount\na,100\nb,0.01\n")
+    assert list(iter_amounts(infile, 'csv', 'amount')) == [(2, '100'), (3, '0.01')]
+
+    with pytest.raises(ValueError, match="表头中找不到列"):
+        list(iter_amounts(io.StringIO("id,price\n"), 'csv', 'amount'))
+
+
+def test_iter_amounts_jsonl_column() -> None:
+    """测试按键名读取 JSONL 金额。"""
+    infile = io.StringIO('{"amount": 100}\n{"amount": "0.5"}\n{"other": 1}\nnot json\n')
+    assert list(iter_amounts(infile, 'jsonl', 'amount')) == [
+        (1, '100'), (2, '0.5'), (3, ''), (4, ''),
+    ]
+
+
+def test_convert_stream_text() -> None:
+    """测试文本格式输出，并确认无效行不会中断处理。"""
+    outfile = io.StringIO()
+    errfile = io.StringIO()
+    counts = convert_stream(io.StringIO("100\nabc\n0.01\n"), outfile, errfile=errfile)
+    assert counts == (2, 1)
+    assert outfile.getvalue() == "壹佰元整\n壹分\n"
+    assert '第2行' in errfile.getvalue()
+
+
+def test_convert_stream_csv_and_tsv() -> None:
+    """测试 CSV 与 TSV 格式输出。"""
+    outfile = io.StringIO()
+    convert_stream(io.StringIO("100\n"), outfile, 'csv')
+    assert outfile.getvalue() == "line,amount,rmb\n1,100,壹佰元整\n"
+
+    outfile = io.StringIO()
+    convert_stream(io.StringIO("amount\tid\n1\tx\n"), outfile, 'tsv', 'amount')
+    assert outfile.getvalue() == "line\tamount\trmb\n2\t1\t壹元整\n"
+
+
+def test_convert_stream_jsonl() -> None:
+    """测试 JSONL 格式输出。"""
+    outfile = io.StringIO()
+    convert_stream(io.StringIO('{"amount": "1234.56"}\n'), outfile, 'jsonl', 'amount')
+    record = json.loads(outfile.getvalue())
+    assert record == {'line': 1, 'amount': '1234.56', 'rmb': '壹仟贰佰叁拾肆元伍角陆分'}
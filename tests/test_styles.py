@@ -0,0 +1,140 @@
+"""输出风格的测试用例。"""
+import itertools
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.rmb_converter import styles
+from src.rmb_converter.cache import clear_caches
+from src.rmb_converter.chinese_currency import (
+    FOUR_DIGITS,
+    convert_to_rmb,
+    format_rmb,
+    format_rmb_styled,
+    get_style_tables,
+)
+from src.rmb_converter.styles import (
+    STYLE_PREFIXED,
+    STYLE_ROUND,
+    STYLE_SIMPLIFIED,
+    STYLE_STANDARD,
+    STYLE_TRADITIONAL,
+    register_style,
+    style_definition,
+    style_names,
+)
+from src.rmb_converter.units import UNITS_WANYI, UNITS_ZHAOJING
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+_BUILTIN_STYLES = (STYLE_STANDARD, STYLE_ROUND, STYLE_PREFIXED, STYLE_TRADITIONAL, STYLE_SIMPLIFIED)
+
+
+def _reference(integer: str, decimal: str, style: str, units: str = UNITS_WANYI) -> str:
+    """
+    对标准写法的结果逐字替换并加前缀，作为参照。
+
+    Args:
+        integer: 整数部分
+        decimal: 小数部分
+        style: 风格名称
+        units: 大数单位体系
+
+    Returns:
+        str: 参照结果
+    """
+    replacements, prefix = style_definition(style)
+    return prefix + format_rmb(integer, decimal, units).translate(str.maketrans(replacements))
+
+
+@pytest.fixture
+def isolated_styles(monkeypatch: "MonkeyPatch") -> None:
+    """隔离测试中注册的风格及其表。"""
+    monkeypatch.setattr(styles, '_DEFINITIONS', dict(styles._DEFINITIONS))
+    monkeypatch.setattr('src.rmb_converter.chinese_currency._STYLE_TABLES', {})
+    clear_caches()
+
+
+def test_builtin_styles() -> None:
+    """测试各内置风格的写法。"""
+    amount = '120034560078.05'
+    assert style_names()[:5] == _BUILTIN_STYLES
+    assert convert_to_rmb(amount, style=STYLE_STANDARD) == convert_to_rmb(amount)
+    assert convert_to_rmb(amount, style=STYLE_ROUND) == '壹仟贰佰亿叁仟肆佰伍拾陆万零柒拾捌圆零伍分'
+    assert convert_to_rmb(amount, style=STYLE_PREFIXED) == (
+        '人民币壹仟贰佰亿叁仟肆佰伍拾陆万零柒拾捌元零伍分')
+    assert convert_to_rmb(amount, style=STYLE_TRADITIONAL) == (
+        '壹仟貳佰億參仟肆佰伍拾陸萬零柒拾捌元零伍分')
+    assert convert_to_rmb(amount, style=STYLE_SIMPLIFIED) == (
+        '一千二百亿三千四百五十六万零七十八元零五分')
+    assert convert_to_rmb('0', style=STYLE_ROUND) == '零圆整'
+    assert convert_to_rmb('0.5', style=STYLE_PREFIXED) == '人民币伍角'
+    assert convert_to_rmb('1' + '0' * 20, units=UNITS_ZHAOJING,
+                          style=STYLE_TRADITIONAL) == '壹垓元整'
+    assert convert_to_rmb('1' + '0' * 36, units=UNITS_WANYI, style=STYLE_TRADITIONAL) == (
+        '壹萬億億億億元整')
+
+
+def test_style_options() -> None:
+    """测试风格与舍入、单位体系和位数限制的组合。"""
+    assert convert_to_rmb('1.005', 'half-up', style=STYLE_SIMPLIFIED) == '一元零一分'
+    assert convert_to_rmb('1' + '0' * 16, units=UNITS_ZHAOJING,
+                          style=STYLE_TRADITIONAL) == '壹京元整'
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_to_rmb('1' * 13, style=STYLE_ROUND)
+    with pytest.raises(ValueError, match="不支持的输出风格: gothic"):
+        convert_to_rmb('1', style='gothic')
+
+
+@pytest.mark.parametrize('style', _BUILTIN_STYLES)
+def test_style_tables_exhaustive(style: str) -> None:
+    """穷举四位数、角分和节的组合，与标准写法逐字替换的结果比较。"""
+    for value in range(10000):
+        integer = str(value)
+        assert format_rmb_styled(integer, '00', style) == _reference(integer, '00', style)
+    for integer in ('0', '1', '10', '100000001'):
+        for cents in range(100):
+            decimal = f'{cents:02d}'
+            assert format_rmb_styled(integer, decimal, style) == _reference(integer, decimal, style)
+    patterns = [values for count in range(2, 9)
+                for values in itertools.product((0, 101, 1010), repeat=count)]
+    patterns += [values for value in range(0, 10000, 7)
+                 for values in ((1, value, 1), (1, 0, value))]
+    patterns += [(1,) + (0,) * count for count in range(8, 13)]
+    for values in patterns:
+        integer = str(int(''.join(f'{value:04d}' for value in values)))
+        for units in (UNITS_WANYI, UNITS_ZHAOJING):
+            assert format_rmb_styled(integer, '12', style, units) == (
+                _reference(integer, '12', style, units)), (integer, units)
+
+
+def test_style_tables_built_once() -> None:
+    """测试各风格的表只生成一次。"""
+    tables = get_style_tables(STYLE_TRADITIONAL)
+    assert get_style_tables(STYLE_TRADITIONAL) is tables
+    assert tables.four_digits[2] == '貳'
+    assert tables.lead_digits[2] == '貳'
+    assert get_style_tables(STYLE_PREFIXED).lead_digits[1] == '人民币壹'
+    assert len(tables.four_digits) == len(FOUR_DIGITS)
+
+
+@pytest.mark.usefixtures('isolated_styles')
+def test_register_style() -> None:
+    """测试在已有风格之上组合新风格。"""
+    register_style('hk', {'元': '圓'}, prefix='人民幣', base=STYLE_TRADITIONAL)
+    assert convert_to_rmb('20000.5', style='hk') == '人民幣貳萬圓伍角'
+    register_style('hk-plain', {'貳': '二'}, prefix='', base='hk')
+    assert convert_to_rmb('20000.5', style='hk-plain') == '二萬圓伍角'
+    assert style_definition('hk')[1] == '人民幣'
+
+    with pytest.raises(ValueError, match="输出风格已存在: hk"):
+        register_style('hk')
+    with pytest.raises(ValueError, match="不支持的输出风格: nope"):
+        register_style('x', base='nope')
+    with pytest.raises(ValueError, match="替换的键必须是单个字符"):
+        register_style('y', {'元整': '圆'})
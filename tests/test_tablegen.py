@@ -0,0 +1,54 @@
+"""预计算表生成脚本的测试用例。"""
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.rmb_converter import _tables
+from src.rmb_converter.chinese_currency import (
+    COMMON_DECIMALS,
+    FOUR_DIGITS,
+    TABLES_VERSION,
+    _generate_decimal_cache,
+    _generate_four_digits_cache,
+)
+from src.rmb_converter.tablegen import TABLES_PATH, main, render
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_tables_up_to_date() -> None:
+    """测试 _tables 模块与生成逻辑一致，修改生成逻辑后须重新生成。"""
+    assert _tables.TABLES_VERSION == TABLES_VERSION
+    assert TABLES_PATH.read_text(encoding='utf-8') == render()
+
+
+def test_loaded_tables_match_generated() -> None:
+    """测试导入时读取的表与现场生成的表一致。"""
+    assert FOUR_DIGITS == _generate_four_digits_cache()
+    assert COMMON_DECIMALS == _generate_decimal_cache()
+
+
+def test_main_writes_module(tmp_path: Path) -> None:
+    """测试生成脚本写出可执行的模块。"""
+    path = tmp_path / 'tables.py'
+    assert main([str(path)]) == 0
+    namespace: dict = {}
+    exec(path.read_text(encoding='utf-8'), namespace)
+    assert namespace['TABLES_VERSION'] == TABLES_VERSION
+    assert tuple(namespace['FOUR_DIGITS'].split('|')) == FOUR_DIGITS
+    assert len(namespace['DECIMALS'].split('|')) == 100
+
+
+def test_main_help_does_not_write(tmp_path: Path, monkeypatch: 'MonkeyPatch') -> None:
+    """测试 --help 只输出帮助，不会被当成输出路径。"""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--help'])
+    assert exc_info.value.code == 0
+    assert list(tmp_path.iterdir()) == []
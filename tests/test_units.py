@@ -0,0 +1,49 @@
+"""大数单位体系模块的测试用例。"""
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.rmb_converter.units import (
+    UNIT_SYSTEMS,
+    UNITS_WANYI,
+    UNITS_ZHAOJING,
+    WANYI_UNITS,
+    max_integer_length,
+    wanyi_unit,
+)
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_max_integer_length() -> None:
+    """测试各单位体系的位数上限。"""
+    assert max_integer_length(UNITS_WANYI) is None
+    assert max_integer_length(UNITS_ZHAOJING) == 52
+    assert set(UNIT_SYSTEMS) == {UNITS_WANYI, UNITS_ZHAOJING}
+    with pytest.raises(ValueError, match="不支持的单位体系"):
+        max_integer_length('roman')
+
+
+def test_wanyi_unit() -> None:
+    """测试万万亿式单位取决于节的序号和下一个非零节。"""
+    assert wanyi_unit(0, -1) == ''
+    assert wanyi_unit(1, -1) == '万'
+    assert wanyi_unit(2, -1) == '亿'
+    assert wanyi_unit(3, -1) == '万亿'
+    assert wanyi_unit(3, 2) == '万'  # 亿写在下面的非零节之后
+    assert wanyi_unit(4, -1) == '亿亿'
+    assert wanyi_unit(6, -1) == '亿亿亿'
+    assert wanyi_unit(6, 4) == '亿'
+    assert wanyi_unit(8, -1) == '亿' * 4
+    assert wanyi_unit(9, 0) == '万亿亿亿亿'
+
+
+def test_wanyi_units_table() -> None:
+    """测试常用单位表与逐个计算的结果一致。"""
+    for section, row in enumerate(WANYI_UNITS):
+        assert row == tuple(wanyi_unit(section, lower) for lower in range(-1, section))
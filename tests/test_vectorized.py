@@ -0,0 +1,45 @@
+"""向量化转换模块的测试用例。"""
+from typing import TYPE_CHECKING
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.rmb_converter.chinese_currency import convert_cents  # noqa: E402
+from src.rmb_converter.vectorized import convert_cents_array  # noqa: E402
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+def test_convert_cents_array_matches_scalar() -> None:
+    """测试向量化结果与逐个转换完全一致。"""
+    rng = np.random.default_rng(0)
+    # 覆盖各位数长度及大量含零的分段组合
+    magnitudes = 10 ** rng.integers(1, 15, size=20000)
+    values = rng.integers(0, magnitudes, dtype=np.int64)
+    patterns = np.array([int(format(i, '014b')) for i in range(1 << 14)], dtype=np.int64)
+    values = np.concatenate([values, patterns, -values[:100], [0, 1, 10, 100, 99999999999999]])
+    result = convert_cents_array(values)
+    assert result.tolist() == [convert_cents(int(v)) for v in values]
+
+
+def test_convert_cents_array_edge_cases() -> None:
+    """测试空数组与异常输入。"""
+    assert convert_cents_array(np.array([], dtype=np.int64)).tolist() == []
+    assert convert_cents_array([0, 1000001]).tolist() == ['零元整', '壹万元零壹分']
+
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_cents_array(np.array([10 ** 14]))
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_cents_array(np.array([np.iinfo(np.int64).min]))
+    # 2**64 - 5 转换为 int64 会回绕成 -5，取绝对值后落回范围内
+    with pytest.raises(OverflowError, match="整数部分超出12位限制"):
+        convert_cents_array(np.array([2 ** 64 - 5], dtype=np.uint64))
+    assert convert_cents_array(np.array([5], dtype=np.uint64)).tolist() == ['伍分']
+    with pytest.raises(ValueError, match="一维整数数组"):
+        convert_cents_array(np.array([1.5]))